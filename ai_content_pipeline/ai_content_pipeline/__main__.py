@@ -14,7 +14,8 @@ import yaml
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-from .pipeline.manager import AIPipelineManager
+from .pipeline.manager import AIPipelineManager, list_available_models
+from .models.text_to_image import UnifiedTextToImageGenerator
 from .config.constants import SUPPORTED_MODELS, MODEL_RECOMMENDATIONS
 
 
@@ -23,8 +24,8 @@ def print_models():
     print("\n🎨 AI Content Pipeline Supported Models")
     print("=" * 50)
     
-    manager = AIPipelineManager()
-    available_models = manager.get_available_models()
+    # Static model lists only; no generator is created
+    available_models = list_available_models()
     
     for step_type, models in available_models.items():
         print(f"\n📦 {step_type.replace('_', '-').title()}")
@@ -33,7 +34,7 @@ def print_models():
             for model in models:
                 # Get model info if available
                 if step_type == "text_to_image":
-                    info = manager.text_to_image.get_model_info(model)
+                    info = UnifiedTextToImageGenerator.MODEL_INFO.get(model)
                     print(f"   • {model}")
                     if info:
                         print(f"     Name: {info.get('name', 'N/A')}")
@@ -189,7 +190,7 @@ def run_chain(args):
                 sys.exit(0)
         
         # Execute chain
-        result = manager.execute_chain(chain, input_data)
+        result = manager.execute_chain(chain, input_data, resume=args.resume)
         
         # Display results
         if result.success:
@@ -200,6 +201,8 @@ def run_chain(args):
         else:
             print(f"\n❌ Chain execution failed!")
             print(f"Error: {result.error}")
+            if result.run_id:
+                print(f"🔁 Resume with: --resume {result.run_id}")
         
         # Save results if requested
         if args.save_json:
@@ -210,7 +213,8 @@ def run_chain(args):
                 "total_cost": result.total_cost,
                 "total_time": result.total_time,
                 "outputs": result.outputs,
-                "error": result.error
+                "error": result.error,
+                "run_id": result.run_id
             }
             
             # Save JSON file in output directory
@@ -308,6 +312,9 @@ Examples:
   # Run custom chain from config
   python -m ai_content_pipeline run-chain --config my_chain.yaml --input "cyberpunk city"
   
+  # Resume a failed run from its last completed step
+  python -m ai_content_pipeline run-chain --config my_chain.yaml --resume <run_id>
+  
   # Create example configurations
   python -m ai_content_pipeline create-examples
         """
@@ -346,6 +353,8 @@ Examples:
     chain_parser.add_argument("--prompt-file", help="Path to text file containing the prompt")
     chain_parser.add_argument("--no-confirm", action="store_true", help="Skip confirmation prompt")
     chain_parser.add_argument("--save-json", help="Save results as JSON")
+    chain_parser.add_argument("--resume", metavar="RUN_ID",
+                              help="Resume an earlier run, skipping its completed steps")
     
     # Create examples command
     examples_parser = subparsers.add_parser("create-examples", help="Create example configuration files")
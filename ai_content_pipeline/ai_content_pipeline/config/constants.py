@@ -221,6 +221,9 @@ SUPPORTED_FORMATS = {
     "video": [".mp4", ".mov", ".avi", ".webm"]
 }
 
+# Maximum number of dependency-graph steps running at the same time
+DEFAULT_MAX_PARALLEL_STEPS = 4
+
 # Default configuration
 DEFAULT_CHAIN_CONFIG = {
     "steps": [
@@ -29,6 +29,16 @@ class UnifiedImageToImageGenerator:
     Integrates with the existing FAL Image-to-Image implementation.
     """
     
+    # Model names offered by this generator
+    MODELS = [
+        "photon_flash",
+        "photon_base", 
+        "flux_kontext",
+        "flux_kontext_multi",
+        "seededit_v3",
+        "clarity_upscaler"
+    ]
+    
     def __init__(self):
         """Initialize the image-to-image generator."""
         self.generator = None
@@ -53,14 +63,7 @@ class UnifiedImageToImageGenerator:
     
     def get_available_models(self) -> list:
         """Get list of available models."""
-        return [
-            "photon_flash",
-            "photon_base", 
-            "flux_kontext",
-            "flux_kontext_multi",
-            "seededit_v3",
-            "clarity_upscaler"
-        ]
+        return list(self.MODELS)
     
     def generate(self, 
                  source_image: str,
@@ -34,6 +34,17 @@ class UnifiedImageUnderstandingGenerator:
     Integrates with the existing Gemini-based image analysis from video_tools.
     """
     
+    # Model names offered by this generator
+    MODELS = [
+        "gemini_describe",
+        "gemini_detailed",
+        "gemini_classify",
+        "gemini_objects",
+        "gemini_ocr",
+        "gemini_composition",
+        "gemini_qa"
+    ]
+    
     def __init__(self):
         """Initialize the image understanding generator."""
         self.analyzer = None
@@ -58,15 +69,7 @@ class UnifiedImageUnderstandingGenerator:
     
     def get_available_models(self) -> list:
         """Get list of available models."""
-        return [
-            "gemini_describe",
-            "gemini_detailed",
-            "gemini_classify",
-            "gemini_objects",
-            "gemini_ocr",
-            "gemini_composition",
-            "gemini_qa"
-        ]
+        return list(self.MODELS)
     
     def analyze(self, 
                 image_path: str,
@@ -36,6 +36,15 @@ class UnifiedPromptGenerator:
     using OpenRouter's multi-model capabilities.
     """
     
+    # Model names offered by this generator
+    MODELS = [
+        "openrouter_video_prompt",
+        "openrouter_video_cinematic",
+        "openrouter_video_realistic",
+        "openrouter_video_artistic",
+        "openrouter_video_dramatic"
+    ]
+    
     def __init__(self):
         """Initialize the prompt generator."""
         self.analyzer = None
@@ -62,13 +71,7 @@ class UnifiedPromptGenerator:
     
     def get_available_models(self) -> list:
         """Get list of available models."""
-        return [
-            "openrouter_video_prompt",
-            "openrouter_video_cinematic",
-            "openrouter_video_realistic",
-            "openrouter_video_artistic",
-            "openrouter_video_dramatic"
-        ]
+        return list(self.MODELS)
     
     def generate(self, 
                 image_path: str,
@@ -21,6 +21,46 @@ class UnifiedTextToImageGenerator(BaseContentModel):
     OpenAI DALL-E and Stability AI integration.
     """
     
+    # Models served through FAL AI
+    FAL_MODELS = ["flux_dev", "flux_schnell", "imagen4", "seedream_v3"]
+    
+    # Display details per model
+    MODEL_INFO = {
+        "flux_dev": {
+            "name": "FLUX.1 Dev",
+            "provider": "FAL AI",
+            "description": "High-quality 12B parameter model",
+            "best_for": "Quality, artistic content",
+            "cost_per_image": "$0.003",
+            "avg_time": "15 seconds"
+        },
+        "flux_schnell": {
+            "name": "FLUX.1 Schnell", 
+            "provider": "FAL AI",
+            "description": "Fast inference model",
+            "best_for": "Speed, prototyping",
+            "cost_per_image": "$0.001",
+            "avg_time": "5 seconds"
+        },
+        "imagen4": {
+            "name": "Imagen 4 Preview Fast",
+            "provider": "Google (via FAL AI)",
+            "description": "Google's latest image model",
+            "best_for": "Photorealism, text rendering",
+            "cost_per_image": "$0.004", 
+            "avg_time": "20 seconds"
+        },
+        "seedream_v3": {
+            "name": "Seedream v3",
+            "provider": "FAL AI",
+            "description": "Bilingual (Chinese/English) model",
+            "best_for": "Multilingual prompts, cost-effective",
+            "cost_per_image": "$0.002",
+            "avg_time": "10 seconds"
+        }
+    }
+    
+    
     def __init__(self):
         super().__init__("text_to_image")
         self._fal_generator = None
@@ -95,6 +135,8 @@ class UnifiedTextToImageGenerator(BaseContentModel):
             # Extract FAL-specific parameters
             output_dir = kwargs.get("output_dir", "output")
             aspect_ratio = kwargs.get("aspect_ratio", "16:9")
+            # Opt-in result cache ("cache: true" in step params); hits need a pinned seed
+            use_cache = kwargs.get("cache")
             
             # Generate image
             result = self._fal_generator.generate_image(
@@ -102,21 +144,27 @@ class UnifiedTextToImageGenerator(BaseContentModel):
                 model=fal_model,
                 output_folder=output_dir,
                 aspect_ratio=aspect_ratio,
+                use_cache=use_cache,
                 **{k: v for k, v in kwargs.items() 
-                   if k not in ["output_dir", "aspect_ratio", "budget", "criteria"]}
+                   if k not in ["output_dir", "aspect_ratio", "budget", "criteria", "cache"]}
             )
             
             if result.get("success"):
-                return self._create_success_result(
+                model_result = self._create_success_result(
                     model=model,
                     output_path=result.get("local_path"),
                     output_url=result.get("image_url"),
                     metadata={
                         "prompt": prompt,
                         "aspect_ratio": aspect_ratio,
+                        "cached": result.get("cached", False),
                         "fal_response": result.get("response", {})
                     }
                 )
+                if result.get("cached"):
+                    # Cached results cost nothing to serve
+                    model_result.cost_estimate = 0.0
+                return model_result
             else:
                 return self._create_error_result(model, result.get("error", "FAL generation failed"))
                 
@@ -137,7 +185,7 @@ class UnifiedTextToImageGenerator(BaseContentModel):
         
         # Check FAL models
         if self._fal_generator:
-            available.extend(["flux_dev", "flux_schnell", "imagen4", "seedream_v3"])
+            available.extend(self.FAL_MODELS)
         
         # TODO: Check other providers when implemented
         
@@ -167,42 +215,7 @@ class UnifiedTextToImageGenerator(BaseContentModel):
     
     def get_model_info(self, model: str) -> Dict[str, Any]:
         """Get detailed information about a specific model."""
-        model_info = {
-            "flux_dev": {
-                "name": "FLUX.1 Dev",
-                "provider": "FAL AI",
-                "description": "High-quality 12B parameter model",
-                "best_for": "Quality, artistic content",
-                "cost_per_image": "$0.003",
-                "avg_time": "15 seconds"
-            },
-            "flux_schnell": {
-                "name": "FLUX.1 Schnell", 
-                "provider": "FAL AI",
-                "description": "Fast inference model",
-                "best_for": "Speed, prototyping",
-                "cost_per_image": "$0.001",
-                "avg_time": "5 seconds"
-            },
-            "imagen4": {
-                "name": "Imagen 4 Preview Fast",
-                "provider": "Google (via FAL AI)",
-                "description": "Google's latest image model",
-                "best_for": "Photorealism, text rendering",
-                "cost_per_image": "$0.004", 
-                "avg_time": "20 seconds"
-            },
-            "seedream_v3": {
-                "name": "Seedream v3",
-                "provider": "FAL AI",
-                "description": "Bilingual (Chinese/English) model",
-                "best_for": "Multilingual prompts, cost-effective",
-                "cost_per_image": "$0.002",
-                "avg_time": "10 seconds"
-            }
-        }
-        
-        return model_info.get(model, {})
+        return self.MODEL_INFO.get(model, {})
     
     def compare_models(self, prompt: str, models: List[str] = None) -> Dict[str, Dict[str, Any]]:
         """Compare multiple models for a given prompt."""
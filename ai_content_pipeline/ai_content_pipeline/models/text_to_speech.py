@@ -6,9 +6,8 @@ Provides unified interface for text-to-speech generation using ElevenLabs API.
 
 import os
 import sys
-import subprocess
-import json
 import time
+import threading
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
@@ -17,20 +16,32 @@ class UnifiedTextToSpeechGenerator:
     """
     Unified text-to-speech generator supporting multiple ElevenLabs models.
     
-    Integrates with the existing text-to-speech CLI system for consistent
-    voice generation and pipeline compatibility.
+    Calls the text_to_speech package in-process through one long-lived
+    ElevenLabsTTSController, so every utterance reuses its HTTP session.
     """
     
+    # Pipeline model names -> ElevenLabs model ids ("elevenlabs" keeps the
+    # English v1 model the former CLI wrapper always used)
+    MODEL_IDS = {
+        "elevenlabs": "eleven_monolingual_v1",
+        "elevenlabs_turbo": "eleven_turbo_v2_5",
+        "elevenlabs_v3": "eleven_v3"
+    }
+    
     def __init__(self):
         """Initialize the TTS generator."""
-        self.tts_path = Path("/home/zdhpe/veo3-video-generation/text_to_speech")
-        self.pipeline_base = Path("/home/zdhpe/veo3-video-generation/ai_content_pipeline")
-        self.supported_models = ["elevenlabs", "elevenlabs_turbo", "elevenlabs_v3"]
+        self.pipeline_base = Path(__file__).resolve().parent.parent.parent
+        self.tts_path = self.pipeline_base.parent / "text_to_speech"
+        self.supported_models = list(self.MODEL_IDS)
         self.supported_voices = [
             "rachel", "drew", "bella", "antoni", "elli", 
             "josh", "arnold", "adam", "sam", "clyde"
         ]
         
+        # Controller is created lazily and shared by all calls
+        self._controller = None
+        self._controller_lock = threading.Lock()
+        
     def generate(
         self,
         prompt: str,
@@ -86,22 +97,14 @@ class UnifiedTextToSpeechGenerator:
                 timestamp = int(time.time())
                 output_file = f"pipeline_tts_{voice}_{timestamp}.mp3"
             
-            # Determine the output directory
-            output_dir = kwargs.get("output_dir", "output")
-            
-            # If output_file doesn't have a directory path, add the pipeline output directory
-            if not "/" in output_file and not output_file.startswith("/"):
-                # Use pipeline output directory
-                full_output_path = self.pipeline_base / output_dir / output_file
-            else:
-                # Use the provided path as-is
-                full_output_path = Path(output_file)
+            full_output_path = self._resolve_output_path(output_file, kwargs.get("output_dir", "output"))
             
-            # Use CLI wrapper for generation (ensures consistency)
-            result = self._call_tts_cli(
+            # Generate in-process with the shared controller
+            result = self._synthesize(
                 text=prompt,
                 voice=voice,
                 output_file=str(full_output_path),
+                model=model,
                 speed=speed,
                 stability=stability,
                 similarity_boost=similarity_boost,
@@ -123,132 +126,132 @@ class UnifiedTextToSpeechGenerator:
         except Exception as e:
             return False, {"error": f"TTS generation error: {str(e)}"}
     
-    def _call_tts_cli(
+    def _resolve_output_path(self, output_file: str, output_dir: str) -> Path:
+        """
+        Resolve an output file the way the former CLI wrapper did.
+        
+        A bare file name goes to the pipeline output directory and an
+        absolute path is used as-is. A relative path with directories is
+        placed under text_to_speech/output/ (the wrapper ran there and
+        prefixed "output/" unless the path already started with it).
+        
+        Args:
+            output_file: Requested output file
+            output_dir: Pipeline output directory for bare file names
+            
+        Returns:
+            Absolute output path
+        """
+        if "/" not in output_file:
+            return self.pipeline_base / output_dir / output_file
+        if output_file.startswith("/"):
+            return Path(output_file)
+        if not output_file.startswith("output/"):
+            output_file = f"output/{output_file}"
+        return self.tts_path / output_file
+    
+    def _get_controller(self):
+        """
+        Get the long-lived ElevenLabs controller, creating it on first use.
+        
+        The controller keeps a pooled HTTP session, so consecutive utterances
+        reuse the same connection instead of paying a new handshake.
+        
+        Returns:
+            ElevenLabsTTSController instance
+            
+        Raises:
+            ValueError: If ELEVENLABS_API_KEY is not set
+        """
+        with self._controller_lock:
+            if self._controller is None:
+                api_key = os.getenv("ELEVENLABS_API_KEY")
+                if not api_key:
+                    raise ValueError("ELEVENLABS_API_KEY not found in environment variables")
+                
+                # The text_to_speech package lives next to ai_content_pipeline
+                repo_root = str(self.tts_path.parent)
+                if repo_root not in sys.path:
+                    sys.path.append(repo_root)
+                from text_to_speech.tts.controller import ElevenLabsTTSController
+                
+                self._controller = ElevenLabsTTSController(api_key)
+            return self._controller
+    
+    def _synthesize(
         self,
         text: str,
         voice: str,
         output_file: str,
+        model: str,
         speed: float,
         stability: float,
         similarity_boost: float,
         style: float
     ) -> Dict[str, Any]:
         """
-        Call the TTS CLI wrapper for speech generation.
+        Generate speech in-process through the shared ElevenLabs controller.
         
         Args:
             text: Text to convert
             voice: Voice name
-            output_file: Output filename
+            output_file: Output file path
+            model: Pipeline model name
             speed: Speech speed
             stability: Voice stability
             similarity_boost: Similarity boost
             style: Style exaggeration
             
         Returns:
-            Result dictionary from CLI
+            Result dictionary (success, output_file, voice_used, text_length,
+            settings, processing_time)
         """
         try:
-            # Build command for CLI wrapper
-            cmd = [
-                "python", "examples/tts_cli_wrapper.py",
-                text, voice, output_file,
-                "--speed", str(speed),
-                "--stability", str(stability),
-                "--similarity-boost", str(similarity_boost),
-                "--style", str(style),
-                "--json"
-            ]
+            controller = self._get_controller()
+            from text_to_speech.models.common import ElevenLabsModel, VoiceSettings, POPULAR_VOICE_IDS
+            
+            voice_id = POPULAR_VOICE_IDS.get(voice.lower())
+            if not voice_id:
+                return {"success": False, "error": f"Unknown voice: {voice}"}
+            
+            settings = {
+                "speed": speed,
+                "stability": stability,
+                "similarity_boost": similarity_boost,
+                "style": style
+            }
+            
+            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
             
-            # Execute CLI command
             start_time = time.time()
-            result = subprocess.run(
-                cmd,
-                cwd=str(self.tts_path),
-                capture_output=True,
-                text=True,
-                timeout=60
+            success = controller.text_to_speech(
+                text=text,
+                voice_id=voice_id,
+                model=ElevenLabsModel(self.MODEL_IDS[model]),
+                voice_settings=VoiceSettings(
+                    stability=stability,
+                    similarity_boost=similarity_boost,
+                    style=style
+                ),
+                speed=speed,
+                output_file=output_file
             )
             processing_time = time.time() - start_time
             
-            if result.returncode == 0:
-                # Parse JSON response - extract only the JSON part
-                stdout_text = result.stdout.strip()
-                
-                # Find JSON block - look for opening brace and matching closing brace
-                json_start_pos = stdout_text.find('{')
-                if json_start_pos >= 0:
-                    # Count braces to find the matching close
-                    brace_count = 0
-                    json_end_pos = -1
-                    
-                    for i in range(json_start_pos, len(stdout_text)):
-                        if stdout_text[i] == '{':
-                            brace_count += 1
-                        elif stdout_text[i] == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                json_end_pos = i
-                                break
-                    
-                    if json_end_pos > json_start_pos:
-                        json_text = stdout_text[json_start_pos:json_end_pos+1]
-                        
-                        try:
-                            response = json.loads(json_text)
-                            response["processing_time"] = processing_time
-                            return response
-                        except json.JSONDecodeError as e:
-                            return {
-                                "success": False,
-                                "error": f"JSON parse error: {str(e)}. JSON: '{json_text[:100]}'"
-                            }
-                
-                return {
-                    "success": False,
-                    "error": f"No valid JSON found in output: {result.stdout[:200]}"
-                }
-            else:
-                # Handle CLI errors
-                try:
-                    # Try to find JSON in stdout even for non-zero exit codes
-                    stdout_text = result.stdout.strip()
-                    
-                    # Find JSON block - look for opening brace and matching closing brace
-                    json_start_pos = stdout_text.find('{')
-                    if json_start_pos >= 0:
-                        # Count braces to find the matching close
-                        brace_count = 0
-                        json_end_pos = -1
-                        
-                        for i in range(json_start_pos, len(stdout_text)):
-                            if stdout_text[i] == '{':
-                                brace_count += 1
-                            elif stdout_text[i] == '}':
-                                brace_count -= 1
-                                if brace_count == 0:
-                                    json_end_pos = i
-                                    break
-                        
-                        if json_end_pos > json_start_pos:
-                            json_text = stdout_text[json_start_pos:json_end_pos+1]
-                            return json.loads(json_text)
-                    
-                    # No JSON found, return error
-                    return {
-                        "success": False,
-                        "error": f"CLI error (exit {result.returncode}): {result.stderr or result.stdout}"
-                    }
-                except json.JSONDecodeError:
-                    return {
-                        "success": False,
-                        "error": f"CLI error: {result.stderr or 'Unknown error'}"
-                    }
-                    
-        except subprocess.TimeoutExpired:
-            return {"success": False, "error": "TTS generation timeout"}
+            if not success:
+                return {"success": False, "error": "ElevenLabs request failed"}
+            
+            return {
+                "success": True,
+                "output_file": output_file,
+                "voice_used": voice,
+                "text_length": len(text),
+                "settings": settings,
+                "processing_time": processing_time
+            }
+            
         except Exception as e:
-            return {"success": False, "error": f"CLI execution error: {str(e)}"}
+            return {"success": False, "error": f"TTS synthesis error: {str(e)}"}
     
     def validate_voice(self, voice: str) -> bool:
         """
@@ -260,28 +263,7 @@ class UnifiedTextToSpeechGenerator:
         Returns:
             True if voice is supported
         """
-        try:
-            cmd = [
-                "python", "examples/tts_cli_wrapper.py",
-                "--validate-voice", voice, "--json"
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                cwd=str(self.tts_path),
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode in [0, 1]:  # Both success and validation failure are valid responses
-                response = json.loads(result.stdout)
-                return response.get("valid", False)
-            else:
-                return False
-                
-        except Exception:
-            return voice in self.supported_voices  # Fallback to static list
+        return voice.lower() in self.supported_voices
     
     def list_voices(self) -> Dict[str, Any]:
         """
@@ -290,37 +272,10 @@ class UnifiedTextToSpeechGenerator:
         Returns:
             Dictionary with voice information
         """
-        try:
-            cmd = [
-                "python", "examples/tts_cli_wrapper.py",
-                "--list-voices", "--json"
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                cwd=str(self.tts_path),
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                response = json.loads(result.stdout)
-                return {
-                    "success": True,
-                    "voices": response.get("voices", self.supported_voices)
-                }
-            else:
-                return {
-                    "success": False,
-                    "voices": self.supported_voices  # Fallback
-                }
-                
-        except Exception:
-            return {
-                "success": False,
-                "voices": self.supported_voices  # Fallback
-            }
+        return {
+            "success": True,
+            "voices": list(self.supported_voices)
+        }
     
     def get_model_info(self, model: str) -> Dict[str, Any]:
         """
@@ -2,7 +2,7 @@
 Content creation chain classes for AI Content Pipeline
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 from enum import Enum
 
@@ -29,27 +29,43 @@ class PipelineStep:
     params: Dict[str, Any]
     enabled: bool = True
     retry_count: int = 0
+    step_id: Optional[str] = None
+    depends_on: List[str] = field(default_factory=list)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PipelineStep':
         """Create PipelineStep from dictionary configuration."""
+        depends_on = data.get("depends_on", [])
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        
         return cls(
             step_type=StepType(data["type"]),
             model=data["model"],
             params=data.get("params", {}),
             enabled=data.get("enabled", True),
-            retry_count=data.get("retry_count", 0)
+            retry_count=data.get("retry_count", 0),
+            step_id=data.get("id"),
+            depends_on=list(depends_on)
         )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert PipelineStep to dictionary."""
-        return {
+        data = {
             "type": self.step_type.value,
             "model": self.model,
             "params": self.params,
             "enabled": self.enabled,
             "retry_count": self.retry_count
         }
+        
+        # Only emit dependency fields when used, so sequential configs round-trip unchanged
+        if self.step_id:
+            data["id"] = self.step_id
+        if self.depends_on:
+            data["depends_on"] = list(self.depends_on)
+        
+        return data
 
 
 @dataclass
@@ -63,6 +79,7 @@ class ChainResult:
     outputs: Dict[str, Any]
     error: Optional[str] = None
     step_results: Optional[List[Dict[str, Any]]] = None
+    run_id: Optional[str] = None
 
 
 class ContentCreationChain:
@@ -125,6 +142,10 @@ class ContentCreationChain:
             errors.append("Chain must have at least one step")
             return errors
         
+        # Chains that declare dependencies are validated as a graph
+        if self.has_dependencies():
+            return self._validate_dependency_graph()
+        
         # Determine initial input type
         initial_input_type = self._determine_initial_input_type()
         
@@ -243,6 +264,141 @@ class ContentCreationChain:
         """Get list of enabled steps."""
         return [step for step in self.steps if step.enabled]
     
+    def has_dependencies(self) -> bool:
+        """Check whether any enabled step declares explicit dependencies."""
+        return any(step.depends_on for step in self.get_enabled_steps())
+    
+    def get_step_ids(self) -> List[str]:
+        """
+        Get identifiers for all enabled steps.
+        
+        Steps without an explicit ``id`` fall back to the same name used for
+        their outputs (e.g. ``step_2_text_to_speech``).
+        
+        Returns:
+            List of step identifiers in enabled-step order
+        """
+        return [
+            step.step_id or f"step_{i+1}_{step.step_type.value}"
+            for i, step in enumerate(self.get_enabled_steps())
+        ]
+    
+    def get_execution_levels(self) -> List[List[int]]:
+        """
+        Group enabled steps into dependency levels.
+        
+        Every step in a level only depends on steps from earlier levels, so
+        all steps of one level may run at the same time.
+        
+        Returns:
+            List of levels, each a list of enabled-step indices
+            
+        Raises:
+            ValueError: If the dependency graph is invalid or has a cycle
+        """
+        errors = self._check_dependency_references()
+        if errors:
+            raise ValueError("; ".join(errors))
+        
+        enabled_steps = self.get_enabled_steps()
+        index_by_id = {step_id: i for i, step_id in enumerate(self.get_step_ids())}
+        remaining = {
+            i: {index_by_id[dep] for dep in step.depends_on}
+            for i, step in enumerate(enabled_steps)
+        }
+        
+        levels = []
+        done = set()
+        while remaining:
+            ready = sorted(i for i, deps in remaining.items() if deps <= done)
+            if not ready:
+                step_ids = self.get_step_ids()
+                cycle = ", ".join(step_ids[i] for i in sorted(remaining))
+                raise ValueError(f"Dependency cycle detected between steps: {cycle}")
+            
+            levels.append(ready)
+            done.update(ready)
+            for i in ready:
+                del remaining[i]
+        
+        return levels
+    
+    def _check_dependency_references(self) -> List[str]:
+        """Check step ids are unique and every dependency refers to a known step."""
+        errors = []
+        step_ids = self.get_step_ids()
+        
+        seen = set()
+        for step_id in step_ids:
+            if step_id in seen:
+                errors.append(f"Duplicate step id: {step_id}")
+            seen.add(step_id)
+        
+        for step, step_id in zip(self.get_enabled_steps(), step_ids):
+            for dep in step.depends_on:
+                if dep == step_id:
+                    errors.append(f"Step '{step_id}' cannot depend on itself")
+                elif dep not in seen:
+                    errors.append(f"Step '{step_id}' depends on unknown step '{dep}'")
+        
+        return errors
+    
+    def _validate_dependency_graph(self) -> List[str]:
+        """
+        Validate a chain whose steps declare ``depends_on``.
+        
+        Steps without dependencies receive the chain input; every other step
+        receives the output of its first dependency.
+        
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        errors = self._check_dependency_references()
+        if errors:
+            return errors
+        
+        try:
+            levels = self.get_execution_levels()
+        except ValueError as e:
+            return [str(e)]
+        
+        enabled_steps = self.get_enabled_steps()
+        step_ids = self.get_step_ids()
+        index_by_id = {step_id: i for i, step_id in enumerate(step_ids)}
+        initial_input_type = self._determine_initial_input_type()
+        
+        # Data type each step hands to its dependents
+        produced_types = {}
+        
+        for level in levels:
+            for i in level:
+                step = enabled_steps[i]
+                step_input = self._get_step_input_type(step.step_type)
+                
+                if step.depends_on:
+                    available_type = produced_types[index_by_id[step.depends_on[0]]]
+                    source = f"step '{step.depends_on[0]}'"
+                else:
+                    available_type = initial_input_type
+                    source = "pipeline input"
+                
+                # TTS with text_override ignores its input, so it may hang off any step
+                uses_own_text = (step.step_type == StepType.TEXT_TO_SPEECH and
+                                 "text_override" in step.params)
+                
+                if step_input != available_type and step_input != "any" and not uses_own_text:
+                    errors.append(
+                        f"Step '{step_ids[i]}' expects {step_input} but {source} provides {available_type}"
+                    )
+                
+                # PROMPT_GENERATION passes its input data through unchanged
+                if step.step_type == StepType.PROMPT_GENERATION:
+                    produced_types[i] = available_type
+                else:
+                    produced_types[i] = self._get_step_output_type(step.step_type)
+        
+        return errors
+    
     def get_initial_input_type(self) -> str:
         """Get the expected initial input type for this chain."""
         return self._determine_initial_input_type()
@@ -0,0 +1,259 @@
+"""
+Dependency-aware scheduler for AI Content Pipeline.
+
+Runs the steps of a chain that declares ``depends_on`` relationships as a
+directed acyclic graph: every step is started as soon as all of its
+dependencies have completed, so independent branches run concurrently.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Any, List, Optional
+
+from .chain import ContentCreationChain, StepType
+
+
+class DAGScheduler:
+    """
+    Executes chain steps in dependency order with bounded concurrency.
+
+    A step without dependencies receives the chain input. A step with
+    dependencies receives the output of its first dependency and the merged
+    ``step_context`` of all of them (e.g. a generated prompt).
+
+    Steps with a checkpoint from an earlier run are restored instead of
+    executed, as long as every dependency was restored as well.
+    """
+
+    def __init__(self, base_executor, max_workers: int = 4):
+        """
+        Initialize the scheduler.
+
+        Args:
+            base_executor: ChainExecutor used to run individual steps
+            max_workers: Maximum number of steps running at the same time
+        """
+        self.base_executor = base_executor
+        self.max_workers = max(1, int(max_workers))
+
+    def execute(
+        self,
+        chain: ContentCreationChain,
+        input_data: Any,
+        checkpoints: Optional[Dict[int, Dict[str, Any]]] = None,
+        on_step_complete: Optional[Callable[..., None]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Execute all enabled steps of a chain as a dependency graph.
+
+        Scheduling stops at the first failed step: steps already running are
+        allowed to finish, steps that have not started are reported as skipped.
+
+        Args:
+            chain: ContentCreationChain with ``depends_on`` declarations
+            input_data: Initial input data for root steps
+            checkpoints: Step index -> checkpoint (``result``, ``output_data``,
+                ``output_type``, ``output_context``) from an earlier run
+            on_step_complete: Called with (index, result, output_data,
+                output_type, output_context) after each executed step succeeds
+            **kwargs: Additional parameters passed to each step
+
+        Returns:
+            Dictionary with ``step_results`` (aligned with enabled steps),
+            ``completion_order``, ``failed_step`` and ``error``
+        """
+        enabled_steps = chain.get_enabled_steps()
+        step_ids = chain.get_step_ids()
+        index_by_id = {step_id: i for i, step_id in enumerate(step_ids)}
+
+        # Raises ValueError for unknown references or cycles
+        chain.get_execution_levels()
+
+        dependencies = {
+            i: [index_by_id[dep] for dep in step.depends_on]
+            for i, step in enumerate(enabled_steps)
+        }
+
+        initial_type = chain.get_initial_input_type()
+        step_results: List[Optional[Dict[str, Any]]] = [None] * len(enabled_steps)
+        output_data: Dict[int, Any] = {}
+        output_types: Dict[int, str] = {}
+        output_contexts: Dict[int, Dict[str, Any]] = {}
+        completion_order: List[int] = []
+        pending = set(range(len(enabled_steps)))
+        checkpoints = checkpoints or {}
+        restored = set()
+        failed_step = None
+        error = None
+
+        print(f"🕸️  Scheduling {len(enabled_steps)} steps by dependency (max_workers={self.max_workers})")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+
+            while pending or running:
+                # Submit every step whose dependencies are satisfied
+                if failed_step is None:
+                    ready = self._restore_checkpoints(
+                        pending, dependencies, checkpoints, restored, step_ids,
+                        step_results, completion_order, output_data, output_types, output_contexts
+                    )
+                    for i in ready:
+                        pending.discard(i)
+                        step_input, step_type, step_context = self._resolve_inputs(
+                            dependencies[i], input_data, initial_type,
+                            output_data, output_types, output_contexts
+                        )
+                        step = enabled_steps[i]
+                        print(f"  📍 Starting {step_ids[i]}: {step.step_type.value} ({step.model})")
+                        future = executor.submit(
+                            self._run_step, step, step_input, step_type,
+                            chain.config, step_context, **kwargs
+                        )
+                        running[future] = (i, step_input, step_type, step_context)
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, step_input, step_type, step_context = running.pop(future)
+                    step = enabled_steps[i]
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {"success": False, "error": f"Step execution failed: {str(e)}"}
+
+                    step_results[i] = result
+                    completion_order.append(i)
+
+                    if not result.get("success", False):
+                        print(f"  ❌ {step_ids[i]} failed: {result.get('error', 'Unknown error')}")
+                        if failed_step is None:
+                            failed_step = i
+                            error = result.get("error", "Unknown error")
+                        continue
+
+                    print(f"  ✅ {step_ids[i]} completed in {result.get('processing_time', 0):.1f}s")
+
+                    # PROMPT_GENERATION adds a prompt to the context and passes its input through
+                    if step.step_type == StepType.PROMPT_GENERATION:
+                        output_data[i] = step_input
+                        output_types[i] = step_type
+                        output_contexts[i] = {
+                            **step_context,
+                            "generated_prompt": result.get("extracted_prompt") or result.get("output_text")
+                        }
+                    else:
+                        output_data[i] = (result.get("output_path") or
+                                          result.get("output_url") or
+                                          result.get("output_text"))
+                        output_types[i] = self.base_executor._get_step_output_type(step.step_type)
+                        output_contexts[i] = step_context
+
+                    if on_step_complete:
+                        on_step_complete(i, result, output_data[i], output_types[i], output_contexts[i])
+
+        # Steps never started because of an earlier failure
+        for i in range(len(enabled_steps)):
+            if step_results[i] is None:
+                step_results[i] = {
+                    "success": False,
+                    "skipped": True,
+                    "processing_time": 0,
+                    "cost": 0.0,
+                    "error": "Skipped: an earlier step failed"
+                }
+
+        return {
+            "step_results": step_results,
+            "completion_order": completion_order,
+            "failed_step": failed_step,
+            "error": error
+        }
+
+    def _restore_checkpoints(
+        self,
+        pending: set,
+        dependencies: Dict[int, List[int]],
+        checkpoints: Dict[int, Dict[str, Any]],
+        restored: set,
+        step_ids: List[str],
+        step_results: List[Optional[Dict[str, Any]]],
+        completion_order: List[int],
+        output_data: Dict[int, Any],
+        output_types: Dict[int, str],
+        output_contexts: Dict[int, Dict[str, Any]]
+    ) -> List[int]:
+        """
+        Restore ready steps that have checkpoints and return the ones to run.
+
+        A checkpoint is only trusted when all dependencies were restored too;
+        once a step runs again, everything downstream of it runs again.
+        """
+        while True:
+            ready = [
+                i for i in sorted(pending)
+                if all(dep in output_data for dep in dependencies[i])
+            ]
+            restorable = [
+                i for i in ready
+                if i in checkpoints and all(dep in restored for dep in dependencies[i])
+            ]
+            if not restorable:
+                return ready
+
+            for i in restorable:
+                checkpoint = checkpoints[i]
+                pending.discard(i)
+                restored.add(i)
+                step_results[i] = {**checkpoint["result"], "cost": 0.0, "resumed": True}
+                completion_order.append(i)
+                output_data[i] = checkpoint["output_data"]
+                output_types[i] = checkpoint["output_type"]
+                output_contexts[i] = checkpoint["output_context"]
+                print(f"  ⏭️  Restored {step_ids[i]} from run checkpoint")
+
+    def _resolve_inputs(
+        self,
+        dependencies: List[int],
+        input_data: Any,
+        initial_type: str,
+        output_data: Dict[int, Any],
+        output_types: Dict[int, str],
+        output_contexts: Dict[int, Dict[str, Any]]
+    ) -> tuple:
+        """Build (input_data, input_type, step_context) for a ready step."""
+        if not dependencies:
+            return input_data, initial_type, {}
+
+        context = {}
+        for dep in dependencies:
+            context.update(output_contexts[dep])
+
+        primary = dependencies[0]
+        return output_data[primary], output_types[primary], context
+
+    def _run_step(
+        self,
+        step,
+        input_data: Any,
+        input_type: str,
+        chain_config: Dict[str, Any],
+        step_context: Dict[str, Any],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Run one step through the base executor and record its wall time."""
+        start_time = time.time()
+        result = self.base_executor._run_step(
+            step=step,
+            input_data=input_data,
+            input_type=input_type,
+            chain_config=chain_config,
+            step_context=step_context.copy(),
+            **kwargs
+        )
+        result.setdefault("processing_time", time.time() - start_time)
+        return result
@@ -1,23 +1,22 @@
 """
 Chain executor for AI Content Pipeline
 
-Handles the sequential execution of pipeline steps with file management.
+Handles the execution of pipeline steps with file management. Steps run
+sequentially unless the chain declares ``depends_on`` relationships, in which
+case independent steps are scheduled concurrently.
 """
 
 import time
 import json
-import requests
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from .chain import ContentCreationChain, ChainResult, PipelineStep, StepType
-from ..models.text_to_image import UnifiedTextToImageGenerator
-from ..models.image_understanding import UnifiedImageUnderstandingGenerator
-from ..models.prompt_generation import UnifiedPromptGenerator
-from ..models.image_to_image import UnifiedImageToImageGenerator
-from ..models.text_to_speech import UnifiedTextToSpeechGenerator
+from .run_manifest import RunManifest
+from .lazy_generators import LazyGenerator, get_generator_init_times
 from ..utils.file_manager import FileManager
+from ..config.constants import DEFAULT_MAX_PARALLEL_STEPS
 
 
 class ChainExecutor:
@@ -27,6 +26,13 @@ class ChainExecutor:
     Manages file flow between steps and handles errors gracefully.
     """
     
+    # Model generators are created on first use by a step of their type
+    text_to_image = LazyGenerator("..models.text_to_image", "UnifiedTextToImageGenerator")
+    image_understanding = LazyGenerator("..models.image_understanding", "UnifiedImageUnderstandingGenerator")
+    prompt_generation = LazyGenerator("..models.prompt_generation", "UnifiedPromptGenerator")
+    image_to_image = LazyGenerator("..models.image_to_image", "UnifiedImageToImageGenerator")
+    text_to_speech = LazyGenerator("..models.text_to_speech", "UnifiedTextToSpeechGenerator")
+    
     def __init__(self, file_manager: FileManager):
         """
         Initialize chain executor.
@@ -36,21 +42,16 @@ class ChainExecutor:
         """
         self.file_manager = file_manager
         
-        # Initialize model generators
-        self.text_to_image = UnifiedTextToImageGenerator()
-        self.image_understanding = UnifiedImageUnderstandingGenerator()
-        self.prompt_generation = UnifiedPromptGenerator()
-        self.image_to_image = UnifiedImageToImageGenerator()
-        self.text_to_speech = UnifiedTextToSpeechGenerator()
-        
-        # TODO: Initialize other generators when implemented
-        # self.image_to_video = UnifiedImageToVideoGenerator()
-        # self.audio_generator = UnifiedAudioGenerator()
-        # self.video_upscaler = UnifiedVideoUpscaler()
-        
-        # Optional parallel execution support
+        # Optional parallel execution support, loaded with the first parallel group
         self._parallel_extension = None
-        self._try_load_parallel_extension()
+        self._parallel_extension_loaded = False
+    
+    def _get_parallel_extension(self):
+        """Get the parallel extension, loading it on first use."""
+        if not getattr(self, "_parallel_extension_loaded", False):
+            self._parallel_extension_loaded = True
+            self._try_load_parallel_extension()
+        return self._parallel_extension
     
     def _try_load_parallel_extension(self):
         """Try to load parallel extension if available."""
@@ -69,19 +70,44 @@ class ChainExecutor:
         self,
         chain: ContentCreationChain,
         input_data: str,
+        resume: Optional[str] = None,
         **kwargs
     ) -> ChainResult:
         """
         Execute a complete content creation chain.
         
+        Completed steps are checkpointed to a run manifest; passing the run id
+        of an earlier execution as ``resume`` skips the steps it completed.
+        
         Args:
             chain: ContentCreationChain to execute
             input_data: Initial input data (text, image path, or video path)
+            resume: Run id (or manifest path) of an earlier run to resume
             **kwargs: Additional execution parameters
             
         Returns:
             ChainResult with execution results
         """
+        try:
+            manifest = self._open_manifest(chain, input_data, resume)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"❌ Cannot resume: {e}")
+            return ChainResult(
+                success=False,
+                steps_completed=0,
+                total_steps=len(chain.get_enabled_steps()),
+                total_cost=0.0,
+                total_time=0.0,
+                outputs={},
+                error=f"Cannot resume: {str(e)}",
+                step_results=[]
+            )
+        run_id = manifest.run_id if manifest else None
+        
+        # Chains with explicit step dependencies run through the DAG scheduler
+        if chain.has_dependencies():
+            return self._execute_dag(chain, input_data, manifest=manifest, **kwargs)
+        
         start_time = time.time()
         step_results = []
         outputs = {}
@@ -92,6 +118,9 @@ class ChainExecutor:
         step_context = {}
         
         enabled_steps = chain.get_enabled_steps()
+        step_ids = chain.get_step_ids()
+        # Checkpoints are only reused until the first step that runs again
+        restoring = bool(resume)
         
         print(f"🎬 Starting chain execution: {len(enabled_steps)} steps")
         
@@ -99,20 +128,13 @@ class ChainExecutor:
             for i, step in enumerate(enabled_steps):
                 print(f"\n📍 Step {i+1}/{len(enabled_steps)}: {step.step_type.value} ({step.model})")
                 
-                # Check if this is a parallel step and extension is available
-                if (self._parallel_extension and 
-                    self._parallel_extension.can_execute_parallel(step)):
-                    # Execute parallel group
-                    step_result = self._parallel_extension.execute_parallel_group(
-                        step=step,
-                        input_data=current_data,
-                        input_type=current_type,
-                        chain_config=chain.config,
-                        step_context=step_context
-                    )
+                checkpoint = manifest.get_checkpoint(i) if restoring and manifest else None
+                if checkpoint:
+                    print(f"⏭️  Restored from run checkpoint (completed {checkpoint['completed_at']})")
+                    step_result = {**checkpoint["result"], "cost": 0.0, "resumed": True}
                 else:
-                    # Execute step normally (existing path)
-                    step_result = self._execute_step(
+                    restoring = False
+                    step_result = self._run_step(
                         step=step,
                         input_data=current_data,
                         input_type=current_type,
@@ -147,6 +169,8 @@ class ChainExecutor:
                     if report_path:
                         print(f"📄 Failure report saved: {report_path}")
                     
+                    self._finish_manifest(manifest, False, f"Step {i+1} failed: {error_msg}")
+                    
                     return ChainResult(
                         success=False,
                         steps_completed=i,
@@ -155,7 +179,8 @@ class ChainExecutor:
                         total_time=total_time,
                         outputs=outputs,
                         error=f"Step {i+1} failed: {error_msg}",
-                        step_results=step_results
+                        step_results=step_results,
+                        run_id=run_id
                     )
                 
                 # Update current data for next step
@@ -220,6 +245,10 @@ class ChainExecutor:
                     if intermediate_path:
                         print(f"💾 Intermediate results saved: {intermediate_path}")
                 
+                if manifest and not checkpoint:
+                    manifest.record_step(i, step_ids[i], step_result, current_data,
+                                         current_type, dict(step_context))
+                
                 print(f"✅ Step completed in {step_result.get('processing_time', 0):.1f}s")
             
             # Chain completed successfully
@@ -245,6 +274,8 @@ class ChainExecutor:
             if report_path:
                 print(f"📄 Execution report saved: {report_path}")
             
+            self._finish_manifest(manifest, True)
+            
             return ChainResult(
                 success=True,
                 steps_completed=len(enabled_steps),
@@ -252,7 +283,8 @@ class ChainExecutor:
                 total_cost=total_cost,
                 total_time=total_time,
                 outputs=outputs,
-                step_results=step_results
+                step_results=step_results,
+                run_id=run_id
             )
             
         except Exception as e:
@@ -276,6 +308,8 @@ class ChainExecutor:
             if report_path:
                 print(f"📄 Error report saved: {report_path}")
             
+            self._finish_manifest(manifest, False, f"Execution error: {str(e)}")
+            
             return ChainResult(
                 success=False,
                 steps_completed=len(step_results),
@@ -284,8 +318,223 @@ class ChainExecutor:
                 total_time=total_time,
                 outputs=outputs,
                 error=f"Execution error: {str(e)}",
-                step_results=step_results
+                step_results=step_results,
+                run_id=run_id
+            )
+    
+    def _execute_dag(
+        self,
+        chain: ContentCreationChain,
+        input_data: str,
+        manifest: Optional[RunManifest] = None,
+        **kwargs
+    ) -> ChainResult:
+        """
+        Execute a chain whose steps declare ``depends_on`` relationships.
+        
+        Independent steps run concurrently as soon as their inputs exist.
+        
+        Args:
+            chain: ContentCreationChain to execute
+            input_data: Initial input data for steps without dependencies
+            manifest: Run manifest for checkpointing and resumption
+            **kwargs: Additional execution parameters
+            
+        Returns:
+            ChainResult with execution results
+        """
+        from .dag_scheduler import DAGScheduler
+        
+        start_time = time.time()
+        enabled_steps = chain.get_enabled_steps()
+        step_ids = chain.get_step_ids()
+        outputs = {}
+        run_id = manifest.run_id if manifest else None
+        
+        checkpoints = {}
+        on_step_complete = None
+        if manifest:
+            for i in range(len(enabled_steps)):
+                checkpoint = manifest.get_checkpoint(i)
+                if checkpoint:
+                    checkpoints[i] = checkpoint
+            
+            on_step_complete = lambda i, *outcome: manifest.record_step(i, step_ids[i], *outcome)
+        
+        print(f"🎬 Starting dependency-graph execution: {len(enabled_steps)} steps")
+        
+        try:
+            scheduler = DAGScheduler(
+                self,
+                max_workers=chain.config.get("max_parallel_steps", DEFAULT_MAX_PARALLEL_STEPS)
+            )
+            run = scheduler.execute(
+                chain, input_data,
+                checkpoints=checkpoints,
+                on_step_complete=on_step_complete,
+                **kwargs
+            )
+        except Exception as e:
+            print(f"❌ Chain execution failed: {str(e)}")
+            self._finish_manifest(manifest, False, f"Execution error: {str(e)}")
+            return ChainResult(
+                success=False,
+                steps_completed=0,
+                total_steps=len(enabled_steps),
+                total_cost=0.0,
+                total_time=time.time() - start_time,
+                outputs=outputs,
+                error=f"Execution error: {str(e)}",
+                step_results=[],
+                run_id=run_id
+            )
+        
+        step_results = run["step_results"]
+        total_cost = sum(result.get("cost", 0.0) or 0.0 for result in step_results)
+        
+        # Store outputs in completion order, named like the sequential path
+        for i in run["completion_order"]:
+            step = enabled_steps[i]
+            step_result = step_results[i]
+            if not step_result.get("success", False):
+                continue
+            
+            step_name = f"step_{i+1}_{step.step_type.value}"
+            
+            if chain.save_intermediates and step_result.get("output_url") and not step_result.get("output_path"):
+                local_path = self._download_intermediate_image(
+                    image_url=step_result["output_url"],
+                    step_name=step_name,
+                    config=chain.config,
+                    step_number=i+1
+                )
+                if local_path:
+                    step_result["output_path"] = local_path
+            
+            outputs[step_name] = {
+                "step_id": step_ids[i],
+                "path": step_result.get("output_path"),
+                "url": step_result.get("output_url"),
+                "text": step_result.get("output_text"),
+                "model": step.model,
+                "metadata": step_result.get("metadata", {})
+            }
+            
+            if step.step_type == StepType.PROMPT_GENERATION:
+                outputs[step_name]["optimized_prompt"] = step_result.get("extracted_prompt")
+                outputs[step_name]["full_analysis"] = step_result.get("output_text")
+        
+        total_time = time.time() - start_time
+        steps_completed = len([r for r in step_results if r.get("success", False)])
+        success = run["failed_step"] is None
+        error = None
+        
+        if success:
+            print(f"\n🎉 Chain completed successfully!")
+        else:
+            failed = run["failed_step"]
+            error = f"Step {failed+1} ({step_ids[failed]}) failed: {run['error']}"
+            print(f"❌ {error}")
+        
+        print(f"⏱️  Total time: {total_time:.1f}s")
+        print(f"💰 Total cost: ${total_cost:.3f}")
+        
+        execution_report = self._create_execution_report(
+            chain=chain,
+            input_data=input_data,
+            step_results=step_results,
+            outputs=outputs,
+            total_cost=total_cost,
+            total_time=total_time,
+            success=success,
+            error=error
+        )
+        report_path = self._save_execution_report(execution_report, chain.config)
+        if report_path:
+            print(f"📄 {'Execution' if success else 'Failure'} report saved: {report_path}")
+        
+        self._finish_manifest(manifest, success, error)
+        
+        return ChainResult(
+            success=success,
+            steps_completed=steps_completed,
+            total_steps=len(enabled_steps),
+            total_cost=total_cost,
+            total_time=total_time,
+            outputs=outputs,
+            error=error,
+            step_results=step_results,
+            run_id=run_id
+        )
+    
+    def _open_manifest(
+        self,
+        chain: ContentCreationChain,
+        input_data: Any,
+        resume: Optional[str] = None
+    ) -> Optional[RunManifest]:
+        """
+        Create a run manifest, or load the one of the run being resumed.
+        
+        Returns:
+            RunManifest, or None if a new manifest could not be written
+            
+        Raises:
+            FileNotFoundError: If the resumed run has no manifest
+            ValueError: If the chain or input changed since the resumed run
+        """
+        if resume:
+            manifest = RunManifest.load(resume, chain, input_data, self.file_manager)
+            print(f"🔁 Resuming run: {manifest.run_id} ({len(manifest.data['steps'])} steps checkpointed)")
+            return manifest
+        
+        try:
+            manifest = RunManifest.create(chain, input_data, self.file_manager)
+            print(f"🧾 Run ID: {manifest.run_id}")
+            return manifest
+        except OSError as e:
+            print(f"⚠️  Failed to create run manifest, run will not be resumable: {e}")
+            return None
+    
+    def _finish_manifest(self, manifest: Optional[RunManifest], success: bool, error: Optional[str] = None):
+        """Record the final status of a run and explain how to resume it."""
+        if not manifest:
+            return
+        try:
+            manifest.finish(success, error)
+        except OSError as e:
+            print(f"⚠️  Failed to update run manifest: {e}")
+    
+    def _run_step(
+        self,
+        step: PipelineStep,
+        input_data: Any,
+        input_type: str,
+        chain_config: Dict[str, Any],
+        step_context: Dict[str, Any],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Run a step, routing parallel groups through the parallel extension when enabled."""
+        parallel_extension = (self._get_parallel_extension()
+                              if step.step_type == StepType.PARALLEL_GROUP else None)
+        if (parallel_extension and 
+            parallel_extension.can_execute_parallel(step)):
+            return parallel_extension.execute_parallel_group(
+                step=step,
+                input_data=input_data,
+                input_type=input_type,
+                chain_config=chain_config,
+                step_context=step_context
             )
+        
+        return self._execute_step(
+            step=step,
+            input_data=input_data,
+            input_type=input_type,
+            chain_config=chain_config,
+            step_context=step_context,
+            **kwargs
+        )
     
     def _execute_step(
         self,
@@ -1066,6 +1315,7 @@ class ChainExecutor:
             StepType.PROMPT_GENERATION: "text",
             StepType.IMAGE_TO_IMAGE: "image",
             StepType.IMAGE_TO_VIDEO: "video",
+            StepType.TEXT_TO_SPEECH: "audio",
             StepType.ADD_AUDIO: "video",
             StepType.UPSCALE_VIDEO: "video",
             StepType.GENERATE_SUBTITLES: "video"
@@ -1179,7 +1429,8 @@ class ChainExecutor:
                     for i, (step, step_result) in enumerate(zip(chain.get_enabled_steps(), step_results))
                 ],
                 "total_time_seconds": round(total_time, 2),
-                "average_time_per_step": round(total_time / len(step_results) if step_results else 0, 2)
+                "average_time_per_step": round(total_time / len(step_results) if step_results else 0, 2),
+                "generator_init_seconds": get_generator_init_times(self)
             },
             "metadata": {
                 "chain_config": chain.to_config(),
@@ -1295,6 +1546,16 @@ class ChainExecutor:
             print(f"⚠️  Failed to save intermediate report: {str(e)}")
             return None
     
+    @staticmethod
+    def _get_download_manager():
+        """Get the shared download manager from the repository's fal_common package."""
+        import sys
+        repo_root = str(Path(__file__).resolve().parents[3])
+        if repo_root not in sys.path:
+            sys.path.append(repo_root)
+        from fal_common import get_default_download_manager
+        return get_default_download_manager()
+    
     def _download_intermediate_image(
         self, 
         image_url: str, 
@@ -1326,15 +1587,9 @@ class ChainExecutor:
             filename = f"{step_name}_{timestamp}{file_extension}"
             filepath = intermediates_dir / filename
             
-            # Download image
+            # Download image through the pooled manager shared with the generators
             print(f"📥 Downloading intermediate image: {step_name}")
-            response = requests.get(image_url, timeout=30, stream=True)
-            response.raise_for_status()
-            
-            # Save to file
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            self._get_download_manager().download(image_url, filepath)
             
             print(f"💾 Intermediate image saved: {filepath}")
             return str(filepath)
@@ -0,0 +1,63 @@
+"""
+Lazily created model generators.
+
+Creating a unified generator is expensive: it extends ``sys.path``, imports
+its backend SDK and builds API clients. ``LazyGenerator`` defers all of that
+until a step first uses the generator. A one-step chain or ``list-models``
+only pays for the generators it touches.
+"""
+
+import importlib
+import threading
+import time
+from typing import Any, Dict
+
+
+class LazyGenerator:
+    """Class attribute that imports and creates a generator on first access.
+
+    The instance is cached in the owner's ``__dict__``, so later accesses are
+    plain attribute lookups. Time spent importing and initializing is
+    recorded in the owner's ``generator_init_times``.
+
+    Example:
+        class ChainExecutor:
+            text_to_image = LazyGenerator("..models.text_to_image", "UnifiedTextToImageGenerator")
+    """
+
+    def __init__(self, module: str, class_name: str):
+        """
+        Args:
+            module: Module path, relative to this package if it starts with '.'
+            class_name: Generator class in that module
+        """
+        self.module = module
+        self.class_name = class_name
+        self.name = class_name
+        self._lock = threading.Lock()
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with self._lock:
+            # Another thread may have created it while we waited
+            if self.name in instance.__dict__:
+                return instance.__dict__[self.name]
+
+            start = time.perf_counter()
+            module = importlib.import_module(self.module, package=__package__)
+            generator = getattr(module, self.class_name)()
+            elapsed = time.perf_counter() - start
+
+            instance.__dict__[self.name] = generator
+            instance.__dict__.setdefault("generator_init_times", {})[self.name] = round(elapsed, 3)
+            print(f"⏱️  {self.name} generator ready in {elapsed:.2f}s")
+            return generator
+
+
+def get_generator_init_times(instance: Any) -> Dict[str, float]:
+    """Seconds spent creating each generator of an instance so far."""
+    return dict(getattr(instance, "generator_init_times", {}))
@@ -13,12 +13,30 @@ from typing import Dict, Any, List, Optional, Union
 
 from .chain import ContentCreationChain, ChainResult, PipelineStep, StepType
 from .executor import ChainExecutor
+from ..utils.file_manager import FileManager
+from ..config.constants import SUPPORTED_MODELS, DEFAULT_CHAIN_CONFIG
 from ..models.text_to_image import UnifiedTextToImageGenerator
 from ..models.image_understanding import UnifiedImageUnderstandingGenerator
 from ..models.prompt_generation import UnifiedPromptGenerator
 from ..models.image_to_image import UnifiedImageToImageGenerator
-from ..utils.file_manager import FileManager
-from ..config.constants import SUPPORTED_MODELS, DEFAULT_CHAIN_CONFIG
+
+
+def list_available_models() -> Dict[str, List[str]]:
+    """
+    Get all available models by step type without creating any generator.
+    
+    Model lists are read from the generator classes and SUPPORTED_MODELS, so
+    listing models costs no SDK imports or API client setup.
+    """
+    return {
+        "text_to_image": list(UnifiedTextToImageGenerator.FAL_MODELS),
+        "image_understanding": list(UnifiedImageUnderstandingGenerator.MODELS),
+        "prompt_generation": list(UnifiedPromptGenerator.MODELS),
+        "image_to_image": list(UnifiedImageToImageGenerator.MODELS),
+        "image_to_video": SUPPORTED_MODELS.get("image_to_video", []),
+        "add_audio": SUPPORTED_MODELS.get("add_audio", []),
+        "upscale_video": SUPPORTED_MODELS.get("upscale_video", []),
+    }
 
 
 class AIPipelineManager:
@@ -43,18 +61,29 @@ class AIPipelineManager:
         self.file_manager = FileManager(self.base_dir)
         self.executor = ChainExecutor(self.file_manager)
         
-        # Initialize model generators
-        self.text_to_image = UnifiedTextToImageGenerator()
-        self.image_understanding = UnifiedImageUnderstandingGenerator()
-        self.prompt_generation = UnifiedPromptGenerator()
-        self.image_to_image = UnifiedImageToImageGenerator()
-        
         # Create directories
         self.output_dir.mkdir(exist_ok=True)
         self.temp_dir.mkdir(exist_ok=True)
         
         print(f"✅ AI Pipeline Manager initialized (base: {self.base_dir})")
     
+    # Model generators are shared with the executor and created on first use
+    @property
+    def text_to_image(self):
+        return self.executor.text_to_image
+    
+    @property
+    def image_understanding(self):
+        return self.executor.image_understanding
+    
+    @property
+    def prompt_generation(self):
+        return self.executor.prompt_generation
+    
+    @property
+    def image_to_image(self):
+        return self.executor.image_to_image
+    
     def create_chain_from_config(self, config_path: str) -> ContentCreationChain:
         """
         Create a content creation chain from configuration file.
@@ -240,27 +269,8 @@ class AIPipelineManager:
         return 0.0
     
     def get_available_models(self) -> Dict[str, List[str]]:
-        """Get all available models by step type."""
-        available = {}
-        
-        # Text-to-image models
-        available["text_to_image"] = self.text_to_image.get_available_models()
-        
-        # Image understanding models
-        available["image_understanding"] = self.image_understanding.get_available_models()
-        
-        # Prompt generation models
-        available["prompt_generation"] = self.prompt_generation.get_available_models()
-        
-        # Image-to-image models
-        available["image_to_image"] = self.image_to_image.get_available_models()
-        
-        # TODO: Add other model types when implemented
-        available["image_to_video"] = SUPPORTED_MODELS.get("image_to_video", [])
-        available["add_audio"] = SUPPORTED_MODELS.get("add_audio", [])
-        available["upscale_video"] = SUPPORTED_MODELS.get("upscale_video", [])
-        
-        return available
+        """Get all available models by step type (see list_available_models)."""
+        return list_available_models()
     
     def create_example_configs(self, output_dir: str = None):
         """
@@ -0,0 +1,187 @@
+"""
+Run manifests for resumable chain execution.
+
+Every chain run writes a manifest to ``<output_dir>/runs/<run_id>.json``
+recording the outputs and ``step_context`` of each completed step. Passing
+the run id back to ``ChainExecutor.execute(..., resume=run_id)`` (or
+``run-chain --resume <run_id>`` on the CLI) skips the checkpointed steps
+whose artifacts still exist and continues from the first step that has not
+completed.
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .chain import ContentCreationChain
+
+
+class RunManifest:
+    """
+    Checkpoint file for one execution of a content creation chain.
+
+    Steps are keyed by their index among the chain's enabled steps. Each
+    checkpoint stores the step result together with the data, type and
+    context that the following steps consume.
+    """
+
+    def __init__(self, path: Path, data: Dict[str, Any]):
+        """
+        Initialize a manifest.
+
+        Args:
+            path: JSON file backing the manifest
+            data: Manifest contents
+        """
+        self.path = Path(path)
+        self.data = data
+
+    @property
+    def run_id(self) -> str:
+        """Identifier used to resume this run."""
+        return self.data["run_id"]
+
+    @staticmethod
+    def runs_dir(chain: ContentCreationChain) -> Path:
+        """Directory holding the manifests of a chain's runs."""
+        return Path(chain.config.get("output_dir", "output")) / "runs"
+
+    @staticmethod
+    def fingerprint(chain: ContentCreationChain, file_manager) -> str:
+        """Hash of the chain's step configuration, used to reject stale resumes."""
+        steps = [step.to_dict() for step in chain.get_enabled_steps()]
+        return file_manager.hash_content(json.dumps(steps, sort_keys=True, default=str))
+
+    @classmethod
+    def create(cls, chain: ContentCreationChain, input_data: Any, file_manager) -> "RunManifest":
+        """
+        Start a manifest for a new run.
+
+        Args:
+            chain: Chain being executed
+            input_data: Initial chain input
+            file_manager: FileManager used for hashing
+
+        Returns:
+            New RunManifest (already saved)
+        """
+        run_id = f"{chain.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        now = datetime.now().isoformat()
+        manifest = cls(cls.runs_dir(chain) / f"{run_id}.json", {
+            "run_id": run_id,
+            "chain_name": chain.name,
+            "chain_fingerprint": cls.fingerprint(chain, file_manager),
+            "input_data": input_data,
+            "status": "running",
+            "created_at": now,
+            "updated_at": now,
+            "steps": {}
+        })
+        manifest.save()
+        return manifest
+
+    @classmethod
+    def load(cls, run_id: str, chain: ContentCreationChain, input_data: Any, file_manager) -> "RunManifest":
+        """
+        Load the manifest of an earlier run for resumption.
+
+        Args:
+            run_id: Run id (or path to a manifest file)
+            chain: Chain being executed; must match the original configuration
+            input_data: Initial chain input; must match the original input
+            file_manager: FileManager used for hashing
+
+        Returns:
+            RunManifest of the earlier run
+
+        Raises:
+            FileNotFoundError: If no manifest exists for the run id
+            ValueError: If the chain configuration or input changed
+        """
+        path = Path(run_id)
+        if not path.is_file():
+            path = cls.runs_dir(chain) / f"{run_id}.json"
+        if not path.is_file():
+            raise FileNotFoundError(f"No run manifest found for '{run_id}' in {cls.runs_dir(chain)}")
+
+        with open(path, 'r') as f:
+            manifest = cls(path, json.load(f))
+
+        if manifest.data.get("chain_fingerprint") != cls.fingerprint(chain, file_manager):
+            raise ValueError(f"Chain configuration changed since run '{manifest.run_id}'; cannot resume")
+        if manifest.data.get("input_data") != input_data:
+            raise ValueError(f"Input differs from run '{manifest.run_id}'; cannot resume")
+
+        manifest.data["status"] = "running"
+        manifest.data["resumed_at"] = datetime.now().isoformat()
+        manifest.save()
+        return manifest
+
+    def record_step(
+        self,
+        index: int,
+        step_id: str,
+        step_result: Dict[str, Any],
+        output_data: Any,
+        output_type: str,
+        output_context: Dict[str, Any]
+    ):
+        """
+        Checkpoint a completed step and save the manifest.
+
+        Args:
+            index: Index of the step among enabled steps
+            step_id: Step identifier
+            step_result: Result dictionary returned by the step
+            output_data: Data passed on to dependent steps
+            output_type: Type of ``output_data``
+            output_context: ``step_context`` after the step
+        """
+        self.data["steps"][str(index)] = {
+            "step_id": step_id,
+            "completed_at": datetime.now().isoformat(),
+            "result": step_result,
+            "output_data": output_data,
+            "output_type": output_type,
+            "output_context": output_context
+        }
+        self.save()
+
+    def get_checkpoint(self, index: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a step checkpoint whose artifacts still exist.
+
+        Args:
+            index: Index of the step among enabled steps
+
+        Returns:
+            Checkpoint dictionary, or None if the step must run again
+        """
+        checkpoint = self.data["steps"].get(str(index))
+        if not checkpoint:
+            return None
+
+        output_path = checkpoint["result"].get("output_path")
+        if output_path and not os.path.exists(output_path):
+            print(f"⚠️  Artifact of {checkpoint['step_id']} is missing ({output_path}); re-running step")
+            return None
+
+        return checkpoint
+
+    def finish(self, success: bool, error: Optional[str] = None):
+        """Mark the run as completed or failed and save."""
+        self.data["status"] = "completed" if success else "failed"
+        self.data["error"] = error
+        self.save()
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.data["updated_at"] = datetime.now().isoformat()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(self.data, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(tmp_path, self.path)
@@ -296,4 +296,8 @@ def _validate_step_config(step: dict, step_index: int) -> List[str]:
     if "params" in step and not isinstance(step["params"], dict):
         errors.append(f"{step_prefix}: 'params' must be a dictionary")
     
+    # Validate dependency declarations if present
+    if "depends_on" in step and not isinstance(step["depends_on"], (str, list)):
+        errors.append(f"{step_prefix}: 'depends_on' must be a step id or a list of step ids")
+    
     return errors
\ No newline at end of file
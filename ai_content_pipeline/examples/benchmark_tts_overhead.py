@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-utterance overhead of subprocess vs in-process TTS
+
+Measures the client-side cost of one text-to-speech call, excluding the time
+ElevenLabs spends synthesizing audio. A local HTTP server stands in for the
+API and answers instantly, so the numbers show pure overhead:
+
+- subprocess: what the pipeline used to do per utterance - start a new Python
+  interpreter, import the text_to_speech wrapper and send the request over a
+  fresh connection
+- in-process: UnifiedTextToSpeechGenerator with its long-lived controller and
+  pooled keep-alive session
+
+Usage:
+    python examples/benchmark_tts_overhead.py [--utterances 20]
+"""
+
+import argparse
+import http.server
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+PIPELINE_DIR = Path(__file__).resolve().parent.parent
+TTS_DIR = PIPELINE_DIR.parent / "text_to_speech"
+sys.path.insert(0, str(PIPELINE_DIR))
+
+from ai_content_pipeline.models.text_to_speech import UnifiedTextToSpeechGenerator
+
+
+class FakeElevenLabsHandler(http.server.BaseHTTPRequestHandler):
+    """Answers every text-to-speech request with a tiny MP3 payload."""
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment so keep-alive calls are not
+    # held back by delayed ACKs
+    wbufsize = 65536
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        body = b"ID3" + b"\x00" * 1024
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+SUBPROCESS_SNIPPET = """
+import sys, requests
+sys.path.insert(0, {tts_dir!r})
+from examples.tts_cli_wrapper import tts_pipeline_generate
+response = requests.post({url!r}, json={{"text": "hello"}}, timeout=30)
+open({output!r}, "wb").write(response.content)
+"""
+
+
+def time_calls(fn, count):
+    """Run fn count times and return per-call durations in milliseconds."""
+    durations = []
+    for i in range(count):
+        start = time.perf_counter()
+        fn(i)
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TTS per-utterance overhead")
+    parser.add_argument("--utterances", type=int, default=20, help="Calls per mode (default: 20)")
+    args = parser.parse_args()
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FakeElevenLabsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}/v1"
+    output_dir = tempfile.mkdtemp(prefix="tts_bench_")
+    os.environ.setdefault("ELEVENLABS_API_KEY", "dummy_benchmark_key_0000000000")
+
+    print("🎤 TTS overhead benchmark")
+    print(f"   Utterances per mode: {args.utterances}")
+
+    def subprocess_call(i):
+        code = SUBPROCESS_SNIPPET.format(
+            tts_dir=str(TTS_DIR),
+            url=f"{base_url}/text-to-speech/voice",
+            output=os.path.join(output_dir, f"sub_{i}.mp3")
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, cwd=str(TTS_DIR))
+
+    generator = UnifiedTextToSpeechGenerator()
+    generator._get_controller().base_url = base_url
+
+    def in_process_call(i):
+        success, result = generator.generate(
+            "hello", output_file=os.path.join(output_dir, f"inproc_{i}.mp3")
+        )
+        if not success:
+            raise RuntimeError(result["error"])
+
+    results = {
+        "subprocess": time_calls(subprocess_call, args.utterances),
+        "in-process": time_calls(in_process_call, args.utterances)
+    }
+
+    print(f"\n{'mode':<12} {'mean ms':>10} {'median ms':>10} {'p95 ms':>10}")
+    for mode, durations in results.items():
+        p95 = sorted(durations)[max(0, int(len(durations) * 0.95) - 1)]
+        print(f"{mode:<12} {statistics.mean(durations):>10.1f} {statistics.median(durations):>10.1f} {p95:>10.1f}")
+
+    speedup = statistics.mean(results["subprocess"]) / statistics.mean(results["in-process"])
+    print(f"\n⚡ In-process overhead is {speedup:.0f}x lower per utterance")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
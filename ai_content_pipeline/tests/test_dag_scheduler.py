@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Tests for dependency-aware (DAG) chain execution.
+
+Steps are executed through a stubbed executor, so no API calls are made.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ai_content_pipeline.pipeline.chain import ContentCreationChain, PipelineStep, StepType
+from ai_content_pipeline.pipeline.dag_scheduler import DAGScheduler
+from ai_content_pipeline.pipeline.executor import ChainExecutor
+from ai_content_pipeline.utils.file_manager import FileManager
+
+
+def make_branching_chain(output_dir: str) -> ContentCreationChain:
+    """text_to_image feeding a TTS branch and an image-to-video branch."""
+    return ContentCreationChain.from_config({
+        "name": "branching_chain",
+        "output_dir": output_dir,
+        "steps": [
+            {"id": "image", "type": "text_to_image", "model": "flux_dev"},
+            {"id": "prompt", "type": "prompt_generation", "model": "openrouter_video_cinematic",
+             "depends_on": ["image"]},
+            {"id": "video", "type": "image_to_video", "model": "hailuo", "depends_on": ["prompt"]},
+            {"id": "speech", "type": "text_to_speech", "model": "elevenlabs",
+             "params": {"text_override": "Narration"}, "depends_on": "image"},
+        ]
+    })
+
+
+class StubExecutor(ChainExecutor):
+    """ChainExecutor whose steps sleep briefly instead of calling APIs."""
+
+    def __init__(self, file_manager: FileManager, fail_type: StepType = None, delay: float = 0.2):
+        self.file_manager = file_manager
+        self._parallel_extension = None
+        self.fail_type = fail_type
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _execute_step(self, step, input_data, input_type, chain_config, step_context=None, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append((step.step_type, input_data, input_type, dict(step_context or {})))
+        try:
+            time.sleep(self.delay)
+            if step.step_type == self.fail_type:
+                return {"success": False, "error": "boom"}
+            if step.step_type == StepType.PROMPT_GENERATION:
+                return {"success": True, "output_text": "analysis", "extracted_prompt": "slow pan",
+                        "processing_time": self.delay, "cost": 0.01}
+            return {"success": True, "output_path": f"{step.step_type.value}.out",
+                    "processing_time": self.delay, "cost": 0.01}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestDependencyChains(unittest.TestCase):
+    """Test chain-level dependency parsing and validation."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_depends_on_round_trip(self):
+        """Test id/depends_on survive from_dict/to_dict."""
+        step = PipelineStep.from_dict({"id": "tts", "type": "text_to_speech", "model": "elevenlabs",
+                                       "depends_on": "image"})
+        self.assertEqual(step.depends_on, ["image"])
+        data = step.to_dict()
+        self.assertEqual(data["id"], "tts")
+        self.assertEqual(data["depends_on"], ["image"])
+
+    def test_sequential_steps_serialize_unchanged(self):
+        """Test steps without dependencies keep their original dictionary form."""
+        step = PipelineStep(StepType.TEXT_TO_IMAGE, "flux_dev", {})
+        self.assertNotIn("depends_on", step.to_dict())
+        self.assertNotIn("id", step.to_dict())
+
+    def test_execution_levels(self):
+        """Test independent branches share a level."""
+        chain = make_branching_chain(self.temp_dir)
+        self.assertTrue(chain.has_dependencies())
+        self.assertEqual(chain.get_execution_levels(), [[0], [1, 3], [2]])
+        self.assertEqual(chain.validate(), [])
+
+    def test_cycle_detected(self):
+        """Test dependency cycles are reported by validation."""
+        chain = ContentCreationChain.from_config({
+            "steps": [
+                {"id": "a", "type": "image_to_image", "model": "photon", "depends_on": ["b"]},
+                {"id": "b", "type": "image_to_image", "model": "photon", "depends_on": ["a"]},
+            ]
+        })
+        errors = chain.validate()
+        self.assertEqual(len(errors), 1)
+        self.assertIn("cycle", errors[0].lower())
+
+    def test_unknown_dependency(self):
+        """Test references to missing steps are reported."""
+        chain = ContentCreationChain.from_config({
+            "steps": [
+                {"id": "a", "type": "text_to_image", "model": "flux_dev"},
+                {"id": "b", "type": "image_to_video", "model": "hailuo", "depends_on": ["missing"]},
+            ]
+        })
+        self.assertIn("unknown step 'missing'", chain.validate()[0])
+
+    def test_type_mismatch_against_dependency(self):
+        """Test a step is checked against the output of its first dependency."""
+        chain = ContentCreationChain.from_config({
+            "steps": [
+                {"id": "a", "type": "text_to_image", "model": "flux_dev"},
+                {"id": "b", "type": "upscale_video", "model": "topaz", "depends_on": ["a"]},
+            ]
+        })
+        errors = chain.validate()
+        self.assertEqual(len(errors), 1)
+        self.assertIn("expects video", errors[0])
+
+
+class TestDAGExecution(unittest.TestCase):
+    """Test concurrent execution through ChainExecutor."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_manager = FileManager(self.temp_dir)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_independent_branches_run_concurrently(self):
+        """Test the TTS branch overlaps the prompt/video branch."""
+        executor = StubExecutor(self.file_manager)
+        chain = make_branching_chain(self.temp_dir)
+
+        result = executor.execute(chain, "a lighthouse at dusk")
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(result.steps_completed, 4)
+        self.assertEqual(executor.max_active, 2)
+        # Three levels of 0.2s each rather than four sequential steps
+        self.assertLess(result.total_time, 0.75)
+        self.assertEqual(set(result.outputs), {
+            "step_1_text_to_image", "step_2_prompt_generation",
+            "step_3_image_to_video", "step_4_text_to_speech"
+        })
+
+    def test_inputs_and_context_follow_dependencies(self):
+        """Test dependents receive their dependency's output and generated prompt."""
+        executor = StubExecutor(self.file_manager, delay=0.01)
+        executor.execute(make_branching_chain(self.temp_dir), "a lighthouse at dusk")
+
+        calls = {call[0]: call for call in executor.calls}
+        self.assertEqual(calls[StepType.TEXT_TO_IMAGE][1], "a lighthouse at dusk")
+        self.assertEqual(calls[StepType.PROMPT_GENERATION][1], "text_to_image.out")
+        # Prompt generation passes the image through and adds the prompt to the context
+        self.assertEqual(calls[StepType.IMAGE_TO_VIDEO][1], "text_to_image.out")
+        self.assertEqual(calls[StepType.IMAGE_TO_VIDEO][2], "image")
+        self.assertEqual(calls[StepType.IMAGE_TO_VIDEO][3], {"generated_prompt": "slow pan"})
+        self.assertEqual(calls[StepType.TEXT_TO_SPEECH][3], {})
+
+    def test_failure_skips_unstarted_steps(self):
+        """Test a failed step stops scheduling of its dependents."""
+        executor = StubExecutor(self.file_manager, fail_type=StepType.PROMPT_GENERATION, delay=0.01)
+        result = executor.execute(make_branching_chain(self.temp_dir), "a lighthouse at dusk")
+
+        self.assertFalse(result.success)
+        self.assertIn("prompt", result.error)
+        self.assertTrue(result.step_results[2].get("skipped"))
+        self.assertNotIn(StepType.IMAGE_TO_VIDEO, [call[0] for call in executor.calls])
+
+    def test_max_workers_bounds_concurrency(self):
+        """Test max_workers limits how many ready steps run at once."""
+        executor = StubExecutor(self.file_manager, delay=0.05)
+        chain = ContentCreationChain.from_config({
+            "steps": [{"id": "root", "type": "text_to_image", "model": "flux_dev"}] + [
+                {"id": f"v{i}", "type": "image_to_video", "model": "hailuo", "depends_on": ["root"]}
+                for i in range(4)
+            ]
+        })
+
+        run = DAGScheduler(executor, max_workers=2).execute(chain, "prompt")
+
+        self.assertIsNone(run["failed_step"])
+        self.assertEqual(executor.max_active, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for on-demand generator creation in ChainExecutor and AIPipelineManager.
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ai_content_pipeline.pipeline.chain import PipelineStep, StepType
+from ai_content_pipeline.pipeline.executor import ChainExecutor
+from ai_content_pipeline.pipeline.manager import AIPipelineManager
+from ai_content_pipeline.utils.file_manager import FileManager
+
+GENERATORS = ("text_to_image", "image_understanding", "prompt_generation",
+              "image_to_image", "text_to_speech")
+
+
+class TestLazyGenerators(unittest.TestCase):
+    """Test generators are created on first use only."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_executor_creates_nothing_up_front(self):
+        executor = ChainExecutor(FileManager(self.temp_dir))
+        for name in GENERATORS:
+            self.assertNotIn(name, executor.__dict__)
+        self.assertIsNone(executor._parallel_extension)
+        self.assertFalse(executor._parallel_extension_loaded)
+
+    def test_generator_created_once_and_timed(self):
+        executor = ChainExecutor(FileManager(self.temp_dir))
+        generator = executor.image_to_image
+
+        self.assertIs(executor.image_to_image, generator)
+        self.assertEqual(type(generator).__name__, "UnifiedImageToImageGenerator")
+        self.assertEqual(set(executor.generator_init_times), {"image_to_image"})
+        self.assertNotIn("text_to_image", executor.__dict__)
+
+    def test_manager_shares_executor_generators(self):
+        manager = AIPipelineManager(self.temp_dir)
+        self.assertIs(manager.image_to_image, manager.executor.image_to_image)
+        self.assertNotIn("prompt_generation", manager.executor.__dict__)
+
+    def test_listing_models_creates_no_generator(self):
+        manager = AIPipelineManager(self.temp_dir)
+        available = manager.get_available_models()
+
+        self.assertIn("flux_dev", available["text_to_image"])
+        self.assertIn("photon_flash", available["image_to_image"])
+        for name in GENERATORS:
+            self.assertNotIn(name, manager.executor.__dict__)
+
+    def test_parallel_extension_loaded_by_first_parallel_group(self):
+        executor = ChainExecutor(FileManager(self.temp_dir))
+        executor._execute_step = lambda **kwargs: {"success": True}
+
+        step = PipelineStep(step_type=StepType.TEXT_TO_SPEECH, model="elevenlabs", params={})
+        executor._run_step(step, "text", "text", {}, {})
+        self.assertFalse(executor._parallel_extension_loaded)
+
+        group = PipelineStep(step_type=StepType.PARALLEL_GROUP, model="parallel",
+                             params={"parallel_steps": []})
+        executor._run_step(group, "text", "text", {}, {})
+        self.assertTrue(executor._parallel_extension_loaded)
+        self.assertIsNotNone(executor._parallel_extension)
+
+
+if __name__ == "__main__":
+    unittest.main()
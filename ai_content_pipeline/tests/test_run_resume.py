@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for checkpointed run manifests and resumed chain execution.
+
+Steps are executed through a stubbed executor, so no API calls are made.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ai_content_pipeline.pipeline.chain import ContentCreationChain, StepType
+from ai_content_pipeline.pipeline.executor import ChainExecutor
+from ai_content_pipeline.utils.file_manager import FileManager
+
+
+class StubExecutor(ChainExecutor):
+    """ChainExecutor whose steps write small files instead of calling APIs."""
+
+    def __init__(self, file_manager: FileManager, output_dir: str, fail_type: StepType = None):
+        self.file_manager = file_manager
+        self._parallel_extension = None
+        self.output_dir = output_dir
+        self.fail_type = fail_type
+        self.calls = []
+
+    def _execute_step(self, step, input_data, input_type, chain_config, step_context=None, **kwargs):
+        self.calls.append(step.step_type)
+        if step.step_type == self.fail_type:
+            return {"success": False, "error": "boom"}
+        path = os.path.join(self.output_dir, f"{step.step_type.value}_{len(self.calls)}.out")
+        with open(path, "w") as f:
+            f.write(str(input_data))
+        return {"success": True, "output_path": path, "processing_time": 0.0, "cost": 0.5}
+
+
+class TestRunResume(unittest.TestCase):
+    """Test resuming sequential and dependency-graph chains."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_manager = FileManager(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_chain(self, steps):
+        return ContentCreationChain.from_config({
+            "name": "resume_chain",
+            "output_dir": self.temp_dir,
+            "steps": steps
+        })
+
+    def sequential_chain(self):
+        return self.make_chain([
+            {"type": "text_to_image", "model": "flux_dev"},
+            {"type": "image_to_image", "model": "photon"},
+            {"type": "image_to_video", "model": "hailuo"},
+        ])
+
+    def test_manifest_records_completed_steps(self):
+        """Test every successful step is checkpointed with its output."""
+        executor = StubExecutor(self.file_manager, self.temp_dir, fail_type=StepType.IMAGE_TO_VIDEO)
+        result = executor.execute(self.sequential_chain(), "a lighthouse")
+
+        self.assertFalse(result.success)
+        manifest_path = Path(self.temp_dir) / "runs" / f"{result.run_id}.json"
+        with open(manifest_path) as f:
+            data = json.load(f)
+        self.assertEqual(data["status"], "failed")
+        self.assertEqual(sorted(data["steps"]), ["0", "1"])
+        self.assertEqual(data["steps"]["1"]["output_type"], "image")
+
+    def test_resume_skips_completed_steps(self):
+        """Test a resumed run only executes the steps that did not complete."""
+        failing = StubExecutor(self.file_manager, self.temp_dir, fail_type=StepType.IMAGE_TO_VIDEO)
+        first = failing.execute(self.sequential_chain(), "a lighthouse")
+
+        executor = StubExecutor(self.file_manager, self.temp_dir)
+        result = executor.execute(self.sequential_chain(), "a lighthouse", resume=first.run_id)
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(executor.calls, [StepType.IMAGE_TO_VIDEO])
+        self.assertEqual(result.total_cost, 0.5)
+        self.assertTrue(result.step_results[0]["resumed"])
+        self.assertEqual(result.run_id, first.run_id)
+
+    def test_missing_artifact_reruns_downstream(self):
+        """Test a deleted artifact re-runs its step and everything after it."""
+        first = StubExecutor(self.file_manager, self.temp_dir).execute(self.sequential_chain(), "a lighthouse")
+        os.remove(first.step_results[1]["output_path"])
+
+        executor = StubExecutor(self.file_manager, self.temp_dir)
+        executor.execute(self.sequential_chain(), "a lighthouse", resume=first.run_id)
+
+        self.assertEqual(executor.calls, [StepType.IMAGE_TO_IMAGE, StepType.IMAGE_TO_VIDEO])
+
+    def test_resume_rejects_changed_chain(self):
+        """Test resuming with a different chain configuration fails cleanly."""
+        first = StubExecutor(self.file_manager, self.temp_dir).execute(self.sequential_chain(), "a lighthouse")
+        changed = self.make_chain([{"type": "text_to_image", "model": "imagen4"}])
+
+        executor = StubExecutor(self.file_manager, self.temp_dir)
+        result = executor.execute(changed, "a lighthouse", resume=first.run_id)
+
+        self.assertFalse(result.success)
+        self.assertIn("configuration changed", result.error)
+        self.assertEqual(executor.calls, [])
+
+    def test_resume_unknown_run(self):
+        """Test an unknown run id is reported instead of raising."""
+        result = StubExecutor(self.file_manager, self.temp_dir).execute(
+            self.sequential_chain(), "a lighthouse", resume="missing_run")
+        self.assertFalse(result.success)
+        self.assertIn("No run manifest", result.error)
+
+    def test_dag_resume(self):
+        """Test dependency-graph chains restore checkpointed branches."""
+        steps = [
+            {"id": "image", "type": "text_to_image", "model": "flux_dev"},
+            {"id": "edit", "type": "image_to_image", "model": "photon", "depends_on": ["image"]},
+            {"id": "video", "type": "image_to_video", "model": "hailuo", "depends_on": ["edit"]},
+            {"id": "speech", "type": "text_to_speech", "model": "elevenlabs",
+             "params": {"text_override": "Narration"}, "depends_on": ["image"]},
+        ]
+        failing = StubExecutor(self.file_manager, self.temp_dir, fail_type=StepType.IMAGE_TO_VIDEO)
+        first = failing.execute(self.make_chain(steps), "a lighthouse")
+        self.assertFalse(first.success)
+
+        executor = StubExecutor(self.file_manager, self.temp_dir)
+        result = executor.execute(self.make_chain(steps), "a lighthouse", resume=first.run_id)
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(executor.calls, [StepType.IMAGE_TO_VIDEO])
+        with open(Path(self.temp_dir) / "runs" / f"{first.run_id}.json") as f:
+            self.assertEqual(json.load(f)["status"], "completed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-process text-to-speech generator.
+
+The ElevenLabs controller is replaced by a stub, so no API calls are made.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory and repository root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from ai_content_pipeline.models.text_to_speech import UnifiedTextToSpeechGenerator
+from text_to_speech.models.common import ElevenLabsModel, POPULAR_VOICE_IDS
+from text_to_speech.tts import controller as tts_controller
+
+
+class StubController:
+    """Records text_to_speech calls and writes a small file instead of calling the API."""
+
+    instances = []
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.calls = []
+        StubController.instances.append(self)
+
+    def text_to_speech(self, **kwargs):
+        self.calls.append(kwargs)
+        Path(kwargs["output_file"]).write_bytes(b"mp3")
+        return True
+
+
+class TestUnifiedTextToSpeechGenerator(unittest.TestCase):
+    """Test generate() result schema, model mapping and output paths."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        StubController.instances = []
+        for patcher in (mock.patch.object(tts_controller, "ElevenLabsTTSController", StubController),
+                        mock.patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test-key"})):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.generator = UnifiedTextToSpeechGenerator()
+        self.generator.pipeline_base = Path(self.temp_dir) / "ai_content_pipeline"
+        self.generator.tts_path = Path(self.temp_dir) / "text_to_speech"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def generate(self, output_file, **kwargs):
+        success, result = self.generator.generate("Hello there.", output_file=output_file, **kwargs)
+        self.assertTrue(success, result)
+        return result
+
+    def test_result_schema(self):
+        result = self.generate("hello.mp3", voice="drew", speed=1.1)
+
+        self.assertEqual(set(result), {"output_file", "voice_used", "text_length", "model",
+                                       "settings", "processing_time"})
+        self.assertEqual(result["voice_used"], "drew")
+        self.assertEqual(result["text_length"], len("Hello there."))
+        self.assertEqual(result["model"], "elevenlabs")
+        self.assertEqual(result["settings"]["speed"], 1.1)
+
+        call = StubController.instances[0].calls[0]
+        self.assertEqual(call["voice_id"], POPULAR_VOICE_IDS["drew"])
+        self.assertEqual(call["voice_settings"].stability, 0.5)
+
+    def test_model_mapping(self):
+        """Test "elevenlabs" keeps the English v1 model of the former CLI wrapper."""
+        for model, expected in [("elevenlabs", ElevenLabsModel.MONOLINGUAL_V1),
+                                ("elevenlabs_turbo", ElevenLabsModel.TURBO_V2_5),
+                                ("elevenlabs_v3", ElevenLabsModel.ELEVEN_V3)]:
+            self.generate(f"{model}.mp3", model=model)
+            self.assertEqual(StubController.instances[0].calls[-1]["model"], expected)
+        # One controller serves every call
+        self.assertEqual(len(StubController.instances), 1)
+
+    def test_output_path_resolution(self):
+        tts_output = self.generator.tts_path / "output"
+        absolute = Path(self.temp_dir) / "elsewhere" / "abs.mp3"
+        cases = [
+            ("bare.mp3", self.generator.pipeline_base / "output" / "bare.mp3"),
+            ("clips/nested.mp3", tts_output / "clips" / "nested.mp3"),
+            ("output/direct.mp3", tts_output / "direct.mp3"),
+            (str(absolute), absolute),
+        ]
+        for output_file, expected in cases:
+            result = self.generate(output_file)
+            self.assertEqual(Path(result["output_file"]), expected)
+            self.assertTrue(expected.exists())
+
+    def test_invalid_input_makes_no_request(self):
+        success, result = self.generator.generate("Hi", voice="nobody")
+
+        self.assertFalse(success)
+        self.assertIn("Unsupported voice", result["error"])
+        self.assertEqual(StubController.instances, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,11 +19,25 @@ API Endpoints:
 """
 
 import os
+import sys
 import time
+import asyncio
 import fal_client
+from pathlib import Path
 from typing import Optional, Dict, Any, Literal
 from dotenv import load_dotenv
 
+# Shared FAL helpers live in the repository-level fal_common package
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from fal_common import (
+    DownloadManager,
+    FALJobEngine,
+    UploadCache,
+    get_default_download_manager,
+    get_default_engine,
+    get_default_upload_cache
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -48,12 +62,23 @@ class FALAvatarGenerator:
     using FAL AI's Avatar models.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        job_engine: Optional[FALJobEngine] = None,
+        download_manager: Optional[DownloadManager] = None,
+        upload_cache: Optional[UploadCache] = None
+    ):
         """
         Initialize the FAL Avatar Generator
         
         Args:
             api_key (str, optional): FAL AI API key. If not provided, will look for FAL_KEY environment variable.
+            job_engine (FALJobEngine, optional): Engine for async requests (default: shared engine)
+            download_manager (DownloadManager, optional): Downloader for generated videos
+                (default: shared pooled manager)
+            upload_cache (UploadCache, optional): Cache of earlier uploads of local images
+                and audio (default: shared on-disk cache)
         """
         self.api_key = api_key or os.getenv('FAL_KEY')
         if not self.api_key:
@@ -67,6 +92,15 @@ class FALAvatarGenerator:
         self.audio_endpoint = "fal-ai/ai-avatar"
         self.multi_endpoint = "fal-ai/ai-avatar/multi"
         
+        # Shared asyncio engine for queue submission and polling
+        self.job_engine = job_engine or get_default_engine()
+        
+        # Pooled, resumable downloads shared with the other generators
+        self.download_manager = download_manager or get_default_download_manager()
+        
+        # The same avatar image is reused across conversations; upload it once
+        self.upload_cache = upload_cache or get_default_upload_cache()
+        
         print(f"✅ FAL Avatar Generator initialized")
         print(f"📍 Text-to-speech endpoint: {self.text_endpoint}")
         print(f"📍 Audio-to-avatar endpoint: {self.audio_endpoint}")
@@ -107,73 +141,75 @@ class FALAvatarGenerator:
             print(f"🖼️ Image: {image_url}")
             print(f"⚡ Turbo mode: {turbo}")
             
-            # Handle local image files
-            if os.path.isfile(image_url):
-                print(f"📤 Uploading local image: {image_url}")
-                image_url = fal_client.upload_file(image_url)
-                print(f"✅ Image uploaded: {image_url}")
-            
-            # Validate parameters
-            if voice not in VOICE_OPTIONS:
-                raise ValueError(f"Invalid voice '{voice}'. Must be one of: {VOICE_OPTIONS}")
-            
-            if not (81 <= num_frames <= 129):
-                raise ValueError(f"num_frames must be between 81 and 129, got {num_frames}")
-            
-            # Prepare arguments
-            arguments = {
-                "image_url": image_url,
-                "text_input": text_input,
-                "voice": voice,
-                "prompt": prompt,
-                "num_frames": num_frames,
-                "turbo": turbo
-            }
-            
-            if seed is not None:
-                arguments["seed"] = seed
+            arguments = self._prepare_text_arguments(
+                image_url, text_input, voice, prompt, num_frames, seed, turbo
+            )
             
             print(f"🚀 Submitting request to {self.text_endpoint}...")
             
             # Track generation time
             start_time = time.time()
             
-            def on_queue_update(update):
-                if isinstance(update, fal_client.InProgress):
-                    for log in update.logs:
-                        print(f"📋 {log['message']}")
-            
             # Generate the avatar video
             result = fal_client.subscribe(
                 self.text_endpoint,
                 arguments=arguments,
                 with_logs=True,
-                on_queue_update=on_queue_update
+                on_queue_update=self._on_queue_update
             )
             
-            generation_time = time.time() - start_time
-            
-            if result and 'video' in result:
-                video_info = result['video']
-                video_url = video_info['url']
-                file_size = video_info.get('file_size', 0)
-                
-                print(f"✅ Avatar video generated successfully!")
-                print(f"⏱️ Generation time: {generation_time:.2f} seconds")
-                print(f"📊 File size: {file_size / (1024*1024):.2f} MB")
-                print(f"🔗 Video URL: {video_url}")
-                
-                # Download video if output path specified
-                if output_path:
-                    self._download_video(video_url, output_path)
-                
-                # Add metadata to result
-                result['generation_time'] = generation_time
-                result['parameters'] = arguments
+            return self._finalize_result(
+                result, arguments, start_time, output_path,
+                "Avatar video generated successfully!"
+            )
                 
-                return result
-            else:
-                raise Exception(f"Unexpected result format: {result}")
+        except Exception as e:
+            print(f"❌ Error generating avatar video: {str(e)}")
+            raise
+    
+    async def generate_avatar_video_async(
+        self,
+        image_url: str,
+        text_input: str,
+        voice: VoiceType = "Bill",
+        prompt: str = "An elderly man with a white beard and headphones records audio with a microphone. He appears engaged and expressive, suggesting a podcast or voiceover.",
+        num_frames: int = 136,
+        seed: Optional[int] = 42,
+        turbo: bool = True,
+        output_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Awaitable version of generate_avatar_video
+        
+        The job is submitted and polled on the running event loop through the
+        shared job engine; uploads and downloads run in the default executor.
+        
+        Args:
+            Same as generate_avatar_video
+            
+        Returns:
+            Dict containing the generated video information and metadata
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            print(f"🎬 Starting avatar video generation (async)...")
+            arguments = await loop.run_in_executor(
+                None,
+                lambda: self._prepare_text_arguments(
+                    image_url, text_input, voice, prompt, num_frames, seed, turbo
+                )
+            )
+            
+            start_time = time.time()
+            result = await self.job_engine.run(self.text_endpoint, arguments)
+            
+            return await loop.run_in_executor(
+                None,
+                lambda: self._finalize_result(
+                    result, arguments, start_time, output_path,
+                    "Avatar video generated successfully!"
+                )
+            )
                 
         except Exception as e:
             print(f"❌ Error generating avatar video: {str(e)}")
@@ -210,75 +246,71 @@ class FALAvatarGenerator:
             print(f"🎵 Audio: {audio_url}")
             print(f"⚡ Turbo mode: {turbo}")
             
-            # Handle local image files
-            if os.path.isfile(image_url):
-                print(f"📤 Uploading local image: {image_url}")
-                image_url = fal_client.upload_file(image_url)
-                print(f"✅ Image uploaded: {image_url}")
-            
-            # Handle local audio files
-            if os.path.isfile(audio_url):
-                print(f"📤 Uploading local audio: {audio_url}")
-                audio_url = fal_client.upload_file(audio_url)
-                print(f"✅ Audio uploaded: {audio_url}")
-            
-            # Validate parameters
-            if not (81 <= num_frames <= 129):
-                raise ValueError(f"num_frames must be between 81 and 129, got {num_frames}")
-            
-            # Prepare arguments
-            arguments = {
-                "image_url": image_url,
-                "audio_url": audio_url,
-                "prompt": prompt,
-                "num_frames": num_frames,
-                "turbo": turbo
-            }
-            
-            if seed is not None:
-                arguments["seed"] = seed
+            arguments = self._prepare_audio_arguments(
+                image_url, audio_url, prompt, num_frames, seed, turbo
+            )
             
             print(f"🚀 Submitting request to {self.audio_endpoint}...")
             
             # Track generation time
             start_time = time.time()
             
-            def on_queue_update(update):
-                if isinstance(update, fal_client.InProgress):
-                    for log in update.logs:
-                        print(f"📋 {log['message']}")
-            
             # Generate the avatar video
             result = fal_client.subscribe(
                 self.audio_endpoint,
                 arguments=arguments,
                 with_logs=True,
-                on_queue_update=on_queue_update
+                on_queue_update=self._on_queue_update
             )
             
-            generation_time = time.time() - start_time
-            
-            if result and 'video' in result:
-                video_info = result['video']
-                video_url = video_info['url']
-                file_size = video_info.get('file_size', 0)
-                
-                print(f"✅ Avatar video generated successfully!")
-                print(f"⏱️ Generation time: {generation_time:.2f} seconds")
-                print(f"📊 File size: {file_size / (1024*1024):.2f} MB")
-                print(f"🔗 Video URL: {video_url}")
-                
-                # Download video if output path specified
-                if output_path:
-                    self._download_video(video_url, output_path)
-                
-                # Add metadata to result
-                result['generation_time'] = generation_time
-                result['parameters'] = arguments
+            return self._finalize_result(
+                result, arguments, start_time, output_path,
+                "Avatar video generated successfully!"
+            )
                 
-                return result
-            else:
-                raise Exception(f"Unexpected result format: {result}")
+        except Exception as e:
+            print(f"❌ Error generating avatar video from audio: {str(e)}")
+            raise
+    
+    async def generate_avatar_from_audio_async(
+        self,
+        image_url: str,
+        audio_url: str,
+        prompt: str = "A person speaking naturally with clear lip-sync and natural expressions.",
+        num_frames: int = 145,
+        seed: Optional[int] = None,
+        turbo: bool = True,
+        output_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Awaitable version of generate_avatar_from_audio
+        
+        Args:
+            Same as generate_avatar_from_audio
+            
+        Returns:
+            Dict containing the generated video information and metadata
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            print(f"🎬 Starting avatar video generation from audio (async)...")
+            arguments = await loop.run_in_executor(
+                None,
+                lambda: self._prepare_audio_arguments(
+                    image_url, audio_url, prompt, num_frames, seed, turbo
+                )
+            )
+            
+            start_time = time.time()
+            result = await self.job_engine.run(self.audio_endpoint, arguments)
+            
+            return await loop.run_in_executor(
+                None,
+                lambda: self._finalize_result(
+                    result, arguments, start_time, output_path,
+                    "Avatar video generated successfully!"
+                )
+            )
                 
         except Exception as e:
             print(f"❌ Error generating avatar video from audio: {str(e)}")
@@ -318,101 +350,235 @@ class FALAvatarGenerator:
             print(f"🎵 Second audio: {second_audio_url}")
             print(f"⚡ Turbo mode: {turbo}")
             
-            # Handle local image files
-            if os.path.isfile(image_url):
-                print(f"📤 Uploading local image: {image_url}")
-                image_url = fal_client.upload_file(image_url)
-                print(f"✅ Image uploaded: {image_url}")
-            
-            # Handle local audio files
-            if os.path.isfile(first_audio_url):
-                print(f"📤 Uploading first audio: {first_audio_url}")
-                first_audio_url = fal_client.upload_file(first_audio_url)
-                print(f"✅ First audio uploaded: {first_audio_url}")
-            
-            if os.path.isfile(second_audio_url):
-                print(f"📤 Uploading second audio: {second_audio_url}")
-                second_audio_url = fal_client.upload_file(second_audio_url)
-                print(f"✅ Second audio uploaded: {second_audio_url}")
-            
-            # Validate parameters
-            if not (81 <= num_frames <= 129):
-                raise ValueError(f"num_frames must be between 81 and 129, got {num_frames}")
-            
-            # Prepare arguments
-            arguments = {
-                "image_url": image_url,
-                "first_audio_url": first_audio_url,
-                "second_audio_url": second_audio_url,
-                "prompt": prompt,
-                "num_frames": num_frames,
-                "turbo": turbo
-            }
-            
-            if seed is not None:
-                arguments["seed"] = seed
+            arguments = self._prepare_multi_arguments(
+                image_url, first_audio_url, second_audio_url, prompt, num_frames, seed, turbo
+            )
             
             print(f"🚀 Submitting request to {self.multi_endpoint}...")
             
             # Track generation time
             start_time = time.time()
             
-            def on_queue_update(update):
-                if isinstance(update, fal_client.InProgress):
-                    for log in update.logs:
-                        print(f"📋 {log['message']}")
-            
             # Generate the multi-avatar conversation video
             result = fal_client.subscribe(
                 self.multi_endpoint,
                 arguments=arguments,
                 with_logs=True,
-                on_queue_update=on_queue_update
+                on_queue_update=self._on_queue_update
             )
             
-            generation_time = time.time() - start_time
-            
-            if result and 'video' in result:
-                video_info = result['video']
-                video_url = video_info['url']
-                file_size = video_info.get('file_size', 0)
-                
-                print(f"✅ Multi-avatar conversation generated successfully!")
-                print(f"⏱️ Generation time: {generation_time:.2f} seconds")
-                print(f"📊 File size: {file_size / (1024*1024):.2f} MB")
-                print(f"🔗 Video URL: {video_url}")
-                
-                # Download video if output path specified
-                if output_path:
-                    self._download_video(video_url, output_path)
-                
-                # Add metadata to result
-                result['generation_time'] = generation_time
-                result['parameters'] = arguments
+            return self._finalize_result(
+                result, arguments, start_time, output_path,
+                "Multi-avatar conversation generated successfully!"
+            )
                 
-                return result
-            else:
-                raise Exception(f"Unexpected result format: {result}")
+        except Exception as e:
+            print(f"❌ Error generating multi-avatar conversation: {str(e)}")
+            raise
+    
+    async def generate_multi_avatar_conversation_async(
+        self,
+        image_url: str,
+        first_audio_url: str,
+        second_audio_url: str,
+        prompt: str = "Two people engaged in a natural conversation, speaking in sequence with clear lip-sync and natural expressions.",
+        num_frames: int = 181,
+        seed: Optional[int] = None,
+        turbo: bool = True,
+        output_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Awaitable version of generate_multi_avatar_conversation
+        
+        Args:
+            Same as generate_multi_avatar_conversation
+            
+        Returns:
+            Dict containing the generated video information and metadata
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            print(f"🎬 Starting multi-person avatar conversation generation (async)...")
+            arguments = await loop.run_in_executor(
+                None,
+                lambda: self._prepare_multi_arguments(
+                    image_url, first_audio_url, second_audio_url, prompt, num_frames, seed, turbo
+                )
+            )
+            
+            start_time = time.time()
+            result = await self.job_engine.run(self.multi_endpoint, arguments)
+            
+            return await loop.run_in_executor(
+                None,
+                lambda: self._finalize_result(
+                    result, arguments, start_time, output_path,
+                    "Multi-avatar conversation generated successfully!"
+                )
+            )
                 
         except Exception as e:
             print(f"❌ Error generating multi-avatar conversation: {str(e)}")
             raise
     
+    def _upload_if_local(self, path_or_url: str, label: str) -> str:
+        """Upload a local file to FAL and return its URL (URLs are returned unchanged)"""
+        if os.path.isfile(path_or_url):
+            print(f"📤 Uploading {label}: {path_or_url}")
+            path_or_url = self.upload_cache.get_or_upload(path_or_url, fal_client.upload_file)
+            print(f"✅ {label[0].upper() + label[1:]} uploaded: {path_or_url}")
+        return path_or_url
+    
+    def _validate_num_frames(self, num_frames: int):
+        """Validate the frame count accepted by the avatar endpoints"""
+        if not (81 <= num_frames <= 129):
+            raise ValueError(f"num_frames must be between 81 and 129, got {num_frames}")
+    
+    def _prepare_text_arguments(
+        self,
+        image_url: str,
+        text_input: str,
+        voice: str,
+        prompt: str,
+        num_frames: int,
+        seed: Optional[int],
+        turbo: bool
+    ) -> Dict[str, Any]:
+        """Upload local inputs, validate parameters and build text-to-avatar arguments"""
+        # Handle local image files
+        image_url = self._upload_if_local(image_url, "local image")
+        
+        # Validate parameters
+        if voice not in VOICE_OPTIONS:
+            raise ValueError(f"Invalid voice '{voice}'. Must be one of: {VOICE_OPTIONS}")
+        self._validate_num_frames(num_frames)
+        
+        # Prepare arguments
+        arguments = {
+            "image_url": image_url,
+            "text_input": text_input,
+            "voice": voice,
+            "prompt": prompt,
+            "num_frames": num_frames,
+            "turbo": turbo
+        }
+        
+        if seed is not None:
+            arguments["seed"] = seed
+        
+        return arguments
+    
+    def _prepare_audio_arguments(
+        self,
+        image_url: str,
+        audio_url: str,
+        prompt: str,
+        num_frames: int,
+        seed: Optional[int],
+        turbo: bool
+    ) -> Dict[str, Any]:
+        """Upload local inputs, validate parameters and build audio-to-avatar arguments"""
+        # Handle local image and audio files
+        image_url = self._upload_if_local(image_url, "local image")
+        audio_url = self._upload_if_local(audio_url, "local audio")
+        
+        # Validate parameters
+        self._validate_num_frames(num_frames)
+        
+        # Prepare arguments
+        arguments = {
+            "image_url": image_url,
+            "audio_url": audio_url,
+            "prompt": prompt,
+            "num_frames": num_frames,
+            "turbo": turbo
+        }
+        
+        if seed is not None:
+            arguments["seed"] = seed
+        
+        return arguments
+    
+    def _prepare_multi_arguments(
+        self,
+        image_url: str,
+        first_audio_url: str,
+        second_audio_url: str,
+        prompt: str,
+        num_frames: int,
+        seed: Optional[int],
+        turbo: bool
+    ) -> Dict[str, Any]:
+        """Upload local inputs, validate parameters and build multi-avatar arguments"""
+        # Handle local image and audio files
+        image_url = self._upload_if_local(image_url, "local image")
+        first_audio_url = self._upload_if_local(first_audio_url, "first audio")
+        second_audio_url = self._upload_if_local(second_audio_url, "second audio")
+        
+        # Validate parameters
+        self._validate_num_frames(num_frames)
+        
+        # Prepare arguments
+        arguments = {
+            "image_url": image_url,
+            "first_audio_url": first_audio_url,
+            "second_audio_url": second_audio_url,
+            "prompt": prompt,
+            "num_frames": num_frames,
+            "turbo": turbo
+        }
+        
+        if seed is not None:
+            arguments["seed"] = seed
+        
+        return arguments
+    
+    def _on_queue_update(self, update):
+        """Print logs from fal_client.subscribe queue updates"""
+        if isinstance(update, fal_client.InProgress):
+            for log in update.logs:
+                print(f"📋 {log['message']}")
+    
+    def _finalize_result(
+        self,
+        result: Dict[str, Any],
+        arguments: Dict[str, Any],
+        start_time: float,
+        output_path: Optional[str],
+        success_message: str
+    ) -> Dict[str, Any]:
+        """Report timing, download the video if requested and attach metadata"""
+        generation_time = time.time() - start_time
+        
+        if result and 'video' in result:
+            video_info = result['video']
+            video_url = video_info['url']
+            file_size = video_info.get('file_size', 0)
+            
+            print(f"✅ {success_message}")
+            print(f"⏱️ Generation time: {generation_time:.2f} seconds")
+            print(f"📊 File size: {file_size / (1024*1024):.2f} MB")
+            print(f"🔗 Video URL: {video_url}")
+            
+            # Download video if output path specified
+            if output_path:
+                self._download_video(video_url, output_path)
+            
+            # Add metadata to result
+            result['generation_time'] = generation_time
+            result['parameters'] = arguments
+            
+            return result
+        else:
+            raise Exception(f"Unexpected result format: {result}")
+    
     def _download_video(self, video_url: str, output_path: str) -> None:
         """Download video from URL to local path"""
         try:
-            import requests
-            
             print(f"📥 Downloading video to {output_path}...")
             
-            # Create output directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
-            
-            response = requests.get(video_url)
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+            # Streams to disk in bounded chunks (creates the output directory if needed)
+            self.download_manager.download(video_url, output_path)
             
             file_size = os.path.getsize(output_path)
             print(f"✅ Video downloaded: {output_path} ({file_size / (1024*1024):.2f} MB)")
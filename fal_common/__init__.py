@@ -0,0 +1,76 @@
+"""
+Shared FAL AI helpers used by the generator modules in this repository.
+
+Generators add the repository root to ``sys.path`` and import from here:
+
+    from fal_common import get_default_engine
+
+    engine = get_default_engine()
+    result = await engine.run("fal-ai/flux-1/schnell", {"prompt": "a red fox"})
+"""
+
+import importlib
+from typing import Any
+
+# Exported names and the submodule defining each. Submodules are imported on
+# first attribute access (PEP 562), so ``from fal_common.media_probe import
+# probe_media`` does not pull in fal_client or requests.
+_EXPORTS = {
+    "CircuitOpenError": "http_client",
+    "DownloadError": "downloads",
+    "DownloadManager": "downloads",
+    "FALJob": "job_engine",
+    "FALJobEngine": "job_engine",
+    "FALJobError": "job_engine",
+    "HostClient": "http_client",
+    "MediaInfo": "media_probe",
+    "MediaProbe": "media_probe",
+    "PollingPolicy": "polling",
+    "ProbeError": "media_probe",
+    "ResultCache": "result_cache",
+    "UploadCache": "upload_cache",
+    "get_default_download_manager": "downloads",
+    "get_default_engine": "job_engine",
+    "get_default_probe": "media_probe",
+    "get_default_upload_cache": "upload_cache",
+    "get_host_client": "http_client",
+    "get_http_stats": "http_client",
+    "probe_media": "media_probe"
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
+
+__all__ = [
+    "CircuitOpenError",
+    "DownloadError",
+    "DownloadManager",
+    "FALJob",
+    "FALJobEngine",
+    "FALJobError",
+    "HostClient",
+    "MediaInfo",
+    "MediaProbe",
+    "PollingPolicy",
+    "ProbeError",
+    "ResultCache",
+    "UploadCache",
+    "get_default_download_manager",
+    "get_default_engine",
+    "get_default_probe",
+    "get_default_upload_cache",
+    "get_host_client",
+    "get_http_stats",
+    "probe_media"
+]
@@ -0,0 +1,330 @@
+"""
+Shared download manager for generated media.
+
+All generators fetch their outputs (images, MP4s) through one pooled
+``requests.Session`` so keep-alive connections to the FAL CDN are reused.
+Downloads stream to a ``.part`` file in fixed-size chunks, resume with HTTP
+range requests after a dropped connection, fetch large files as parallel
+byte ranges and are verified against the expected size (and optional
+SHA256) before being moved into place. Range requests carry ``If-Range``
+with the probed ETag or Last-Modified date, so a resource that changed
+mid-download is fetched again in full instead of being spliced.
+
+Example:
+    manager = get_default_download_manager()
+    path = manager.download("https://v3.fal.media/files/.../video.mp4", "output/video.mp4")
+"""
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+# Sizes are checked against Content-Length, which only matches the bytes
+# written when the body is not content-encoded
+_IDENTITY_ENCODING = {"Accept-Encoding": "identity"}
+
+
+class DownloadError(Exception):
+    """Raised when a download fails or does not pass verification."""
+
+
+class DownloadManager:
+    """
+    Pooled, resumable downloader.
+
+    Files at least ``parallel_threshold`` bytes long are fetched as
+    ``max_parts`` concurrent byte ranges when the server supports them;
+    smaller files (and servers without range support) use a single
+    streaming request. Memory use is bounded by ``chunk_size`` per stream.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 16,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+        chunk_size: int = 1024 * 1024,
+        parallel_threshold: int = 32 * 1024 * 1024,
+        max_parts: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        session: Optional[requests.Session] = None
+    ):
+        """
+        Initialize the download manager.
+
+        Args:
+            pool_size: Maximum pooled connections per host
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait between received bytes
+            chunk_size: Bytes read and written per chunk
+            parallel_threshold: Minimum size in bytes for parallel range fetching
+            max_parts: Number of concurrent ranges for large files
+            max_retries: Resume attempts after a failed request
+            retry_backoff: Base delay in seconds between attempts (doubles each time)
+            session: Existing session to use instead of a new pooled one
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.chunk_size = chunk_size
+        self.parallel_threshold = parallel_threshold
+        self.max_parts = max(1, max_parts)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.session = session or self._create_session(pool_size)
+        self._stats = {"downloads": 0, "resumed": 0, "parallel": 0, "bytes": 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def download(
+        self,
+        url: str,
+        output_path: Union[str, Path],
+        expected_size: Optional[int] = None,
+        expected_sha256: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> Path:
+        """
+        Download a URL to a local file.
+
+        Args:
+            url: URL to download
+            output_path: Destination file (parent directories are created)
+            expected_size: Size in bytes the file must have (default: Content-Length)
+            expected_sha256: Hex digest the file must match
+            progress: Called as ``progress(downloaded_bytes, total_bytes)``
+
+        Returns:
+            Path of the downloaded file
+
+        Raises:
+            DownloadError: If the download fails after all retries or does not verify
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = output_path.with_name(output_path.name + ".part")
+
+        total, accepts_ranges, validator = self._probe(url)
+        if expected_size is None:
+            expected_size = total
+
+        if (accepts_ranges and expected_size and expected_size >= self.parallel_threshold
+                and self.max_parts > 1 and not part_path.exists()):
+            self._download_parallel(url, part_path, expected_size, progress, validator)
+        else:
+            self._download_stream(url, part_path, expected_size, progress, validator)
+
+        self._verify(part_path, expected_size, expected_sha256)
+        os.replace(part_path, output_path)
+
+        with self._lock:
+            self._stats["downloads"] += 1
+            self._stats["bytes"] += output_path.stat().st_size
+        return output_path
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get counts of downloads, resumed and parallel transfers and bytes written."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _probe(self, url: str) -> Tuple[Optional[int], bool, Optional[str]]:
+        """Get the content length, range support and If-Range validator of a URL (best effort)."""
+        try:
+            response = self.session.head(url, headers=_IDENTITY_ENCODING, timeout=self.timeout,
+                                         allow_redirects=True)
+            if response.status_code >= 400:
+                return None, False, None
+        except requests.RequestException:
+            return None, False, None
+
+        length = response.headers.get("Content-Length")
+        accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        return (int(length) if length and length.isdigit() else None), accepts_ranges, _validator(response)
+
+    @staticmethod
+    def _range_headers(byte_range: str, validator: Optional[str]) -> Dict[str, str]:
+        """Headers for a range request that falls back to the full body if the resource changed."""
+        headers = dict(_IDENTITY_ENCODING, Range=byte_range)
+        if validator:
+            headers["If-Range"] = validator
+        return headers
+
+    def _download_stream(
+        self,
+        url: str,
+        part_path: Path,
+        total: Optional[int],
+        progress: Optional[ProgressCallback],
+        validator: Optional[str] = None
+    ):
+        """Stream a URL into part_path, resuming from its current size on failure."""
+        attempt = 0
+        while True:
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            if total is not None and offset >= total:
+                return
+
+            if offset:
+                headers = self._range_headers(f"bytes={offset}-", validator)
+            else:
+                headers = dict(_IDENTITY_ENCODING)
+            try:
+                with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+                    if offset and response.status_code == 416:
+                        # Stale partial file from a different or changed resource
+                        part_path.unlink()
+                        continue
+                    response.raise_for_status()
+                    validator = validator or _validator(response)
+                    if offset and response.status_code == 206:
+                        mode = "ab"
+                        with self._lock:
+                            self._stats["resumed"] += 1
+                    else:
+                        # Server ignored the range request or the resource changed; start over
+                        mode, offset = "wb", 0
+                        if response.status_code == 200:
+                            length = response.headers.get("Content-Length")
+                            if length and length.isdigit():
+                                total = int(length)
+                    if total is None:
+                        length = response.headers.get("Content-Length")
+                        if length and length.isdigit():
+                            total = offset + int(length)
+
+                    downloaded = offset
+                    with open(part_path, mode) as f:
+                        for chunk in response.iter_content(chunk_size=self.chunk_size):
+                            if chunk:
+                                f.write(chunk)
+                                downloaded += len(chunk)
+                                if progress:
+                                    progress(downloaded, total)
+                if total is None or downloaded >= total:
+                    return
+                raise requests.ConnectionError(f"Connection closed after {downloaded} of {total} bytes")
+            except requests.HTTPError as e:
+                raise DownloadError(f"Download of {url} failed: {e}") from e
+            except requests.RequestException as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise DownloadError(f"Download of {url} failed after {attempt} attempts: {e}") from e
+                time.sleep(self.retry_backoff * (2 ** (attempt - 1)))
+
+    def _download_parallel(
+        self,
+        url: str,
+        part_path: Path,
+        total: int,
+        progress: Optional[ProgressCallback],
+        validator: Optional[str] = None
+    ):
+        """Fetch a URL as concurrent byte ranges written into a preallocated file."""
+        part_size = -(-total // self.max_parts)
+        ranges = [(start, min(start + part_size, total) - 1) for start in range(0, total, part_size)]
+
+        with open(part_path, "wb") as f:
+            f.truncate(total)
+
+        downloaded = [0]
+        progress_lock = threading.Lock()
+
+        def on_chunk(size: int):
+            with progress_lock:
+                downloaded[0] += size
+                if progress:
+                    progress(downloaded[0], total)
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [pool.submit(self._fetch_range, url, part_path, start, end, on_chunk, validator)
+                       for start, end in ranges]
+            errors: List[BaseException] = [e for e in (fut.exception() for fut in futures) if e]
+
+        if errors:
+            part_path.unlink(missing_ok=True)
+            raise DownloadError(f"Parallel download of {url} failed: {errors[0]}") from errors[0]
+
+        with self._lock:
+            self._stats["parallel"] += 1
+
+    def _fetch_range(self, url: str, part_path: Path, start: int, end: int, on_chunk: Callable[[int], None],
+                     validator: Optional[str] = None):
+        """Write bytes start..end (inclusive) of a URL into part_path, retrying from where it stopped."""
+        attempt = 0
+        position = start
+        with open(part_path, "r+b") as f:
+            while position <= end:
+                try:
+                    headers = self._range_headers(f"bytes={position}-{end}", validator)
+                    with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+                        response.raise_for_status()
+                        if response.status_code != 206:
+                            raise DownloadError("Server ignored the range request or the file changed")
+                        f.seek(position)
+                        for chunk in response.iter_content(chunk_size=self.chunk_size):
+                            chunk = chunk[:end + 1 - position]
+                            if chunk:
+                                f.write(chunk)
+                                position += len(chunk)
+                                on_chunk(len(chunk))
+                    if position <= end:
+                        raise requests.ConnectionError(f"Range {start}-{end} closed at byte {position}")
+                except requests.HTTPError as e:
+                    raise DownloadError(str(e)) from e
+                except requests.RequestException:
+                    attempt += 1
+                    if attempt > self.max_retries:
+                        raise
+                    time.sleep(self.retry_backoff * (2 ** (attempt - 1)))
+
+    def _verify(self, part_path: Path, expected_size: Optional[int], expected_sha256: Optional[str]):
+        """Check size and checksum; a file that fails is removed."""
+        actual_size = part_path.stat().st_size
+        if expected_size is not None and actual_size != expected_size:
+            part_path.unlink(missing_ok=True)
+            raise DownloadError(f"Size mismatch for {part_path.name}: expected {expected_size} bytes, got {actual_size}")
+
+        if expected_sha256:
+            digest = hashlib.sha256()
+            with open(part_path, "rb") as f:
+                for block in iter(lambda: f.read(self.chunk_size), b""):
+                    digest.update(block)
+            if digest.hexdigest() != expected_sha256.lower():
+                part_path.unlink(missing_ok=True)
+                raise DownloadError(f"Checksum mismatch for {part_path.name}")
+
+
+def _validator(response: requests.Response) -> Optional[str]:
+    """Strong ETag, else Last-Modified, of a response; If-Range does not accept weak ETags."""
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+_default_manager: Optional[DownloadManager] = None
+_default_manager_lock = threading.Lock()
+
+
+def get_default_download_manager() -> DownloadManager:
+    """Get the process-wide download manager shared by all generators."""
+    global _default_manager
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = DownloadManager()
+    return _default_manager
@@ -0,0 +1,334 @@
+"""
+Shared per-host HTTP clients for the ElevenLabs and OpenRouter APIs.
+
+Each API host gets one ``HostClient`` per process: a pooled keep-alive
+``requests.Session`` plus the retry policy and health state for that host.
+Rate-limited responses (HTTP 429/503) are retried after the server's
+``Retry-After`` delay, other transient failures with jittered exponential
+backoff. A circuit breaker stops sending requests to a host after repeated
+failures and lets a single probe through once the cooldown has passed.
+Latency histograms, retry counts and status codes are collected per host.
+
+Example:
+    client = get_host_client("https://api.elevenlabs.io/v1")
+    response = client.request("GET", "https://api.elevenlabs.io/v1/voices", headers=headers)
+    print(client.get_stats()["latency_histogram"])
+"""
+
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is unbounded
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Circuit breaker states
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised when a request is refused because the host's circuit breaker is open."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Delay in seconds, or None if missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class HostClient:
+    """
+    Pooled session, retry policy, circuit breaker and metrics for one API host.
+
+    Responses are returned to the caller whatever their status once retries
+    are exhausted; only connection errors and an open circuit raise.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        pool_size: int = 16,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 120.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        session: Optional[requests.Session] = None
+    ):
+        """
+        Initialize the host client.
+
+        Args:
+            host: Scheme and host the client serves (e.g. "https://api.elevenlabs.io")
+            pool_size: Maximum pooled keep-alive connections to the host
+            max_retries: Default number of retries per request
+            backoff: Base delay for exponential backoff in seconds
+            max_backoff: Maximum backoff delay in seconds
+            max_retry_after: Longest Retry-After delay honored; longer waits are capped
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe request
+            retry_statuses: Status codes that are retried
+            session: Session to use instead of a new pooled one
+        """
+        self.host = host
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.retry_statuses = frozenset(retry_statuses)
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        self._requests = 0
+        self._retries = 0
+        self._failures = 0
+        self._circuit_opens = 0
+        self._rejected = 0
+        self._status_counts: Dict[int, int] = {}
+        self._latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._latency_total = 0.0
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        max_retries: Optional[int] = None,
+        backoff: Optional[float] = None,
+        session: Optional[requests.Session] = None,
+        **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send a request with retries and circuit breaking.
+
+        Args:
+            method: HTTP method
+            url: Request URL on this host
+            max_retries: Retries for this request (default: the client's max_retries)
+            backoff: Base backoff delay for this request (default: the client's backoff)
+            session: Session to send through instead of the client's pooled session
+            **kwargs: Passed to requests.Session.request (headers, json, data, files, timeout, stream, ...)
+
+        Returns:
+            Final response (may be an error status once retries are exhausted)
+
+        Raises:
+            CircuitOpenError: If the host's circuit breaker is open
+            requests.exceptions.RequestException: If the last attempt failed to connect
+        """
+        max_retries = self.max_retries if max_retries is None else max_retries
+        backoff = self.backoff if backoff is None else backoff
+        client = session or self.session
+        kwargs.setdefault("timeout", 60)
+
+        for attempt in range(max_retries + 1):
+            self._before_request()
+            if attempt:
+                self._rewind_files(kwargs.get("files"))
+
+            start = time.monotonic()
+            try:
+                response = client.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                self._record(time.monotonic() - start, None)
+                if attempt >= max_retries:
+                    raise
+                delay = self._backoff_delay(attempt, backoff)
+                self._count_retry()
+                print(f"Request to {self.host} failed (attempt {attempt + 1}): {e}. Retrying in {delay:.1f}s...")
+                time.sleep(delay)
+                continue
+
+            self._record(time.monotonic() - start, response.status_code)
+            if response.status_code not in self.retry_statuses or attempt >= max_retries:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = min(retry_after, self.max_retry_after)
+            else:
+                delay = self._backoff_delay(attempt, backoff)
+            self._count_retry()
+            print(f"HTTP {response.status_code} from {self.host}. Waiting {delay:.1f}s before retry...")
+            response.close()
+            time.sleep(delay)
+
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request (see request)."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request (see request)."""
+        return self.request("POST", url, **kwargs)
+
+    @property
+    def circuit_state(self) -> str:
+        """Current circuit breaker state."""
+        with self._lock:
+            return self._state
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request, retry, status and latency metrics for the host."""
+        with self._lock:
+            histogram = {
+                f"<={bound}s": count for bound, count in zip(LATENCY_BUCKETS, self._latency_counts)
+            }
+            histogram[f">{LATENCY_BUCKETS[-1]}s"] = self._latency_counts[-1]
+            attempts = sum(self._latency_counts)
+            return {
+                "host": self.host,
+                "requests": self._requests,
+                "retries": self._retries,
+                "failures": self._failures,
+                "rejected": self._rejected,
+                "circuit_state": self._state,
+                "circuit_opens": self._circuit_opens,
+                "status_counts": dict(self._status_counts),
+                "latency_histogram": histogram,
+                "average_latency": self._latency_total / attempts if attempts else 0.0
+            }
+
+    def _before_request(self):
+        """Count the attempt and refuse it if the circuit is open."""
+        with self._lock:
+            if self._state == CIRCUIT_OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    self._rejected += 1
+                    raise CircuitOpenError(f"Circuit open for {self.host}; not sending request")
+                self._state = CIRCUIT_HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == CIRCUIT_HALF_OPEN:
+                # Only one probe request decides whether the host has recovered
+                if self._probe_in_flight:
+                    self._rejected += 1
+                    raise CircuitOpenError(f"Circuit half-open for {self.host}; probe already in flight")
+                self._probe_in_flight = True
+            self._requests += 1
+
+    def _record(self, latency: float, status: Optional[int]):
+        """Record one attempt's latency and outcome and update the circuit."""
+        failed = status is None or status >= 500
+        with self._lock:
+            self._latency_total += latency
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if latency <= bound:
+                    self._latency_counts[i] += 1
+                    break
+            else:
+                self._latency_counts[-1] += 1
+
+            if status is not None:
+                self._status_counts[status] = self._status_counts.get(status, 0) + 1
+
+            self._probe_in_flight = False
+            if not failed:
+                self._consecutive_failures = 0
+                self._state = CIRCUIT_CLOSED
+                return
+
+            self._failures += 1
+            self._consecutive_failures += 1
+            if self._state == CIRCUIT_HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != CIRCUIT_OPEN:
+                    self._circuit_opens += 1
+                    print(f"⚠️ Circuit opened for {self.host} after {self._consecutive_failures} failures")
+                self._state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+
+    def _count_retry(self):
+        with self._lock:
+            self._retries += 1
+
+    def _backoff_delay(self, attempt: int, backoff: float) -> float:
+        """Exponential backoff with jitter so concurrent callers do not retry in lockstep."""
+        delay = min(self.max_backoff, backoff * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+
+    @staticmethod
+    def _rewind_files(files: Optional[Dict[str, Any]]):
+        """Seek multipart file objects back to the start before a retry."""
+        for value in (files or {}).values():
+            file_obj = value[1] if isinstance(value, tuple) else value
+            if hasattr(file_obj, "seek"):
+                file_obj.seek(0)
+
+
+_host_clients: Dict[str, HostClient] = {}
+_host_clients_lock = threading.Lock()
+
+
+def host_key(url: str) -> str:
+    """Scheme and host part of a URL, e.g. "https://openrouter.ai"."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def get_host_client(url: str, **kwargs: Any) -> HostClient:
+    """
+    Get the process-wide client for the host of a URL.
+
+    Args:
+        url: Any URL (or base URL) on the host
+        **kwargs: HostClient settings, applied only when the client is first created
+
+    Returns:
+        Shared HostClient for the host
+    """
+    key = host_key(url)
+    with _host_clients_lock:
+        client = _host_clients.get(key)
+        if client is None:
+            client = _host_clients[key] = HostClient(key, **kwargs)
+    return client
+
+
+def get_http_stats() -> Dict[str, Dict[str, Any]]:
+    """Get metrics for every host contacted by this process."""
+    with _host_clients_lock:
+        clients = list(_host_clients.values())
+    return {client.host: client.get_stats() for client in clients}
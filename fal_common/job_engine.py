@@ -0,0 +1,418 @@
+"""
+Asyncio job engine for FAL AI queue endpoints.
+
+Submits requests to any FAL endpoint, polls their queue status and fetches
+results without blocking a thread per job, so a single event loop can keep
+thousands of generations in flight.
+
+Synchronous callers (``run_sync``, ``run_coroutine``) share one long-lived
+background event loop, so the async HTTP client and its connections are
+reused across calls and threads instead of being bound to a short-lived
+``asyncio.run`` loop.
+
+Example:
+    engine = FALJobEngine()
+    result = await engine.run("fal-ai/flux-1/schnell", {"prompt": "a red fox"})
+
+    jobs = await engine.run_many([
+        ("fal-ai/flux-1/schnell", {"prompt": "a red fox"}),
+        ("fal-ai/flux-1/dev", {"prompt": "a blue heron"}),
+    ])
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import fal_client
+
+from .polling import PollingPolicy
+
+T = TypeVar("T")
+
+# Job states reported on FALJob.status
+PENDING = "PENDING"
+QUEUED = "QUEUED"
+IN_PROGRESS = "IN_PROGRESS"
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+TIMEOUT = "TIMEOUT"
+
+
+class FALJobError(Exception):
+    """Raised when a FAL job fails, times out or returns an error."""
+
+    def __init__(self, message: str, job: "FALJob"):
+        super().__init__(message)
+        self.job = job
+
+
+@dataclass
+class FALJob:
+    """State of a single request submitted to a FAL queue endpoint."""
+    endpoint: str
+    arguments: Dict[str, Any]
+    request_id: Optional[str] = None
+    status: str = PENDING
+    queue_position: Optional[int] = None
+    status_checks: int = 0
+    in_progress_checks: int = 0
+    logs: List[Dict[str, Any]] = field(default_factory=list)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    submitted_at: Optional[float] = None
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self.status in (COMPLETED, FAILED, TIMEOUT)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since submission (until completion if finished)."""
+        if self.submitted_at is None:
+            return 0.0
+        end = self.completed_at if self.completed_at is not None else time.time()
+        return end - self.submitted_at
+
+    @property
+    def running_time(self) -> float:
+        """Seconds since the job left the queue (until completion if finished)."""
+        if self.started_at is None:
+            return 0.0
+        end = self.completed_at if self.completed_at is not None else time.time()
+        return end - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the job without its arguments or result payload."""
+        return {
+            "endpoint": self.endpoint,
+            "request_id": self.request_id,
+            "status": self.status,
+            "status_checks": self.status_checks,
+            "elapsed": round(self.elapsed, 3),
+            "error": self.error
+        }
+
+
+class FALJobEngine:
+    """
+    Runs FAL queue jobs concurrently on one asyncio event loop.
+
+    Each job costs one coroutine instead of one OS thread: the engine submits
+    the request, sleeps between status checks and fetches the result once the
+    job is completed. ``max_in_flight`` bounds how many jobs are submitted
+    and polled at the same time per event loop; the ``PollingPolicy`` decides
+    how long each job sleeps between checks.
+
+    Async clients and semaphores are bound to the event loop they are used
+    on, so the engine keeps one of each per loop. Synchronous calls all run
+    on the engine's background loop and therefore share one client and one
+    in-flight limit.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        max_in_flight: int = 1000,
+        polling: Optional[PollingPolicy] = None,
+        timeout: Optional[float] = 900.0,
+        with_logs: bool = False
+    ):
+        """
+        Initialize the job engine.
+
+        Args:
+            client: Async FAL client (default: ``fal_client.AsyncClient()``)
+            max_in_flight: Maximum number of jobs submitted and polled at once
+            polling: Policy for intervals between status checks (default: adaptive)
+            timeout: Default seconds to wait for a job (None to wait forever)
+            with_logs: Request job logs with each status check
+        """
+        self._client = client
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.polling = polling or PollingPolicy()
+        self.timeout = timeout
+        self.with_logs = with_logs
+        self._lock = threading.Lock()
+        self._loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = \
+            weakref.WeakKeyDictionary()
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+            weakref.WeakKeyDictionary()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+
+    @property
+    def client(self) -> Any:
+        """Async FAL client for the running event loop, created on first use."""
+        if self._client is not None:
+            return self._client
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._loop_clients.get(loop)
+            if client is None:
+                client = self._loop_clients[loop] = fal_client.AsyncClient()
+            return client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the in-flight semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_in_flight)
+            return semaphore
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop, starting its thread on first use."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="fal-job-engine", daemon=True)
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+    def run_coroutine(self, coro: Awaitable[T]) -> T:
+        """
+        Run a coroutine on the engine's background loop and wait for its result.
+
+        Safe to call from any thread, including threads that run their own
+        event loop (e.g. Jupyter), but not from a coroutine already running
+        on the engine loop.
+
+        Args:
+            coro: Coroutine to run, typically one using this engine
+
+        Returns:
+            Result of the coroutine
+        """
+        loop = self._get_loop()
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError("run_coroutine cannot block the job engine loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def submit(self, endpoint: str, arguments: Dict[str, Any]) -> FALJob:
+        """
+        Submit a request to a FAL queue endpoint.
+
+        Args:
+            endpoint: FAL endpoint (e.g. "fal-ai/flux-1/dev")
+            arguments: Request arguments
+
+        Returns:
+            FALJob with the assigned request id
+        """
+        job = FALJob(endpoint=endpoint, arguments=arguments)
+        handle = await self.client.submit(endpoint, arguments=arguments)
+        job.request_id = handle.request_id
+        job.status = QUEUED
+        job.submitted_at = time.time()
+        return job
+
+    async def wait(
+        self,
+        job: FALJob,
+        on_update: Optional[Callable[[FALJob, Any], None]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Poll a submitted job until it completes and return its result.
+
+        Args:
+            job: Job returned by ``submit``
+            on_update: Optional callback called with (job, status) after each check
+            timeout: Seconds to wait (default: engine timeout)
+
+        Returns:
+            Result payload of the job
+
+        Raises:
+            FALJobError: If the job fails or does not finish in time
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = job.submitted_at + timeout if timeout is not None else None
+
+        while True:
+            status = await self.client.status(job.endpoint, job.request_id, with_logs=self.with_logs)
+            job.status_checks += 1
+            self.polling.record_status_call(job.endpoint)
+            self._apply_status(job, status)
+
+            if on_update:
+                on_update(job, status)
+
+            if isinstance(status, fal_client.Completed):
+                break
+
+            if deadline is not None and time.time() >= deadline:
+                job.status = TIMEOUT
+                job.completed_at = time.time()
+                job.error = f"Job did not complete within {timeout:.0f}s"
+                await self._cancel_quietly(job)
+                raise FALJobError(job.error, job)
+
+            interval = self.polling.next_interval(job)
+            if deadline is not None:
+                interval = max(0.0, min(interval, deadline - time.time()))
+            await asyncio.sleep(interval)
+
+        error = getattr(status, "error", None)
+        if error:
+            return self._fail(job, str(error))
+
+        try:
+            job.result = await self.client.result(job.endpoint, job.request_id)
+        except Exception as e:
+            return self._fail(job, str(e))
+
+        job.status = COMPLETED
+        job.completed_at = time.time()
+        self.polling.record_runtime(job.endpoint, job.running_time or job.elapsed)
+        return job.result
+
+    async def run(
+        self,
+        endpoint: str,
+        arguments: Dict[str, Any],
+        on_update: Optional[Callable[[FALJob, Any], None]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Submit a job and wait for its result.
+
+        Args:
+            endpoint: FAL endpoint
+            arguments: Request arguments
+            on_update: Optional status callback, see ``wait``
+            timeout: Seconds to wait (default: engine timeout)
+
+        Returns:
+            Result payload of the job
+
+        Raises:
+            FALJobError: If the job fails or does not finish in time
+        """
+        async with self._get_semaphore():
+            job = await self.submit(endpoint, arguments)
+            return await self.wait(job, on_update=on_update, timeout=timeout)
+
+    async def run_job(
+        self,
+        endpoint: str,
+        arguments: Dict[str, Any],
+        on_update: Optional[Callable[[FALJob, Any], None]] = None,
+        timeout: Optional[float] = None
+    ) -> FALJob:
+        """
+        Like ``run`` but never raises; failures are recorded on the returned job.
+
+        Returns:
+            FALJob with ``result`` or ``error`` set
+        """
+        job = FALJob(endpoint=endpoint, arguments=arguments)
+        async with self._get_semaphore():
+            try:
+                job = await self.submit(endpoint, arguments)
+                await self.wait(job, on_update=on_update, timeout=timeout)
+            except FALJobError as e:
+                job = e.job
+            except Exception as e:
+                job.status = FAILED
+                job.error = str(e)
+                job.completed_at = time.time()
+        return job
+
+    async def run_many(
+        self,
+        requests: List[Tuple[str, Dict[str, Any]]],
+        on_update: Optional[Callable[[FALJob, Any], None]] = None,
+        timeout: Optional[float] = None
+    ) -> List[FALJob]:
+        """
+        Run many jobs concurrently, bounded by ``max_in_flight``.
+
+        Args:
+            requests: List of (endpoint, arguments) pairs
+            on_update: Optional status callback shared by all jobs
+            timeout: Seconds to wait for each job (default: engine timeout)
+
+        Returns:
+            FALJob per request, in input order
+        """
+        return list(await asyncio.gather(*[
+            self.run_job(endpoint, arguments, on_update=on_update, timeout=timeout)
+            for endpoint, arguments in requests
+        ]))
+
+    def run_sync(
+        self,
+        endpoint: str,
+        arguments: Dict[str, Any],
+        on_update: Optional[Callable[[FALJob, Any], None]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Blocking wrapper around ``run`` for synchronous callers.
+
+        The job runs on the engine's background loop, see ``run_coroutine``.
+        """
+        return self.run_coroutine(self.run(endpoint, arguments, on_update=on_update, timeout=timeout))
+
+    def get_polling_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get status-call counts and learned runtimes per endpoint."""
+        return self.polling.get_stats()
+
+    def _apply_status(self, job: FALJob, status: Any):
+        """Record a queue status on the job."""
+        if isinstance(status, fal_client.Queued):
+            job.status = QUEUED
+            job.queue_position = status.position
+        elif isinstance(status, fal_client.InProgress):
+            job.status = IN_PROGRESS
+            job.queue_position = None
+            job.in_progress_checks += 1
+            if job.started_at is None:
+                job.started_at = time.time()
+        elif isinstance(status, fal_client.Completed):
+            job.queue_position = None
+
+        logs = getattr(status, "logs", None)
+        if logs:
+            job.logs = list(logs)
+
+    def _fail(self, job: FALJob, error: str):
+        """Mark a job as failed and raise."""
+        job.status = FAILED
+        job.error = error
+        job.completed_at = time.time()
+        raise FALJobError(f"FAL job {job.request_id} failed: {error}", job)
+
+    async def _cancel_quietly(self, job: FALJob):
+        """Best-effort cancellation of a timed-out job."""
+        cancel = getattr(self.client, "cancel", None)
+        if cancel is None:
+            return
+        try:
+            await cancel(job.endpoint, job.request_id)
+        except Exception:
+            pass
+
+
+_default_engine: Optional[FALJobEngine] = None
+_default_engine_lock = threading.Lock()
+
+
+def get_default_engine() -> FALJobEngine:
+    """Get the process-wide job engine shared by all generators."""
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = FALJobEngine()
+        return _default_engine
@@ -0,0 +1,260 @@
+"""
+Cached ffprobe metadata for media files.
+
+Every probe runs a single ``ffprobe -print_format json -show_streams
+-show_format`` and the parsed result is cached by (path, size, mtime), so
+validating, listing and batch-processing the same files does not spawn new
+ffprobe processes. Results are typed dataclasses shared by the video tools
+and the generator packages.
+
+Example:
+    info = probe_media("input/clip.mp4")
+    if info.has_video:
+        print(info.duration, info.video.width, info.video.fps)
+"""
+
+import json
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+PathLike = Union[str, Path]
+
+
+class ProbeError(Exception):
+    """Raised when ffprobe is missing or cannot read a file."""
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_frame_rate(rate: Optional[str]) -> Optional[float]:
+    """Convert an ffprobe rate such as "30000/1001" to frames per second."""
+    if not rate:
+        return None
+    numerator, _, denominator = rate.partition("/")
+    num = _to_float(numerator)
+    den = _to_float(denominator) if denominator else 1.0
+    if not num or not den:
+        return None
+    return num / den
+
+
+@dataclass(frozen=True)
+class VideoStreamInfo:
+    """First video stream of a media file."""
+    codec: Optional[str]
+    width: Optional[int]
+    height: Optional[int]
+    frame_rate: Optional[str]
+    fps: Optional[float]
+    pix_fmt: Optional[str]
+    bit_rate: Optional[int]
+    frame_count: Optional[int]
+
+
+@dataclass(frozen=True)
+class AudioStreamInfo:
+    """First audio stream of a media file."""
+    codec: Optional[str]
+    sample_rate: Optional[int]
+    channels: Optional[int]
+    bit_rate: Optional[int]
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    """Container and stream metadata of a media file."""
+    path: str
+    duration: Optional[float]
+    file_size: Optional[int]
+    bit_rate: Optional[int]
+    format_name: Optional[str]
+    video: Optional[VideoStreamInfo]
+    audio: Optional[AudioStreamInfo]
+
+    @property
+    def has_video(self) -> bool:
+        return self.video is not None
+
+    @property
+    def has_audio(self) -> bool:
+        return self.audio is not None
+
+    @classmethod
+    def from_ffprobe(cls, path: PathLike, data: Dict[str, Any]) -> "MediaInfo":
+        """
+        Build MediaInfo from ffprobe's JSON output.
+
+        Args:
+            path: Probed file
+            data: Parsed output of ``ffprobe -show_streams -show_format``
+
+        Returns:
+            MediaInfo
+        """
+        fmt = data.get("format", {})
+        streams = data.get("streams", [])
+        # Cover art is reported as a video stream; skip attached pictures
+        video_data = next(
+            (s for s in streams
+             if s.get("codec_type") == "video" and not s.get("disposition", {}).get("attached_pic")),
+            None
+        )
+        audio_data = next((s for s in streams if s.get("codec_type") == "audio"), None)
+
+        video = None
+        if video_data is not None:
+            frame_rate = video_data.get("r_frame_rate")
+            video = VideoStreamInfo(
+                codec=video_data.get("codec_name"),
+                width=_to_int(video_data.get("width")),
+                height=_to_int(video_data.get("height")),
+                frame_rate=frame_rate,
+                fps=parse_frame_rate(video_data.get("avg_frame_rate")) or parse_frame_rate(frame_rate),
+                pix_fmt=video_data.get("pix_fmt"),
+                bit_rate=_to_int(video_data.get("bit_rate")),
+                frame_count=_to_int(video_data.get("nb_frames"))
+            )
+
+        audio = None
+        if audio_data is not None:
+            audio = AudioStreamInfo(
+                codec=audio_data.get("codec_name"),
+                sample_rate=_to_int(audio_data.get("sample_rate")),
+                channels=_to_int(audio_data.get("channels")),
+                bit_rate=_to_int(audio_data.get("bit_rate"))
+            )
+
+        duration = _to_float(fmt.get("duration"))
+        if duration is None:
+            stream_durations = [_to_float(s.get("duration")) for s in (video_data, audio_data) if s]
+            duration = max((d for d in stream_durations if d is not None), default=None)
+
+        return cls(
+            path=str(path),
+            duration=duration,
+            file_size=_to_int(fmt.get("size")),
+            bit_rate=_to_int(fmt.get("bit_rate")),
+            format_name=fmt.get("format_name"),
+            video=video,
+            audio=audio
+        )
+
+
+class MediaProbe:
+    """
+    ffprobe runner with an LRU cache keyed by (resolved path, size, mtime).
+
+    A file that is rewritten gets a new size or mtime and is probed again.
+    """
+
+    def __init__(self, ffprobe: str = "ffprobe", max_entries: int = 512, timeout: float = 60.0):
+        """
+        Initialize the probe.
+
+        Args:
+            ffprobe: ffprobe executable
+            max_entries: Maximum number of cached results
+            timeout: Seconds before an ffprobe call is abandoned
+        """
+        self.ffprobe = ffprobe
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.hits = 0
+        self.probes = 0
+        self._cache: "OrderedDict[Tuple[str, int, int], MediaInfo]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def probe(self, path: PathLike) -> MediaInfo:
+        """
+        Get metadata for a media file.
+
+        Args:
+            path: Media file
+
+        Returns:
+            MediaInfo
+
+        Raises:
+            ProbeError: If the file is missing, ffprobe is unavailable or the file is unreadable
+        """
+        file_path = Path(path)
+        try:
+            stat = file_path.stat()
+        except OSError as e:
+            raise ProbeError(f"Cannot probe {file_path}: {e}") from e
+        key = (str(file_path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        info = MediaInfo.from_ffprobe(file_path, self._run_ffprobe(file_path))
+
+        with self._lock:
+            self.probes += 1
+            self._cache[key] = info
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return info
+
+    def clear(self):
+        """Drop all cached results."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache size, hits and ffprobe runs."""
+        with self._lock:
+            return {"entries": len(self._cache), "hits": self.hits, "probes": self.probes}
+
+    def _run_ffprobe(self, file_path: Path) -> Dict[str, Any]:
+        cmd = [
+            self.ffprobe, "-v", "error", "-print_format", "json",
+            "-show_streams", "-show_format", str(file_path)
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=self.timeout)
+            return json.loads(result.stdout or "{}")
+        except FileNotFoundError as e:
+            raise ProbeError("ffprobe not found; install ffmpeg to probe media files") from e
+        except subprocess.CalledProcessError as e:
+            raise ProbeError(f"ffprobe failed for {file_path.name}: {e.stderr.strip()}") from e
+        except (subprocess.TimeoutExpired, ValueError) as e:
+            raise ProbeError(f"ffprobe failed for {file_path.name}: {e}") from e
+
+
+_default_probe: Optional[MediaProbe] = None
+_default_probe_lock = threading.Lock()
+
+
+def get_default_probe() -> MediaProbe:
+    """Get the process-wide media probe shared by all modules."""
+    global _default_probe
+    with _default_probe_lock:
+        if _default_probe is None:
+            _default_probe = MediaProbe()
+    return _default_probe
+
+
+def probe_media(path: PathLike) -> MediaInfo:
+    """Probe a media file with the shared cache (see MediaProbe.probe)."""
+    return get_default_probe().probe(path)
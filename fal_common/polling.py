@@ -0,0 +1,154 @@
+"""
+Adaptive polling policy for FAL queue jobs.
+
+Decides how long to wait before the next status check of a job:
+
+- while queued, the wait grows with the queue position (a job 40th in line
+  will not start in the next few seconds);
+- once in progress, checks start frequent and back off exponentially;
+- when the endpoint has finished jobs before, the wait is aimed at the
+  expected completion time learned from those runs.
+
+The policy also counts status calls per endpoint so the cost of polling can
+be reported alongside generation results.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+# Job states (mirrors fal_common.job_engine)
+QUEUED = "QUEUED"
+IN_PROGRESS = "IN_PROGRESS"
+
+
+class PollingPolicy:
+    """
+    Computes status-check intervals from job state and per-endpoint history.
+
+    A single policy is shared by every job of an engine, so runtimes learned
+    from one Hailuo render shorten or lengthen the waits of the next one.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.5,
+        max_interval: float = 15.0,
+        queued_interval: float = 2.0,
+        queued_interval_per_position: float = 0.5,
+        backoff_factor: float = 1.5,
+        history_weight: float = 0.3
+    ):
+        """
+        Initialize the polling policy.
+
+        Args:
+            min_interval: Shortest wait between two status checks (seconds)
+            max_interval: Longest wait between two status checks (seconds)
+            queued_interval: Base wait while the job is queued
+            queued_interval_per_position: Extra wait per job ahead in the queue
+            backoff_factor: Growth of the wait per in-progress check
+            history_weight: Weight of the newest runtime in the moving average
+        """
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.queued_interval = queued_interval
+        self.queued_interval_per_position = queued_interval_per_position
+        self.backoff_factor = max(1.0, backoff_factor)
+        self.history_weight = history_weight
+        self._runtimes: Dict[str, float] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def fixed(cls, interval: float) -> "PollingPolicy":
+        """Create a policy that always waits ``interval`` seconds."""
+        return cls(
+            min_interval=interval,
+            max_interval=interval,
+            queued_interval=interval,
+            queued_interval_per_position=0.0,
+            backoff_factor=1.0,
+            history_weight=0.0
+        )
+
+    def next_interval(self, job: Any) -> float:
+        """
+        Get the wait before the next status check of a job.
+
+        Args:
+            job: FALJob after its latest status check
+
+        Returns:
+            Seconds to sleep before polling again
+        """
+        if job.status == QUEUED:
+            position = job.queue_position or 0
+            interval = self.queued_interval + self.queued_interval_per_position * position
+            return self._clamp(interval)
+
+        # In progress: exponential backoff from the minimum interval
+        checks = max(0, job.in_progress_checks - 1)
+        interval = self.min_interval * (self.backoff_factor ** checks)
+
+        # Aim at the expected completion time when the endpoint has history
+        expected = self.expected_runtime(job.endpoint)
+        if expected is not None and job.started_at is not None:
+            remaining = expected - job.running_time
+            if remaining > 0:
+                interval = max(interval, remaining / 2)
+
+        return self._clamp(interval)
+
+    def expected_runtime(self, endpoint: str) -> Optional[float]:
+        """Get the moving-average runtime of an endpoint, if known."""
+        with self._lock:
+            return self._runtimes.get(endpoint)
+
+    def record_status_call(self, endpoint: str):
+        """Count one status request for an endpoint."""
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, {"jobs": 0, "status_calls": 0})
+            stats["status_calls"] += 1
+
+    def record_runtime(self, endpoint: str, runtime: float):
+        """
+        Record the in-progress runtime of a finished job.
+
+        Args:
+            endpoint: FAL endpoint of the job
+            runtime: Seconds between the job starting and completing
+        """
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, {"jobs": 0, "status_calls": 0})
+            stats["jobs"] += 1
+            previous = self._runtimes.get(endpoint)
+            if previous is None or self.history_weight <= 0:
+                self._runtimes[endpoint] = runtime
+            else:
+                self._runtimes[endpoint] = (
+                    self.history_weight * runtime + (1 - self.history_weight) * previous
+                )
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get polling statistics per endpoint.
+
+        Returns:
+            Dictionary mapping endpoint to jobs, status_calls,
+            calls_per_job and expected_runtime
+        """
+        with self._lock:
+            report = {}
+            for endpoint, stats in self._stats.items():
+                jobs = stats["jobs"]
+                report[endpoint] = {
+                    "jobs": jobs,
+                    "status_calls": stats["status_calls"],
+                    "calls_per_job": round(stats["status_calls"] / jobs, 2) if jobs else None,
+                    "expected_runtime": self._runtimes.get(endpoint)
+                }
+            return report
+
+    def _clamp(self, interval: float) -> float:
+        """Keep an interval within [min_interval, max_interval]."""
+        return min(self.max_interval, max(self.min_interval, interval))
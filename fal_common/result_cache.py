@@ -0,0 +1,196 @@
+"""
+Content-addressed on-disk cache for FAL generation results.
+
+Results are stored as JSON files named after a SHA256 hash of the endpoint,
+model and canonicalized request parameters, so re-running a chain with the
+same prompt and parameters returns the earlier result in milliseconds
+instead of paying for a new generation.
+
+Generations without a pinned seed are random, so by default only requests
+with an explicit seed are cached (``seed_policy="pinned"``).
+
+Example:
+    cache = ResultCache()
+    key = cache.make_key("fal-ai/flux-1/dev", "flux_dev", {"prompt": "a fox", "seed": 7})
+    result = cache.get(key)
+    if result is None:
+        result = generate(...)
+        cache.put(key, result)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Seed policies
+SEED_PINNED = "pinned"
+SEED_ALWAYS = "always"
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "veo3-fal-tool" / "results"
+
+
+class ResultCache:
+    """
+    LRU result cache stored as one JSON file per request.
+
+    Every hit refreshes the entry's modification time; when the cache holds
+    more than ``max_entries`` files or ``max_bytes`` bytes, the least recently
+    used entries are removed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: int = 1000,
+        max_bytes: int = 50 * 1024 * 1024,
+        seed_policy: str = SEED_PINNED
+    ):
+        """
+        Initialize the result cache.
+
+        Args:
+            cache_dir: Directory for cache files (default: FAL_RESULT_CACHE_DIR
+                environment variable or ~/.cache/veo3-fal-tool/results)
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total size of cached results in bytes
+            seed_policy: "pinned" to cache only seeded requests, "always" to cache all
+        """
+        if seed_policy not in (SEED_PINNED, SEED_ALWAYS):
+            raise ValueError(f"seed_policy must be '{SEED_PINNED}' or '{SEED_ALWAYS}', got '{seed_policy}'")
+
+        self.cache_dir = Path(cache_dir or os.getenv("FAL_RESULT_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.seed_policy = seed_policy
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def canonicalize(params: Dict[str, Any]) -> str:
+        """Serialize parameters deterministically (sorted keys, no None values)."""
+        cleaned = {k: v for k, v in params.items() if v is not None}
+        return json.dumps(cleaned, sort_keys=True, separators=(",", ":"), default=str)
+
+    def make_key(self, endpoint: str, model: str, params: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            endpoint: FAL endpoint
+            model: Model name
+            params: Request parameters that affect the output
+
+        Returns:
+            SHA256 hex digest
+        """
+        content = f"{endpoint}\n{model}\n{self.canonicalize(params)}"
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def is_cacheable(self, params: Dict[str, Any]) -> bool:
+        """Check whether a request may be served from the cache under the seed policy."""
+        if self.seed_policy == SEED_ALWAYS:
+            return True
+        return params.get("seed") is not None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached result.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        path = self._path(key)
+        with self._lock:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                # Refresh LRU position
+                os.utime(path, None)
+            except (OSError, ValueError):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return entry.get("result")
+
+    def put(self, key: str, result: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None):
+        """
+        Store a result and evict old entries if limits are exceeded.
+
+        Args:
+            key: Key from ``make_key``
+            result: JSON-serializable result
+            metadata: Optional description stored alongside the result
+        """
+        entry = {
+            "key": key,
+            "created_at": time.time(),
+            "metadata": metadata or {},
+            "result": result
+        }
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        with self._lock:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp_path, path)
+            self._evict()
+
+    def invalidate(self, key: str) -> bool:
+        """Remove one entry; returns True if it existed."""
+        with self._lock:
+            try:
+                self._path(key).unlink()
+                return True
+            except FileNotFoundError:
+                return False
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            for path in self._entries():
+                path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counts and current cache size."""
+        with self._lock:
+            entries = self._entries()
+            return {
+                "cache_dir": str(self.cache_dir),
+                "entries": len(entries),
+                "total_bytes": sum(p.stat().st_size for p in entries),
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _entries(self) -> List[Path]:
+        return list(self.cache_dir.glob("*.json"))
+
+    def _evict(self):
+        """Remove least recently used entries beyond the configured limits."""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort(key=lambda e: e[0])
+        total_bytes = sum(size for _, size, _ in entries)
+
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, path = entries.pop(0)
+            path.unlink(missing_ok=True)
+            total_bytes -= size
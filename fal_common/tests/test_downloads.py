@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared download manager.
+
+Files are served by a local HTTP server that supports range requests and
+can be told to drop a connection part-way through a response.
+"""
+
+import hashlib
+import http.server
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add repository root to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from fal_common.downloads import DownloadError, DownloadManager
+
+PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
+
+
+class RangeHandler(http.server.BaseHTTPRequestHandler):
+    """Serves PAYLOAD with range support; truncates the first GET when asked.
+
+    With ``change_on_drop`` the ETag changes after the truncated response, as
+    if the file had been replaced.
+    """
+    protocol_version = "HTTP/1.1"
+    drop_next = False
+    change_on_drop = False
+    etag = '"v1"'
+    requests_seen = []
+    headers_seen = []
+
+    def do_HEAD(self):
+        RangeHandler.headers_seen.append(dict(self.headers))
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", RangeHandler.etag)
+        self.end_headers()
+
+    def do_GET(self):
+        RangeHandler.requests_seen.append(self.headers.get("Range"))
+        RangeHandler.headers_seen.append(dict(self.headers))
+        start, end = 0, len(PAYLOAD) - 1
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and if_range not in (None, RangeHandler.etag):
+            range_header = None
+        if range_header:
+            first, _, last = range_header[len("bytes="):].partition("-")
+            start, end = int(first), int(last) if last else len(PAYLOAD) - 1
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+        else:
+            self.send_response(200)
+        body = PAYLOAD[start:end + 1]
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", RangeHandler.etag)
+        self.end_headers()
+
+        if RangeHandler.drop_next:
+            RangeHandler.drop_next = False
+            if RangeHandler.change_on_drop:
+                RangeHandler.etag = '"v2"'
+            self.wfile.write(body[:len(body) // 3])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownloadManager(unittest.TestCase):
+    """Test streaming, resumed and parallel downloads."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/video.mp4"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        RangeHandler.drop_next = False
+        RangeHandler.change_on_drop = False
+        RangeHandler.etag = '"v1"'
+        RangeHandler.requests_seen = []
+        RangeHandler.headers_seen = []
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def target(self, name="video.mp4"):
+        return os.path.join(self.temp_dir, "nested", name)
+
+    def test_stream_download(self):
+        """Test a small file is streamed in one request and verified."""
+        manager = DownloadManager(chunk_size=64 * 1024)
+        path = manager.download(self.url, self.target(),
+                                expected_sha256=hashlib.sha256(PAYLOAD).hexdigest())
+        self.assertEqual(path.read_bytes(), PAYLOAD)
+        self.assertFalse(Path(str(path) + ".part").exists())
+        self.assertEqual(RangeHandler.requests_seen, [None])
+
+    def test_resume_after_dropped_connection(self):
+        """Test a truncated response is resumed with a range request."""
+        RangeHandler.drop_next = True
+        manager = DownloadManager(chunk_size=64 * 1024, retry_backoff=0)
+        path = manager.download(self.url, self.target())
+
+        self.assertEqual(path.read_bytes(), PAYLOAD)
+        self.assertTrue(RangeHandler.requests_seen[-1].startswith("bytes="))
+        self.assertEqual(manager.get_stats()["resumed"], 1)
+        self.assertEqual(RangeHandler.headers_seen[-1]["If-Range"], '"v1"')
+        self.assertTrue(all(h["Accept-Encoding"] == "identity" for h in RangeHandler.headers_seen))
+
+    def test_changed_file_restarts_instead_of_resuming(self):
+        """Test a resource replaced mid-download is fetched again in full."""
+        RangeHandler.drop_next = True
+        RangeHandler.change_on_drop = True
+        manager = DownloadManager(chunk_size=64 * 1024, retry_backoff=0)
+        path = manager.download(self.url, self.target())
+
+        self.assertEqual(path.read_bytes(), PAYLOAD)
+        self.assertEqual(RangeHandler.headers_seen[-1]["If-Range"], '"v1"')
+        self.assertEqual(manager.get_stats()["resumed"], 0)
+
+    def test_parallel_ranges(self):
+        """Test large files are fetched as concurrent byte ranges."""
+        manager = DownloadManager(chunk_size=64 * 1024, parallel_threshold=256 * 1024, max_parts=4)
+        progress = []
+        path = manager.download(self.url, self.target(), progress=lambda done, total: progress.append(done))
+
+        self.assertEqual(path.read_bytes(), PAYLOAD)
+        self.assertEqual(len(RangeHandler.requests_seen), 4)
+        self.assertEqual(progress[-1], len(PAYLOAD))
+        self.assertEqual(manager.get_stats()["parallel"], 1)
+
+    def test_checksum_mismatch(self):
+        """Test a file that fails verification is removed and reported."""
+        manager = DownloadManager()
+        with self.assertRaises(DownloadError):
+            manager.download(self.url, self.target(), expected_sha256="0" * 64)
+        self.assertEqual(os.listdir(os.path.join(self.temp_dir, "nested")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared per-host HTTP client.
+
+Responses come from a local HTTP server that plays back a scripted list of
+status codes, so retries and the circuit breaker run without real APIs.
+"""
+
+import http.server
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add repository root to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from fal_common.http_client import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_OPEN,
+    CircuitOpenError,
+    HostClient,
+    get_host_client,
+    parse_retry_after
+)
+
+
+class ScriptedHandler(http.server.BaseHTTPRequestHandler):
+    """Answers each request with the next (status, headers) pair from the script."""
+    protocol_version = "HTTP/1.1"
+    script = []
+    requests_seen = 0
+
+    def do_GET(self):
+        ScriptedHandler.requests_seen += 1
+        status, headers = ScriptedHandler.script.pop(0) if ScriptedHandler.script else (200, {})
+        body = b"ok"
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHostClient(unittest.TestCase):
+    """Test retries, Retry-After handling, circuit breaking and metrics."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ScriptedHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/v1/voices"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self):
+        ScriptedHandler.script = []
+        ScriptedHandler.requests_seen = 0
+        self.client = HostClient("local", backoff=0.01, reset_timeout=0.2, failure_threshold=2)
+
+    def test_retry_after_is_honored(self):
+        ScriptedHandler.script = [(429, {"Retry-After": "0.3"}), (200, {})]
+
+        start = time.monotonic()
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+        stats = self.client.get_stats()
+        self.assertEqual(stats["retries"], 1)
+        self.assertEqual(stats["status_counts"], {429: 1, 200: 1})
+        self.assertEqual(sum(stats["latency_histogram"].values()), 2)
+
+    def test_rate_limits_do_not_open_circuit(self):
+        ScriptedHandler.script = [(429, {})] * 3
+
+        response = self.client.get(self.url, max_retries=2)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(self.client.circuit_state, CIRCUIT_CLOSED)
+
+    def test_circuit_opens_and_recovers(self):
+        ScriptedHandler.script = [(503, {}), (503, {})]
+
+        self.assertEqual(self.client.get(self.url, max_retries=1).status_code, 503)
+        self.assertEqual(self.client.circuit_state, CIRCUIT_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.client.get(self.url)
+        self.assertEqual(ScriptedHandler.requests_seen, 2)
+
+        # After the cooldown a single probe closes the circuit again
+        time.sleep(0.25)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.assertEqual(self.client.circuit_state, CIRCUIT_CLOSED)
+        self.assertEqual(self.client.get_stats()["rejected"], 1)
+
+    def test_one_client_per_host(self):
+        first = get_host_client("https://api.example.com/v1")
+        second = get_host_client("https://api.example.com/v1/voices")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, get_host_client("https://openrouter.example.com/api/v1"))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("2"), 2.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Tests for the asyncio FAL job engine.
+
+A fake async client replays scripted queue statuses, so no API calls are made.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import fal_client
+
+# Add repository root to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from fal_common.job_engine import (
+    FALJob, FALJobEngine, FALJobError, COMPLETED, FAILED, IN_PROGRESS, QUEUED, TIMEOUT
+)
+from fal_common.polling import PollingPolicy
+
+
+class FakeAsyncClient:
+    """Async FAL client returning scripted statuses for every request."""
+
+    def __init__(self, statuses=None, error=None, delay=0.0):
+        self.statuses = statuses or [fal_client.Queued(position=2),
+                                     fal_client.InProgress(logs=[]),
+                                     fal_client.Completed(logs=None, metrics={})]
+        self.error = error
+        self.delay = delay
+        self.submitted = []
+        self.cancelled = []
+        self._checks = {}
+        self.active = 0
+        self.max_active = 0
+
+    async def submit(self, endpoint, arguments):
+        request_id = f"req-{len(self.submitted)}"
+        self.submitted.append((endpoint, arguments))
+        self._checks[request_id] = 0
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        return SimpleNamespace(request_id=request_id)
+
+    async def status(self, endpoint, request_id, with_logs=False):
+        await asyncio.sleep(self.delay)
+        index = min(self._checks[request_id], len(self.statuses) - 1)
+        self._checks[request_id] += 1
+        status = self.statuses[index]
+        if isinstance(status, fal_client.Completed) and self.error:
+            return fal_client.Completed(logs=None, metrics={}, error=self.error, error_type="runtime")
+        return status
+
+    async def result(self, endpoint, request_id):
+        self.active -= 1
+        return {"request_id": request_id, "endpoint": endpoint}
+
+    async def cancel(self, endpoint, request_id):
+        self.active -= 1
+        self.cancelled.append(request_id)
+
+
+class LoopBoundClient(FakeAsyncClient):
+    """Fake client that, like httpx, only works on the loop it was first used on."""
+
+    created = []
+
+    def __init__(self):
+        super().__init__()
+        self.loop = None
+        LoopBoundClient.created.append(self)
+
+    async def submit(self, endpoint, arguments):
+        loop = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = loop
+        elif self.loop is not loop:
+            raise RuntimeError("Event loop is closed")
+        return await super().submit(endpoint, arguments)
+
+
+class TestFALJobEngine(unittest.TestCase):
+    """Test job submission, polling and concurrency."""
+
+    def test_run_returns_result(self):
+        """Test a job is polled through queue states to its result."""
+        client = FakeAsyncClient()
+        engine = FALJobEngine(client=client, polling=PollingPolicy.fixed(0))
+        updates = []
+
+        result = engine.run_sync("fal-ai/test", {"prompt": "fox"},
+                                 on_update=lambda job, status: updates.append(job.queue_position))
+
+        self.assertEqual(result["request_id"], "req-0")
+        self.assertEqual(updates, [2, None, None])
+
+    def test_run_job_records_status_checks(self):
+        """Test run_job reports the final state and number of status calls."""
+        engine = FALJobEngine(client=FakeAsyncClient(), polling=PollingPolicy.fixed(0))
+
+        job = asyncio.run(engine.run_job("fal-ai/test", {"prompt": "fox"}))
+
+        self.assertEqual(job.status, COMPLETED)
+        self.assertEqual(job.status_checks, 3)
+        self.assertIsNotNone(job.result)
+        self.assertGreaterEqual(job.elapsed, 0)
+
+    def test_completed_with_error_fails(self):
+        """Test an error reported on completion raises FALJobError."""
+        engine = FALJobEngine(client=FakeAsyncClient(error="NSFW content"), polling=PollingPolicy.fixed(0))
+
+        with self.assertRaises(FALJobError) as ctx:
+            engine.run_sync("fal-ai/test", {})
+
+        self.assertEqual(ctx.exception.job.status, FAILED)
+        self.assertIn("NSFW content", str(ctx.exception))
+
+    def test_timeout_cancels_job(self):
+        """Test a job still queued at the deadline is cancelled."""
+        client = FakeAsyncClient(statuses=[fal_client.Queued(position=1)])
+        engine = FALJobEngine(client=client, polling=PollingPolicy.fixed(0.01), timeout=0.05)
+
+        job = asyncio.run(engine.run_job("fal-ai/test", {}))
+
+        self.assertEqual(job.status, TIMEOUT)
+        self.assertEqual(client.cancelled, ["req-0"])
+
+    def test_run_many_keeps_order_and_bounds_concurrency(self):
+        """Test run_many returns jobs in input order with max_in_flight respected."""
+        client = FakeAsyncClient(delay=0.01)
+        engine = FALJobEngine(client=client, max_in_flight=3, polling=PollingPolicy.fixed(0))
+        requests = [("fal-ai/test", {"index": i}) for i in range(10)]
+
+        jobs = asyncio.run(engine.run_many(requests))
+
+        self.assertEqual([job.arguments["index"] for job in jobs], list(range(10)))
+        self.assertTrue(all(job.status == COMPLETED for job in jobs))
+        self.assertEqual(client.max_active, 3)
+
+    def test_run_sync_reuses_one_client_across_calls(self):
+        """Test repeated blocking calls share the background loop and its client."""
+        LoopBoundClient.created = []
+        engine = FALJobEngine(polling=PollingPolicy.fixed(0))
+
+        with mock.patch("fal_client.AsyncClient", LoopBoundClient):
+            first = engine.run_sync("fal-ai/test", {})
+            second = engine.run_sync("fal-ai/test", {})
+            batch = engine.run_coroutine(engine.run_many([("fal-ai/test", {})] * 3))
+
+        self.assertEqual((first["request_id"], second["request_id"]), ("req-0", "req-1"))
+        self.assertTrue(all(job.status == COMPLETED for job in batch))
+        self.assertEqual(len(LoopBoundClient.created), 1)
+
+    def test_separate_event_loops_get_their_own_client(self):
+        """Test coroutines run under different asyncio.run loops do not share a client."""
+        LoopBoundClient.created = []
+        engine = FALJobEngine(polling=PollingPolicy.fixed(0))
+
+        with mock.patch("fal_client.AsyncClient", LoopBoundClient):
+            asyncio.run(engine.run("fal-ai/test", {}))
+            asyncio.run(engine.run("fal-ai/test", {}))
+
+        self.assertEqual(len(LoopBoundClient.created), 2)
+
+    def test_run_sync_from_threads_shares_in_flight_limit(self):
+        """Test blocking calls from many threads are bounded by one semaphore."""
+        client = FakeAsyncClient(delay=0.01)
+        engine = FALJobEngine(client=client, max_in_flight=2, polling=PollingPolicy.fixed(0))
+        threads = [threading.Thread(target=engine.run_sync, args=("fal-ai/test", {})) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(client.submitted), 8)
+        self.assertEqual(client.max_active, 2)
+
+    def test_run_sync_inside_running_loop(self):
+        """Test blocking calls work from a thread that is running its own loop."""
+        engine = FALJobEngine(client=FakeAsyncClient(), polling=PollingPolicy.fixed(0))
+
+        async def notebook_cell():
+            return engine.run_sync("fal-ai/test", {})
+
+        self.assertEqual(asyncio.run(notebook_cell())["request_id"], "req-0")
+
+    def test_polling_stats_reported(self):
+        """Test the engine reports status calls and runtimes per endpoint."""
+        engine = FALJobEngine(client=FakeAsyncClient(), polling=PollingPolicy.fixed(0))
+
+        asyncio.run(engine.run_many([("fal-ai/test", {}), ("fal-ai/test", {})]))
+
+        stats = engine.get_polling_stats()["fal-ai/test"]
+        self.assertEqual(stats["jobs"], 2)
+        self.assertEqual(stats["status_calls"], 6)
+        self.assertEqual(stats["calls_per_job"], 3)
+        self.assertIsNotNone(stats["expected_runtime"])
+
+
+class TestPollingPolicy(unittest.TestCase):
+    """Test interval selection of the adaptive polling policy."""
+
+    def setUp(self):
+        self.policy = PollingPolicy(min_interval=0.5, max_interval=15.0, queued_interval=2.0,
+                                    queued_interval_per_position=0.5, backoff_factor=2.0)
+
+    def make_job(self, status, queue_position=None, in_progress_checks=0, running_time=None):
+        job = FALJob(endpoint="fal-ai/hailuo", arguments={}, status=status,
+                     queue_position=queue_position, in_progress_checks=in_progress_checks)
+        if running_time is not None:
+            job.started_at = time.time() - running_time
+        return job
+
+    def test_queued_interval_grows_with_position(self):
+        """Test jobs further back in the queue are polled less often."""
+        near = self.policy.next_interval(self.make_job(QUEUED, queue_position=0))
+        far = self.policy.next_interval(self.make_job(QUEUED, queue_position=40))
+        self.assertEqual(near, 2.0)
+        self.assertEqual(far, 15.0)
+
+    def test_in_progress_backs_off(self):
+        """Test in-progress polling starts fast and backs off."""
+        intervals = [
+            self.policy.next_interval(self.make_job(IN_PROGRESS, in_progress_checks=n, running_time=0))
+            for n in (1, 2, 3)
+        ]
+        self.assertEqual(intervals, [0.5, 1.0, 2.0])
+
+    def test_history_targets_expected_runtime(self):
+        """Test a learned runtime stretches the wait toward expected completion."""
+        self.policy.record_runtime("fal-ai/hailuo", 20.0)
+        early = self.policy.next_interval(self.make_job(IN_PROGRESS, in_progress_checks=1, running_time=2))
+        late = self.policy.next_interval(self.make_job(IN_PROGRESS, in_progress_checks=1, running_time=25))
+        self.assertAlmostEqual(early, 9.0, places=1)
+        self.assertEqual(late, 0.5)
+
+    def test_runtime_moving_average(self):
+        """Test runtimes are blended into a moving average."""
+        policy = PollingPolicy(history_weight=0.5)
+        policy.record_runtime("fal-ai/kling", 10.0)
+        policy.record_runtime("fal-ai/kling", 20.0)
+        self.assertEqual(policy.expected_runtime("fal-ai/kling"), 15.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached ffprobe metadata service.
+
+A small script stands in for ffprobe: it prints canned JSON and appends a
+line to a log on every run, so the number of probes can be counted.
+"""
+
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add repository root to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from fal_common.media_probe import MediaInfo, MediaProbe, ProbeError, parse_frame_rate
+
+FFPROBE_OUTPUT = {
+    "streams": [
+        {"codec_type": "video", "codec_name": "h264", "width": 1280, "height": 720,
+         "r_frame_rate": "30000/1001", "avg_frame_rate": "30000/1001", "pix_fmt": "yuv420p",
+         "bit_rate": "2500000", "nb_frames": "240"},
+        {"codec_type": "audio", "codec_name": "aac", "sample_rate": "48000",
+         "channels": 2, "bit_rate": "128000"},
+        {"codec_type": "video", "codec_name": "mjpeg", "disposition": {"attached_pic": 1}}
+    ],
+    "format": {"format_name": "mov,mp4,m4a,3gp,3g2,mj2", "duration": "8.008000",
+               "size": "2640000", "bit_rate": "2637362"}
+}
+
+FAKE_FFPROBE = """#!{python}
+import json, sys
+with open({log!r}, "a") as f:
+    f.write(sys.argv[-1] + "\\n")
+print(json.dumps({output!r}))
+"""
+
+
+class TestMediaProbe(unittest.TestCase):
+    """Test parsing and the (path, size, mtime) cache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log = os.path.join(self.temp_dir, "probes.log")
+        self.ffprobe = os.path.join(self.temp_dir, "ffprobe")
+        with open(self.ffprobe, "w") as f:
+            f.write(FAKE_FFPROBE.format(python=sys.executable, log=self.log, output=FFPROBE_OUTPUT))
+        os.chmod(self.ffprobe, os.stat(self.ffprobe).st_mode | stat.S_IEXEC)
+        self.video = Path(self.temp_dir) / "clip.mp4"
+        self.video.write_bytes(b"video")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def probe_count(self) -> int:
+        if not os.path.exists(self.log):
+            return 0
+        with open(self.log) as f:
+            return len(f.readlines())
+
+    def test_parses_streams_and_format(self):
+        info = MediaInfo.from_ffprobe("clip.mp4", FFPROBE_OUTPUT)
+
+        self.assertAlmostEqual(info.duration, 8.008)
+        self.assertEqual(info.file_size, 2640000)
+        self.assertEqual((info.video.codec, info.video.width, info.video.height), ("h264", 1280, 720))
+        self.assertAlmostEqual(info.video.fps, 29.97, places=2)
+        self.assertEqual(info.video.frame_rate, "30000/1001")
+        self.assertEqual((info.audio.codec, info.audio.sample_rate, info.audio.channels), ("aac", 48000, 2))
+
+    def test_audio_only_file(self):
+        data = {"streams": [{"codec_type": "audio", "codec_name": "mp3", "duration": "3.5"}],
+                "format": {"format_name": "mp3"}}
+
+        info = MediaInfo.from_ffprobe("voice.mp3", data)
+
+        self.assertFalse(info.has_video)
+        self.assertTrue(info.has_audio)
+        self.assertEqual(info.duration, 3.5)
+
+    def test_repeat_probes_hit_cache(self):
+        probe = MediaProbe(ffprobe=self.ffprobe)
+
+        first = probe.probe(self.video)
+        second = probe.probe(str(self.video))
+
+        self.assertIs(first, second)
+        self.assertEqual(self.probe_count(), 1)
+        self.assertEqual(probe.get_stats(), {"entries": 1, "hits": 1, "probes": 1})
+
+    def test_modified_file_is_probed_again(self):
+        probe = MediaProbe(ffprobe=self.ffprobe)
+
+        probe.probe(self.video)
+        self.video.write_bytes(b"re-encoded video")
+        os.utime(self.video, ns=(time.time_ns(), time.time_ns() + 1000))
+        probe.probe(self.video)
+
+        self.assertEqual(self.probe_count(), 2)
+
+    def test_errors(self):
+        with self.assertRaises(ProbeError):
+            MediaProbe(ffprobe=self.ffprobe).probe(Path(self.temp_dir) / "missing.mp4")
+        with self.assertRaises(ProbeError):
+            MediaProbe(ffprobe=os.path.join(self.temp_dir, "no-ffprobe")).probe(self.video)
+
+    def test_parse_frame_rate(self):
+        self.assertEqual(parse_frame_rate("25/1"), 25.0)
+        self.assertIsNone(parse_frame_rate("0/0"))
+        self.assertIsNone(parse_frame_rate(None))
+
+    def test_import_does_not_need_fal_client(self):
+        """Test ffmpeg-only users can import the probe without fal_client or requests."""
+        script = (
+            "import sys\n"
+            "sys.modules['fal_client'] = sys.modules['requests'] = None\n"
+            "from fal_common.media_probe import probe_media\n"
+            "from fal_common import ProbeError\n"
+        )
+        root = str(Path(__file__).resolve().parent.parent.parent)
+        result = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed FAL result cache.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add repository root to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from fal_common.result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    """Test keying, seed policy and eviction."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_key_ignores_param_order_and_none(self):
+        """Test equivalent parameter dictionaries hash to the same key."""
+        cache = ResultCache(self.temp_dir)
+        a = cache.make_key("fal-ai/flux-1/dev", "flux_dev", {"prompt": "fox", "seed": 1, "steps": None})
+        b = cache.make_key("fal-ai/flux-1/dev", "flux_dev", {"seed": 1, "prompt": "fox"})
+        c = cache.make_key("fal-ai/flux-1/dev", "flux_dev", {"seed": 2, "prompt": "fox"})
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+
+    def test_round_trip_counts_hits(self):
+        """Test stored results are returned and hits/misses counted."""
+        cache = ResultCache(self.temp_dir)
+        key = cache.make_key("e", "m", {"seed": 1})
+
+        self.assertIsNone(cache.get(key))
+        cache.put(key, {"image_url": "https://example.com/a.png"})
+        self.assertEqual(cache.get(key), {"image_url": "https://example.com/a.png"})
+
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+
+    def test_seed_policy(self):
+        """Test only seeded requests are cacheable under the default policy."""
+        self.assertFalse(ResultCache(self.temp_dir).is_cacheable({"prompt": "fox"}))
+        self.assertTrue(ResultCache(self.temp_dir).is_cacheable({"prompt": "fox", "seed": 0}))
+        self.assertTrue(ResultCache(self.temp_dir, seed_policy="always").is_cacheable({"prompt": "fox"}))
+        with self.assertRaises(ValueError):
+            ResultCache(self.temp_dir, seed_policy="sometimes")
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted past max_entries."""
+        cache = ResultCache(self.temp_dir, max_entries=2)
+        keys = [cache.make_key("e", "m", {"seed": i}) for i in range(3)]
+
+        cache.put(keys[0], {"i": 0})
+        cache.put(keys[1], {"i": 1})
+        # Age both entries, then touch the first so the second becomes LRU
+        for key in keys[:2]:
+            old = time.time() - 100
+            os.utime(Path(self.temp_dir) / f"{key}.json", (old, old))
+        cache.get(keys[0])
+        cache.put(keys[2], {"i": 2})
+
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+
+    def test_size_eviction(self):
+        """Test entries are evicted once max_bytes is exceeded."""
+        cache = ResultCache(self.temp_dir, max_bytes=300)
+        for i in range(5):
+            cache.put(cache.make_key("e", "m", {"seed": i}), {"payload": "x" * 100})
+        self.assertLessEqual(cache.get_stats()["total_bytes"], 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent FAL upload cache.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add repository root to path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from fal_common.upload_cache import UploadCache
+
+
+class FakeUploader:
+    """Records uploads like fal_client.upload_file."""
+
+    def __init__(self):
+        self.uploaded = []
+
+    def upload(self, path: str) -> str:
+        self.uploaded.append(path)
+        return f"https://v3.fal.media/files/{len(self.uploaded)}.png"
+
+    async def upload_async(self, path: str) -> str:
+        await asyncio.sleep(0.01)
+        return self.upload(path)
+
+
+def record_uploads(cache_dir: str, paths):
+    """Record fake uploads from a separate process."""
+    cache = UploadCache(cache_dir)
+    for path in paths:
+        cache.put(path, f"https://v3.fal.media/files/{Path(path).name}")
+
+
+class TestUploadCache(unittest.TestCase):
+    """Test content-addressed reuse, expiry and persistence."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_file(self, name: str, content: bytes) -> Path:
+        path = Path(self.temp_dir) / name
+        path.write_bytes(content)
+        return path
+
+    def test_same_content_uploaded_once_across_instances(self):
+        """Test identical bytes at another path, in a new cache instance, reuse the URL."""
+        uploader = FakeUploader()
+        image = self.make_file("portrait.png", b"image-bytes")
+        copy = self.make_file("copy.png", b"image-bytes")
+
+        first = UploadCache(self.cache_dir).get_or_upload(image, uploader.upload)
+        cache = UploadCache(self.cache_dir)
+        second = cache.get_or_upload(copy, uploader.upload)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(uploader.uploaded), 1)
+        self.assertEqual(cache.get_stats()["bytes_saved"], len(b"image-bytes"))
+
+    def test_changed_file_is_uploaded_again(self):
+        """Test a modified file is re-hashed and uploaded."""
+        uploader = FakeUploader()
+        cache = UploadCache(self.cache_dir)
+        image = self.make_file("frame.png", b"v1")
+
+        first = cache.get_or_upload(image, uploader.upload)
+        image.write_bytes(b"version-2")
+        os.utime(image, ns=(time.time_ns(), time.time_ns() + 1000))
+        second = cache.get_or_upload(image, uploader.upload)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(uploader.uploaded), 2)
+
+    def test_expired_urls_are_not_reused(self):
+        """Test URLs older than the TTL trigger a new upload."""
+        uploader = FakeUploader()
+        cache = UploadCache(self.cache_dir, ttl=0.05)
+        video = self.make_file("clip.mp4", b"video-bytes")
+
+        cache.get_or_upload(video, uploader.upload)
+        time.sleep(0.1)
+        cache.get_or_upload(video, uploader.upload)
+
+        self.assertEqual(len(uploader.uploaded), 2)
+        self.assertEqual(cache.get_stats()["hits"], 0)
+
+    def test_async_upload(self):
+        """Test the async variant shares entries with the sync one."""
+        uploader = FakeUploader()
+        cache = UploadCache(self.cache_dir)
+        image = self.make_file("avatar.png", b"avatar")
+
+        url = asyncio.run(cache.get_or_upload_async(image, uploader.upload_async))
+
+        self.assertEqual(cache.get(image), url)
+        self.assertEqual(asyncio.run(cache.get_or_upload_async(image, uploader.upload_async)), url)
+        self.assertEqual(len(uploader.uploaded), 1)
+
+    def test_concurrent_async_uploads_share_one_upload(self):
+        """Test concurrent async calls for the same content upload it once."""
+        uploader = FakeUploader()
+        cache = UploadCache(self.cache_dir)
+        image = self.make_file("frame.png", b"frame")
+        copy = self.make_file("frame-copy.png", b"frame")
+
+        async def upload_all():
+            return await asyncio.gather(*[
+                cache.get_or_upload_async(path, uploader.upload_async) for path in (image, copy) * 3
+            ])
+
+        urls = asyncio.run(upload_all())
+
+        self.assertEqual(len(set(urls)), 1)
+        self.assertEqual(len(uploader.uploaded), 1)
+        self.assertEqual(cache.get_stats()["hits"], 5)
+
+    def test_processes_do_not_lose_entries(self):
+        """Test concurrent writers in separate processes keep each other's entries."""
+        groups = [[str(self.make_file(f"p{p}-{i}.png", f"{p}-{i}".encode())) for i in range(10)]
+                  for p in range(4)]
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=record_uploads, args=(self.cache_dir, group)) for group in groups]
+
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        cache = UploadCache(self.cache_dir)
+        self.assertEqual(cache.get_stats()["entries"], 40)
+        self.assertTrue(all(cache.get(path) for group in groups for path in group))
+
+
+if __name__ == "__main__":
+    unittest.main()
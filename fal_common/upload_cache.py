@@ -0,0 +1,292 @@
+"""
+Persistent cache of files uploaded to FAL storage.
+
+Uploading the same source image or video for every run of a chain (or every
+avatar conversation) wastes seconds to minutes per file. The cache maps the
+SHA256 of a file's contents to the CDN URL FAL returned for it, so a later
+upload of identical bytes - from any path, in any process - reuses the URL.
+Hashing is skipped when a path's size and modification time are unchanged.
+URLs older than the TTL are treated as expired and the file is uploaded again.
+
+Example:
+    cache = get_default_upload_cache()
+    url = cache.get_or_upload("input/portrait.png", fal_client.upload_file)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: readers stay safe through atomic replace
+    fcntl = None
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "veo3-fal-tool" / "uploads"
+
+PathLike = Union[str, Path]
+
+
+class UploadCache:
+    """
+    Content-addressed map from local files to FAL storage URLs.
+
+    The index is one JSON file holding URL entries keyed by content hash and
+    a path index of (size, mtime) stamps. It is re-read before every lookup
+    and replaced atomically on every write. Writers hold an exclusive file
+    lock for the whole read-modify-write, so several processes can share it
+    without losing each other's entries.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl: float = 24 * 60 * 60,
+        max_paths: int = 2000
+    ):
+        """
+        Initialize the upload cache.
+
+        Args:
+            cache_dir: Directory for the index (default: FAL_UPLOAD_CACHE_DIR
+                environment variable or ~/.cache/veo3-fal-tool/uploads)
+            ttl: Seconds an uploaded URL is reused before the file is uploaded again
+            max_paths: Maximum number of remembered path stamps
+        """
+        self.cache_dir = Path(cache_dir or os.getenv("FAL_UPLOAD_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.cache_dir / "index.json"
+        self.ttl = ttl
+        self.max_paths = max_paths
+        self.hits = 0
+        self.uploads = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._async_key_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = \
+            weakref.WeakKeyDictionary()
+
+    def content_hash(self, file_path: PathLike) -> str:
+        """
+        SHA256 of a file's contents, reusing the stored hash if size and mtime match.
+
+        Args:
+            file_path: Local file
+
+        Returns:
+            SHA256 hex digest
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        with self._lock:
+            stamp = self._load()["paths"].get(str(path))
+        if stamp and stamp["size"] == stat.st_size and stamp["mtime_ns"] == stat.st_mtime_ns:
+            return stamp["sha256"]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        sha256 = digest.hexdigest()
+
+        with self._update_index() as index:
+            index["paths"].pop(str(path), None)
+            index["paths"][str(path)] = {
+                "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256
+            }
+        return sha256
+
+    def get(self, file_path: PathLike) -> Optional[str]:
+        """
+        Get the URL of an earlier upload of the same content.
+
+        Args:
+            file_path: Local file
+
+        Returns:
+            CDN URL, or None if the content was never uploaded or its URL expired
+        """
+        key = self.content_hash(file_path)
+        with self._lock:
+            entry = self._load()["uploads"].get(key)
+        if entry and time.time() - entry["uploaded_at"] < self.ttl:
+            return entry["url"]
+        return None
+
+    def put(self, file_path: PathLike, url: str):
+        """
+        Record the URL an upload of a file returned.
+
+        Args:
+            file_path: Local file that was uploaded
+            url: URL returned by FAL storage
+        """
+        key = self.content_hash(file_path)
+        size = Path(file_path).stat().st_size
+        with self._update_index() as index:
+            index["uploads"][key] = {"url": url, "size": size, "uploaded_at": time.time()}
+
+    def get_or_upload(self, file_path: PathLike, upload_fn: Callable[[str], str]) -> str:
+        """
+        Return the cached URL for a file, uploading it if needed.
+
+        Concurrent calls for the same content in one process wait for a single upload.
+
+        Args:
+            file_path: Local file
+            upload_fn: Function uploading a path and returning its URL (e.g. fal_client.upload_file)
+
+        Returns:
+            CDN URL of the file's contents
+        """
+        key = self.content_hash(file_path)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            url = self._reuse(file_path)
+            if url:
+                return url
+            url = upload_fn(str(file_path))
+            self._record_upload(file_path, url)
+            return url
+
+    async def get_or_upload_async(
+        self,
+        file_path: PathLike,
+        upload_fn: Callable[[str], Awaitable[str]]
+    ) -> str:
+        """
+        Async variant of ``get_or_upload`` (e.g. with fal_client.upload_file_async).
+
+        Hashing runs in the default executor so large files do not block the
+        event loop. Concurrent calls for the same content on one event loop
+        wait for a single upload.
+        """
+        loop = asyncio.get_running_loop()
+        key = await loop.run_in_executor(None, self.content_hash, file_path)
+        with self._lock:
+            loop_locks = self._async_key_locks.setdefault(loop, {})
+            key_lock = loop_locks.setdefault(key, asyncio.Lock())
+
+        async with key_lock:
+            url = await loop.run_in_executor(None, self._reuse, file_path)
+            if url:
+                return url
+            url = await upload_fn(str(file_path))
+            await loop.run_in_executor(None, self._record_upload, file_path, url)
+            return url
+
+    def clear(self):
+        """Forget all uploads and path stamps."""
+        with self._lock, self._file_lock():
+            self.index_path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get reuse counts and the number of cached uploads."""
+        with self._lock:
+            index = self._load()
+        now = time.time()
+        live = [e for e in index["uploads"].values() if now - e["uploaded_at"] < self.ttl]
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(live),
+            "hits": self.hits,
+            "uploads": self.uploads,
+            "bytes_saved": self.bytes_saved
+        }
+
+    def _reuse(self, file_path: PathLike) -> Optional[str]:
+        url = self.get(file_path)
+        if url:
+            with self._lock:
+                self.hits += 1
+                self.bytes_saved += Path(file_path).stat().st_size
+            print(f"♻️ Reusing uploaded file: {url}")
+        return url
+
+    def _record_upload(self, file_path: PathLike, url: str):
+        self.put(file_path, url)
+        with self._lock:
+            self.uploads += 1
+
+    @contextmanager
+    def _update_index(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """Load the index for modification and save it when the block exits."""
+        with self._lock, self._file_lock():
+            index = self._load()
+            yield index
+            self._save(index)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """
+        Serialize index writes across processes.
+
+        Only writers take this lock; readers rely on the atomic replace in _save().
+        """
+        if fcntl is None:
+            yield
+            return
+
+        try:
+            lock_file = open(self.index_path.with_suffix(".lock"), "w")
+        except OSError:
+            yield
+            return
+
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the index (caller holds the lock)."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if isinstance(index.get("uploads"), dict) and isinstance(index.get("paths"), dict):
+                return index
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {"uploads": {}, "paths": {}}
+
+    def _save(self, index: Dict[str, Dict[str, Any]]):
+        """Drop expired entries and write the index atomically (caller holds the lock)."""
+        cutoff = time.time() - self.ttl
+        index["uploads"] = {k: v for k, v in index["uploads"].items() if v["uploaded_at"] >= cutoff}
+        if len(index["paths"]) > self.max_paths:
+            # Dicts keep insertion order, so the oldest stamps go first
+            for path in list(index["paths"])[:len(index["paths"]) - self.max_paths]:
+                del index["paths"][path]
+
+        tmp_path = self.index_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            print(f"⚠️ Could not write upload cache {self.index_path}: {e}")
+
+
+_default_cache: Optional[UploadCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_upload_cache() -> UploadCache:
+    """Get the process-wide upload cache shared by all generators."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = UploadCache()
+    return _default_cache
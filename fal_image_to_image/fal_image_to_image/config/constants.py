@@ -27,6 +27,24 @@ REFRAME_ENDPOINTS = {
     "photon_base": "fal-ai/luma-photon/reframe"
 }
 
+# Request rate limits per endpoint: (requests per second, burst size).
+# Conservative defaults; raise them to match the limits of your FAL account.
+DEFAULT_RATE_LIMIT = (2.0, 4)
+ENDPOINT_RATE_LIMITS = {
+    "fal-ai/luma-photon/flash/modify": (2.0, 4),
+    "fal-ai/luma-photon/modify": (1.0, 2),
+    "fal-ai/luma-photon/flash/reframe": (2.0, 4),
+    "fal-ai/luma-photon/reframe": (1.0, 2),
+    "fal-ai/flux-kontext/dev": (2.0, 4),
+    "fal-ai/flux-pro/kontext/max/multi": (1.0, 2),
+    "fal-ai/bytedance/seededit/v3/edit-image": (4.0, 8),
+    "fal-ai/clarity-upscaler": (1.0, 2)
+}
+
+# Batch processing
+DEFAULT_BATCH_CONCURRENCY = 8  # Images edited at the same time
+DEFAULT_DOWNLOAD_CONCURRENCY = 4  # Result images of one edit downloaded at the same time
+
 # Aspect ratios for different models
 ASPECT_RATIOS = ["1:1", "16:9", "9:16", "4:3", "3:4", "21:9", "9:21"]
 KONTEXT_MULTI_ASPECT_RATIOS = ["21:9", "16:9", "4:3", "3:2", "1:1", "2:3", "3:4", "9:16", "9:21"]
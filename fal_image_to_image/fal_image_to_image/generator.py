@@ -5,6 +5,8 @@ This module provides a unified interface for multiple FAL AI image editing model
 """
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 import fal_client
@@ -12,7 +14,7 @@ from dotenv import load_dotenv
 
 from .models import PhotonModel, PhotonBaseModel, KontextModel, KontextMultiModel, SeedEditModel, ClarityModel
 from .utils.file_utils import upload_local_image, ensure_output_directory
-from .config.constants import SUPPORTED_MODELS, MODEL_INFO, ModelType
+from .config.constants import SUPPORTED_MODELS, MODEL_INFO, ModelType, DEFAULT_BATCH_CONCURRENCY
 
 # Load environment variables
 load_dotenv()
@@ -291,47 +293,80 @@ class FALImageToImageGenerator:
         image_urls: List[str],
         model: ModelType = "photon",
         output_dir: Optional[str] = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
         **kwargs
     ) -> List[Dict[str, Any]]:
         """
-        Modify multiple images with different prompts.
+        Modify multiple images with different prompts concurrently.
+        
+        Up to ``max_concurrency`` images are uploaded, edited and downloaded
+        at the same time. Requests are spaced by the model endpoint's token
+        bucket (see ENDPOINT_RATE_LIMITS), so a batch takes about as long as
+        its slowest requests instead of the sum of all of them.
         
         Args:
             prompts: List of text instructions
-            image_urls: List of image URLs
+            image_urls: List of image URLs or local image paths (uploaded first)
             model: Model to use for all modifications
             output_dir: Custom output directory
+            max_concurrency: Maximum number of images processed at the same time
             **kwargs: Model-specific parameters
             
         Returns:
-            List of generation results for each image
+            List of generation results in input order, each with batch_index,
+            upload_time and item_time
         """
         if len(prompts) != len(image_urls):
             raise ValueError("Number of prompts must match number of image URLs")
+        if model not in self.models:
+            raise ValueError(f"Unsupported model: {model}. Supported models: {list(self.models.keys())}")
         
-        results = []
         total_images = len(prompts)
+        if total_images == 0:
+            return []
         
-        print(f"🎨 Starting batch modification of {total_images} images with {model}...")
+        print(f"🎨 Starting batch modification of {total_images} images with {model} "
+              f"(up to {max_concurrency} at a time)...")
+        batch_start = time.time()
         
-        for i, (prompt, image_url) in enumerate(zip(prompts, image_urls), 1):
-            print(f"\n📸 Processing image {i}/{total_images}")
+        def process(index: int, prompt: str, image_url: str) -> Dict[str, Any]:
+            item_start = time.time()
+            upload_time = 0.0
+            try:
+                if not image_url.startswith(("http://", "https://", "data:")):
+                    print(f"📤 Uploading local image {index + 1}/{total_images}: {image_url}")
+                    image_url = upload_local_image(image_url)
+                    upload_time = time.time() - item_start
+                
+                result = self.modify_image(
+                    prompt=prompt,
+                    image_url=image_url,
+                    model=model,
+                    output_dir=output_dir,
+                    output_prefix=f"batch_{index + 1:03d}",
+                    **kwargs
+                )
+            except Exception as e:
+                print(f"❌ Image {index + 1}/{total_images} failed: {e}")
+                result = {"success": False, "error": str(e), "model": model, "prompt": prompt}
             
-            result = self.modify_image(
-                prompt=prompt,
-                image_url=image_url,
-                model=model,
-                output_dir=output_dir,
-                **kwargs
-            )
-            results.append(result)
-            
-            # Brief pause between requests
-            if i < total_images:
-                import time
-                time.sleep(1)
+            result.update({
+                "batch_index": index,
+                "upload_time": upload_time,
+                "item_time": time.time() - item_start
+            })
+            status = "✅" if result.get("success") else "❌"
+            print(f"{status} Image {index + 1}/{total_images} finished in {result['item_time']:.2f}s")
+            return result
+        
+        workers = max(1, min(max_concurrency, total_images))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(process, range(total_images), prompts, image_urls))
         
+        total_time = time.time() - batch_start
         successful = sum(1 for r in results if r.get("success", False))
-        print(f"\n✅ Batch processing completed: {successful}/{total_images} successful")
+        sequential_time = sum(r["item_time"] for r in results)
+        print(f"\n✅ Batch processing completed: {successful}/{total_images} successful "
+              f"in {total_time:.2f}s ({sequential_time:.2f}s of work)")
         
         return results
\ No newline at end of file
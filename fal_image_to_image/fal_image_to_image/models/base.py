@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, List
 import fal_client
 
 from ..utils.file_utils import download_images, ensure_output_directory
+from ..utils.rate_limiter import get_rate_limiter
 from ..config.constants import MODEL_ENDPOINTS, MODEL_DISPLAY_NAMES
 
 
@@ -82,6 +83,7 @@ class BaseModel(ABC):
         prompt: str,
         image_url: str,
         output_dir: Optional[str] = None,
+        output_prefix: str = "modified_image",
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -91,6 +93,7 @@ class BaseModel(ABC):
             prompt: Text instruction for image modification
             image_url: URL of input image
             output_dir: Custom output directory
+            output_prefix: Filename prefix for downloaded images
             **kwargs: Model-specific parameters
             
         Returns:
@@ -106,7 +109,8 @@ class BaseModel(ABC):
             # Log generation info
             self._log_generation_start(prompt, **validated_params)
             
-            # Make API call
+            # Make API call once the endpoint's rate limit allows it
+            rate_limit_wait = get_rate_limiter(self.endpoint).acquire()
             start_time = time.time()
             response = fal_client.subscribe(self.endpoint, arguments=arguments)
             processing_time = time.time() - start_time
@@ -120,7 +124,7 @@ class BaseModel(ABC):
             
             # Download images
             output_directory = ensure_output_directory(output_dir)
-            downloaded_files = download_images(images, output_directory)
+            downloaded_files = download_images(images, output_directory, prefix=output_prefix)
             
             # Build result dictionary
             result = {
@@ -128,6 +132,7 @@ class BaseModel(ABC):
                 "model": self.display_name,
                 "prompt": prompt,
                 "processing_time": processing_time,
+                "rate_limit_wait": rate_limit_wait,
                 "images": images,
                 "downloaded_files": downloaded_files,
                 "output_directory": str(output_directory)
@@ -165,6 +165,7 @@ class PhotonModel(BaseModel):
         prompt: str,
         image_url: str,
         output_dir: Optional[str] = None,
+        output_prefix: str = "modified_image",
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -175,15 +176,16 @@ class PhotonModel(BaseModel):
             # Validate parameters
             validated_params = self.validate_parameters(**kwargs)
             
-            # Determine which endpoint to use
+            # Determine which endpoint to use (kept local so concurrent
+            # batch requests cannot switch each other's endpoint)
             if self._should_use_reframe(**validated_params):
                 # Use reframe endpoint
-                self.endpoint = REFRAME_ENDPOINTS[self.model_key]
+                endpoint = REFRAME_ENDPOINTS[self.model_key]
                 operation = "Reframing"
             else:
                 # Use regular modify endpoint
                 from ..config.constants import MODEL_ENDPOINTS
-                self.endpoint = MODEL_ENDPOINTS[self.model_key]
+                endpoint = MODEL_ENDPOINTS[self.model_key]
                 operation = "Modifying"
             
             # Prepare API arguments
@@ -198,11 +200,13 @@ class PhotonModel(BaseModel):
                     formatted_key = key.replace('_', ' ').title()
                     print(f"   {formatted_key}: {value}")
             
-            # Make API call
+            # Make API call once the endpoint's rate limit allows it
             import time
+            from ..utils.rate_limiter import get_rate_limiter
+            rate_limit_wait = get_rate_limiter(endpoint).acquire()
             start_time = time.time()
             import fal_client
-            response = fal_client.subscribe(self.endpoint, arguments=arguments)
+            response = fal_client.subscribe(endpoint, arguments=arguments)
             processing_time = time.time() - start_time
             
             print(f"✅ {operation} completed in {processing_time:.2f} seconds")
@@ -215,7 +219,7 @@ class PhotonModel(BaseModel):
             # Download images
             from ..utils.file_utils import download_images, ensure_output_directory
             output_directory = ensure_output_directory(output_dir)
-            downloaded_files = download_images(images, output_directory)
+            downloaded_files = download_images(images, output_directory, prefix=output_prefix)
             
             # Build result dictionary
             result = {
@@ -223,6 +227,7 @@ class PhotonModel(BaseModel):
                 "model": self.display_name,
                 "operation": operation.lower(),
                 "processing_time": processing_time,
+                "rate_limit_wait": rate_limit_wait,
                 "images": images,
                 "downloaded_files": downloaded_files,
                 "output_directory": str(output_directory)
@@ -417,6 +422,7 @@ class PhotonBaseModel(BaseModel):
         prompt: str,
         image_url: str,
         output_dir: Optional[str] = None,
+        output_prefix: str = "modified_image",
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -427,15 +433,16 @@ class PhotonBaseModel(BaseModel):
             # Validate parameters
             validated_params = self.validate_parameters(**kwargs)
             
-            # Determine which endpoint to use
+            # Determine which endpoint to use (kept local so concurrent
+            # batch requests cannot switch each other's endpoint)
             if self._should_use_reframe(**validated_params):
                 # Use reframe endpoint
-                self.endpoint = REFRAME_ENDPOINTS[self.model_key]
+                endpoint = REFRAME_ENDPOINTS[self.model_key]
                 operation = "Reframing"
             else:
                 # Use regular modify endpoint
                 from ..config.constants import MODEL_ENDPOINTS
-                self.endpoint = MODEL_ENDPOINTS[self.model_key]
+                endpoint = MODEL_ENDPOINTS[self.model_key]
                 operation = "Modifying"
             
             # Prepare API arguments
@@ -450,11 +457,13 @@ class PhotonBaseModel(BaseModel):
                     formatted_key = key.replace('_', ' ').title()
                     print(f"   {formatted_key}: {value}")
             
-            # Make API call
+            # Make API call once the endpoint's rate limit allows it
             import time
+            from ..utils.rate_limiter import get_rate_limiter
+            rate_limit_wait = get_rate_limiter(endpoint).acquire()
             start_time = time.time()
             import fal_client
-            response = fal_client.subscribe(self.endpoint, arguments=arguments)
+            response = fal_client.subscribe(endpoint, arguments=arguments)
             processing_time = time.time() - start_time
             
             print(f"✅ {operation} completed in {processing_time:.2f} seconds")
@@ -467,7 +476,7 @@ class PhotonBaseModel(BaseModel):
             # Download images
             from ..utils.file_utils import download_images, ensure_output_directory
             output_directory = ensure_output_directory(output_dir)
-            downloaded_files = download_images(images, output_directory)
+            downloaded_files = download_images(images, output_directory, prefix=output_prefix)
             
             # Build result dictionary
             result = {
@@ -475,6 +484,7 @@ class PhotonBaseModel(BaseModel):
                 "model": self.display_name,
                 "operation": operation.lower(),
                 "processing_time": processing_time,
+                "rate_limit_wait": rate_limit_wait,
                 "images": images,
                 "downloaded_files": downloaded_files,
                 "output_directory": str(output_directory)
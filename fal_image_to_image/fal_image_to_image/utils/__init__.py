@@ -1,4 +1,5 @@
 """Utility functions for FAL Image-to-Image package."""
 
 from .file_utils import *
+from .rate_limiter import TokenBucket, get_rate_limit, get_rate_limiter
 from .validators import *
\ No newline at end of file
@@ -3,11 +3,30 @@ File and image handling utilities
 """
 
 import os
+import sys
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 import fal_client
+from requests.adapters import HTTPAdapter
+
+from ..config.constants import DEFAULT_DOWNLOAD_CONCURRENCY
+
+# Inside the repository, uploads go through the shared fal_common upload
+# cache; an installed copy of this package uploads directly
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if (_REPO_ROOT / "fal_common").is_dir() and str(_REPO_ROOT) not in sys.path:
+    sys.path.append(str(_REPO_ROOT))
+try:
+    from fal_common.upload_cache import get_default_upload_cache
+except ImportError:
+    get_default_upload_cache = None
+
+# Keep-alive connections to the FAL CDN shared by all downloads
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
 
 
 def upload_local_image(image_path: str) -> str:
@@ -29,8 +48,11 @@ def upload_local_image(image_path: str) -> str:
         raise FileNotFoundError(f"Image file not found: {image_path}")
     
     try:
-        # Upload file to FAL AI
-        url = fal_client.upload_file(str(image_file))
+        # Upload file to FAL AI (reusing an earlier upload of the same content)
+        if get_default_upload_cache is not None:
+            url = get_default_upload_cache().get_or_upload(image_file, fal_client.upload_file)
+        else:
+            url = fal_client.upload_file(str(image_file))
         print(f"✅ Image uploaded successfully: {url}")
         return url
     except Exception as e:
@@ -52,7 +74,7 @@ def download_image(image_url: str, output_path: Path) -> str:
         Exception: If download fails
     """
     try:
-        response = requests.get(image_url)
+        response = _session.get(image_url, timeout=60)
         response.raise_for_status()
         
         with open(output_path, 'wb') as f:
@@ -63,38 +85,47 @@ def download_image(image_url: str, output_path: Path) -> str:
         raise Exception(f"Failed to download image from {image_url}: {e}")
 
 
-def download_images(images: List[dict], output_dir: Path, prefix: str = "modified_image") -> List[str]:
+def download_images(
+    images: List[dict],
+    output_dir: Path,
+    prefix: str = "modified_image",
+    max_workers: int = DEFAULT_DOWNLOAD_CONCURRENCY
+) -> List[str]:
     """
-    Download multiple images from API response.
+    Download multiple images from API response concurrently.
     
     Args:
         images: List of image dictionaries from API response
         output_dir: Directory to save images
         prefix: Filename prefix for saved images
+        max_workers: Maximum number of simultaneous downloads
         
     Returns:
-        List of downloaded file paths
+        List of downloaded file paths, in response order
     """
     output_dir.mkdir(exist_ok=True)
-    downloaded_files = []
+    timestamp = int(time.time())
     
-    for i, image_info in enumerate(images):
+    def download(indexed_image):
+        i, image_info = indexed_image
         image_url = image_info.get("url")
-        if image_url:
-            # Generate filename
-            timestamp = int(time.time())
-            filename = f"{prefix}_{timestamp}_{i+1}.png"
-            file_path = output_dir / filename
-            
-            # Download image
-            try:
-                download_image(image_url, file_path)
-                downloaded_files.append(str(file_path))
-                print(f"✅ Image saved: {file_path}")
-            except Exception as e:
-                print(f"❌ Failed to download image {i+1}: {e}")
+        if not image_url:
+            return None
+        
+        file_path = output_dir / f"{prefix}_{timestamp}_{i+1}.png"
+        try:
+            download_image(image_url, file_path)
+            print(f"✅ Image saved: {file_path}")
+            return str(file_path)
+        except Exception as e:
+            print(f"❌ Failed to download image {i+1}: {e}")
+            return None
+    
+    workers = max(1, min(max_workers, len(images)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(download, enumerate(images)))
     
-    return downloaded_files
+    return [path for path in results if path]
 
 
 def ensure_output_directory(output_dir: Optional[str] = None) -> Path:
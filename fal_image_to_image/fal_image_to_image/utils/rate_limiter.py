@@ -0,0 +1,86 @@
+"""
+Token-bucket rate limiting for FAL endpoints
+"""
+
+import threading
+import time
+from typing import Dict, Tuple
+
+from ..config.constants import DEFAULT_RATE_LIMIT, ENDPOINT_RATE_LIMITS
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Holds up to ``capacity`` tokens and refills ``rate`` tokens per second,
+    so bursts of ``capacity`` requests go out immediately and sustained
+    traffic is spread to ``rate`` requests per second.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens (burst size)
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, blocking until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limit(endpoint: str) -> Tuple[float, int]:
+    """Get the (requests per second, burst) limit configured for an endpoint."""
+    return ENDPOINT_RATE_LIMITS.get(endpoint, DEFAULT_RATE_LIMIT)
+
+
+def get_rate_limiter(endpoint: str) -> TokenBucket:
+    """
+    Get the process-wide token bucket for a FAL endpoint.
+
+    Args:
+        endpoint: FAL endpoint (e.g. "fal-ai/bytedance/seededit/v3/edit-image")
+
+    Returns:
+        TokenBucket shared by every request to the endpoint
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(endpoint)
+        if limiter is None:
+            rate, burst = get_rate_limit(endpoint)
+            limiter = _limiters[endpoint] = TokenBucket(rate, burst)
+    return limiter
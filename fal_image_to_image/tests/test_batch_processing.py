@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Batch Processing Tests
+
+Tests the endpoint token bucket, concurrent batch modification and
+concurrent result downloads. FAL requests and downloads are stubbed out.
+NO API CALLS - COMPLETELY FREE!
+
+Usage:
+    python -m pytest tests/test_batch_processing.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fal_image_to_image import FALImageToImageGenerator
+from fal_image_to_image.utils import file_utils, rate_limiter
+from fal_image_to_image.utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """Stands in for the time module; sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test bursts, refill and waiting of the token bucket."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(rate_limiter, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_rate(self):
+        """Test `capacity` requests pass at once and the next waits 1/rate seconds."""
+        bucket = TokenBucket(rate=2.0, capacity=3)
+
+        self.assertEqual([bucket.acquire() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        self.assertAlmostEqual(self.clock.now, 101.0)
+
+    def test_refill_is_capped_at_capacity(self):
+        bucket = TokenBucket(rate=1.0, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+
+        self.clock.now += 60
+        self.assertEqual([bucket.acquire(), bucket.acquire()], [0.0, 0.0])
+        self.assertAlmostEqual(bucket.acquire(), 1.0)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1.0, capacity=0)
+
+
+class TestBatchModifyImages(unittest.TestCase):
+    """Test batch results keep input order and failures stay per item."""
+
+    def setUp(self):
+        self.generator = FALImageToImageGenerator("test_key")
+        self.prefixes = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.generator.modify_image = self.fake_modify_image
+
+    def fake_modify_image(self, prompt, image_url, model, output_dir, output_prefix, **kwargs):
+        with self.lock:
+            self.prefixes.append(output_prefix)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        # Earlier items finish last
+        time.sleep(0.05 / (int(prompt[-1]) + 1))
+        with self.lock:
+            self.active -= 1
+        if prompt == "edit 2":
+            raise RuntimeError("content policy violation")
+        return {"success": True, "prompt": prompt, "image_url": image_url}
+
+    def test_results_in_input_order_with_failures(self):
+        prompts = [f"edit {i}" for i in range(5)]
+        urls = [f"https://example.com/{i}.png" for i in range(4)] + ["missing/local.png"]
+
+        results = self.generator.batch_modify_images(prompts, urls, model="photon", max_concurrency=2)
+
+        self.assertEqual([r["batch_index"] for r in results], list(range(5)))
+        self.assertEqual([r["success"] for r in results], [True, True, False, True, False])
+        self.assertIn("content policy violation", results[2]["error"])
+        self.assertIn("not found", results[4]["error"])
+        self.assertEqual(results[3]["image_url"], "https://example.com/3.png")
+        self.assertLessEqual(self.max_active, 2)
+        self.assertEqual(sorted(self.prefixes), ["batch_001", "batch_002", "batch_003", "batch_004"])
+
+    def test_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            self.generator.batch_modify_images(["a", "b"], ["https://example.com/a.png"])
+
+
+class TestDownloadImages(unittest.TestCase):
+    """Test concurrent downloads get distinct, ordered file names."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def fake_download(self, image_url, output_path):
+        if image_url.endswith("broken.png"):
+            raise Exception("404")
+        Path(output_path).write_bytes(image_url.encode())
+        return str(output_path)
+
+    def test_prefixes_keep_batch_files_apart(self):
+        images = [{"url": "https://cdn/a.png"}, {"url": None}, {"url": "https://cdn/broken.png"},
+                  {"url": "https://cdn/d.png"}]
+
+        with mock.patch.object(file_utils, "download_image", self.fake_download):
+            first = file_utils.download_images(images, self.output_dir, prefix="batch_001")
+            second = file_utils.download_images(images, self.output_dir, prefix="batch_002")
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(set(first + second)), 4)
+        self.assertTrue(all(Path(p).name.startswith("batch_001_") for p in first))
+        self.assertEqual(Path(first[0]).read_bytes(), b"https://cdn/a.png")
+        self.assertTrue(first[1].endswith("_4.png"))
+
+
+if __name__ == "__main__":
+    unittest.main()
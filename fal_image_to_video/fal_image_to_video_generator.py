@@ -4,15 +4,28 @@ Advanced image-to-video generation using FAL AI's dual models with high-quality
 """
 
 import os
-import time
+import asyncio
 import traceback
 import uuid
 import argparse
 import sys
+from pathlib import Path
 from typing import Optional, Dict, Any
 import fal_client
 from dotenv import load_dotenv
 
+# Shared FAL helpers live in the repository-level fal_common package
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from fal_common import (
+    DownloadManager,
+    FALJobEngine,
+    FALJobError,
+    UploadCache,
+    get_default_download_manager,
+    get_default_engine,
+    get_default_upload_cache
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -25,12 +38,21 @@ class FALImageToVideoGenerator:
     - Kling Video 2.1: High-quality image-to-video generation, 5-10 second videos
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        job_engine: Optional[FALJobEngine] = None,
+        download_manager: Optional[DownloadManager] = None,
+        upload_cache: Optional[UploadCache] = None
+    ):
         """
         Initialize the FAL Image-to-Video Generator
         
         Args:
             api_key: FAL API key (if not provided, will use FAL_KEY environment variable)
+            job_engine: Job engine for queued/async requests (default: shared engine)
+            download_manager: Downloader for generated videos (default: shared pooled manager)
+            upload_cache: Cache of earlier uploads of local images (default: shared on-disk cache)
         """
         self.api_key = api_key or os.getenv('FAL_KEY')
         if not self.api_key:
@@ -43,6 +65,15 @@ class FALImageToVideoGenerator:
         self.hailuo_endpoint = "fal-ai/minimax/hailuo-02/standard/image-to-video"
         self.kling_endpoint = "fal-ai/kling-video/v2.1/standard/image-to-video"
         
+        # Shared asyncio engine for queue submission and polling
+        self.job_engine = job_engine or get_default_engine()
+        
+        # Pooled, resumable downloads shared with the other generators
+        self.download_manager = download_manager or get_default_download_manager()
+        
+        # Local images already uploaded (by any run) are not uploaded again
+        self.upload_cache = upload_cache or get_default_upload_cache()
+        
     def generate_video_from_image(
         self,
         prompt: str,
@@ -72,122 +103,194 @@ class FALImageToVideoGenerator:
             Dictionary containing the result with video URL and metadata
         """
         try:
-            # Select model endpoint
-            if model == "fal-ai/kling-video/v2.1/standard/image-to-video":
-                endpoint = self.kling_endpoint
-                model_name = "Kling Video 2.1"
-                # Kling specific parameters
-                arguments = {
-                    "prompt": prompt,
-                    "image_url": image_url,
-                    "duration": duration,
-                    "negative_prompt": "blur, distort, and low quality",
-                    "cfg_scale": 0.5
-                }
-            else:  # Default to Hailuo
-                endpoint = self.hailuo_endpoint
-                model_name = "MiniMax Hailuo-02"
-                # Hailuo specific parameters
-                arguments = {
-                    "prompt": prompt,
-                    "image_url": image_url,
-                    "duration": duration,
-                    "prompt_optimizer": prompt_optimizer
-                }
-            
-            print(f"Starting video generation with FAL AI {model_name}...")
-            print(f"Prompt: '{prompt}'")
-            print(f"Image URL: {image_url}")
-            print(f"Duration: {duration} seconds")
-            print(f"Model: {model_name}")
-            
-            # Generate unique task ID
-            task_id = str(uuid.uuid4())[:8]
-            print(f"Task ID: {task_id}")
-            
-            # Define queue update handler
-            def on_queue_update(update):
-                if hasattr(update, 'logs') and update.logs:
-                    print("Processing... Logs:")
-                    for log in update.logs:
-                        print(f"  {log.get('message', str(log))}")
-                else:
-                    print(f"Processing... Update: {type(update).__name__}")
+            endpoint, model_name, arguments = self._build_request(
+                model, prompt, image_url, duration, prompt_optimizer=prompt_optimizer
+            )
+            task_id = self._announce_request(model_name, prompt, image_url, duration)
             
             # Generate video
             print("Submitting request to FAL AI...")
             
             if use_async:
-                # Async processing
-                handler = fal_client.submit(
-                    endpoint,
-                    arguments=arguments
-                )
-                
-                request_id = handler.request_id
-                print(f"Request submitted with ID: {request_id}")
-                
-                # Poll for completion
-                while True:
-                    status = fal_client.status(endpoint, request_id, with_logs=True)
-                    print(f"Status: {status.status}")
-                    
-                    if status.status == "COMPLETED":
-                        result = fal_client.result(endpoint, request_id)
-                        break
-                    elif status.status == "FAILED":
-                        print(f"Request failed: {status}")
-                        return None
-                    
-                    time.sleep(5)  # Wait 5 seconds before checking again
-                    
+                # Queue submission with polling through the shared job engine
+                result = self.job_engine.run_sync(endpoint, arguments, on_update=self._on_job_update)
             else:
                 # Synchronous processing
                 result = fal_client.subscribe(
                     endpoint,
                     arguments=arguments,
                     with_logs=True,
-                    on_queue_update=on_queue_update,
+                    on_queue_update=self._on_queue_update,
                 )
             
             print("Video generation completed successfully!")
             
-            # Process result
-            if result and 'video' in result:
-                video_info = result['video']
-                video_url = video_info['url']
-                original_file_name = video_info.get('file_name', 'generated_video.mp4')
-                file_size = video_info.get('file_size', 0)
-                
-                # Generate custom filename: inputname_taskid.mp4
-                if input_filename and input_filename is not None:
-                    base_name = os.path.splitext(input_filename)[0]
-                    custom_filename = f"{base_name}_{task_id}.mp4"
-                else:
-                    custom_filename = f"generated_{task_id}.mp4"
-                
-                print(f"Generated video URL: {video_url}")
-                print(f"Original file name: {original_file_name}")
-                print(f"Custom file name: {custom_filename}")
-                print(f"File size: {file_size} bytes")
-                
-                # Download video locally with custom filename
-                local_path = self.download_video(video_url, output_folder, custom_filename)
-                if local_path:
-                    result['local_path'] = local_path
-                    result['task_id'] = task_id
-                    result['custom_filename'] = custom_filename
+            return self._process_result(
+                result, output_folder, task_id,
+                self._custom_filename(task_id, input_filename),
+                default_file_name='generated_video.mp4'
+            )
                 
-                return result
-            else:
-                print("No video found in result")
-                return None
+        except FALJobError as e:
+            print(f"Request failed: {e}")
+            return None
+        except Exception as e:
+            print(f"Error during video generation: {e}")
+            traceback.print_exc()
+            return None
+    
+    async def generate_video_from_image_async(
+        self,
+        prompt: str,
+        image_url: str,
+        duration: str = "6",
+        prompt_optimizer: bool = True,
+        output_folder: str = "output",
+        model: str = "fal-ai/minimax/hailuo-02/standard/image-to-video",
+        input_filename: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Awaitable version of generate_video_from_image
+        
+        The job is submitted and polled on the running event loop, so many
+        generations can be awaited concurrently without a thread per job.
+        
+        Args:
+            Same as generate_video_from_image (without use_async)
+            
+        Returns:
+            Dictionary containing the result with video URL and metadata
+        """
+        try:
+            endpoint, model_name, arguments = self._build_request(
+                model, prompt, image_url, duration, prompt_optimizer=prompt_optimizer
+            )
+            task_id = self._announce_request(model_name, prompt, image_url, duration)
+            
+            result = await self.job_engine.run(endpoint, arguments, on_update=self._on_job_update)
+            print("Video generation completed successfully!")
+            
+            # Download off the event loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                lambda: self._process_result(
+                    result, output_folder, task_id,
+                    self._custom_filename(task_id, input_filename),
+                    default_file_name='generated_video.mp4'
+                )
+            )
                 
+        except FALJobError as e:
+            print(f"Request failed: {e}")
+            return None
         except Exception as e:
             print(f"Error during video generation: {e}")
             traceback.print_exc()
             return None
     
+    def _build_request(
+        self,
+        model: str,
+        prompt: str,
+        image_url: str,
+        duration: str,
+        prompt_optimizer: bool = True,
+        negative_prompt: str = "blur, distort, and low quality",
+        cfg_scale: float = 0.5
+    ):
+        """
+        Build endpoint, display name and arguments for a model
+        
+        Returns:
+            Tuple of (endpoint, model_name, arguments)
+        """
+        if model == self.kling_endpoint:
+            # Kling specific parameters
+            return self.kling_endpoint, "Kling Video 2.1", {
+                "prompt": prompt,
+                "image_url": image_url,
+                "duration": duration,
+                "negative_prompt": negative_prompt,
+                "cfg_scale": cfg_scale
+            }
+        
+        # Default to Hailuo
+        return self.hailuo_endpoint, "MiniMax Hailuo-02", {
+            "prompt": prompt,
+            "image_url": image_url,
+            "duration": duration,
+            "prompt_optimizer": prompt_optimizer
+        }
+    
+    def _announce_request(self, model_name: str, prompt: str, image_url: str, duration: str) -> str:
+        """Print request details and return a new task ID"""
+        print(f"Starting video generation with FAL AI {model_name}...")
+        print(f"Prompt: '{prompt}'")
+        print(f"Image URL: {image_url}")
+        print(f"Duration: {duration} seconds")
+        print(f"Model: {model_name}")
+        
+        # Generate unique task ID
+        task_id = str(uuid.uuid4())[:8]
+        print(f"Task ID: {task_id}")
+        return task_id
+    
+    def _custom_filename(self, task_id: str, input_filename: Optional[str] = None) -> str:
+        """Build output filename: inputname_taskid.mp4"""
+        if input_filename:
+            base_name = os.path.splitext(input_filename)[0]
+            return f"{base_name}_{task_id}.mp4"
+        return f"generated_{task_id}.mp4"
+    
+    def _on_queue_update(self, update):
+        """Print fal_client.subscribe queue updates"""
+        if hasattr(update, 'logs') and update.logs:
+            print("Processing... Logs:")
+            for log in update.logs:
+                print(f"  {log.get('message', str(log))}")
+        else:
+            print(f"Processing... Update: {type(update).__name__}")
+    
+    def _on_job_update(self, job, status):
+        """Print job engine status updates"""
+        if job.queue_position is not None:
+            print(f"Status: {job.status} (queue position {job.queue_position})")
+        else:
+            print(f"Status: {job.status} (status check #{job.status_checks})")
+    
+    def _process_result(
+        self,
+        result: Optional[Dict[str, Any]],
+        output_folder: str,
+        task_id: str,
+        custom_filename: str,
+        default_file_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Download the generated video and attach local file details to the result"""
+        if not (result and 'video' in result):
+            print("No video found in result")
+            return None
+        
+        video_info = result['video']
+        video_url = video_info['url']
+        original_file_name = video_info.get('file_name', default_file_name)
+        file_size = video_info.get('file_size', 0)
+        
+        print(f"Generated video URL: {video_url}")
+        print(f"Original file name: {original_file_name}")
+        print(f"Custom file name: {custom_filename}")
+        print(f"File size: {file_size} bytes")
+        
+        # Download video locally with custom filename
+        local_path = self.download_video(video_url, output_folder, custom_filename)
+        if local_path:
+            result['local_path'] = local_path
+            result['task_id'] = task_id
+            result['custom_filename'] = custom_filename
+        
+        return result
+    
     def upload_local_image(self, image_path: str) -> Optional[str]:
         """
         Upload a local image file to FAL AI and get the URL
@@ -205,8 +308,8 @@ class FALImageToVideoGenerator:
                 print(f"Image file not found: {image_path}")
                 return None
             
-            # Upload file to FAL AI
-            url = fal_client.upload_file(image_path)
+            # Upload file to FAL AI (reusing an earlier upload of the same content)
+            url = self.upload_cache.get_or_upload(image_path, fal_client.upload_file)
             print(f"Image uploaded successfully: {url}")
             return url
             
@@ -260,6 +363,46 @@ class FALImageToVideoGenerator:
             input_filename=input_filename
         )
     
+    async def generate_video_from_local_image_async(
+        self,
+        prompt: str,
+        image_path: str,
+        duration: str = "6",
+        prompt_optimizer: bool = True,
+        output_folder: str = "output",
+        model: str = "fal-ai/minimax/hailuo-02/standard/image-to-video"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Awaitable version of generate_video_from_local_image
+        
+        Args:
+            Same as generate_video_from_local_image (without use_async)
+            
+        Returns:
+            Dictionary containing the result with video URL and metadata
+        """
+        if not os.path.exists(image_path):
+            print(f"Image file not found: {image_path}")
+            return None
+        
+        try:
+            print(f"Uploading local image: {image_path}")
+            image_url = await self.upload_cache.get_or_upload_async(image_path, fal_client.upload_file_async)
+            print(f"Image uploaded successfully: {image_url}")
+        except Exception as e:
+            print(f"Error uploading image: {e}")
+            return None
+        
+        return await self.generate_video_from_image_async(
+            prompt=prompt,
+            image_url=image_url,
+            duration=duration,
+            prompt_optimizer=prompt_optimizer,
+            output_folder=output_folder,
+            model=model,
+            input_filename=os.path.basename(image_path)
+        )
+    
     def generate_video_with_kling(
         self,
         prompt: str,
@@ -293,89 +436,83 @@ class FALImageToVideoGenerator:
             print(f"CFG Scale: {cfg_scale}")
             
             # Kling specific parameters
-            arguments = {
-                "prompt": prompt,
-                "image_url": image_url,
-                "duration": duration,
-                "negative_prompt": negative_prompt,
-                "cfg_scale": cfg_scale
-            }
-            
-            # Define queue update handler
-            def on_queue_update(update):
-                if hasattr(update, 'logs') and update.logs:
-                    print("Processing... Logs:")
-                    for log in update.logs:
-                        print(f"  {log.get('message', str(log))}")
-                else:
-                    print(f"Processing... Update: {type(update).__name__}")
+            endpoint, _, arguments = self._build_request(
+                self.kling_endpoint, prompt, image_url, duration,
+                negative_prompt=negative_prompt, cfg_scale=cfg_scale
+            )
             
             # Generate video
             print("Submitting request to FAL AI Kling...")
             
             if use_async:
-                # Async processing
-                handler = fal_client.submit(
-                    self.kling_endpoint,
-                    arguments=arguments
-                )
-                
-                request_id = handler.request_id
-                print(f"Request submitted with ID: {request_id}")
-                
-                # Poll for completion
-                while True:
-                    status = fal_client.status(self.kling_endpoint, request_id, with_logs=True)
-                    print(f"Status: {status.status}")
-                    
-                    if status.status == "COMPLETED":
-                        result = fal_client.result(self.kling_endpoint, request_id)
-                        break
-                    elif status.status == "FAILED":
-                        print(f"Request failed: {status}")
-                        return None
-                    
-                    time.sleep(5)  # Wait 5 seconds before checking again
-                    
+                # Queue submission with polling through the shared job engine
+                result = self.job_engine.run_sync(endpoint, arguments, on_update=self._on_job_update)
             else:
                 # Synchronous processing
                 result = fal_client.subscribe(
-                    self.kling_endpoint,
+                    endpoint,
                     arguments=arguments,
                     with_logs=True,
-                    on_queue_update=on_queue_update,
+                    on_queue_update=self._on_queue_update,
                 )
             
             print("Video generation completed successfully!")
             
-            # Process result
-            if result and 'video' in result:
-                video_info = result['video']
-                video_url = video_info['url']
-                original_file_name = video_info.get('file_name', 'kling_video.mp4')
-                file_size = video_info.get('file_size', 0)
-                
-                # Generate custom filename: inputname_taskid.mp4
-                task_id = str(uuid.uuid4())[:8]
-                custom_filename = f"kling_{task_id}.mp4"
-                
-                print(f"Generated video URL: {video_url}")
-                print(f"Original file name: {original_file_name}")
-                print(f"Custom file name: {custom_filename}")
-                print(f"File size: {file_size} bytes")
-                
-                # Download video locally with custom filename
-                local_path = self.download_video(video_url, output_folder, custom_filename)
-                if local_path:
-                    result['local_path'] = local_path
-                    result['task_id'] = task_id
-                    result['custom_filename'] = custom_filename
+            task_id = str(uuid.uuid4())[:8]
+            return self._process_result(
+                result, output_folder, task_id, f"kling_{task_id}.mp4",
+                default_file_name='kling_video.mp4'
+            )
                 
-                return result
-            else:
-                print("No video found in result")
-                return None
+        except FALJobError as e:
+            print(f"Request failed: {e}")
+            return None
+        except Exception as e:
+            print(f"Error during Kling video generation: {e}")
+            traceback.print_exc()
+            return None
+    
+    async def generate_video_with_kling_async(
+        self,
+        prompt: str,
+        image_url: str,
+        duration: str = "5",
+        negative_prompt: str = "blur, distort, and low quality",
+        cfg_scale: float = 0.5,
+        output_folder: str = "output"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Awaitable version of generate_video_with_kling
+        
+        Args:
+            Same as generate_video_with_kling (without use_async)
+            
+        Returns:
+            Dictionary containing the result with video URL and metadata
+        """
+        try:
+            print(f"Starting video generation with Kling Video 2.1...")
+            endpoint, _, arguments = self._build_request(
+                self.kling_endpoint, prompt, image_url, duration,
+                negative_prompt=negative_prompt, cfg_scale=cfg_scale
+            )
+            
+            result = await self.job_engine.run(endpoint, arguments, on_update=self._on_job_update)
+            print("Video generation completed successfully!")
+            
+            task_id = str(uuid.uuid4())[:8]
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                lambda: self._process_result(
+                    result, output_folder, task_id, f"kling_{task_id}.mp4",
+                    default_file_name='kling_video.mp4'
+                )
+            )
                 
+        except FALJobError as e:
+            print(f"Request failed: {e}")
+            return None
         except Exception as e:
             print(f"Error during Kling video generation: {e}")
             traceback.print_exc()
@@ -427,21 +564,10 @@ class FALImageToVideoGenerator:
             Local path of the downloaded video or None if failed
         """
         try:
-            import requests
-            
-            # Create output folder if it doesn't exist
-            os.makedirs(output_folder, exist_ok=True)
-            
-            # Download video
+            # Download video (creates the output folder if needed)
             print(f"Downloading video from: {video_url}")
-            response = requests.get(video_url, stream=True)
-            response.raise_for_status()
-            
-            # Save to local file
             local_path = os.path.join(output_folder, filename)
-            with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            self.download_manager.download(video_url, local_path)
             
             # Return absolute path
             absolute_path = os.path.abspath(local_path)
@@ -13,12 +13,24 @@ Date: 2024
 """
 
 import os
-import requests
+import sys
+import asyncio
 import time
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 import fal_client
 from dotenv import load_dotenv
 
+# Shared FAL helpers live in the repository-level fal_common package
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from fal_common import (
+    DownloadManager,
+    FALJobEngine,
+    ResultCache,
+    get_default_download_manager,
+    get_default_engine
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -41,12 +53,21 @@ class FALTextToImageGenerator:
         "flux_dev": "fal-ai/flux-1/dev"
     }
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        job_engine: Optional[FALJobEngine] = None,
+        result_cache: Optional[ResultCache] = None,
+        download_manager: Optional[DownloadManager] = None
+    ):
         """
         Initialize the FAL Text-to-Image Generator.
         
         Args:
             api_key: FAL AI API key. If not provided, will try to load from environment.
+            job_engine: Job engine for async requests (default: shared engine)
+            result_cache: Cache for reusing seeded generations (default: disabled)
+            download_manager: Downloader for generated images (default: shared pooled manager)
         """
         self.api_key = api_key or os.getenv('FAL_KEY')
         if not self.api_key:
@@ -55,6 +76,15 @@ class FALTextToImageGenerator:
         # Set the API key for fal_client
         os.environ['FAL_KEY'] = self.api_key
         
+        # Shared asyncio engine for queue submission and polling
+        self.job_engine = job_engine or get_default_engine()
+        
+        # Opt-in result cache; created on demand when use_cache=True
+        self.result_cache = result_cache
+        
+        # Pooled, resumable downloads shared with the other generators
+        self.download_manager = download_manager or get_default_download_manager()
+        
         # Model-specific default parameters
         self.model_defaults = {
             "imagen4": {
@@ -110,6 +140,7 @@ class FALTextToImageGenerator:
         prompt: str,
         model: str = "flux_schnell",
         negative_prompt: Optional[str] = None,
+        use_cache: Optional[bool] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -119,11 +150,108 @@ class FALTextToImageGenerator:
             prompt: Text description of the image to generate
             model: Model to use (imagen4, seedream, flux_schnell, flux_dev)
             negative_prompt: What to avoid in the image (not supported by all models)
+            use_cache: Reuse a cached result for identical seeded requests
+                (default: only if a result_cache was configured)
+            **kwargs: Model-specific parameters
+            
+        Returns:
+            Dictionary containing image URL and metadata
+        """
+        endpoint, payload = self._build_request(prompt, model, negative_prompt, **kwargs)
+        
+        try:
+            self._announce_request(prompt, model, negative_prompt)
+            
+            cache, cache_key = self._resolve_cache(model, endpoint, payload, use_cache)
+            cached = self._load_cached(cache, cache_key)
+            if cached:
+                return cached
+            
+            # Submit the request
+            result = fal_client.subscribe(
+                endpoint,
+                arguments=payload,
+                with_logs=True
+            )
+            
+            response = self._format_result(result, model, endpoint, prompt, negative_prompt, payload)
+            self._store_cached(cache, cache_key, response)
+            return response
+                
+        except Exception as e:
+            print(f"❌ Error generating image: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e),
+                'model': model,
+                'endpoint': endpoint,
+                'prompt': prompt
+            }
+    
+    async def generate_image_async(
+        self,
+        prompt: str,
+        model: str = "flux_schnell",
+        negative_prompt: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Awaitable version of generate_image.
+        
+        The request is submitted and polled on the running event loop through
+        the shared job engine, so many images can be awaited concurrently.
+        
+        Args:
+            prompt: Text description of the image to generate
+            model: Model to use (imagen4, seedream, flux_schnell, flux_dev)
+            negative_prompt: What to avoid in the image (not supported by all models)
+            use_cache: Reuse a cached result for identical seeded requests
+            timeout: Seconds to wait before cancelling the job (default: engine timeout)
             **kwargs: Model-specific parameters
             
         Returns:
             Dictionary containing image URL and metadata
         """
+        endpoint, payload = self._build_request(prompt, model, negative_prompt, **kwargs)
+        
+        try:
+            self._announce_request(prompt, model, negative_prompt)
+            
+            cache, cache_key = self._resolve_cache(model, endpoint, payload, use_cache)
+            cached = self._load_cached(cache, cache_key)
+            if cached:
+                return cached
+            
+            result = await self.job_engine.run(endpoint, payload, timeout=timeout)
+            response = self._format_result(result, model, endpoint, prompt, negative_prompt, payload)
+            self._store_cached(cache, cache_key, response)
+            return response
+                
+        except Exception as e:
+            print(f"❌ Error generating image: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e),
+                'model': model,
+                'endpoint': endpoint,
+                'prompt': prompt
+            }
+    
+    def _build_request(
+        self,
+        prompt: str,
+        model: str,
+        negative_prompt: Optional[str] = None,
+        **kwargs
+    ) -> tuple:
+        """
+        Build the endpoint and request payload for a model.
+        
+        Returns:
+            Tuple of (endpoint, payload)
+        """
         endpoint = self.validate_model(model)
         
         # Get default parameters for the model
@@ -142,50 +270,105 @@ class FALTextToImageGenerator:
         if negative_prompt and model in ["seedream", "flux_dev"]:
             payload["negative_prompt"] = negative_prompt
         
+        return endpoint, payload
+    
+    def _resolve_cache(
+        self,
+        model: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        use_cache: Optional[bool]
+    ) -> tuple:
+        """
+        Pick the result cache and key for a request.
+        
+        The key covers the endpoint, model, prompt and the parameters the
+        model accepts (see _filter_model_params), plus the seed.
+        
+        Returns:
+            Tuple of (cache, key), or (None, None) when caching does not apply
+        """
+        if use_cache is False or (use_cache is None and self.result_cache is None):
+            return None, None
+        
+        if self.result_cache is None:
+            self.result_cache = ResultCache()
+        
+        key_params = self._filter_model_params(model, payload, verbose=False)
+        key_params["prompt"] = payload.get("prompt")
+        key_params["negative_prompt"] = payload.get("negative_prompt")
+        key_params["seed"] = payload.get("seed")
+        
+        if not self.result_cache.is_cacheable(key_params):
+            return None, None
+        
+        return self.result_cache, self.result_cache.make_key(endpoint, model, key_params)
+    
+    def _load_cached(self, cache: Optional[ResultCache], key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return a cached response marked as such, or None."""
+        if cache is None:
+            return None
+        
+        cached = cache.get(key)
+        if cached:
+            cached['cached'] = True
+            print(f"♻️ Using cached result ({key[:12]})")
+            print(f"🔗 Image URL: {cached.get('image_url')}")
+        return cached
+    
+    def _store_cached(self, cache: Optional[ResultCache], key: Optional[str], response: Dict[str, Any]):
+        """Store a successful response in the cache."""
+        if cache is None or not response.get('success'):
+            return
+        
         try:
-            print(f"🎨 Generating image with {model} model...")
-            print(f"📝 Prompt: {prompt}")
-            if negative_prompt and model in ["seedream", "flux_dev"]:
-                print(f"❌ Negative prompt: {negative_prompt}")
-            
-            # Submit the request
-            result = fal_client.subscribe(
-                endpoint,
-                arguments=payload,
-                with_logs=True
-            )
+            cache.put(key, response, metadata={'model': response.get('model'), 'prompt': response.get('prompt')})
+        except OSError as e:
+            print(f"⚠️ Could not write result cache: {e}")
+    
+    def _announce_request(self, prompt: str, model: str, negative_prompt: Optional[str] = None):
+        """Print the generation request details."""
+        print(f"🎨 Generating image with {model} model...")
+        print(f"📝 Prompt: {prompt}")
+        if negative_prompt and model in ["seedream", "flux_dev"]:
+            print(f"❌ Negative prompt: {negative_prompt}")
+    
+    def _format_result(
+        self,
+        result: Dict[str, Any],
+        model: str,
+        endpoint: str,
+        prompt: str,
+        negative_prompt: Optional[str],
+        payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Convert a raw FAL result into the generator's response dictionary.
+        
+        Raises:
+            Exception: If the result contains no images
+        """
+        if result and 'images' in result and len(result['images']) > 0:
+            image_data = result['images'][0]
             
-            if result and 'images' in result and len(result['images']) > 0:
-                image_data = result['images'][0]
-                
-                response = {
-                    'success': True,
-                    'model': model,
-                    'endpoint': endpoint,
-                    'image_url': image_data['url'],
-                    'image_size': str(image_data.get('width', 'unknown')) + 'x' + str(image_data.get('height', 'unknown')) if 'width' in image_data else 'unknown',
-                    'prompt': prompt,
-                    'negative_prompt': negative_prompt,
-                    'parameters': payload,
-                    'full_result': result
-                }
-                
-                print(f"✅ Image generated successfully!")
-                print(f"🔗 Image URL: {response['image_url']}")
-                
-                return response
-            else:
-                raise Exception("No images returned from API")
-                
-        except Exception as e:
-            print(f"❌ Error generating image: {str(e)}")
-            return {
-                'success': False,
-                'error': str(e),
+            response = {
+                'success': True,
                 'model': model,
                 'endpoint': endpoint,
-                'prompt': prompt
+                'image_url': image_data['url'],
+                'image_size': str(image_data.get('width', 'unknown')) + 'x' + str(image_data.get('height', 'unknown')) if 'width' in image_data else 'unknown',
+                'prompt': prompt,
+                'negative_prompt': negative_prompt,
+                'parameters': payload,
+                'full_result': result
             }
+            
+            print(f"✅ Image generated successfully!")
+            print(f"🔗 Image URL: {response['image_url']}")
+            
+            return response
+        else:
+            raise Exception("No images returned from API")
     
     def generate_with_imagen4(
         self,
@@ -348,12 +531,7 @@ class FALTextToImageGenerator:
             
             # Download the image
             print(f"⬇️ Downloading image to: {filepath}")
-            response = requests.get(image_url, stream=True)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            self.download_manager.download(image_url, filepath)
             
             print(f"✅ Image downloaded successfully!")
             return filepath
@@ -370,11 +548,18 @@ class FALTextToImageGenerator:
         output_folder: str = "output",
         download_images: bool = True,
         auto_confirm: bool = False,
+        max_concurrency: int = 4,
+        timeout: Optional[float] = None,
         **model_kwargs
     ) -> Dict[str, Any]:
         """
         Generate images with multiple models using the same prompt (batch processing).
         
+        Models run concurrently (up to max_concurrency at a time) and each
+        image is downloaded as soon as its generation finishes, while the
+        other models are still generating. The batch runs on the job engine's
+        background loop, so this also works inside a running event loop.
+        
         Args:
             prompt: Text description for all models
             models: List of models to use (default: all models)
@@ -382,11 +567,69 @@ class FALTextToImageGenerator:
             output_folder: Folder to save generated images
             download_images: Whether to download images locally
             auto_confirm: Skip confirmation prompt (use with caution!)
+            max_concurrency: Maximum number of models generating at once (1 = sequential)
+            timeout: Seconds to wait for each model before cancelling it
             **model_kwargs: Additional parameters to pass to all models
             
         Returns:
             Dictionary with results from all models
         """
+        models = self._prepare_batch(prompt, models, negative_prompt, auto_confirm, max_concurrency)
+        if models is None:
+            return {'cancelled': True, 'reason': 'User cancelled'}
+        
+        return self.job_engine.run_coroutine(self._run_batch(
+            prompt, models, negative_prompt, output_folder, download_images,
+            max_concurrency, timeout, model_kwargs
+        ))
+    
+    async def batch_generate_async(
+        self,
+        prompt: str,
+        models: Optional[List[str]] = None,
+        negative_prompt: Optional[str] = None,
+        output_folder: str = "output",
+        download_images: bool = True,
+        auto_confirm: bool = False,
+        max_concurrency: int = 4,
+        timeout: Optional[float] = None,
+        **model_kwargs
+    ) -> Dict[str, Any]:
+        """
+        Awaitable version of batch_generate.
+        
+        Args:
+            Same as batch_generate
+            
+        Returns:
+            Dictionary with results from all models
+        """
+        models = self._prepare_batch(prompt, models, negative_prompt, auto_confirm, max_concurrency)
+        if models is None:
+            return {'cancelled': True, 'reason': 'User cancelled'}
+        
+        return await self._run_batch(
+            prompt, models, negative_prompt, output_folder, download_images,
+            max_concurrency, timeout, model_kwargs
+        )
+    
+    def _prepare_batch(
+        self,
+        prompt: str,
+        models: Optional[List[str]],
+        negative_prompt: Optional[str],
+        auto_confirm: bool,
+        max_concurrency: int
+    ) -> Optional[List[str]]:
+        """
+        Validate the batch models, print the plan and ask for confirmation.
+        
+        Returns:
+            Models to run, or None if the user cancelled
+        
+        Raises:
+            ValueError: If a model is not supported
+        """
         if models is None:
             models = list(self.MODEL_ENDPOINTS.keys())
         
@@ -396,7 +639,7 @@ class FALTextToImageGenerator:
                 available_models = ", ".join(self.MODEL_ENDPOINTS.keys())
                 raise ValueError(f"Model '{model}' not supported. Available models: {available_models}")
         
-        print(f"🔄 Batch generating with {len(models)} models...")
+        print(f"🔄 Batch generating with {len(models)} models (up to {max_concurrency} at once)...")
         print(f"📝 Prompt: {prompt}")
         if negative_prompt:
             compatible_models = [m for m in models if m in ["seedream", "flux_dev"]]
@@ -407,61 +650,42 @@ class FALTextToImageGenerator:
             confirm = input("⚠️ This will generate multiple images and cost money. Continue? (y/N): ")
             if confirm.lower() not in ['y', 'yes']:
                 print("❌ Batch generation cancelled.")
-                return {'cancelled': True, 'reason': 'User cancelled'}
+                return None
         
-        results = {}
-        successful_count = 0
+        return models
+    
+    async def _run_batch(
+        self,
+        prompt: str,
+        models: List[str],
+        negative_prompt: Optional[str],
+        output_folder: str,
+        download_images: bool,
+        max_concurrency: int,
+        timeout: Optional[float],
+        model_kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate all models of a confirmed batch and summarize the results."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
         start_time = time.time()
         
-        for i, model in enumerate(models, 1):
-            print(f"\n🎨 [{i}/{len(models)}] Generating with {model}...")
-            
-            try:
-                # Generate image
-                model_start_time = time.time()
-                result = self.generate_image(
-                    prompt=prompt,
-                    model=model,
-                    negative_prompt=negative_prompt,
-                    **model_kwargs
-                )
-                model_time = time.time() - model_start_time
-                
-                if result['success']:
-                    successful_count += 1
-                    result['generation_time'] = model_time
-                    
-                    # Download image if requested
-                    if download_images:
-                        try:
-                            timestamp = int(time.time())
-                            filename = f"batch_{model}_{timestamp}.png"
-                            local_path = self.download_image(
-                                result['image_url'],
-                                output_folder,
-                                filename
-                            )
-                            result['local_path'] = local_path
-                        except Exception as download_error:
-                            print(f"⚠️ Download failed for {model}: {download_error}")
-                            result['download_error'] = str(download_error)
-                
-                results[model] = result
-                
-            except Exception as e:
-                print(f"❌ Error with {model}: {str(e)}")
-                results[model] = {
-                    'success': False,
-                    'error': str(e),
-                    'model': model
-                }
+        model_results = await asyncio.gather(*[
+            self._batch_generate_model(
+                model, i, len(models), prompt, negative_prompt, output_folder,
+                download_images, timeout, semaphore, model_kwargs
+            )
+            for i, model in enumerate(models, 1)
+        ])
+        results = dict(zip(models, model_results))
         
         total_time = time.time() - start_time
+        successful_count = sum(1 for r in results.values() if r.get('success'))
+        sequential_time = sum(r.get('model_time', 0) for r in results.values())
         
         # Summary
         print(f"\n📊 Batch generation complete!")
         print(f"✅ Success: {successful_count}/{len(models)} models")
-        print(f"⏱️ Total time: {total_time:.2f} seconds")
+        print(f"⏱️ Total time: {total_time:.2f} seconds (sum of model times: {sequential_time:.2f}s)")
         print(f"💰 Estimated cost: ~${successful_count * 0.015:.3f}")
         
         if successful_count > 0:
@@ -475,12 +699,68 @@ class FALTextToImageGenerator:
                 'successful': successful_count,
                 'failed': len(models) - successful_count,
                 'total_time': total_time,
+                'sequential_time': sequential_time,
+                'speedup': sequential_time / total_time if total_time > 0 else 1.0,
+                'max_concurrency': max_concurrency,
                 'estimated_cost': successful_count * 0.015,
                 'prompt': prompt,
                 'negative_prompt': negative_prompt
             }
         }
     
+    async def _batch_generate_model(
+        self,
+        model: str,
+        index: int,
+        total: int,
+        prompt: str,
+        negative_prompt: Optional[str],
+        output_folder: str,
+        download_images: bool,
+        timeout: Optional[float],
+        semaphore: asyncio.Semaphore,
+        model_kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate (and download) one model's image inside a batch."""
+        async with semaphore:
+            print(f"\n🎨 [{index}/{total}] Generating with {model}...")
+            model_start_time = time.time()
+            
+            try:
+                result = await self.generate_image_async(
+                    prompt=prompt,
+                    model=model,
+                    negative_prompt=negative_prompt,
+                    timeout=timeout,
+                    **model_kwargs
+                )
+            except Exception as e:
+                print(f"❌ Error with {model}: {str(e)}")
+                result = {
+                    'success': False,
+                    'error': str(e),
+                    'model': model
+                }
+            result['generation_time'] = time.time() - model_start_time
+        
+        # Download outside the semaphore so the next model can start generating
+        if result.get('success') and download_images:
+            download_start_time = time.time()
+            try:
+                timestamp = int(time.time())
+                filename = f"batch_{model}_{timestamp}.png"
+                loop = asyncio.get_running_loop()
+                result['local_path'] = await loop.run_in_executor(
+                    None, self.download_image, result['image_url'], output_folder, filename
+                )
+            except Exception as download_error:
+                print(f"⚠️ Download failed for {model}: {download_error}")
+                result['download_error'] = str(download_error)
+            result['download_time'] = time.time() - download_start_time
+        
+        result['model_time'] = time.time() - model_start_time
+        return result
+    
     def compare_models(
         self,
         prompt: str,
@@ -659,13 +939,14 @@ class FALTextToImageGenerator:
             print(f"❌ {error_msg}")
             return {"success": False, "error": error_msg}
     
-    def _filter_model_params(self, model: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _filter_model_params(self, model: str, params: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
         """
         Filter parameters to only include those valid for the specified model.
         
         Args:
             model: Model name
             params: Dictionary of parameters
+            verbose: Print the parameters that were kept
             
         Returns:
             Filtered parameters dictionary
@@ -697,7 +978,7 @@ class FALTextToImageGenerator:
         filtered = {k: v for k, v in params.items() 
                    if k in model_valid_params and v is not None}
         
-        if filtered:
+        if filtered and verbose:
             print(f"🔧 Using parameters: {filtered}")
         
         return filtered
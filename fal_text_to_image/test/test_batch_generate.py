@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+FAL AI Text-to-Image Batch Generation Test
+
+Tests concurrent batch_generate against a fake async FAL client.
+NO IMAGE GENERATION - COMPLETELY FREE!
+
+Usage:
+    python test_batch_generate.py
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+import fal_client
+
+# Add parent directory to path to import the generator
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fal_text_to_image_generator import FALTextToImageGenerator
+from fal_common import FALJobEngine, PollingPolicy
+
+
+class FakeAsyncClient:
+    """Async FAL client finishing each endpoint after its own delay."""
+
+    def __init__(self, delays, failing=()):
+        self.delays = delays
+        self.failing = set(failing)
+        self.endpoints = {}
+        self.active = 0
+        self.max_active = 0
+
+    async def submit(self, endpoint, arguments):
+        request_id = f"req-{len(self.endpoints)}"
+        self.endpoints[request_id] = endpoint
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        return SimpleNamespace(request_id=request_id)
+
+    async def status(self, endpoint, request_id, with_logs=False):
+        await asyncio.sleep(self.delays.get(endpoint, 0.0))
+        if endpoint in self.failing:
+            return fal_client.Completed(logs=None, metrics={}, error="model crashed", error_type="runtime")
+        return fal_client.Completed(logs=None, metrics={})
+
+    async def result(self, endpoint, request_id):
+        self.active -= 1
+        return {"images": [{"url": f"https://fal.media/{request_id}.png", "width": 64, "height": 64}]}
+
+
+class TestBatchGenerate(unittest.TestCase):
+    """Test ordering, bounded concurrency and failure isolation of batch_generate."""
+
+    MODELS = ["imagen4", "seedream", "flux_schnell", "flux_dev"]
+
+    def make_generator(self, delays=None, failing=()):
+        endpoints = FALTextToImageGenerator.MODEL_ENDPOINTS
+        self.client = FakeAsyncClient(
+            {endpoints[model]: delay for model, delay in (delays or {}).items()},
+            failing=[endpoints[model] for model in failing]
+        )
+        engine = FALJobEngine(client=self.client, polling=PollingPolicy.fixed(0))
+        return FALTextToImageGenerator(api_key="test-key", job_engine=engine)
+
+    def batch(self, generator, **kwargs):
+        return generator.batch_generate("a red fox", models=self.MODELS, download_images=False,
+                                        auto_confirm=True, **kwargs)
+
+    def test_results_keep_model_order(self):
+        """Test results are keyed in request order although later models finish first."""
+        generator = self.make_generator({"imagen4": 0.15, "seedream": 0.1, "flux_schnell": 0.05})
+
+        batch = self.batch(generator)
+
+        self.assertEqual(list(batch['results']), self.MODELS)
+        self.assertEqual([r['model'] for r in batch['results'].values()], self.MODELS)
+        self.assertEqual(batch['summary']['successful'], 4)
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency models generate at once."""
+        generator = self.make_generator({model: 0.05 for model in self.MODELS})
+
+        batch = self.batch(generator, max_concurrency=2)
+
+        self.assertEqual(self.client.max_active, 2)
+        self.assertEqual(batch['summary']['max_concurrency'], 2)
+
+    def test_failure_is_isolated(self):
+        """Test one failing model does not affect the others."""
+        generator = self.make_generator(failing=["seedream"])
+
+        results = self.batch(generator)['results']
+
+        self.assertFalse(results['seedream']['success'])
+        self.assertIn("model crashed", results['seedream']['error'])
+        self.assertTrue(all(results[m]['success'] for m in self.MODELS if m != "seedream"))
+
+    def test_repeated_batches_and_running_loop(self):
+        """Test batches can run back to back and from inside a running event loop."""
+        generator = self.make_generator()
+
+        first = self.batch(generator)
+        second = self.batch(generator)
+
+        async def notebook_cell():
+            return self.batch(generator)
+
+        third = asyncio.run(notebook_cell())
+        for batch in (first, second, third):
+            self.assertEqual(batch['summary']['successful'], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
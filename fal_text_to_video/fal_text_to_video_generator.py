@@ -11,9 +11,10 @@ Supported Models:
 """
 
 import os
+import sys
 import time
 import json
-import requests
+import asyncio
 from pathlib import Path
 from typing import Dict, Any, Optional, Union, Literal
 from dotenv import load_dotenv
@@ -25,6 +26,15 @@ except ImportError:
     print("❌ fal-client not installed. Run: pip install fal-client")
     exit(1)
 
+# Shared FAL helpers live in the repository-level fal_common package
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from fal_common import (
+    DownloadManager,
+    FALJobEngine,
+    get_default_download_manager,
+    get_default_engine
+)
+
 
 class TextToVideoModel(Enum):
     """Available text-to-video models."""
@@ -79,16 +89,31 @@ class FALTextToVideoGenerator:
         }
     }
     
-    def __init__(self, api_key: Optional[str] = None, verbose: bool = True):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        verbose: bool = True,
+        job_engine: Optional[FALJobEngine] = None,
+        download_manager: Optional[DownloadManager] = None
+    ):
         """
         Initialize the FAL Text-to-Video Generator.
         
         Args:
             api_key (str, optional): FAL API key. If not provided, loads from environment.
             verbose (bool): Enable verbose output. Defaults to True.
+            job_engine (FALJobEngine, optional): Engine for async requests (default: shared engine)
+            download_manager (DownloadManager, optional): Downloader for generated videos
+                (default: shared pooled manager)
         """
         self.verbose = verbose
         
+        # Shared asyncio engine for queue submission and polling
+        self.job_engine = job_engine or get_default_engine()
+        
+        # Pooled, resumable downloads shared with the other generators
+        self.download_manager = download_manager or get_default_download_manager()
+        
         # Load environment variables
         load_dotenv()
         
@@ -185,52 +210,15 @@ class FALTextToVideoGenerator:
         Returns:
             Dict[str, Any]: Generation result with video URL, local path, cost, and metadata
         """
-        # Calculate cost
-        if model == TextToVideoModel.GOOGLE_VEO3:
-            if duration is None:
-                duration = "8s"
-            cost = self.calculate_cost(model, duration, generate_audio)
-        else:
-            cost = self.calculate_cost(model)
-        
-        if self.verbose:
-            config = self.MODEL_CONFIGS[model]
-            print(f"🎬 Generating video with {config['name']}...")
-            print(f"📝 Prompt: {prompt}")
-            print(f"💰 Estimated cost: ${cost:.2f}")
-            
-            if model == TextToVideoModel.GOOGLE_VEO3:
-                print(f"📐 Aspect ratio: {aspect_ratio}")
-                print(f"⏱️ Duration: {duration}")
-                print(f"🔊 Audio: {'enabled' if generate_audio else 'disabled'}")
-                if negative_prompt:
-                    print(f"🚫 Negative prompt: {negative_prompt}")
+        options = dict(
+            prompt_optimizer=prompt_optimizer, aspect_ratio=aspect_ratio, duration=duration,
+            generate_audio=generate_audio, enhance_prompt=enhance_prompt,
+            negative_prompt=negative_prompt, seed=seed
+        )
+        options["duration"], cost = self._estimate_request_cost(prompt, model, **options)
         
         try:
-            # Prepare request arguments based on model
-            if model == TextToVideoModel.MINIMAX_HAILUO:
-                arguments = {
-                    "prompt": prompt,
-                    "prompt_optimizer": prompt_optimizer
-                }
-            
-            elif model == TextToVideoModel.GOOGLE_VEO3:
-                arguments = {
-                    "prompt": prompt,
-                    "aspect_ratio": aspect_ratio,
-                    "duration": duration,
-                    "generate_audio": generate_audio,
-                    "enhance_prompt": enhance_prompt
-                }
-                
-                # Add optional Veo 3 parameters
-                if negative_prompt:
-                    arguments["negative_prompt"] = negative_prompt
-                if seed is not None:
-                    arguments["seed"] = seed
-            
-            else:
-                raise ValueError(f"Unknown model: {model}")
+            arguments = self._build_arguments(prompt, model, **options)
             
             if self.verbose:
                 print("🔄 Submitting generation request...")
@@ -246,84 +234,244 @@ class FALTextToVideoGenerator:
             if self.verbose:
                 print("✅ Video generation completed!")
             
-            # Process result
-            video_url = result.get('video', {}).get('url') if 'video' in result else None
-            if not video_url:
-                raise Exception("No video URL in response")
-            
-            # Generate output filename if not provided
-            if not output_filename:
-                timestamp = int(time.time())
-                safe_prompt = "".join(c for c in prompt[:30] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                safe_prompt = safe_prompt.replace(' ', '_')
-                
-                model_name = "minimax" if model == TextToVideoModel.MINIMAX_HAILUO else "veo3"
-                
-                if model == TextToVideoModel.GOOGLE_VEO3:
-                    audio_suffix = "_with_audio" if generate_audio else "_no_audio"
-                    output_filename = f"{model_name}_{safe_prompt}_{duration}_{aspect_ratio.replace(':', 'x')}{audio_suffix}_{timestamp}.mp4"
-                else:
-                    output_filename = f"{model_name}_{safe_prompt}_{timestamp}.mp4"
-            
-            # Ensure .mp4 extension
-            if not output_filename.endswith('.mp4'):
-                output_filename += '.mp4'
+            return self._build_generation_result(result, prompt, model, cost, output_filename, **options)
             
-            # Download video
-            local_path = self._download_video(video_url, output_filename)
-            
-            # Prepare result
-            generation_result = {
-                'success': True,
-                'video_url': video_url,
-                'local_path': str(local_path),
-                'filename': output_filename,
-                'prompt': prompt,
-                'model': model.value,
-                'model_name': self.MODEL_CONFIGS[model]["name"],
-                'cost_usd': cost,
-                'metadata': result
-            }
+        except Exception as e:
+            return self._build_error_result(e, prompt, model, cost)
+    
+    async def generate_video_async(
+        self,
+        prompt: str,
+        model: TextToVideoModel = TextToVideoModel.MINIMAX_HAILUO,
+        prompt_optimizer: bool = True,
+        aspect_ratio: AspectRatio = "16:9",
+        duration: Optional[Veo3Duration] = None,
+        generate_audio: bool = True,
+        enhance_prompt: bool = True,
+        negative_prompt: Optional[str] = None,
+        seed: Optional[int] = None,
+        output_filename: Optional[str] = None,
+        timeout: int = 600
+    ) -> Dict[str, Any]:
+        """
+        Awaitable version of generate_video.
+        
+        The job is submitted and polled on the running event loop through the
+        shared job engine instead of blocking a thread in fal_client.subscribe.
+        
+        Args:
+            Same as generate_video
+        
+        Returns:
+            Dict[str, Any]: Generation result with video URL, local path, cost, and metadata
+        """
+        options = dict(
+            prompt_optimizer=prompt_optimizer, aspect_ratio=aspect_ratio, duration=duration,
+            generate_audio=generate_audio, enhance_prompt=enhance_prompt,
+            negative_prompt=negative_prompt, seed=seed
+        )
+        options["duration"], cost = self._estimate_request_cost(prompt, model, **options)
+        
+        try:
+            arguments = self._build_arguments(prompt, model, **options)
             
-            # Add model-specific metadata
-            if model == TextToVideoModel.MINIMAX_HAILUO:
-                generation_result.update({
-                    'prompt_optimizer': prompt_optimizer,
-                    'resolution': '1080p',
-                    'duration': '6s'
-                })
+            if self.verbose:
+                print("🔄 Submitting generation request...")
             
-            elif model == TextToVideoModel.GOOGLE_VEO3:
-                generation_result.update({
-                    'aspect_ratio': aspect_ratio,
-                    'duration': duration,
-                    'generate_audio': generate_audio,
-                    'enhance_prompt': enhance_prompt,
-                    'negative_prompt': negative_prompt,
-                    'seed': seed,
-                    'resolution': '720p'
-                })
+            result = await self.job_engine.run(model.value, arguments, timeout=timeout)
             
             if self.verbose:
-                print(f"📹 Video saved: {local_path}")
-                print(f"🔗 Original URL: {video_url}")
-                print(f"💰 Actual cost: ${cost:.2f}")
+                print("✅ Video generation completed!")
             
-            return generation_result
+            # Download off the event loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                lambda: self._build_generation_result(result, prompt, model, cost, output_filename, **options)
+            )
             
         except Exception as e:
-            error_result = {
-                'success': False,
-                'error': str(e),
-                'prompt': prompt,
-                'model': model.value,
-                'estimated_cost': cost
+            return self._build_error_result(e, prompt, model, cost)
+    
+    def _estimate_request_cost(
+        self,
+        prompt: str,
+        model: TextToVideoModel,
+        duration: Optional[Veo3Duration] = None,
+        aspect_ratio: AspectRatio = "16:9",
+        generate_audio: bool = True,
+        negative_prompt: Optional[str] = None,
+        **kwargs
+    ) -> tuple:
+        """
+        Resolve the default duration, calculate cost and print the request summary.
+        
+        Returns:
+            Tuple of (duration, cost)
+        """
+        # Calculate cost
+        if model == TextToVideoModel.GOOGLE_VEO3:
+            if duration is None:
+                duration = "8s"
+            cost = self.calculate_cost(model, duration, generate_audio)
+        else:
+            cost = self.calculate_cost(model)
+        
+        if self.verbose:
+            config = self.MODEL_CONFIGS[model]
+            print(f"🎬 Generating video with {config['name']}...")
+            print(f"📝 Prompt: {prompt}")
+            print(f"💰 Estimated cost: ${cost:.2f}")
+            
+            if model == TextToVideoModel.GOOGLE_VEO3:
+                print(f"📐 Aspect ratio: {aspect_ratio}")
+                print(f"⏱️ Duration: {duration}")
+                print(f"🔊 Audio: {'enabled' if generate_audio else 'disabled'}")
+                if negative_prompt:
+                    print(f"🚫 Negative prompt: {negative_prompt}")
+        
+        return duration, cost
+    
+    def _build_arguments(
+        self,
+        prompt: str,
+        model: TextToVideoModel,
+        prompt_optimizer: bool = True,
+        aspect_ratio: AspectRatio = "16:9",
+        duration: Optional[Veo3Duration] = None,
+        generate_audio: bool = True,
+        enhance_prompt: bool = True,
+        negative_prompt: Optional[str] = None,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Prepare request arguments based on model."""
+        if model == TextToVideoModel.MINIMAX_HAILUO:
+            return {
+                "prompt": prompt,
+                "prompt_optimizer": prompt_optimizer
+            }
+        
+        elif model == TextToVideoModel.GOOGLE_VEO3:
+            arguments = {
+                "prompt": prompt,
+                "aspect_ratio": aspect_ratio,
+                "duration": duration,
+                "generate_audio": generate_audio,
+                "enhance_prompt": enhance_prompt
             }
             
-            if self.verbose:
-                print(f"❌ Generation failed: {e}")
+            # Add optional Veo 3 parameters
+            if negative_prompt:
+                arguments["negative_prompt"] = negative_prompt
+            if seed is not None:
+                arguments["seed"] = seed
             
-            return error_result
+            return arguments
+        
+        else:
+            raise ValueError(f"Unknown model: {model}")
+    
+    def _build_generation_result(
+        self,
+        result: Dict[str, Any],
+        prompt: str,
+        model: TextToVideoModel,
+        cost: float,
+        output_filename: Optional[str] = None,
+        prompt_optimizer: bool = True,
+        aspect_ratio: AspectRatio = "16:9",
+        duration: Optional[Veo3Duration] = None,
+        generate_audio: bool = True,
+        enhance_prompt: bool = True,
+        negative_prompt: Optional[str] = None,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Download the generated video and build the result dictionary."""
+        # Process result
+        video_url = result.get('video', {}).get('url') if 'video' in result else None
+        if not video_url:
+            raise Exception("No video URL in response")
+        
+        # Generate output filename if not provided
+        if not output_filename:
+            timestamp = int(time.time())
+            safe_prompt = "".join(c for c in prompt[:30] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            safe_prompt = safe_prompt.replace(' ', '_')
+            
+            model_name = "minimax" if model == TextToVideoModel.MINIMAX_HAILUO else "veo3"
+            
+            if model == TextToVideoModel.GOOGLE_VEO3:
+                audio_suffix = "_with_audio" if generate_audio else "_no_audio"
+                output_filename = f"{model_name}_{safe_prompt}_{duration}_{aspect_ratio.replace(':', 'x')}{audio_suffix}_{timestamp}.mp4"
+            else:
+                output_filename = f"{model_name}_{safe_prompt}_{timestamp}.mp4"
+        
+        # Ensure .mp4 extension
+        if not output_filename.endswith('.mp4'):
+            output_filename += '.mp4'
+        
+        # Download video
+        local_path = self._download_video(video_url, output_filename)
+        
+        # Prepare result
+        generation_result = {
+            'success': True,
+            'video_url': video_url,
+            'local_path': str(local_path),
+            'filename': output_filename,
+            'prompt': prompt,
+            'model': model.value,
+            'model_name': self.MODEL_CONFIGS[model]["name"],
+            'cost_usd': cost,
+            'metadata': result
+        }
+        
+        # Add model-specific metadata
+        if model == TextToVideoModel.MINIMAX_HAILUO:
+            generation_result.update({
+                'prompt_optimizer': prompt_optimizer,
+                'resolution': '1080p',
+                'duration': '6s'
+            })
+        
+        elif model == TextToVideoModel.GOOGLE_VEO3:
+            generation_result.update({
+                'aspect_ratio': aspect_ratio,
+                'duration': duration,
+                'generate_audio': generate_audio,
+                'enhance_prompt': enhance_prompt,
+                'negative_prompt': negative_prompt,
+                'seed': seed,
+                'resolution': '720p'
+            })
+        
+        if self.verbose:
+            print(f"📹 Video saved: {local_path}")
+            print(f"🔗 Original URL: {video_url}")
+            print(f"💰 Actual cost: ${cost:.2f}")
+        
+        return generation_result
+    
+    def _build_error_result(
+        self,
+        error: Exception,
+        prompt: str,
+        model: TextToVideoModel,
+        cost: float
+    ) -> Dict[str, Any]:
+        """Build the result dictionary for a failed generation."""
+        error_result = {
+            'success': False,
+            'error': str(error),
+            'prompt': prompt,
+            'model': model.value,
+            'estimated_cost': cost
+        }
+        
+        if self.verbose:
+            print(f"❌ Generation failed: {error}")
+        
+        return error_result
     
     def _download_video(self, url: str, filename: str) -> Path:
         """Download video from URL to local file."""
@@ -333,25 +481,17 @@ class FALTextToVideoGenerator:
             print(f"⬇️ Downloading video: {filename}")
         
         try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
+            def show_progress(downloaded: int, total_size: Optional[int]):
+                if total_size:
+                    progress = (downloaded / total_size) * 100
+                    print(f"\r⬇️ Downloading: {progress:.1f}%", end='', flush=True)
             
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if self.verbose and total_size > 0:
-                            progress = (downloaded / total_size) * 100
-                            print(f"\r⬇️ Downloading: {progress:.1f}%", end='', flush=True)
+            self.download_manager.download(
+                url, local_path, progress=show_progress if self.verbose else None
+            )
             
             if self.verbose:
-                if total_size > 0:
-                    print()  # New line after progress
+                print()  # New line after progress
                 print(f"✅ Download completed: {local_path}")
             
             return local_path
@@ -3,12 +3,24 @@ File handling utilities for FAL Video to Video
 """
 
 import os
+import sys
 import time
 import requests
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse
 
+# Inside the repository, uploads and probes go through the shared fal_common
+# caches; an installed copy of this package uploads directly and uses moviepy
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if (_REPO_ROOT / "fal_common").is_dir() and str(_REPO_ROOT) not in sys.path:
+    sys.path.append(str(_REPO_ROOT))
+try:
+    from fal_common.media_probe import ProbeError, probe_media
+    from fal_common.upload_cache import get_default_upload_cache
+except ImportError:
+    probe_media = get_default_upload_cache = None
+
 
 def ensure_output_directory(output_dir: Optional[str] = None) -> Path:
     """
@@ -83,8 +95,11 @@ def upload_video(video_path: str) -> str:
     
     print(f"📤 Uploading video: {video_path}")
     
-    # Upload the video file
-    video_url = fal_client.upload_file(video_path)
+    # Upload the video file (reusing an earlier upload of the same content)
+    if get_default_upload_cache is not None:
+        video_url = get_default_upload_cache().get_or_upload(video_path, fal_client.upload_file)
+    else:
+        video_url = fal_client.upload_file(video_path)
     
     print(f"✅ Video uploaded successfully: {video_url}")
     return video_url
@@ -92,7 +107,8 @@ def upload_video(video_path: str) -> str:
 
 def get_video_info(video_path: str) -> Dict[str, Any]:
     """
-    Get video information using moviepy.
+    Get video information using the cached ffprobe service (moviepy outside
+    the repository).
     
     Args:
         video_path: Path to video file
@@ -100,6 +116,31 @@ def get_video_info(video_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary with video information
     """
+    if probe_media is None:
+        return _get_video_info_moviepy(video_path)
+    
+    try:
+        info = probe_media(video_path)
+    except ProbeError as e:
+        print(f"⚠️  Could not get video info: {e}")
+        return {}
+    
+    if not info.has_video:
+        print(f"⚠️  Could not get video info: no video stream in {Path(video_path).name}")
+        return {}
+    
+    return {
+        "duration": info.duration,
+        "fps": info.video.fps,
+        "size": [info.video.width, info.video.height],
+        "width": info.video.width,
+        "height": info.video.height,
+        "has_audio": info.has_audio
+    }
+
+
+def _get_video_info_moviepy(video_path: str) -> Dict[str, Any]:
+    """Get video information by opening the file with moviepy."""
     try:
         from moviepy.editor import VideoFileClip
         
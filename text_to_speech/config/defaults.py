@@ -43,6 +43,17 @@ DEFAULT_MAX_TEXT_LENGTH = 40000
 DEFAULT_SPEED_RANGE = (0.25, 4.0)
 DEFAULT_PAUSE_DURATION = 0.5
 
+# Multi-speaker synthesis settings
+DEFAULT_SEGMENT_CONCURRENCY = 4  # Script segments synthesized in parallel
+DEFAULT_SEGMENT_FORMAT = AudioFormat.PCM_MEDIUM  # Raw PCM so segments join sample-accurately; pcm_44100 needs a Pro plan
+
+# Streaming long-form synthesis settings
+DEFAULT_STREAM_CHUNK_LENGTH = 1500  # Characters per request; smaller chunks reach the first audio sooner
+DEFAULT_STREAM_PREFETCH = 1  # Requests kept in flight ahead of the chunk being written
+
+# Voice catalog cache settings
+DEFAULT_VOICE_CACHE_TTL = 24 * 60 * 60  # Seconds before the on-disk catalog is revalidated with the API
+
 # Default voice cloning settings
 DEFAULT_VOICE_CLONE_DESCRIPTION = "A clear, natural speaking voice"
 DEFAULT_VOICE_CLONE_LABELS = ["english", "american", "male", "middle_aged"]
@@ -62,4 +73,5 @@ DEFAULT_VOICE_STYLES = ["professional", "casual", "dramatic", "authoritative", "
 
 # Environment variable names
 ENV_API_KEY = "ELEVENLABS_API_KEY"
-ENV_OPENROUTER_KEY = "OPENROUTER_API_KEY"
\ No newline at end of file
+ENV_OPENROUTER_KEY = "OPENROUTER_API_KEY"
+ENV_VOICE_CACHE_DIR = "ELEVENLABS_VOICE_CACHE_DIR"
\ No newline at end of file
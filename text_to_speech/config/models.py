@@ -49,6 +49,14 @@ DEFAULT_MODEL_SETTINGS = {
         "quality": "high",
         "features": ["balanced", "streaming", "cost_effective"],
         "recommended_for": ["streaming_applications", "cost_effective_projects"]
+    },
+    ElevenLabsModel.MONOLINGUAL_V1: {
+        "max_characters": 5000,
+        "languages": 1,
+        "latency": "low",
+        "quality": "good",
+        "features": ["english", "legacy"],
+        "recommended_for": ["existing_english_projects"]
     }
 }
 
@@ -15,6 +15,7 @@ class ElevenLabsModel(Enum):
     MULTILINGUAL_V2 = "eleven_multilingual_v2"  # Highest quality, 29 languages, 10k chars
     FLASH_V2_5 = "eleven_flash_v2_5"  # Ultra-low latency ~75ms, 32 languages, 40k chars
     TURBO_V2_5 = "eleven_turbo_v2_5"  # Balanced quality/speed, 32 languages, 40k chars
+    MONOLINGUAL_V1 = "eleven_monolingual_v1"  # Legacy English-only model
 
 
 class AudioFormat(Enum):
@@ -23,6 +24,7 @@ class AudioFormat(Enum):
     MP3_HIGH = "mp3_44100_192"  # High quality: 44.1kHz @ 192kbps
     MP3_LOW = "mp3_22050_32"   # Low quality: 22.05kHz @ 32kbps
     PCM = "pcm_16000"          # PCM 16kHz
+    PCM_MEDIUM = "pcm_24000"   # PCM 24kHz
     PCM_HIGH = "pcm_44100"     # PCM 44.1kHz
     ULAW = "ulaw_8000"         # μ-law 8kHz (telephony)
     OPUS = "opus_48000"        # Opus 48kHz
@@ -7,7 +7,6 @@ Main pipeline orchestration for AI content generation and text-to-speech convers
 import os
 import json
 import time
-import requests
 from typing import Dict, List, Optional, Union, Tuple
 from dotenv import load_dotenv
 
@@ -28,6 +27,7 @@ try:
     from ..models.common import ElevenLabsModel, VoiceSettings
     from ..config.voices import get_voice_style_preset
     from ..utils.validators import validate_text_input
+    from ..utils.api_helpers import create_session, make_request_with_retry
 except ImportError:
     # Fallback for direct execution
     import sys
@@ -46,6 +46,7 @@ except ImportError:
     from models.common import ElevenLabsModel, VoiceSettings
     from config.voices import get_voice_style_preset
     from utils.validators import validate_text_input
+    from utils.api_helpers import create_session, make_request_with_retry
 
 
 class OpenRouterTTSPipeline:
@@ -75,6 +76,8 @@ class OpenRouterTTSPipeline:
             "X-Title": "ElevenLabs TTS Pipeline",
             "Content-Type": "application/json"
         }
+        # Pooled session shared by all OpenRouter callers
+        self.openrouter_session = create_session(base_url=self.openrouter_base_url)
     
     def calculate_length_requirements(self, target_minutes: float, num_people: int = 1) -> LengthCalculation:
         """
@@ -117,10 +120,10 @@ class OpenRouterTTSPipeline:
         
         try:
             # Make request to OpenRouter
-            response = requests.post(
+            response = make_request_with_retry(
                 f"{self.openrouter_base_url}/chat/completions",
-                headers=self.openrouter_headers,
-                json={
+                self.openrouter_headers,
+                data={
                     "model": model.value,
                     "messages": [
                         {
@@ -131,10 +134,10 @@ class OpenRouterTTSPipeline:
                     "max_tokens": length_calc.estimated_tokens + 500,
                     "temperature": 0.7
                 },
-                timeout=60
+                session=self.openrouter_session
             )
             
-            if response.status_code == 200:
+            if response is not None:
                 result = response.json()
                 content = result['choices'][0]['message']['content']
                 
@@ -151,7 +154,7 @@ class OpenRouterTTSPipeline:
                     }
                 )
             else:
-                print(f"OpenRouter API error: {response.status_code} - {response.text}")
+                print("OpenRouter API request failed")
                 return None
                 
         except Exception as e:
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+API Helper Tests
+
+Tests make_request_with_retry with and without the shared fal_common host
+clients. HTTP sessions are stubbed out.
+NO API CALLS - COMPLETELY FREE!
+
+Usage:
+    python -m pytest tests/
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+# Add the repository root so the text_to_speech package can be imported
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from text_to_speech.utils import api_helpers
+
+
+class FakeSession:
+    """Session answering with queued status codes (or raising queued errors)."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = requests.Response()
+        response.status_code = outcome
+        response._content = b"{}"
+        return response
+
+
+class TestRetryFallback(unittest.TestCase):
+    """Test the built-in retry loop used when fal_common is not importable."""
+
+    def setUp(self):
+        for patcher in (mock.patch.object(api_helpers, "get_host_client", None),
+                        mock.patch.object(api_helpers.time, "sleep")):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_rate_limit_and_connection_errors_are_retried(self):
+        session = FakeSession(429, requests.ConnectionError("reset"), 200)
+
+        response = api_helpers.make_request_with_retry(
+            "https://api.example.com/v1/voices", {"xi-api-key": "k"}, method="GET", session=session
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(session.calls), 3)
+        self.assertEqual(session.calls[0][2]["timeout"], 30)
+
+    def test_gives_up_after_max_retries(self):
+        session = FakeSession(429, 429)
+
+        self.assertIsNone(api_helpers.make_request_with_retry(
+            "https://api.example.com/v1/tts", {}, data={"text": "hi"}, max_retries=1, session=session
+        ))
+        self.assertEqual(session.calls[0][2]["json"], {"text": "hi"})
+
+    def test_sessions_are_pooled_per_host(self):
+        first = api_helpers.create_session(base_url="https://api.example.com/v1")
+
+        self.assertIs(api_helpers.create_session(base_url="https://api.example.com/v2"), first)
+        self.assertIsNot(api_helpers.create_session(base_url="https://other.example.com"), first)
+        self.assertEqual(api_helpers.get_http_stats("https://api.example.com"), {})
+
+
+class TestSharedHostClient(unittest.TestCase):
+    """Test requests go through fal_common's host client when it is available."""
+
+    def test_request_uses_host_client(self):
+        self.assertIsNotNone(api_helpers.get_host_client)
+        session = FakeSession(304)
+
+        response = api_helpers.make_request_with_retry(
+            "https://api.example.com/v1/voices", {}, method="GET", session=session
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(api_helpers.get_http_stats("https://api.example.com")["requests"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Long-Form Streaming Tests
+
+Tests the prefetch pipeline of text_to_speech_long_form against stubbed
+streaming responses.
+NO API CALLS - COMPLETELY FREE!
+
+Usage:
+    python -m pytest tests/
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add the repository root so the text_to_speech package can be imported
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from text_to_speech.tts.controller import ElevenLabsTTSController
+
+
+class FakeResponse:
+    """Streaming response yielding its body in two parts."""
+
+    def __init__(self, body):
+        self.body = body
+        self.closed = False
+
+    def iter_content(self, chunk_size=8192):
+        yield self.body[:1]
+        yield self.body[1:]
+
+    def close(self):
+        self.closed = True
+
+
+class TestLongFormPrefetch(unittest.TestCase):
+    """Test chunks are requested ahead of the writer and written in order."""
+
+    TEXT = "First one. Second one. Third one. Fourth one. Fifth one."
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.temp_dir.name, "long.mp3")
+        self.controller = ElevenLabsTTSController("test-key-1234567890abcdef")
+        self.controller._request_speech = self.fake_request
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.responses = []
+        self.failing = None
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def fake_request(self, text, voice_id, model, voice_settings, audio_format, speed, stream):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        # Later chunks finish first
+        time.sleep(0.05 if text.startswith("First") else 0.01)
+        with self.lock:
+            self.active -= 1
+        if text == self.failing:
+            return None
+        response = FakeResponse(text.encode())
+        self.responses.append(response)
+        return response
+
+    def test_chunks_written_in_order_with_bounded_prefetch(self):
+        """Test output keeps chunk order and at most `prefetch` requests run at once."""
+        stats = self.controller.text_to_speech_long_form(
+            self.TEXT, "voice", self.output, max_chunk_length=12, prefetch=2
+        )
+
+        self.assertTrue(stats["success"])
+        self.assertEqual(stats["chunks"], 5)
+        self.assertEqual(self.max_active, 2)
+        expected = self.TEXT.replace(". ", ".").encode()
+        self.assertEqual(Path(self.output).read_bytes(), expected)
+        self.assertEqual(stats["bytes_written"], len(expected))
+        self.assertIsNotNone(stats["time_to_first_audio"])
+
+    def test_failed_chunk_stops_and_closes_prefetched_responses(self):
+        """Test a failed chunk aborts the run, removes the output and closes open responses."""
+        self.failing = "Second one."
+        stats = self.controller.text_to_speech_long_form(
+            self.TEXT, "voice", self.output, max_chunk_length=12, prefetch=2
+        )
+
+        self.assertFalse(stats["success"])
+        self.assertFalse(os.path.exists(self.output))
+        self.assertTrue(all(response.closed for response in self.responses))
+
+
+if __name__ == "__main__":
+    unittest.main()
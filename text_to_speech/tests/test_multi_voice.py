@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Multi-Voice Generation Tests
+
+Tests PCM segment assembly and the concurrent segment fan-out of
+multi_voice_generation. Speech requests are stubbed out.
+NO API CALLS - COMPLETELY FREE!
+
+Usage:
+    python -m pytest tests/
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import wave
+from pathlib import Path
+
+# Add the repository root so the text_to_speech package can be imported
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from text_to_speech.models.common import AudioFormat
+from text_to_speech.tts.audio_processor import AudioProcessor
+from text_to_speech.tts.controller import ElevenLabsTTSController
+
+
+def read_frames(path):
+    with wave.open(str(path), 'rb') as wav:
+        return wav.getframerate(), wav.readframes(wav.getnframes())
+
+
+class TestAssemblePcmSegments(unittest.TestCase):
+    """Test segments are joined with exact silence gaps."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.processor = AudioProcessor()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_segment(self, name, data):
+        path = self.root / name
+        path.write_bytes(data)
+        return str(path)
+
+    def test_silence_gap_length(self):
+        """Test the gap between segments is round(sample_rate * pause) frames."""
+        first = self.write_segment("a.pcm", b"\x01\x00" * 100)
+        second = self.write_segment("b.pcm", b"\x02\x00" * 50)
+        output = self.root / "out.wav"
+
+        self.assertTrue(self.processor.assemble_pcm_segments(
+            [first, second], output, sample_rate=24000, pause_seconds=0.0125))
+
+        rate, frames = read_frames(output)
+        self.assertEqual(rate, 24000)
+        self.assertEqual(frames, b"\x01\x00" * 100 + b"\x00\x00" * 300 + b"\x02\x00" * 50)
+
+    def test_odd_length_segment_stays_sample_aligned(self):
+        """Test a trailing half sample is dropped so later segments stay aligned."""
+        first = self.write_segment("a.pcm", b"\x01\x00" * 10 + b"\x7f")
+        second = self.write_segment("b.pcm", b"\x02\x00" * 10)
+        output = self.root / "out.wav"
+
+        self.assertTrue(self.processor.assemble_pcm_segments(
+            [first, second], output, sample_rate=16000, pause_seconds=0.001))
+
+        _, frames = read_frames(output)
+        self.assertEqual(len(frames) % 2, 0)
+        self.assertEqual(frames, b"\x01\x00" * 10 + b"\x00\x00" * 16 + b"\x02\x00" * 10)
+
+
+class TestMultiVoiceGeneration(unittest.TestCase):
+    """Test segments are synthesized concurrently and joined in script order."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.temp_dir.name, "dialogue.wav")
+        self.controller = ElevenLabsTTSController("test-key-1234567890abcdef")
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.formats = []
+        self.controller.text_to_speech = self.fake_text_to_speech
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def fake_text_to_speech(self, text, voice_id, model, voice_settings, audio_format, output_file):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.formats.append(audio_format)
+        # Earlier segments finish last
+        time.sleep(0.02 * (5 - int(text)))
+        with self.lock:
+            self.active -= 1
+        if text == "3":
+            return False
+        Path(output_file).write_bytes(bytes([int(text), 0]) * 4)
+        return True
+
+    def test_fan_out_is_bounded_and_ordered(self):
+        """Test concurrency stays within max_concurrency and output keeps script order."""
+        script = [{"speaker": "rachel", "text": str(i)} for i in range(5)]
+
+        self.assertTrue(self.controller.multi_voice_generation(
+            script, output_file=self.output, pause_between_speakers=0.0, max_concurrency=2))
+
+        self.assertEqual(self.max_active, 2)
+        self.assertEqual(set(self.formats), {AudioFormat.PCM_MEDIUM})
+        rate, frames = read_frames(self.output)
+        self.assertEqual(rate, 24000)
+        # Failed segment 3 is skipped, the rest stay in script order
+        self.assertEqual(frames, b"".join(bytes([i, 0]) * 4 for i in (0, 1, 2, 4)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Text Splitting Tests
+
+Tests sentence splitting and chunking of long text.
+NO API CALLS - COMPLETELY FREE!
+
+Usage:
+    python -m pytest tests/
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add the repository root so the text_to_speech package can be imported
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from text_to_speech.tts.audio_processor import AudioProcessor
+
+
+class TestSplitSentences(unittest.TestCase):
+    """Test sentence boundaries around abbreviations, quotes and line breaks."""
+
+    def setUp(self):
+        self.processor = AudioProcessor()
+
+    def test_abbreviations_and_initials(self):
+        """Test titles, e.g. and initials do not end a sentence."""
+        self.assertEqual(
+            self.processor.split_sentences("Mr. Smith met Dr. J. Doe, e.g. at noon. They talked."),
+            ["Mr. Smith met Dr. J. Doe, e.g. at noon.", "They talked."]
+        )
+
+    def test_number_abbreviations_only_before_numbers(self):
+        """Test "no." ends a sentence unless a number follows."""
+        self.assertEqual(self.processor.split_sentences("The answer is no. We left."),
+                         ["The answer is no.", "We left."])
+        self.assertEqual(self.processor.split_sentences("See No. 5 and fig. 2 first. Then go."),
+                         ["See No. 5 and fig. 2 first.", "Then go."])
+
+    def test_quotes_and_newlines(self):
+        """Test closing quotes stay with their sentence and line breaks split."""
+        self.assertEqual(
+            self.processor.split_sentences('He said "Stop!" She agreed.\nTitle line\n\nLast one'),
+            ['He said "Stop!"', "She agreed.", "Title line", "Last one"]
+        )
+
+
+class TestSplitLongText(unittest.TestCase):
+    """Test chunks are sentence-aligned and never exceed max_length."""
+
+    def setUp(self):
+        self.processor = AudioProcessor()
+
+    def test_short_text_is_one_chunk(self):
+        self.assertEqual(self.processor.split_long_text("Hello there.", 50), ["Hello there."])
+
+    def test_sentences_are_packed(self):
+        """Test whole sentences are packed into chunks."""
+        text = "One two. Three four. Five six. Seven."
+        self.assertEqual(self.processor.split_long_text(text, 20),
+                         ["One two. Three four.", "Five six. Seven."])
+
+    def test_oversized_sentence_is_hard_split(self):
+        """Test a sentence longer than max_length is split at whitespace, or cut without any."""
+        text = "Short. " + "word " * 8 + "end. " + "x" * 25
+        chunks = self.processor.split_long_text(text, 12)
+
+        self.assertTrue(all(len(chunk) <= 12 for chunk in chunks))
+        self.assertEqual(chunks[:3], ["Short.", "word word", "word word"])
+        self.assertEqual(chunks[-3:], ["x" * 12, "x" * 12, "x"])
+        self.assertEqual("".join(text.split()), "".join("".join(chunks).split()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Voice Catalog Tests
+
+Tests the on-disk voice catalog, its revalidation with the API and the
+voice lookup indexes. The /voices request is stubbed out.
+NO API CALLS - COMPLETELY FREE!
+
+Usage:
+    python -m pytest tests/
+"""
+
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the repository root so the text_to_speech package can be imported
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from text_to_speech.config.voices import POPULAR_VOICES
+from text_to_speech.models.common import VoiceInfo
+from text_to_speech.tts import voice_manager
+from text_to_speech.tts.voice_catalog import VoiceIndex
+
+STORED = [
+    VoiceInfo("v1", "Aria", "premade", gender="female"),
+    VoiceInfo("v2", "Bram", "cloned", gender="male"),
+]
+
+
+class FakeResponse:
+    """Minimal /voices response."""
+
+    def __init__(self, status_code, voices=(), etag=None):
+        self.status_code = status_code
+        self._voices = list(voices)
+        self.headers = {"ETag": etag} if etag else {}
+
+    def json(self):
+        return {"voices": self._voices}
+
+
+class TestVoiceCatalog(unittest.TestCase):
+    """Test when the stored catalog is used, revalidated or refetched."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = voice_manager.VoiceManager("test-key", cache_dir=self.temp_dir.name, cache_ttl=60)
+        self.cache = self.manager.catalog_cache
+        self.requests = []
+        self.responses = []
+        patcher = mock.patch.object(voice_manager, "make_request_with_retry", self.fake_request)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def fake_request(self, url, headers, method="GET", session=None, **kwargs):
+        self.requests.append(headers)
+        return self.responses.pop(0)
+
+    def store(self, age=0.0, etag='"abc"'):
+        """Write STORED to the catalog as if fetched `age` seconds ago."""
+        self.cache.save(STORED, etag)
+        entry = json.loads(self.cache.path.read_text())
+        entry["fetched_at"] -= age
+        self.cache.path.write_text(json.dumps(entry))
+
+    def test_fresh_catalog_makes_no_request(self):
+        self.store()
+
+        self.assertEqual(self.manager.get_voices(), STORED)
+        self.assertEqual(self.requests, [])
+
+    def test_stale_catalog_revalidated_with_etag(self):
+        """Test a 304 keeps the stored voices and restarts the TTL."""
+        self.store(age=120)
+        self.responses.append(FakeResponse(304))
+
+        self.assertEqual(self.manager.get_voices(), STORED)
+        self.assertEqual(self.requests[0]["If-None-Match"], '"abc"')
+        entry = self.cache.load()
+        self.assertTrue(self.cache.is_fresh(entry))
+        self.assertEqual(entry["etag"], '"abc"')
+
+    def test_changed_catalog_replaces_stored_one(self):
+        self.store(age=120)
+        self.responses.append(FakeResponse(200, [{"voice_id": "v3", "name": "Cleo", "category": "premade"}],
+                                           etag='"def"'))
+
+        self.assertEqual([voice.name for voice in self.manager.get_voices()], ["Cleo"])
+        self.assertEqual(self.cache.load()["etag"], '"def"')
+
+    def test_failed_fetch_falls_back_to_stored_catalog(self):
+        self.store(age=120)
+        self.responses.append(None)
+
+        self.assertEqual(self.manager.get_voices(), STORED)
+        # The stale entry is kept as it was
+        self.assertLess(self.cache.load()["fetched_at"], time.time() - 60)
+
+    def test_failed_fetch_without_catalog_uses_popular_voices(self):
+        self.responses.append(None)
+
+        self.assertEqual(self.manager.get_voices(), list(POPULAR_VOICES.values()))
+        self.assertFalse(self.cache.path.exists())
+
+
+class TestVoiceIndex(unittest.TestCase):
+    """Test lookups ignore case and keep catalog order."""
+
+    def setUp(self):
+        self.index = VoiceIndex(STORED + [VoiceInfo("v3", "aria", "Premade", gender="Male")])
+
+    def test_filters_are_case_insensitive(self):
+        self.assertEqual([v.voice_id for v in self.index.filter(category="PREMADE")], ["v1", "v3"])
+        self.assertEqual([v.voice_id for v in self.index.filter(gender="male")], ["v2", "v3"])
+        self.assertEqual([v.voice_id for v in self.index.filter(category="premade", gender="MALE")], ["v3"])
+        self.assertEqual(self.index.filter(category="unknown"), ())
+
+    def test_first_voice_wins_on_duplicate_names(self):
+        self.assertEqual(self.index.by_name["aria"].voice_id, "v1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ Core TTS functionality including voice control, audio processing, and speech gen
 Components:
 - controller: Main TTS controller with speech generation
 - voice_manager: Voice selection and management
+- voice_catalog: On-disk voice catalog cache and lookup indexes
 - audio_processor: Audio format handling and processing
 """
 
@@ -6,8 +6,13 @@ Audio format handling, processing, and utility functions.
 
 import os
 import io
+import re
 import time
-from typing import Dict, List, Optional, Union, Any
+import shutil
+import subprocess
+import tempfile
+import wave
+from typing import Callable, Dict, List, Optional, Union, Any
 from pathlib import Path
 
 try:
@@ -22,6 +27,20 @@ except ImportError:
     from utils.file_manager import save_audio_file, ensure_output_dir
 
 
+# Sentence end: terminal punctuation and closing quotes/brackets before whitespace, or a line break
+SENTENCE_BOUNDARY = re.compile(r'[.!?]+["\'\u201d\u2019)\]]*(?=\s)|\n+')
+
+# Words whose trailing period does not end a sentence
+ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "e.g", "i.e",
+    "a.m", "p.m", "inc", "ltd", "co", "corp", "approx", "dept", "est", "mt", "jan",
+    "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec"
+}
+
+# Abbreviations that are also ordinary words; only "No. 5" or "fig. 2" keeps the sentence going
+NUMBER_ABBREVIATIONS = {"no", "fig", "vol"}
+
+
 class AudioProcessor:
     """
     Handles audio format processing, conversion, and file operations.
@@ -34,6 +53,7 @@ class AudioProcessor:
             AudioFormat.MP3_HIGH: {"mime": "audio/mpeg", "extension": ".mp3"},
             AudioFormat.MP3_LOW: {"mime": "audio/mpeg", "extension": ".mp3"},
             AudioFormat.PCM: {"mime": "audio/wav", "extension": ".wav"},
+            AudioFormat.PCM_MEDIUM: {"mime": "audio/wav", "extension": ".wav"},
             AudioFormat.PCM_HIGH: {"mime": "audio/wav", "extension": ".wav"},
             AudioFormat.ULAW: {"mime": "audio/wav", "extension": ".wav"},
             AudioFormat.OPUS: {"mime": "audio/opus", "extension": ".opus"}
@@ -115,21 +135,48 @@ class AudioProcessor:
                 # Save streaming data to file
                 output_path = ensure_output_dir(output_file)
                 with open(output_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=1024):
-                        if chunk:
-                            f.write(chunk)
+                    self.write_streaming_response(response, f)
                 return True
             else:
                 # Collect streaming data in memory
-                content = b""
-                for chunk in response.iter_content(chunk_size=1024):
-                    if chunk:
-                        content += chunk
-                return content
+                buffer = io.BytesIO()
+                self.write_streaming_response(response, buffer)
+                return buffer.getvalue()
         except Exception as e:
             print(f"Error processing streaming response: {e}")
             return False
     
+    def write_streaming_response(
+        self,
+        response,
+        file_obj,
+        chunk_size: int = 8192,
+        on_first_chunk: Optional[Callable[[], None]] = None
+    ) -> int:
+        """
+        Copy a streaming HTTP response into an open binary file as it arrives.
+        
+        Args:
+            response: Streaming HTTP response object
+            file_obj: Writable binary file object
+            chunk_size: Bytes read per iteration
+            on_first_chunk: Called once, just before the first bytes are written
+            
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    if written == 0 and on_first_chunk:
+                        on_first_chunk()
+                    file_obj.write(chunk)
+                    written += len(chunk)
+        finally:
+            response.close()
+        return written
+    
     def process_regular_response(self, response, output_file: Optional[str] = None) -> Union[bytes, bool]:
         """
         Process a regular HTTP response for audio data.
@@ -177,10 +224,52 @@ class AudioProcessor:
         
         return text
     
+    def split_sentences(self, text: str) -> List[str]:
+        """
+        Split text into sentences.
+        
+        Sentences end at ., ! or ? (plus any closing quotes or brackets)
+        followed by whitespace, or at a line break. Periods after common
+        abbreviations (Mr., e.g., etc.) and single-letter initials do not end
+        a sentence; "No." and "Fig." only count as abbreviations before a number.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            List of sentences, stripped of surrounding whitespace
+        """
+        sentences = []
+        start = 0
+        
+        for match in SENTENCE_BOUNDARY.finditer(text):
+            if text[match.start()] == ".":
+                preceding = text[start:match.start()].split()
+                token = preceding[-1].lstrip("\"'([\u201c\u2018").lower() if preceding else ""
+                if token in ABBREVIATIONS or (len(token) == 1 and token.isalpha()):
+                    continue
+                if token in NUMBER_ABBREVIATIONS and text[match.end():].lstrip()[:1].isdigit():
+                    continue
+            
+            sentence = text[start:match.end()].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = match.end()
+        
+        tail = text[start:].strip()
+        if tail:
+            sentences.append(tail)
+        
+        return sentences
+    
     def split_long_text(self, text: str, max_length: int = 5000) -> List[str]:
         """
         Split long text into smaller chunks for processing.
         
+        Chunks are packed with whole sentences (see split_sentences); a
+        sentence longer than max_length is split at the last whitespace
+        that fits, or cut at max_length if it has none.
+        
         Args:
             text: Input text to split
             max_length: Maximum length per chunk
@@ -194,36 +283,35 @@ class AudioProcessor:
         chunks = []
         current_chunk = ""
         
-        # Split by sentences first
-        sentences = text.split('. ')
-        
-        for sentence in sentences:
-            # If adding this sentence would exceed the limit
-            if len(current_chunk) + len(sentence) + 2 > max_length:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = sentence + ". "
+        for sentence in self.split_sentences(text):
+            for piece in self._hard_split(sentence, max_length):
+                # Start a new chunk if adding this piece would exceed the limit
+                if current_chunk and len(current_chunk) + len(piece) + 1 > max_length:
+                    chunks.append(current_chunk)
+                    current_chunk = piece
                 else:
-                    # Single sentence is too long, split by words
-                    words = sentence.split()
-                    for word in words:
-                        if len(current_chunk) + len(word) + 1 > max_length:
-                            if current_chunk:
-                                chunks.append(current_chunk.strip())
-                                current_chunk = word + " "
-                            else:
-                                # Single word is too long, just add it
-                                chunks.append(word)
-                        else:
-                            current_chunk += word + " "
-            else:
-                current_chunk += sentence + ". "
+                    current_chunk = f"{current_chunk} {piece}" if current_chunk else piece
         
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        if current_chunk:
+            chunks.append(current_chunk)
         
         return chunks
     
+    @staticmethod
+    def _hard_split(sentence: str, max_length: int) -> List[str]:
+        """Split a sentence into pieces of at most max_length, preferring whitespace."""
+        pieces = []
+        while len(sentence) > max_length:
+            window = sentence[:max_length + 1]
+            cut = max(window.rfind(" "), window.rfind("\t"), window.rfind("\n"))
+            if cut <= 0:
+                cut = max_length
+            pieces.append(sentence[:cut].rstrip())
+            sentence = sentence[cut:].lstrip()
+        if sentence:
+            pieces.append(sentence)
+        return pieces
+    
     def combine_audio_files(self, file_paths: List[str], output_path: str) -> bool:
         """
         Combine multiple audio files into one.
@@ -239,17 +327,118 @@ class AudioProcessor:
             True if successful, False otherwise
         """
         try:
-            combined_data = b""
+            output_path = ensure_output_dir(output_path)
             
-            for file_path in file_paths:
-                with open(file_path, 'rb') as f:
-                    combined_data += f.read()
+            # Stream each file into the output instead of accumulating bytes in memory
+            with open(output_path, 'wb') as out:
+                for file_path in file_paths:
+                    with open(file_path, 'rb') as f:
+                        shutil.copyfileobj(f, out)
             
-            return self.save_audio(combined_data, output_path)
+            return True
         except Exception as e:
             print(f"Error combining audio files: {e}")
             return False
     
+    def can_assemble_pcm(self, output_path: Union[str, Path]) -> bool:
+        """
+        Check whether PCM segments can be assembled into the given output file.
+        
+        WAV output is written directly; any other format needs ffmpeg to encode.
+        
+        Args:
+            output_path: Desired output file path
+            
+        Returns:
+            True if assemble_pcm_segments can produce this file
+        """
+        return Path(output_path).suffix.lower() == ".wav" or shutil.which("ffmpeg") is not None
+    
+    def assemble_pcm_segments(
+        self,
+        segment_paths: List[str],
+        output_path: Union[str, Path],
+        sample_rate: int = 44100,
+        pause_seconds: float = 0.0,
+        channels: int = 1,
+        sample_width: int = 2
+    ) -> bool:
+        """
+        Join raw PCM segments with exact silence gaps and encode the result once.
+        
+        Segments are streamed into a WAV file chunk by chunk, with
+        pause_seconds of digital silence between consecutive segments. If
+        the output is not a WAV file, the WAV is encoded to the output format
+        with a single ffmpeg run.
+        
+        Args:
+            segment_paths: Raw 16-bit little-endian PCM files, in playback order
+            output_path: Output file path (format taken from the extension)
+            sample_rate: Sample rate of the segments in Hz
+            pause_seconds: Silence inserted between segments
+            channels: Number of interleaved channels in the segments
+            sample_width: Bytes per sample
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        output_path = ensure_output_dir(output_path)
+        frame_size = channels * sample_width
+        silence = b"\x00" * (int(round(sample_rate * pause_seconds)) * frame_size)
+        encode = output_path.suffix.lower() != ".wav"
+        
+        try:
+            with tempfile.TemporaryDirectory(prefix="tts_assemble_") as temp_dir:
+                wav_path = Path(temp_dir) / "assembled.wav" if encode else output_path
+                
+                with wave.open(str(wav_path), 'wb') as wav:
+                    wav.setnchannels(channels)
+                    wav.setsampwidth(sample_width)
+                    wav.setframerate(sample_rate)
+                    for index, segment_path in enumerate(segment_paths):
+                        if index and silence:
+                            wav.writeframesraw(silence)
+                        with open(segment_path, 'rb') as f:
+                            carry = b""
+                            for chunk in iter(lambda: f.read(64 * 1024), b""):
+                                # Keep whole frames only so segments stay sample-aligned
+                                chunk = carry + chunk
+                                usable = len(chunk) - len(chunk) % frame_size
+                                wav.writeframesraw(chunk[:usable])
+                                carry = chunk[usable:]
+                
+                if encode:
+                    return self.encode_audio(wav_path, output_path)
+            return True
+        except Exception as e:
+            print(f"Error assembling audio segments: {e}")
+            return False
+    
+    def encode_audio(self, input_path: Union[str, Path], output_path: Union[str, Path]) -> bool:
+        """
+        Encode an audio file with ffmpeg; the codec follows the output extension.
+        
+        Args:
+            input_path: Source audio file
+            output_path: Destination file
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-y", "-loglevel", "error", "-i", str(input_path), str(output_path)],
+                capture_output=True,
+                text=True
+            )
+            if result.returncode != 0:
+                print(f"Error encoding audio: {result.stderr.strip()}")
+                return False
+            return True
+        except FileNotFoundError:
+            print("Error encoding audio: ffmpeg not found")
+            return False
+    
     def get_audio_info(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """
         Get basic information about an audio file.
@@ -6,12 +6,24 @@ Core text-to-speech functionality with voice control, timing, and audio generati
 
 import os
 import time
+import tempfile
 import requests
-from typing import Dict, List, Optional, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
 from ..models.common import ElevenLabsModel, AudioFormat, VoiceSettings, VoiceInfo
-from ..config.defaults import DEFAULT_VOICE_SETTINGS, DEFAULT_MODEL, DEFAULT_API_BASE_URL
-from ..utils.api_helpers import make_request_with_retry, build_headers, validate_api_key
+from ..config.defaults import (
+    DEFAULT_VOICE_SETTINGS,
+    DEFAULT_MODEL,
+    DEFAULT_API_BASE_URL,
+    DEFAULT_SEGMENT_CONCURRENCY,
+    DEFAULT_SEGMENT_FORMAT,
+    DEFAULT_STREAM_CHUNK_LENGTH,
+    DEFAULT_STREAM_PREFETCH
+)
+from ..utils.api_helpers import make_request_with_retry, build_headers, validate_api_key, create_session, get_http_stats
 from ..utils.validators import validate_text_input, validate_voice_settings, validate_speed
+from ..utils.file_manager import ensure_output_dir
 from .voice_manager import VoiceManager
 from .audio_processor import AudioProcessor
 
@@ -29,13 +41,19 @@ class ElevenLabsTTSController:
     - Professional voice cloning
     """
     
-    def __init__(self, api_key: str, base_url: str = DEFAULT_API_BASE_URL):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_API_BASE_URL,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize the TTS controller
         
         Args:
             api_key: ElevenLabs API key
             base_url: API base URL
+            session: HTTP session to reuse (default: the API host's shared pooled session)
         """
         if not validate_api_key(api_key):
             raise ValueError("Invalid API key format")
@@ -44,8 +62,11 @@ class ElevenLabsTTSController:
         self.base_url = base_url
         self.headers = build_headers(api_key)
         
+        # Keep-alive session shared by all clients of the API host
+        self.session = session or create_session(base_url=base_url)
+        
         # Initialize managers
-        self.voice_manager = VoiceManager(api_key, base_url)
+        self.voice_manager = VoiceManager(api_key, base_url, session=self.session)
         self.audio_processor = AudioProcessor()
     
     def text_to_speech(
@@ -75,16 +96,49 @@ class ElevenLabsTTSController:
         Returns:
             Audio bytes or success status
         """
+        try:
+            response = self._request_speech(
+                text, voice_id, model, voice_settings, audio_format, speed, stream
+            )
+            if not response:
+                return False
+            
+            # Process response
+            if stream:
+                return self.audio_processor.process_streaming_response(response, output_file)
+            else:
+                return self.audio_processor.process_regular_response(response, output_file)
+                
+        except Exception as e:
+            print(f"Error in text-to-speech conversion: {e}")
+            return False
+    
+    def _request_speech(
+        self,
+        text: str,
+        voice_id: str,
+        model: ElevenLabsModel,
+        voice_settings: Optional[VoiceSettings],
+        audio_format: AudioFormat,
+        speed: float,
+        stream: bool
+    ) -> Optional[requests.Response]:
+        """
+        Validate inputs and send one text-to-speech request
+        
+        Returns:
+            API response (body not yet read when stream=True), or None on failure
+        """
         # Validate inputs
         is_valid, error = validate_text_input(text)
         if not is_valid:
             print(f"Invalid text input: {error}")
-            return False
+            return None
         
         is_valid, error = validate_speed(speed)
         if not is_valid:
             print(f"Invalid speed setting: {error}")
-            return False
+            return None
         
         if voice_settings is None:
             voice_settings = DEFAULT_VOICE_SETTINGS
@@ -92,7 +146,7 @@ class ElevenLabsTTSController:
         is_valid, error = validate_voice_settings(voice_settings)
         if not is_valid:
             print(f"Invalid voice settings: {error}")
-            return False
+            return None
         
         # Prepare payload
         payload = {
@@ -108,32 +162,119 @@ class ElevenLabsTTSController:
         # Prepare headers for audio format
         headers = self.audio_processor.build_headers_for_format(self.headers, audio_format)
         
-        try:
-            # Build URL
-            url = f"{self.base_url}/text-to-speech/{voice_id}"
-            if stream:
-                url += "/stream"
-            
-            # Make API request
-            response = make_request_with_retry(
-                url=url,
-                headers=headers,
-                data=payload,
-                method="POST"
-            )
-            
-            if not response:
-                return False
+        # Build URL
+        url = f"{self.base_url}/text-to-speech/{voice_id}"
+        if stream:
+            url += "/stream"
+        url += f"?output_format={audio_format.value}"
+        
+        # Make API request
+        return make_request_with_retry(
+            url=url,
+            headers=headers,
+            data=payload,
+            method="POST",
+            session=self.session,
+            stream=stream
+        )
+    
+    def text_to_speech_long_form(
+        self,
+        text: str,
+        voice_id: str,
+        output_file: str,
+        model: ElevenLabsModel = DEFAULT_MODEL,
+        voice_settings: Optional[VoiceSettings] = None,
+        audio_format: AudioFormat = AudioFormat.MP3,
+        speed: float = 1.0,
+        max_chunk_length: int = DEFAULT_STREAM_CHUNK_LENGTH,
+        prefetch: int = DEFAULT_STREAM_PREFETCH
+    ) -> Dict[str, Any]:
+        """
+        Convert long text to speech, streaming audio to disk as it is generated
+        
+        The text is split into sentence-aligned chunks. While chunk N's
+        /stream response is being written to the output file, requests for
+        the next `prefetch` chunks are already in flight, so synthesis and
+        writing overlap and only a bounded number of responses is open at once.
+        
+        Args:
+            text: Text to convert
+            voice_id: Voice ID to use
+            output_file: Output file path
+            model: TTS model to use
+            voice_settings: Voice configuration
+            audio_format: Output audio format
+            speed: Speech speed (0.25-4.0)
+            max_chunk_length: Maximum characters per request
+            prefetch: Chunks requested ahead of the one being written
             
-            # Process response
-            if stream:
-                return self.audio_processor.process_streaming_response(response, output_file)
-            else:
-                return self.audio_processor.process_regular_response(response, output_file)
-                
-        except Exception as e:
-            print(f"Error in text-to-speech conversion: {e}")
-            return False
+        Returns:
+            Dictionary with success, output_file, chunks, bytes_written,
+            time_to_first_audio and total_time (seconds)
+        """
+        chunks = self.audio_processor.split_long_text(text, max_chunk_length)
+        output_path = ensure_output_dir(output_file)
+        start_time = time.time()
+        stats = {
+            "success": False,
+            "output_file": str(output_path),
+            "chunks": len(chunks),
+            "bytes_written": 0,
+            "time_to_first_audio": None,
+            "total_time": 0.0
+        }
+        
+        def mark_first_audio():
+            if stats["time_to_first_audio"] is None:
+                stats["time_to_first_audio"] = time.time() - start_time
+                print(f"First audio written after {stats['time_to_first_audio']:.2f}s")
+        
+        def request(chunk: str) -> Optional[requests.Response]:
+            return self._request_speech(chunk, voice_id, model, voice_settings, audio_format, speed, True)
+        
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max(1, prefetch)) as pool:
+            try:
+                with open(output_path, "wb") as f:
+                    next_chunk = 0
+                    for index in range(len(chunks)):
+                        # Keep up to `prefetch` requests ahead of the writer
+                        while next_chunk < len(chunks) and len(pending) < max(1, prefetch):
+                            pending.append(pool.submit(request, chunks[next_chunk]))
+                            next_chunk += 1
+                        
+                        response = pending.popleft().result()
+                        if not response:
+                            print(f"Failed to generate audio for chunk {index + 1}/{len(chunks)}")
+                            break
+                        
+                        # Submit the next request before writing this one
+                        if next_chunk < len(chunks):
+                            pending.append(pool.submit(request, chunks[next_chunk]))
+                            next_chunk += 1
+                        
+                        stats["bytes_written"] += self.audio_processor.write_streaming_response(
+                            response, f, on_first_chunk=mark_first_audio
+                        )
+                    else:
+                        stats["success"] = True
+            except Exception as e:
+                print(f"Error in long-form text-to-speech: {e}")
+            finally:
+                # Close responses that were fetched but will not be written
+                for future in pending:
+                    future.cancel()
+                for future in pending:
+                    if not future.cancelled():
+                        response = future.result()
+                        if response:
+                            response.close()
+        
+        stats["total_time"] = time.time() - start_time
+        if not stats["success"]:
+            output_path.unlink(missing_ok=True)
+        return stats
     
     def text_to_speech_with_timing_control(
         self,
@@ -143,7 +284,8 @@ class ElevenLabsTTSController:
         pause_duration: float = 0.5,
         model: ElevenLabsModel = DEFAULT_MODEL,
         voice_settings: Optional[VoiceSettings] = None,
-        output_file: Optional[str] = None
+        output_file: Optional[str] = None,
+        streaming: bool = True
     ) -> bool:
         """
         Convert text to speech with enhanced timing control
@@ -156,6 +298,8 @@ class ElevenLabsTTSController:
             model: TTS model to use
             voice_settings: Voice configuration
             output_file: Output file path
+            streaming: Write audio to the output file chunk by chunk as it is
+                generated (see text_to_speech_long_form)
             
         Returns:
             True if successful, False otherwise
@@ -174,6 +318,17 @@ class ElevenLabsTTSController:
         # Add timing breaks to text
         enhanced_text = self.audio_processor.add_timing_breaks(text, pause_duration)
         
+        if streaming and output_file:
+            result = self.text_to_speech_long_form(
+                text=enhanced_text,
+                voice_id=voice_id,
+                output_file=output_file,
+                model=model,
+                voice_settings=voice_settings,
+                speed=speed
+            )
+            return result["success"]
+        
         # Generate speech
         result = self.text_to_speech(
             text=enhanced_text,
@@ -192,17 +347,25 @@ class ElevenLabsTTSController:
         model: ElevenLabsModel = DEFAULT_MODEL,
         voice_settings: Optional[VoiceSettings] = None,
         output_file: Optional[str] = None,
-        pause_between_speakers: float = 0.3
+        pause_between_speakers: float = 0.3,
+        max_concurrency: int = DEFAULT_SEGMENT_CONCURRENCY
     ) -> bool:
         """
         Generate multi-voice audio from a script
         
+        Segments are synthesized concurrently into a private temporary
+        directory, then joined in script order. When the output can be
+        encoded (WAV output, or ffmpeg available), segments are requested as
+        raw PCM and joined with exact silence gaps before a single encode;
+        otherwise MP3 segments are concatenated without pauses.
+        
         Args:
             script: List of {"speaker": "voice_name", "text": "content"} dictionaries
             model: TTS model to use
             voice_settings: Voice configuration
             output_file: Output file path
             pause_between_speakers: Pause duration between speakers
+            max_concurrency: Maximum number of segments synthesized at once
             
         Returns:
             True if successful, False otherwise
@@ -211,69 +374,80 @@ class ElevenLabsTTSController:
             print("Script cannot be empty")
             return False
         
-        audio_segments = []
-        temp_files = []
+        if not output_file:
+            print("An output file is required for multi-voice generation")
+            return False
         
-        try:
-            for i, segment in enumerate(script):
-                speaker = segment.get("speaker", "")
-                text = segment.get("text", "")
-                
-                if not speaker or not text:
-                    print(f"Invalid script segment {i}: missing speaker or text")
+        # Resolve voices up front so worker threads only make TTS requests
+        segments = []
+        for i, segment in enumerate(script):
+            speaker = segment.get("speaker", "")
+            text = segment.get("text", "")
+            
+            if not speaker or not text:
+                print(f"Invalid script segment {i}: missing speaker or text")
+                continue
+            
+            voice_id = self.voice_manager.get_popular_voice_id(speaker)
+            if not voice_id:
+                voice_info = self.voice_manager.get_voice_by_name(speaker)
+                if voice_info:
+                    voice_id = voice_info.voice_id
+                else:
+                    print(f"Voice '{speaker}' not found, skipping segment")
                     continue
+            
+            segments.append((i, text, voice_id))
+        
+        if not segments:
+            return False
+        
+        assemble_pcm = self.audio_processor.can_assemble_pcm(output_file)
+        segment_format = DEFAULT_SEGMENT_FORMAT if assemble_pcm else AudioFormat.MP3
+        extension = ".pcm" if assemble_pcm else ".mp3"
+        
+        try:
+            # Per-run directory so concurrent runs never share segment files
+            with tempfile.TemporaryDirectory(prefix="tts_segments_") as temp_dir:
+                def synthesize(segment) -> Optional[str]:
+                    i, text, voice_id = segment
+                    temp_file = os.path.join(temp_dir, f"segment_{i:04d}{extension}")
+                    success = self.text_to_speech(
+                        text=text,
+                        voice_id=voice_id,
+                        model=model,
+                        voice_settings=voice_settings,
+                        audio_format=segment_format,
+                        output_file=temp_file
+                    )
+                    if not success:
+                        print(f"Failed to generate audio for segment {i}")
+                        return None
+                    return temp_file
                 
-                # Get voice ID
-                voice_id = self.voice_manager.get_popular_voice_id(speaker)
-                if not voice_id:
-                    voice_info = self.voice_manager.get_voice_by_name(speaker)
-                    if voice_info:
-                        voice_id = voice_info.voice_id
-                    else:
-                        print(f"Voice '{speaker}' not found, skipping segment")
-                        continue
-                
-                # Generate audio for this segment
-                temp_file = f"temp_segment_{i}.mp3"
-                success = self.text_to_speech(
-                    text=text,
-                    voice_id=voice_id,
-                    model=model,
-                    voice_settings=voice_settings,
-                    output_file=temp_file
-                )
+                with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+                    # map() keeps script order regardless of completion order
+                    temp_files = [path for path in pool.map(synthesize, segments) if path]
                 
-                if success:
-                    temp_files.append(temp_file)
-                else:
-                    print(f"Failed to generate audio for segment {i}")
-            
-            # Combine audio files
-            if temp_files and output_file:
-                success = self.audio_processor.combine_audio_files(temp_files, output_file)
+                if not temp_files:
+                    return False
                 
-                # Cleanup temp files
-                for temp_file in temp_files:
-                    try:
-                        os.remove(temp_file)
-                    except OSError:
-                        pass
+                if assemble_pcm:
+                    sample_rate = int(segment_format.value.split("_")[1])
+                    return self.audio_processor.assemble_pcm_segments(
+                        temp_files,
+                        output_file,
+                        sample_rate=sample_rate,
+                        pause_seconds=pause_between_speakers
+                    )
                 
-                return success
+                if pause_between_speakers:
+                    print("ffmpeg not found; joining MP3 segments without pauses")
+                return self.audio_processor.combine_audio_files(temp_files, output_file)
             
         except Exception as e:
             print(f"Error in multi-voice generation: {e}")
-            
-            # Cleanup temp files on error
-            for temp_file in temp_files:
-                try:
-                    os.remove(temp_file)
-                except OSError:
-                    pass
-            
             return False
-        
-        return False
     
     def clone_voice_from_file(
         self,
@@ -308,7 +482,8 @@ class ElevenLabsTTSController:
                     headers=self.headers,
                     data=data,
                     files=files,
-                    method="POST"
+                    method="POST",
+                    session=self.session
                 )
             
             if response and response.status_code in [200, 201]:
@@ -344,4 +519,8 @@ class ElevenLabsTTSController:
     
     def search_voices(self, query: str, category: Optional[str] = None, gender: Optional[str] = None) -> List[VoiceInfo]:
         """Search for voices"""
-        return self.voice_manager.search_voices(query, category, gender)
\ No newline at end of file
+        return self.voice_manager.search_voices(query, category, gender)
+    
+    def get_http_stats(self) -> Dict[str, Any]:
+        """Get latency, retry and circuit breaker metrics for the API host"""
+        return get_http_stats(self.base_url)
\ No newline at end of file
@@ -0,0 +1,216 @@
+"""
+Voice Catalog Module
+
+On-disk cache and lookup indexes for the ElevenLabs voice catalog.
+
+The catalog is stored as one JSON file per API key and base URL, written
+atomically so concurrent readers (other CLI runs, pipeline workers) always
+see a complete file. Entries younger than the TTL are used without any
+network call; older entries are revalidated with the stored ETag, so an
+unchanged catalog costs a single 304 response.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: readers stay safe through atomic replace
+    fcntl = None
+
+try:
+    from ..models.common import VoiceInfo
+    from ..config.defaults import DEFAULT_VOICE_CACHE_TTL, ENV_VOICE_CACHE_DIR
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from models.common import VoiceInfo
+    from config.defaults import DEFAULT_VOICE_CACHE_TTL, ENV_VOICE_CACHE_DIR
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "veo3-fal-tool" / "voices"
+
+
+def parse_voice(voice_data: Dict[str, Any]) -> VoiceInfo:
+    """
+    Build a VoiceInfo from one entry of the /voices response.
+
+    Args:
+        voice_data: Voice dictionary from the API
+
+    Returns:
+        VoiceInfo object
+    """
+    labels = voice_data.get("labels") or {}
+    return VoiceInfo(
+        voice_id=voice_data.get("voice_id", ""),
+        name=voice_data.get("name", ""),
+        category=voice_data.get("category", ""),
+        description=voice_data.get("description") or "",
+        language=voice_data.get("language") or labels.get("language", "en"),
+        gender=voice_data.get("gender") or labels.get("gender", "neutral")
+    )
+
+
+class VoiceIndex:
+    """
+    Immutable snapshot of a voice list with lookup indexes.
+
+    Names, categories and genders are indexed case-insensitively. A snapshot
+    is never modified after construction, so threads can read it without
+    locking while a refresh builds its replacement.
+    """
+
+    def __init__(self, voices: Iterable[VoiceInfo]):
+        """
+        Build the indexes.
+
+        Args:
+            voices: Voices in catalog order
+        """
+        self.voices: Tuple[VoiceInfo, ...] = tuple(voices)
+        self.by_id: Dict[str, VoiceInfo] = {}
+        self.by_name: Dict[str, VoiceInfo] = {}
+        by_category: Dict[str, List[VoiceInfo]] = {}
+        by_gender: Dict[str, List[VoiceInfo]] = {}
+
+        for voice in self.voices:
+            self.by_id.setdefault(voice.voice_id, voice)
+            # First voice wins on duplicate names, matching the old linear scan
+            self.by_name.setdefault(voice.name.lower(), voice)
+            by_category.setdefault(voice.category.lower(), []).append(voice)
+            by_gender.setdefault(voice.gender.lower(), []).append(voice)
+
+        self.by_category = {key: tuple(value) for key, value in by_category.items()}
+        self.by_gender = {key: tuple(value) for key, value in by_gender.items()}
+
+    def filter(self, category: Optional[str] = None, gender: Optional[str] = None) -> Tuple[VoiceInfo, ...]:
+        """
+        Get voices matching optional category and gender filters.
+
+        Args:
+            category: Voice category filter
+            gender: Gender filter
+
+        Returns:
+            Matching voices in catalog order
+        """
+        voices = self.voices
+        if category is not None:
+            voices = self.by_category.get(category.lower(), ())
+        if gender is not None:
+            gender_ids = {voice.voice_id for voice in self.by_gender.get(gender.lower(), ())}
+            voices = tuple(voice for voice in voices if voice.voice_id in gender_ids)
+        return voices
+
+
+class VoiceCatalogCache:
+    """
+    Persistent voice catalog for one API key and base URL.
+
+    The cache file holds the voice list, the response ETag and the fetch
+    time. The API key itself is never written; it only selects the file name.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        cache_dir: Optional[str] = None,
+        ttl: float = DEFAULT_VOICE_CACHE_TTL
+    ):
+        """
+        Initialize the catalog cache.
+
+        Args:
+            api_key: ElevenLabs API key (selects the per-account cache file)
+            base_url: API base URL
+            cache_dir: Directory for catalog files (default: ELEVENLABS_VOICE_CACHE_DIR
+                environment variable or ~/.cache/veo3-fal-tool/voices)
+            ttl: Seconds a stored catalog is used before it is revalidated
+        """
+        self.cache_dir = Path(cache_dir or os.getenv(ENV_VOICE_CACHE_DIR) or DEFAULT_CACHE_DIR)
+        self.ttl = ttl
+        account = hashlib.sha256(f"{base_url}\n{api_key}".encode("utf-8")).hexdigest()[:16]
+        self.path = self.cache_dir / f"voices_{account}.json"
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the stored catalog.
+
+        Returns:
+            Dictionary with voices, etag and fetched_at, or None if missing or unreadable
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            entry["voices"] = [VoiceInfo(**voice) for voice in entry["voices"]]
+            return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Ignoring unreadable voice cache {self.path}: {e}")
+            return None
+
+    def save(self, voices: List[VoiceInfo], etag: Optional[str] = None):
+        """
+        Store a catalog atomically.
+
+        Args:
+            voices: Voices to store
+            etag: ETag header of the response the voices came from
+        """
+        entry = {
+            "fetched_at": time.time(),
+            "etag": etag,
+            "voices": [asdict(voice) for voice in voices]
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".voices_", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Could not write voice cache {self.path}: {e}")
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check whether a stored catalog is younger than the TTL."""
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    @contextmanager
+    def refresh_lock(self):
+        """
+        Serialize refreshes across processes.
+
+        Only writers take this lock; readers rely on the atomic replace in save().
+        """
+        if fcntl is None:
+            yield
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            lock_file = open(self.path.with_suffix(".lock"), "w")
+        except OSError:
+            yield
+            return
+
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
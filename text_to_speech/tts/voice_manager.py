@@ -4,13 +4,17 @@ Voice Management Module
 Voice selection, management, and retrieval functionality.
 """
 
+import threading
+import time
 import requests
 from typing import Dict, List, Optional, Union
 
 try:
     from ..models.common import VoiceInfo, POPULAR_VOICE_IDS
     from ..config.voices import POPULAR_VOICES, get_voice_preset
+    from ..config.defaults import DEFAULT_VOICE_CACHE_TTL
     from ..utils.api_helpers import make_request_with_retry, build_headers
+    from .voice_catalog import VoiceCatalogCache, VoiceIndex, parse_voice
 except ImportError:
     # Fallback for direct execution
     import sys
@@ -18,67 +22,142 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from models.common import VoiceInfo, POPULAR_VOICE_IDS
     from config.voices import POPULAR_VOICES, get_voice_preset
+    from config.defaults import DEFAULT_VOICE_CACHE_TTL
     from utils.api_helpers import make_request_with_retry, build_headers
+    from tts.voice_catalog import VoiceCatalogCache, VoiceIndex, parse_voice
 
 
 class VoiceManager:
     """
     Manages voice selection, retrieval, and caching for TTS operations.
+    
+    The voice catalog is kept on disk (see voice_catalog) and shared by every
+    process using the same API key, so a warm start resolves voices without
+    any network call. Lookups go through prebuilt indexes instead of scanning
+    the voice list.
     """
     
-    def __init__(self, api_key: str, base_url: str = "https://api.elevenlabs.io/v1"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.elevenlabs.io/v1",
+        session: Optional[requests.Session] = None,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = DEFAULT_VOICE_CACHE_TTL,
+        use_disk_cache: bool = True
+    ):
         """
         Initialize the voice manager.
         
         Args:
             api_key: ElevenLabs API key
             base_url: API base URL
+            session: HTTP session to reuse (optional)
+            cache_dir: Directory for the on-disk voice catalog (default: see VoiceCatalogCache)
+            cache_ttl: Seconds the catalog is used before it is revalidated with the API
+            use_disk_cache: Whether to persist the catalog between processes
         """
         self.api_key = api_key
         self.base_url = base_url
         self.headers = build_headers(api_key)
+        self.session = session
+        self.cache_ttl = cache_ttl
+        self.catalog_cache = VoiceCatalogCache(api_key, base_url, cache_dir, cache_ttl) if use_disk_cache else None
         
-        # Cache for voices
-        self._voices_cache: Optional[List[VoiceInfo]] = None
+        # Current index snapshot; replaced as a whole on refresh so readers need no lock
+        self._index: Optional[VoiceIndex] = None
+        self._index_loaded_at = 0.0
+        self._refresh_lock = threading.Lock()
     
     def get_voices(self, refresh_cache: bool = False) -> List[VoiceInfo]:
         """
-        Get all available voices from the API.
+        Get all available voices.
+        
+        Served from memory, then from the on-disk catalog, and only fetched
+        from the API when the catalog is missing or older than the TTL.
         
         Args:
-            refresh_cache: Whether to refresh the cached voices
+            refresh_cache: Whether to revalidate the catalog with the API
             
         Returns:
             List of VoiceInfo objects
         """
-        if self._voices_cache is None or refresh_cache:
-            try:
-                url = f"{self.base_url}/voices"
-                response = make_request_with_retry(url, self.headers, method="GET")
-                
-                if response and response.status_code == 200:
-                    voices_data = response.json()
-                    self._voices_cache = []
-                    
-                    for voice_data in voices_data.get("voices", []):
-                        voice_info = VoiceInfo(
-                            voice_id=voice_data.get("voice_id", ""),
-                            name=voice_data.get("name", ""),
-                            category=voice_data.get("category", ""),
-                            description=voice_data.get("description", ""),
-                            language=voice_data.get("language", "en"),
-                            gender=voice_data.get("gender", "neutral")
-                        )
-                        self._voices_cache.append(voice_info)
-                else:
-                    print("Failed to retrieve voices from API, using popular voices as fallback")
-                    self._voices_cache = list(POPULAR_VOICES.values())
-                    
-            except Exception as e:
-                print(f"Error retrieving voices: {e}")
-                self._voices_cache = list(POPULAR_VOICES.values())
-        
-        return self._voices_cache or []
+        return list(self._get_index(refresh_cache).voices)
+    
+    def _get_index(self, refresh: bool = False) -> VoiceIndex:
+        """Get the current voice index, loading or refreshing it if needed."""
+        index = self._index
+        if index is not None and not refresh and time.time() - self._index_loaded_at < self.cache_ttl:
+            return index
+        
+        with self._refresh_lock:
+            # Another thread may have refreshed while we waited
+            if self._index is not None and self._index is not index:
+                return self._index
+            self._index = VoiceIndex(self._load_voices(refresh))
+            self._index_loaded_at = time.time()
+            return self._index
+    
+    def _load_voices(self, refresh: bool) -> List[VoiceInfo]:
+        """Load voices from the on-disk catalog, revalidating it with the API when stale."""
+        if self.catalog_cache is None:
+            voices, _ = self._fetch_voices()
+            return voices if voices is not None else list(POPULAR_VOICES.values())
+        
+        entry = self.catalog_cache.load()
+        if entry and not refresh and self.catalog_cache.is_fresh(entry):
+            return entry["voices"]
+        
+        # One process refreshes at a time; the others pick up its result
+        with self.catalog_cache.refresh_lock():
+            latest = self.catalog_cache.load()
+            if latest and latest.get("fetched_at", 0) > (entry or {}).get("fetched_at", 0):
+                return latest["voices"]
+            
+            voices, etag = self._fetch_voices(etag=(entry or {}).get("etag"))
+            if voices is None and etag is not None:
+                # 304 Not Modified: keep the stored voices and restart the TTL
+                voices = entry["voices"]
+            if voices is not None:
+                self.catalog_cache.save(voices, etag)
+                return voices
+        
+        if entry:
+            print("Failed to refresh voices from API, using cached voice catalog")
+            return entry["voices"]
+        
+        print("Failed to retrieve voices from API, using popular voices as fallback")
+        return list(POPULAR_VOICES.values())
+    
+    def _fetch_voices(self, etag: Optional[str] = None):
+        """
+        Fetch the voice catalog from the API.
+        
+        Args:
+            etag: ETag of the stored catalog, sent as If-None-Match
+            
+        Returns:
+            Tuple of (voices, etag). Voices is None when the catalog is
+            unchanged (etag set) or the request failed (etag None).
+        """
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        
+        try:
+            url = f"{self.base_url}/voices"
+            response = make_request_with_retry(url, headers, method="GET", session=self.session)
+            
+            if response is None:
+                return None, None
+            if response.status_code == 304:
+                return None, etag
+            
+            voices = [parse_voice(voice_data) for voice_data in response.json().get("voices", [])]
+            return voices, response.headers.get("ETag")
+        except Exception as e:
+            print(f"Error retrieving voices: {e}")
+            return None, None
     
     def get_voice_by_id(self, voice_id: str) -> Optional[VoiceInfo]:
         """
@@ -90,11 +169,7 @@ class VoiceManager:
         Returns:
             VoiceInfo object if found, None otherwise
         """
-        voices = self.get_voices()
-        for voice in voices:
-            if voice.voice_id == voice_id:
-                return voice
-        return None
+        return self._get_index().by_id.get(voice_id)
     
     def get_voice_by_name(self, voice_name: str) -> Optional[VoiceInfo]:
         """
@@ -112,12 +187,7 @@ class VoiceManager:
             return voice_info
         
         # Then check all voices
-        voices = self.get_voices()
-        for voice in voices:
-            if voice.name.lower() == voice_name.lower():
-                return voice
-        
-        return None
+        return self._get_index().by_name.get(voice_name.lower())
     
     def get_popular_voice_id(self, voice_name: str) -> Optional[str]:
         """
@@ -143,24 +213,14 @@ class VoiceManager:
         Returns:
             List of matching VoiceInfo objects
         """
-        voices = self.get_voices()
-        results = []
-        
+        # Filters narrow the candidates through the indexes before text matching
+        voices = self._get_index().filter(category, gender)
         query_lower = query.lower()
         
-        for voice in voices:
-            # Check if query matches name or description
-            name_match = query_lower in voice.name.lower()
-            desc_match = query_lower in voice.description.lower()
-            
-            # Apply filters
-            category_match = category is None or voice.category == category
-            gender_match = gender is None or voice.gender == gender
-            
-            if (name_match or desc_match) and category_match and gender_match:
-                results.append(voice)
-        
-        return results
+        return [
+            voice for voice in voices
+            if query_lower in voice.name.lower() or query_lower in voice.description.lower()
+        ]
     
     def get_voices_by_category(self, category: str) -> List[VoiceInfo]:
         """
@@ -172,8 +232,7 @@ class VoiceManager:
         Returns:
             List of VoiceInfo objects
         """
-        voices = self.get_voices()
-        return [voice for voice in voices if voice.category == category]
+        return list(self._get_index().filter(category=category))
     
     def get_voices_by_gender(self, gender: str) -> List[VoiceInfo]:
         """
@@ -185,8 +244,7 @@ class VoiceManager:
         Returns:
             List of VoiceInfo objects
         """
-        voices = self.get_voices()
-        return [voice for voice in voices if voice.gender == gender.lower()]
+        return list(self._get_index().filter(gender=gender))
     
     def print_voices(self, category: Optional[str] = None, limit: int = 20):
         """
@@ -196,10 +254,7 @@ class VoiceManager:
             category: Optional category filter
             limit: Maximum number of voices to display
         """
-        voices = self.get_voices()
-        
-        if category:
-            voices = [v for v in voices if v.category == category]
+        voices = self._get_index().filter(category or None)
         
         print(f"\nAvailable Voices ({len(voices)} total):")
         print("-" * 80)
@@ -235,12 +290,6 @@ class VoiceManager:
         """
         import random
         
-        voices = self.get_voices()
-        
-        # Apply filters
-        if category:
-            voices = [v for v in voices if v.category == category]
-        if gender:
-            voices = [v for v in voices if v.gender == gender]
+        voices = self._get_index().filter(category or None, gender or None)
         
         return random.choice(voices) if voices else None
\ No newline at end of file
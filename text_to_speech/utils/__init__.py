@@ -10,7 +10,7 @@ Components:
 """
 
 from .file_manager import ensure_output_dir, save_audio_file
-from .api_helpers import validate_api_key, make_request_with_retry
+from .api_helpers import validate_api_key, make_request_with_retry, create_session
 from .validators import validate_voice_settings, validate_text_input
 
 __all__ = [
@@ -18,6 +18,7 @@ __all__ = [
     "save_audio_file", 
     "validate_api_key",
     "make_request_with_retry",
+    "create_session",
     "validate_voice_settings",
     "validate_text_input"
 ]
\ No newline at end of file
@@ -4,11 +4,25 @@ API Helper Utilities
 Common utilities for API interactions and request handling.
 """
 
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Optional, Any
+from urllib.parse import urlsplit
 import json
 
+try:
+    # Shared per-host clients (retries, Retry-After, circuit breaker) when the
+    # repository's fal_common package is importable
+    from fal_common.http_client import get_host_client
+except ImportError:
+    get_host_client = None
+
+# Pooled sessions per host, used when fal_common is not available
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
 
 def validate_api_key(api_key: str) -> bool:
     """
@@ -34,6 +48,50 @@ def validate_api_key(api_key: str) -> bool:
     return True
 
 
+def create_session(pool_size: int = 16, base_url: str = "https://api.elevenlabs.io/v1") -> requests.Session:
+    """
+    Get the shared keep-alive HTTP session for an API host.
+    
+    Every controller and manager talking to the same host reuses one
+    connection pool, which avoids a new TCP/TLS handshake per API call.
+    
+    Args:
+        pool_size: Maximum number of pooled connections (applied when the
+            host's session is first created)
+        base_url: Any URL on the API host
+        
+    Returns:
+        Pooled requests.Session shared by the process
+    """
+    if get_host_client is not None:
+        return get_host_client(base_url, pool_size=pool_size).session
+    
+    host = urlsplit(base_url).netloc.lower()
+    with _sessions_lock:
+        if host not in _sessions:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+        return _sessions[host]
+
+
+def get_http_stats(url: str) -> Dict[str, Any]:
+    """
+    Get latency, retry and circuit breaker metrics for an API host.
+    
+    Args:
+        url: Any URL on the API host
+        
+    Returns:
+        Metrics dictionary (empty when fal_common is not available)
+    """
+    if get_host_client is None:
+        return {}
+    return get_host_client(url).get_stats()
+
+
 def make_request_with_retry(
     url: str,
     headers: Dict[str, str],
@@ -41,11 +99,20 @@ def make_request_with_retry(
     files: Optional[Dict[str, Any]] = None,
     method: str = "POST",
     max_retries: int = 3,
-    retry_delay: float = 1.0
+    retry_delay: float = 1.0,
+    session: Optional[requests.Session] = None,
+    stream: bool = False
 ) -> Optional[requests.Response]:
     """
     Make an HTTP request with retry logic.
     
+    With fal_common available, requests go through the shared client for
+    the URL's host, which retries rate-limited responses after their
+    Retry-After delay, backs off with jitter on transient errors and stops
+    calling a failing host until it recovers (see fal_common.http_client).
+    Otherwise rate-limited requests back off exponentially and connection
+    errors are retried after retry_delay, on the host's pooled session.
+    
     Args:
         url: Request URL
         headers: Request headers
@@ -53,50 +120,61 @@ def make_request_with_retry(
         files: Request files (for multipart requests)
         method: HTTP method
         max_retries: Maximum number of retry attempts
-        retry_delay: Delay between retries in seconds
+        retry_delay: Base delay for exponential backoff in seconds
+        session: Session to send the request through (default: the host's pooled session)
+        stream: Whether to defer downloading the response body
         
     Returns:
         Response object if successful, None otherwise
     """
-    for attempt in range(max_retries + 1):
+    method = method.upper()
+    if method not in ("GET", "POST"):
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    kwargs: Dict[str, Any] = {"headers": headers, "timeout": 30 if method == "GET" else 60, "stream": stream}
+    if method == "POST":
+        if files:
+            # Remove Content-Type for multipart requests
+            headers_copy = headers.copy()
+            headers_copy.pop("Content-Type", None)
+            kwargs.update(headers=headers_copy, data=data, files=files)
+        elif data:
+            kwargs["json"] = data
+    
+    if get_host_client is not None:
         try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=headers, timeout=30)
-            elif method.upper() == "POST":
-                if files:
-                    # Remove Content-Type for multipart requests
-                    headers_copy = headers.copy()
-                    headers_copy.pop("Content-Type", None)
-                    response = requests.post(url, headers=headers_copy, data=data, files=files, timeout=60)
-                elif data:
-                    response = requests.post(url, headers=headers, json=data, timeout=60)
-                else:
-                    response = requests.post(url, headers=headers, timeout=60)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            # Check if request was successful
-            if response.status_code in [200, 201]:
-                return response
-            elif response.status_code == 429:  # Rate limit
+            response = get_host_client(url).request(
+                method, url, max_retries=max_retries, backoff=retry_delay, session=session, **kwargs
+            )
+        except requests.exceptions.RequestException as e:
+            print(f"Request failed: {e}")
+            return None
+    else:
+        response = None
+        session = session or create_session(base_url=url)
+        for attempt in range(max_retries + 1):
+            try:
+                response = session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
                 if attempt < max_retries:
-                    wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
-                    print(f"Rate limited. Waiting {wait_time} seconds before retry...")
-                    time.sleep(wait_time)
+                    print(f"Request failed (attempt {attempt + 1}): {e}")
+                    time.sleep(retry_delay)
                     continue
-            else:
-                print(f"HTTP {response.status_code}: {response.text}")
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            if attempt < max_retries:
-                print(f"Request failed (attempt {attempt + 1}): {e}")
-                time.sleep(retry_delay)
-                continue
-            else:
                 print(f"Request failed after {max_retries + 1} attempts: {e}")
                 return None
+            
+            if response.status_code == 429 and attempt < max_retries:
+                wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
+                print(f"Rate limited. Waiting {wait_time} seconds before retry...")
+                time.sleep(wait_time)
+                continue
+            break
+    
+    # Check if request was successful (304 answers a conditional If-None-Match GET)
+    if response.status_code in [200, 201, 304]:
+        return response
     
+    print(f"HTTP {response.status_code}: {response.text}")
     return None
 
 
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: separate ffmpeg invocations vs a single-pass MediaGraph
+
+Produces the same four derivatives of a synthetic test video - a thumbnail,
+frames every 2 seconds, a 640x360 copy and an H.264 re-encode - in two ways:
+
+- separate: VideoProcessor.get_thumbnail, extract_frames, resize_video and
+  convert_format, each decoding the source again
+- graph: one MediaGraph, decoding the source once and splitting it to every
+  output
+
+Requires ffmpeg on PATH.
+
+Usage:
+    python examples/benchmark_media_graph.py [--duration 60] [--runs 3]
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add video_tools directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from video_utils.enhanced_video_processor import VideoProcessor
+from video_utils.media_graph import MediaGraph
+
+
+def make_source(path: Path, duration: int):
+    """Render a 1080p test pattern with a sine tone."""
+    cmd = [
+        'ffmpeg', '-y', '-v', 'error',
+        '-f', 'lavfi', '-i', f'testsrc2=size=1920x1080:rate=30:duration={duration}',
+        '-f', 'lavfi', '-i', f'sine=frequency=440:duration={duration}',
+        '-c:v', 'libx264', '-preset', 'veryfast', '-c:a', 'aac', '-shortest', str(path)
+    ]
+    subprocess.run(cmd, check=True)
+
+
+def run_separate(processor: VideoProcessor, source: Path, output_dir: Path) -> bool:
+    return all([
+        processor.get_thumbnail(source, output_dir / 'thumb.jpg', '00:00:05'),
+        processor.extract_frames(source, output_dir / 'frames', '1/2'),
+        processor.resize_video(source, output_dir / 'resized.mp4', 640, 360),
+        processor.convert_format(source, output_dir / 'converted.mp4', 'libx264'),
+    ])
+
+
+def run_graph(source: Path, output_dir: Path) -> bool:
+    graph = (MediaGraph(source)
+             .thumbnail(output_dir / 'thumb.jpg', '00:00:05')
+             .frames(output_dir / 'frames', '1/2')
+             .resize(output_dir / 'resized.mp4', 640, 360)
+             .convert(output_dir / 'converted.mp4', 'libx264'))
+    return graph.run().returncode == 0
+
+
+def time_runs(label: str, runs: int, work) -> float:
+    timings = []
+    for i in range(runs):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            start = time.perf_counter()
+            if not work(Path(temp_dir)):
+                raise RuntimeError(f"{label} run {i + 1} failed")
+            timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    print(f"   {label:<10} median {median:6.2f}s  (runs: {', '.join(f'{t:.2f}' for t in timings)})")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-pass ffmpeg graphs")
+    parser.add_argument('--duration', type=int, default=60, help="Source video length in seconds")
+    parser.add_argument('--runs', type=int, default=3, help="Runs per approach")
+    args = parser.parse_args()
+
+    if not shutil.which('ffmpeg'):
+        print("❌ ffmpeg not found on PATH")
+        return 1
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = Path(temp_dir) / 'source.mp4'
+        print(f"🎬 Rendering {args.duration}s 1080p test source...")
+        make_source(source, args.duration)
+
+        processor = VideoProcessor(verbose=False)
+        print(f"⏱️  Four derivatives, {args.runs} runs each:")
+        separate = time_runs('separate', args.runs, lambda out: run_separate(processor, source, out))
+        graph = time_runs('graph', args.runs, lambda out: run_graph(source, out))
+
+    print(f"\n📊 Single pass is {separate / graph:.2f}x faster ({separate - graph:.2f}s saved per video)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test script for parallel ffmpeg batch processing.
+
+A small script named ffmpeg is put first on PATH. Like ffmpeg it creates
+the output file first, then prints -progress output, sleeps and logs the
+-threads value, so batches run without real ffmpeg or media files.
+"""
+
+import json
+import os
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+# Add the parent directory to ensure imports work correctly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from video_utils.enhanced_video_processor import VideoProcessor
+from video_utils.ffmpeg_runner import BatchJob, FFmpegBatchRunner, run_ffmpeg
+
+FAKE_FFMPEG = """#!{python}
+import sys, time
+args = sys.argv[1:]
+threads = args[args.index('-threads') + 1]
+output = args[args.index('-threads') + 2]
+open(output, 'w').close()
+with open({log!r}, 'a') as f:
+    f.write(threads + '\\n')
+for step in range(1, 5):
+    time.sleep({step_time})
+    print('out_time_us=%d' % (step * 1000000))
+    print('speed=2x')
+    print('progress=%s' % ('end' if step == 4 else 'continue'), flush=True)
+"""
+
+
+def install_fake_ffmpeg(directory: Path, step_time: float = 0.1) -> Path:
+    """Create the fake ffmpeg and put it first on PATH; returns the threads log."""
+    log = directory / "threads.log"
+    ffmpeg = directory / "bin" / "ffmpeg"
+    ffmpeg.parent.mkdir()
+    ffmpeg.write_text(FAKE_FFMPEG.format(python=sys.executable, log=str(log), step_time=step_time))
+    ffmpeg.chmod(ffmpeg.stat().st_mode | stat.S_IEXEC)
+    os.environ['PATH'] = f"{ffmpeg.parent}{os.pathsep}{os.environ['PATH']}"
+    return log
+
+
+def make_videos(directory: Path, count: int) -> Path:
+    input_dir = directory / "input"
+    input_dir.mkdir()
+    for i in range(count):
+        (input_dir / f"clip_{i}.mp4").write_bytes(b"video")
+    return input_dir
+
+
+def test_batch_runs_in_parallel():
+    """Test videos are processed concurrently with a JSON summary."""
+    print("🧪 Testing parallel batch processing...")
+    original_path = os.environ['PATH']
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp = Path(temp_dir)
+            log = install_fake_ffmpeg(temp)
+            input_dir = make_videos(temp, 4)
+            output_dir = temp / "output"
+            progress = []
+
+            processor = VideoProcessor(verbose=False)
+            start = time.time()
+            results = processor.batch_process(
+                input_dir, output_dir, 'resize', max_workers=4, threads_per_job=2,
+                progress_callback=lambda name, percent, stats: progress.append((name, percent)),
+                width=640, height=360)
+            elapsed = time.time() - start
+
+            assert all(results.values()) and len(results) == 4
+            # Four 0.4s jobs in parallel, not 1.6s in series
+            assert elapsed < 1.2, elapsed
+            assert log.read_text().split() == ['2'] * 4
+            assert (output_dir / "clip_0_processed.mp4").exists()
+            assert ('clip_0.mp4', 100.0) in progress
+
+            summary = json.loads((output_dir / "batch_summary.json").read_text())
+            assert summary['operation'] == 'resize'
+            assert summary['succeeded'] == 4 and summary['workers'] == 4
+            assert summary == processor.last_batch_summary
+    finally:
+        os.environ['PATH'] = original_path
+    print("✅ Four videos processed in parallel")
+
+
+def test_cancel_stops_running_and_pending_jobs():
+    """Test cancelling terminates ffmpeg and skips queued jobs."""
+    print("🧪 Testing batch cancellation...")
+    original_path = os.environ['PATH']
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp = Path(temp_dir)
+            install_fake_ffmpeg(temp, step_time=0.5)
+            runner = FFmpegBatchRunner(max_workers=1, verbose=False)
+            runner.progress_callback = lambda name, percent, stats: runner.cancel()
+
+            def make_job(i: int) -> BatchJob:
+                output = temp / f"out_{i}.mp4"
+                cmd = ['ffmpeg', '-i', f"in_{i}.mp4", str(output), '-y']
+                return BatchJob(f"in_{i}.mp4", lambda: run_ffmpeg(cmd, output).returncode == 0,
+                                Path(f"in_{i}.mp4"), output, duration=4.0)
+
+            start = time.time()
+            summary = runner.run([make_job(i) for i in range(3)])
+
+            assert summary['cancelled'] == 3 and summary['succeeded'] == 0
+            assert time.time() - start < 1.5
+            # The terminated job's partial output is removed
+            assert not (temp / "out_0.mp4").exists()
+    finally:
+        os.environ['PATH'] = original_path
+    print("✅ Running job terminated and queued jobs skipped")
+
+
+def test_small_batch_gets_all_cores():
+    """Test threads are shared among the jobs actually running, not the pool size."""
+    print("🧪 Testing thread allocation...")
+    original_path = os.environ['PATH']
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp = Path(temp_dir)
+            log = install_fake_ffmpeg(temp, step_time=0.01)
+            with mock.patch('video_utils.ffmpeg_runner.os.cpu_count', return_value=16):
+                runner = FFmpegBatchRunner(verbose=False)
+
+            def make_job(i: int) -> BatchJob:
+                output = temp / f"out_{i}.mp4"
+                cmd = ['ffmpeg', '-i', f"in_{i}.mp4", str(output), '-y']
+                return BatchJob(f"in_{i}.mp4", lambda: run_ffmpeg(cmd, output).returncode == 0,
+                                Path(f"in_{i}.mp4"), output)
+
+            single = runner.run([make_job(0)])
+            pair = runner.run([make_job(1), make_job(2)])
+
+            assert runner.max_workers == 16
+            assert (single['threads_per_job'], pair['threads_per_job']) == (16, 8)
+            assert log.read_text().split() == ['16', '8', '8']
+    finally:
+        os.environ['PATH'] = original_path
+    print("✅ One- and two-file batches use all 16 cores")
+
+
+def main():
+    """Run all batch runner tests."""
+    test_batch_runs_in_parallel()
+    test_cancel_stops_running_and_pending_jobs()
+    test_small_batch_gets_all_cores()
+    print("\n🎉 All ffmpeg batch runner tests passed!")
+
+
+if __name__ == "__main__":
+    main()
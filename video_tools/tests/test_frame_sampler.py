@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script for frame-sampled OpenRouter video analysis.
+
+A fake ffmpeg writes a stream of small JPEG images to stdout and the
+matching showinfo timings to stderr, so no real ffmpeg is needed. The
+OpenRouter request is captured instead of sent.
+"""
+
+import os
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the parent directory to ensure imports work correctly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from video_utils import openrouter_analyzer
+from video_utils.frame_sampler import build_sample_command, sample_frames, split_jpeg_stream
+
+FAKE_FFMPEG = """#!{python}
+import sys
+times = {times!r}
+for i, t in enumerate(times):
+    sys.stdout.buffer.write(b'\\xff\\xd8frame%d\\xff\\xd9' % i)
+    sys.stderr.write('[Parsed_showinfo_2 @ 0x1] n:%d pts:%d pts_time:%s duration:1\\n' % (i, t * 1000, t))
+"""
+
+
+class FakeFFmpeg:
+    """Puts a fake ffmpeg emitting one JPEG per timestamp first on PATH."""
+
+    def __init__(self, times):
+        self.times = times
+
+    def __enter__(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        ffmpeg = root / "ffmpeg"
+        ffmpeg.write_text(FAKE_FFMPEG.format(python=sys.executable, times=self.times))
+        ffmpeg.chmod(ffmpeg.stat().st_mode | stat.S_IEXEC)
+        self.original_path = os.environ['PATH']
+        os.environ['PATH'] = f"{root}{os.pathsep}{self.original_path}"
+        self.video = root / "clip.mp4"
+        self.video.write_bytes(b"video")
+        return self
+
+    def __exit__(self, *exc):
+        os.environ['PATH'] = self.original_path
+        self.temp_dir.cleanup()
+
+
+def test_command_combines_scene_and_uniform_selection():
+    """Test the single pass selects scene changes plus a uniform fallback, in memory."""
+    print("🧪 Testing sampling command...")
+    cmd = build_sample_command(Path("clip.mp4"), interval=10.0, max_width=512)
+    filters = cmd[cmd.index('-vf') + 1]
+    assert "gt(scene,0.3)*gte(t-prev_selected_t,2.500)" in filters
+    assert "gte(t-prev_selected_t,10.000)" in filters
+    assert "scale='min(512,iw)':-2" in filters
+    assert cmd[-3:] == ['-q:v', '5', 'pipe:1'] and 'image2pipe' in cmd
+    print("✅ One ffmpeg pass writing JPEGs to stdout")
+
+
+def test_frames_are_split_timed_and_budgeted():
+    """Test the JPEG stream is split, timed from showinfo and reduced to the budget."""
+    print("🧪 Testing frame sampling...")
+    assert split_jpeg_stream(b"junk\xff\xd8a\xff\xd9\xff\xd8b\xff\xd9") == [b"\xff\xd8a\xff\xd9", b"\xff\xd8b\xff\xd9"]
+
+    with FakeFFmpeg([0.0, 1.5, 3.0, 4.2, 10.0, 12.5, 20.0, 30.0]) as fake:
+        frames = sample_frames(fake.video, max_frames=4, duration=40.0)
+
+    assert [frame.timestamp for frame in frames] == [0.0, 3.0, 10.0, 20.0]
+    assert frames[1].data == b"\xff\xd8frame2\xff\xd9"
+    assert frames[0].data_url.startswith("data:image/jpeg;base64,")
+    print("✅ 8 candidate frames reduced to an evenly spread 4")
+
+
+def test_describe_video_sends_multi_image_message():
+    """Test describe_video sends timestamped frames instead of a canned answer."""
+    print("🧪 Testing OpenRouter video description...")
+    analyzer = openrouter_analyzer.OpenRouterAnalyzer(api_key="test-key")
+    requests = []
+
+    def capture(content_list, prompt):
+        requests.append((content_list, prompt))
+        return "A short clip."
+
+    analyzer._analyze_with_prompt = capture
+    with FakeFFmpeg([0.0, 65.5]) as fake:
+        result = analyzer.describe_video(fake.video)
+
+    assert result['description'] == "A short clip."
+    assert result['frames_analyzed'] == 2 and result['frame_timestamps'] == [0.0, 65.5]
+    content_list, prompt = requests[0]
+    assert [item['type'] for item in content_list] == ['text', 'image_url', 'text', 'image_url']
+    assert content_list[2]['text'] == "Frame 2 at 01:05.50"
+    assert "2 frames sampled" in prompt
+    print("✅ Frames sent as one multi-image request")
+
+
+def main():
+    """Run all frame sampler tests."""
+    test_command_combines_scene_and_uniform_selection()
+    test_frames_are_split_timed_and_budgeted()
+    test_describe_video_sends_multi_image_message()
+    print("\n🎉 All frame sampler tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test script for splitting combined Gemini analysis responses.
+
+No API key or network is needed; responses are given as JSON strings.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add the parent directory to ensure imports work correctly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from video_utils.gemini_analyzer import COMBINED_FACETS, split_combined_response
+
+
+def test_split_video_response():
+    """Test a combined video response maps onto the per-facet result dicts."""
+    print("🧪 Testing combined video response split...")
+    response = json.dumps({
+        'description': 'A cat on a sofa.',
+        'scenes': '0:00-0:05 cat sleeps',
+        'key_info': 'Topic: cats',
+        'transcription': '[no speech]'
+    })
+
+    results = split_combined_response(response, 'video', 'files/abc')
+
+    assert set(results) == {'description', 'scenes', 'key_info', 'transcription'}
+    assert results['scenes'] == {
+        'file_id': 'files/abc', 'scene_analysis': '0:00-0:05 cat sleeps', 'analysis_type': 'scenes'
+    }
+    assert results['key_info']['analysis_type'] == 'extraction'
+    assert results['transcription']['include_timestamps'] is True
+    assert results['description']['detailed'] is True
+    print("✅ Video facets split into existing result formats")
+
+
+def test_code_fenced_image_response():
+    """Test JSON wrapped in a markdown code fence is still parsed."""
+    print("🧪 Testing fenced image response...")
+    fields = {key: f"{key} text" for key, *_ in COMBINED_FACETS['image']}
+    response = "```json\n" + json.dumps(fields) + "\n```"
+
+    results = split_combined_response(response, 'image', 'files/img')
+
+    assert results['text_extraction']['extracted_text'] == 'text_extraction text'
+    assert results['composition']['analysis_type'] == 'composition'
+    print("✅ Fenced JSON parsed")
+
+
+def test_incomplete_response_raises():
+    """Test missing facets or invalid JSON raise so callers can fall back."""
+    print("🧪 Testing incomplete responses...")
+    for response in ['not json', json.dumps({'description': 'only one facet'})]:
+        try:
+            split_combined_response(response, 'audio', 'files/aud')
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected ValueError for {response!r}")
+    print("✅ Incomplete responses rejected")
+
+
+def main():
+    """Run all combined analysis tests."""
+    test_split_video_response()
+    test_code_fenced_image_response()
+    test_incomplete_response_raises()
+    print("\n🎉 All combined analysis tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test script for the Gemini file upload registry.
+
+Uses fake upload/delete functions, so no API key or network is needed.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the parent directory to ensure imports work correctly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from video_utils import gemini_analyzer
+from video_utils.gemini_file_registry import GeminiFileRegistry
+
+
+class FakeFileAPI:
+    """Records uploads and deletions like genai.upload_file/delete_file."""
+
+    def __init__(self):
+        self.uploaded = []
+        self.deleted = []
+
+    def upload(self, path: Path) -> str:
+        name = f"files/{len(self.uploaded)}"
+        self.uploaded.append(path)
+        return name
+
+    def delete(self, name: str):
+        self.deleted.append(name)
+
+
+def make_file(directory: Path, name: str, content: bytes) -> Path:
+    path = directory / name
+    path.write_bytes(content)
+    return path
+
+
+def test_reuse_same_content():
+    """Test repeated analyses of the same content upload it once."""
+    print("🧪 Testing upload reuse...")
+    api = FakeFileAPI()
+    registry = GeminiFileRegistry(delete_fn=api.delete)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        video = make_file(Path(temp_dir), "clip.mp4", b"video-bytes")
+        copy = make_file(Path(temp_dir), "copy.mp4", b"video-bytes")
+
+        names = [registry.get_or_upload(video, api.upload) for _ in range(4)]
+        names.append(registry.get_or_upload(copy, api.upload))
+
+    assert len(api.uploaded) == 1
+    assert len(set(names)) == 1
+    assert registry.is_managed(names[0])
+    assert registry.get_stats()['hits'] == 4
+    print("✅ Same content uploaded once for five analyses")
+
+
+def test_ttl_expiry_deletes_remote_file():
+    """Test expired uploads are deleted and re-uploaded."""
+    print("🧪 Testing TTL eviction...")
+    api = FakeFileAPI()
+    registry = GeminiFileRegistry(ttl=0.05, delete_fn=api.delete)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        audio = make_file(Path(temp_dir), "track.mp3", b"audio-bytes")
+        first = registry.get_or_upload(audio, api.upload)
+        registry.release(first)
+        time.sleep(0.1)
+        second = registry.get_or_upload(audio, api.upload)
+
+    assert first != second
+    assert api.deleted == [first]
+    print("✅ Expired upload deleted and replaced")
+
+
+def test_capacity_eviction_and_clear():
+    """Test the least recently used upload is evicted past max_entries."""
+    print("🧪 Testing capacity eviction...")
+    api = FakeFileAPI()
+    registry = GeminiFileRegistry(max_entries=2, delete_fn=api.delete)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = [make_file(Path(temp_dir), f"{i}.png", bytes([i])) for i in range(3)]
+        names = []
+        for path in files:
+            names.append(registry.get_or_upload(path, api.upload))
+            registry.release(names[-1])
+
+    assert api.deleted == [names[0]]
+    registry.clear()
+    assert sorted(api.deleted) == sorted(names)
+    assert registry.get_stats()['entries'] == 0
+    print("✅ LRU upload evicted and remaining uploads cleared")
+
+
+def test_in_use_file_deleted_after_last_release():
+    """Test an evicted upload still being analyzed is deleted only when released."""
+    print("🧪 Testing deferred deletion of in-use uploads...")
+    api = FakeFileAPI()
+    registry = GeminiFileRegistry(max_entries=1, delete_fn=api.delete)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        video = make_file(Path(temp_dir), "clip.mp4", b"video-bytes")
+        image = make_file(Path(temp_dir), "frame.png", b"image-bytes")
+        first = registry.get_or_upload(video, api.upload)
+        assert registry.get_or_upload(video, api.upload) == first
+        second = registry.get_or_upload(image, api.upload)
+
+        # Evicted for capacity while two analyses still use it
+        assert api.deleted == []
+        assert registry.release(first) and api.deleted == []
+        assert registry.release(first) and api.deleted == [first]
+        assert registry.release(second)
+        assert not registry.release("files/unmanaged")
+
+        registry.get_or_upload(image, api.upload)
+
+    registry.clear()
+    assert api.deleted == [first]
+    registry.clear(force=True)
+    assert api.deleted == [first, second]
+    print("✅ In-use upload deleted after its last release")
+
+
+def test_failed_analysis_releases_upload():
+    """Test an analysis that raises still releases its upload."""
+    print("🧪 Testing release after a failed analysis...")
+    api = FakeFileAPI()
+    registry = GeminiFileRegistry(max_entries=1, delete_fn=api.delete)
+
+    def fail(contents):
+        raise RuntimeError("quota exceeded")
+
+    # Skip __init__ so no API key or SDK is needed
+    analyzer = object.__new__(gemini_analyzer.GeminiVideoAnalyzer)
+    analyzer.file_registry = registry
+    analyzer.model = SimpleNamespace(generate_content=fail)
+    analyzer.upload_image = api.upload
+    original_genai = getattr(gemini_analyzer, "genai", None)
+    gemini_analyzer.genai = SimpleNamespace(get_file=lambda name: name, delete_file=api.delete)
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image = make_file(Path(temp_dir), "frame.png", b"image-bytes")
+            other = make_file(Path(temp_dir), "other.png", b"other-bytes")
+            for analyze in (analyzer.describe_image, analyzer.classify_image, analyzer.extract_text_from_image):
+                try:
+                    analyze(image)
+                except RuntimeError:
+                    pass
+                else:
+                    raise AssertionError("analysis error was swallowed")
+
+            # Released three times, so evicting it deletes it right away
+            name = registry.get_or_upload(image, api.upload)
+            registry.release(name)
+            registry.get_or_upload(other, api.upload)
+    finally:
+        gemini_analyzer.genai = original_genai
+
+    assert len(api.uploaded) == 2
+    assert api.deleted == [name]
+    print("✅ Upload released although the analysis failed")
+
+
+def main():
+    """Run all registry tests."""
+    test_reuse_same_content()
+    test_ttl_expiry_deletes_remote_file()
+    test_capacity_eviction_and_clear()
+    test_in_use_file_deleted_after_last_release()
+    test_failed_analysis_releases_upload()
+    print("\n🎉 All Gemini file registry tests passed!")
+
+
+if __name__ == "__main__":
+    main()
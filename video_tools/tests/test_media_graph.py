@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for single-pass multi-output ffmpeg graphs.
+
+Checks the compiled ffmpeg command lines, and runs VideoProcessor batches
+against a fake ffmpeg that logs its arguments, so no real ffmpeg is needed.
+"""
+
+import json
+import os
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the parent directory to ensure imports work correctly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from video_utils.enhanced_video_processor import VideoProcessor
+from video_utils.media_graph import MediaGraph
+
+FAKE_FFMPEG = """#!{python}
+import json, sys
+with open({log!r}, 'a') as f:
+    f.write(json.dumps(sys.argv[1:]) + '\\n')
+"""
+
+
+def test_outputs_share_one_decode():
+    """Test full-length outputs are fed from one split of the first input."""
+    print("🧪 Testing graph compilation...")
+    source = Path("input/clip.mp4")
+    cmd = (MediaGraph(source)
+           .resize(Path("out/small.mp4"), 640, 360)
+           .convert(Path("out/h265.mp4"), 'libx265')
+           .frames(Path("out/frames"), "1/5")
+           .build_command())
+
+    assert cmd.count('-i') == 1
+    assert cmd.count('-filter_complex') == 1
+    graph = cmd[cmd.index('-filter_complex') + 1].split(';')
+    assert graph[0] == "[0:v]split=3[v0][v1][v2]"
+    assert "[v0]scale=640:360:force_original_aspect_ratio=decrease[o0]" in graph
+    assert "[v2]fps=1/5[o2]" in graph
+    assert cmd[cmd.index('[v1]') + 3:cmd.index('[v1]') + 5] == ['-c:v', 'libx265']
+    assert cmd[-1] == str(Path("out/frames/clip_frame_%04d.png"))
+    print("✅ Three outputs compiled to one split graph")
+
+
+def test_thumbnails_use_seeked_inputs():
+    """Test thumbnails read an input-seeked copy instead of the shared decode."""
+    print("🧪 Testing thumbnail inputs...")
+    cmd = (MediaGraph(Path("clip.mp4"))
+           .thumbnail(Path("a.jpg"), "00:00:05")
+           .thumbnail(Path("b.jpg"), "00:01:00")
+           .build_command())
+
+    assert '-filter_complex' not in cmd
+    assert cmd[cmd.index('-ss') + 1:cmd.index('-ss') + 4] == ['5.000000', '-i', 'clip.mp4']
+    assert ['-map', '2:v:0', '-frames:v', '1'] == cmd[cmd.index('b.jpg') - 6:cmd.index('b.jpg') - 2]
+    print("✅ Thumbnails seek before decoding")
+
+
+def test_batch_graph_runs_one_ffmpeg_per_video():
+    """Test the 'graph' batch operation renders all outputs per video in one process."""
+    print("🧪 Testing graph batches...")
+    original_path = os.environ['PATH']
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp = Path(temp_dir)
+            log = temp / "ffmpeg.log"
+            ffmpeg = temp / "bin" / "ffmpeg"
+            ffmpeg.parent.mkdir()
+            ffmpeg.write_text(FAKE_FFMPEG.format(python=sys.executable, log=str(log)))
+            ffmpeg.chmod(ffmpeg.stat().st_mode | stat.S_IEXEC)
+            os.environ['PATH'] = f"{ffmpeg.parent}{os.pathsep}{original_path}"
+
+            input_dir = temp / "input"
+            input_dir.mkdir()
+            for name in ("a.mp4", "b.mp4"):
+                (input_dir / name).write_bytes(b"video")
+            outputs = [
+                {'operation': 'thumbnail'},
+                {'operation': 'resize', 'width': 1280, 'height': 720},
+                {'operation': 'resize', 'width': 640, 'height': 360},
+                {'operation': 'convert'}
+            ]
+
+            results = VideoProcessor(verbose=False).batch_process(
+                input_dir, temp / "output", 'graph', outputs=outputs)
+
+            assert results == {'a.mp4': True, 'b.mp4': True}
+            calls = [json.loads(line) for line in log.read_text().splitlines()]
+            assert len(calls) == 2
+            produced = {Path(arg).name for call in calls for arg in call
+                        if arg.startswith(str(temp / "output"))}
+            assert produced == {f"{stem}{name}" for stem in "ab" for name in
+                                ("_thumb.jpg", "_resized.mp4", "_resized2.mp4", "_converted.mp4")}
+    finally:
+        os.environ['PATH'] = original_path
+    print("✅ One ffmpeg process per video")
+
+
+def main():
+    """Run all media graph tests."""
+    test_outputs_share_one_decode()
+    test_thumbnails_use_seeked_inputs()
+    test_batch_graph_runs_one_ffmpeg_per_video()
+    print("\n🎉 All media graph tests passed!")
+
+
+if __name__ == "__main__":
+    main()
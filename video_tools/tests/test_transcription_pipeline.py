@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test script for pipelined batch transcription.
+
+Extraction and transcription are replaced by timed fakes, so neither ffmpeg
+nor Whisper is needed.
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add the parent directory to ensure imports work correctly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from video_utils.transcription_pipeline import TranscriptionPipeline
+from video_utils.whisper_transcriber import WhisperTranscriber
+
+
+class FakeTranscriber:
+    """Takes 0.2s to extract audio and 0.2s to transcribe each file."""
+
+    def __init__(self, temp_dir: Path, use_local: bool = False, on_transcribe=None):
+        self.temp_dir = temp_dir
+        self.use_local = use_local
+        self.client = None if use_local else object()
+        self.on_transcribe = on_transcribe
+        self.extracted = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _extract_audio_from_video(self, video_path: Path) -> Path:
+        time.sleep(0.2)
+        if video_path.stem == "broken":
+            raise RuntimeError("ffmpeg failed")
+        audio_path = self.temp_dir / f"{video_path.stem}_audio.wav"
+        audio_path.write_bytes(b"audio")
+        self.extracted.append(audio_path)
+        return audio_path
+
+    def transcribe_audio_file(self, audio_path: Path, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        if self.on_transcribe:
+            self.on_transcribe(audio_path)
+        time.sleep(0.2)
+        with self.lock:
+            self.active -= 1
+        return {'text': f"text of {audio_path.stem}", 'model': kwargs.get('model_size')}
+
+
+def test_extraction_overlaps_api_transcription():
+    """Test videos are extracted and transcribed concurrently, results in input order."""
+    print("🧪 Testing pipelined API batch...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        transcriber = FakeTranscriber(temp)
+        videos = [temp / f"clip{i}.mp4" for i in range(8)] + [temp / "broken.mp4"]
+        finished = []
+
+        start = time.perf_counter()
+        results = TranscriptionPipeline(
+            transcriber, extract_workers=4, transcribe_workers=4,
+            on_result=lambda index, path, result: finished.append(index)
+        ).run(videos, model_size="turbo")
+        elapsed = time.perf_counter() - start
+
+        assert [r.get('text') for r in results[:8]] == [f"text of clip{i}_audio" for i in range(8)]
+        assert results[8] == {'error': 'ffmpeg failed', 'success': False}
+        assert sorted(finished) == list(range(1, 10))
+        assert transcriber.peak == 4
+        assert not any(path.exists() for path in transcriber.extracted)
+        # Sequential processing would take 9 x 0.2s extraction + 8 x 0.2s transcription
+        assert elapsed < 1.6, elapsed
+    print(f"✅ 9 files in {elapsed:.2f}s, temporary audio removed")
+
+
+def test_local_model_uses_one_worker():
+    """Test a local model is fed by a single transcription worker."""
+    print("🧪 Testing local model batch...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        transcriber = FakeTranscriber(Path(temp_dir), use_local=True)
+        files = [Path(temp_dir) / f"song{i}.mp3" for i in range(3)]
+        pipeline = TranscriptionPipeline(transcriber, transcribe_workers=8)
+        results = pipeline.run(files)
+
+        assert pipeline.transcribe_workers == 1 and transcriber.peak == 1
+        assert transcriber.extracted == []
+        assert [r['text'] for r in results] == [f"text of song{i}" for i in range(3)]
+    print("✅ One local worker, audio files skip extraction")
+
+
+def test_batch_transcribe_writes_incrementally():
+    """Test results and the summary are on disk before the batch finishes."""
+    print("🧪 Testing incremental batch output...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        output_dir = temp / "out"
+        seen_while_running = []
+
+        def check_progress(audio_path):
+            summary_file = output_dir / "batch_transcription_summary.json"
+            if audio_path.stem == "c":
+                summary = json.loads(summary_file.read_text())
+                seen_while_running.append(summary['completed'])
+                assert (output_dir / "a_transcription.json").exists()
+
+        transcriber = WhisperTranscriber(use_local=True)
+        fake = FakeTranscriber(temp, use_local=True, on_transcribe=check_progress)
+        transcriber.transcribe_audio_file = fake.transcribe_audio_file
+        files = [temp / name for name in ("a.wav", "b.wav", "c.wav")]
+
+        results = transcriber.batch_transcribe(files, output_dir=output_dir, extract_workers=1)
+
+        assert seen_while_running == [2]
+        summary = json.loads((output_dir / "batch_transcription_summary.json").read_text())
+        assert (summary['total_files'], summary['completed'], summary['successful']) == (3, 3, 3)
+        assert [r['batch_index'] for r in results] == [1, 2, 3]
+        assert not list(output_dir.glob("*.tmp"))
+    print("✅ Results and summary written as files finish")
+
+
+def main():
+    """Run all transcription pipeline tests."""
+    test_extraction_overlaps_api_transcription()
+    test_local_model_uses_one_worker()
+    test_batch_transcribe_writes_incrementally()
+    print("\n🎉 All transcription pipeline tests passed!")
+
+
+if __name__ == "__main__":
+    main()
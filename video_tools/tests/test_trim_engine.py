@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test script for the keyframe-aware trimming engine.
+
+Fake ffprobe and ffmpeg scripts are put first on PATH: ffprobe describes a
+one-hour video (H.264/AAC unless told otherwise) with a keyframe every 2
+seconds, ffmpeg logs its arguments and creates the output file. Like the
+real WebM muxer, the fake ffmpeg rejects codecs WebM cannot hold.
+"""
+
+import json
+import os
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the parent directory to ensure imports work correctly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from video_utils.trim_engine import cut_media, parse_timestamp, plan_cut
+
+FAKE_FFPROBE = """#!{python}
+import json, sys
+args = sys.argv[1:]
+if 'packet=pts_time,flags' in args:
+    start, end = (float(t) for t in args[args.index('-read_intervals') + 1].split('%'))
+    frame = int(start // 2) * 60
+    while frame / 30 <= end:
+        print('%.6f,%s' % (frame / 30, 'K_' if frame % 60 == 0 else '__'))
+        frame += 1
+else:
+    print(json.dumps({{
+        'streams': [
+            {{'codec_type': 'video', 'codec_name': {video_codec!r}, 'width': 1920, 'height': 1080,
+              'r_frame_rate': '30/1', 'avg_frame_rate': '30/1', 'pix_fmt': 'yuv420p'}},
+            {{'codec_type': 'audio', 'codec_name': {audio_codec!r}, 'sample_rate': '48000', 'channels': 2}}
+        ],
+        'format': {{'duration': '3600.0', 'size': '100', 'bit_rate': '1000'}}
+    }}))
+"""
+
+FAKE_FFMPEG = """#!{python}
+import json, sys
+args = sys.argv[1:]
+with open({log!r}, 'a') as f:
+    f.write(json.dumps(args) + '\\n')
+if args[-2].endswith('.webm') and ({{'libx264', 'aac'}} & set(args) or {missing!r} in args):
+    sys.exit(1)
+open(args[-2], 'w').close()
+"""
+
+
+class FakeTools:
+    """Installs fake ffprobe/ffmpeg on PATH for the duration of a test."""
+
+    def __init__(self, video_codec='h264', audio_codec='aac', suffix='.mp4', missing_encoder=None):
+        self.codecs = {'video_codec': video_codec, 'audio_codec': audio_codec, 'missing': missing_encoder}
+        self.suffix = suffix
+
+    def __enter__(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.log = self.root / "ffmpeg.log"
+        bin_dir = self.root / "bin"
+        bin_dir.mkdir()
+        for name, script in (('ffprobe', FAKE_FFPROBE), ('ffmpeg', FAKE_FFMPEG)):
+            tool = bin_dir / name
+            tool.write_text(script.format(python=sys.executable, log=str(self.log), **self.codecs))
+            tool.chmod(tool.stat().st_mode | stat.S_IEXEC)
+        self.original_path = os.environ['PATH']
+        os.environ['PATH'] = f"{bin_dir}{os.pathsep}{self.original_path}"
+        self.video = self.root / f"source{self.suffix}"
+        self.video.write_bytes(b"video")
+        return self
+
+    def __exit__(self, *exc):
+        os.environ['PATH'] = self.original_path
+        self.temp_dir.cleanup()
+
+    def ffmpeg_calls(self):
+        if not self.log.exists():
+            return []
+        return [json.loads(line) for line in self.log.read_text().splitlines()]
+
+
+def test_aligned_start_is_stream_copied():
+    """Test a cut starting on a keyframe is one input-seeking stream copy."""
+    print("🧪 Testing keyframe-aligned cut...")
+    with FakeTools() as tools:
+        output = tools.root / "cut.mp4"
+        result = cut_media(tools.video, output, "00:30:00", duration=5)
+
+        assert result.success and result.plan.mode == 'copy'
+        calls = tools.ffmpeg_calls()
+        assert len(calls) == 1
+        args = calls[0]
+        assert args.index('-ss') < args.index('-i')
+        assert args[args.index('-ss') + 1] == '1800.000000'
+        assert args[args.index('-t') + 1] == '5.000000'
+        assert args[args.index('-c') + 1] == 'copy'
+    print("✅ Aligned cut stream-copied with input seeking")
+
+
+def test_unaligned_start_reencodes_only_first_gop():
+    """Test an unaligned start re-encodes up to the next keyframe and copies the rest."""
+    print("🧪 Testing smart cut...")
+    with FakeTools() as tools:
+        output = tools.root / "cut.mp4"
+        result = cut_media(tools.video, output, 1801, end=1806)
+
+        assert result.success and result.plan.mode == 'smart'
+        assert result.plan.keyframe == 1802.0
+        head, tail, join = tools.ffmpeg_calls()
+        assert head[head.index('-c:v') + 1] == 'libx264'
+        assert head[head.index('-t') + 1] == '1.000000'
+        assert tail[tail.index('-ss') + 1] == '1802.000000'
+        assert tail[tail.index('-c') + 1] == 'copy'
+        assert join[:2] == ['-f', 'concat'] and join[-2] == str(output)
+    print("✅ Only the partial GOP was re-encoded")
+
+
+def test_snap_and_short_cuts():
+    """Test keyframe snapping and cuts inside a single GOP."""
+    print("🧪 Testing snapping and short cuts...")
+    with FakeTools() as tools:
+        snapped = plan_cut(tools.video, 1801.0, 1806.0, snap_to_keyframes=True)
+        assert (snapped.mode, snapped.start) == ('copy', 1800.0)
+
+        inside_gop = plan_cut(tools.video, 1800.5, 1801.5)
+        assert inside_gop.mode == 'reencode'
+
+        from_start = plan_cut(tools.video, 0.0, 10.0)
+        assert from_start.mode == 'copy'
+    print("✅ Snapping copies from the previous keyframe; sub-GOP cuts re-encode")
+
+
+def test_webm_source_reencodes_with_webm_encoders():
+    """Test an unaligned VP9/Opus WebM cut re-encodes with encoders WebM accepts."""
+    print("🧪 Testing WebM re-encode...")
+    with FakeTools(video_codec='vp9', audio_codec='opus', suffix='.webm') as tools:
+        output = tools.root / "cut.webm"
+        result = cut_media(tools.video, output, 1801, duration=5)
+
+        assert result.success and result.plan.mode == 'reencode'
+        (args,) = tools.ffmpeg_calls()
+        assert args[args.index('-c:v') + 1] == 'libvpx-vp9'
+        assert args[args.index('-c:a') + 1] == 'libopus'
+
+        # VP9 into MP4 does not fit the container and is re-encoded
+        mp4_plan = plan_cut(tools.video, 1801.0, 1806.0, output_path=tools.root / "cut.mp4")
+        assert mp4_plan.mode == 'reencode'
+    print("✅ WebM cut re-encoded as VP9/Opus")
+
+
+def test_missing_encoder_falls_back_to_keyframe_copy():
+    """Test a failed re-encode falls back to copying from the previous keyframe."""
+    print("🧪 Testing missing encoder fallback...")
+    with FakeTools(video_codec='vp9', audio_codec='opus', suffix='.webm',
+                   missing_encoder='libvpx-vp9') as tools:
+        output = tools.root / "cut.webm"
+        result = cut_media(tools.video, output, 1801, duration=5)
+
+        assert result.success and result.plan.mode == 'copy' and result.plan.start == 1800.0
+        reencode, copy = tools.ffmpeg_calls()
+        assert copy[copy.index('-c') + 1] == 'copy'
+    print("✅ Fell back to a keyframe-aligned stream copy")
+
+
+def test_parse_timestamp():
+    """Test timestamp parsing."""
+    assert parse_timestamp("01:02:03.5") == 3723.5
+    assert parse_timestamp("02:30") == 150.0
+    assert parse_timestamp(7) == 7.0
+
+
+def main():
+    """Run all trim engine tests."""
+    test_aligned_start_is_stream_copied()
+    test_unaligned_start_reencodes_only_first_gop()
+    test_snap_and_short_cuts()
+    test_webm_source_reencodes_with_webm_encoders()
+    test_missing_encoder_falls_back_to_keyframe_copy()
+    test_parse_timestamp()
+    print("\n🎉 All trim engine tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test script for chunked Whisper API transcription of long audio.
+
+A fake ffmpeg reports a one-hour file with a short silence every minute and
+writes each chunk's time range into the chunk file. A fake OpenAI client
+reads the range back and returns one segment for every 10 seconds of the
+source timeline.
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add the parent directory to ensure imports work correctly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from video_utils.whisper_chunking import plan_chunks, render_segments, transcribe_chunked
+
+FAKE_FFMPEG = """#!{python}
+import sys
+args = sys.argv[1:]
+if any(arg.startswith('silencedetect') for arg in args):
+    sys.stderr.write('  Duration: 01:00:00.00, start: 0.000000, bitrate: 256 kb/s\\n')
+    for minute in range(1, 60):
+        sys.stderr.write('[silencedetect @ 0x1] silence_start: %d.2\\n' % (minute * 60 - 1))
+        sys.stderr.write('[silencedetect @ 0x1] silence_end: %d.8 | silence_duration: 0.6\\n' % (minute * 60 - 1))
+else:
+    start, duration = float(args[args.index('-ss') + 1]), float(args[args.index('-t') + 1])
+    with open(args[-1], 'w') as f:
+        f.write('%f,%f' % (start, duration))
+"""
+
+
+class FakeTranscriptions:
+    """Returns a segment for each 10 seconds of source audio inside the chunk."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def create(self, file, **kwargs):
+        assert kwargs['response_format'] == 'verbose_json'
+        start, duration = (float(v) for v in file.read().decode().split(','))
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.1)
+        with self.lock:
+            self.active -= 1
+
+        segments = []
+        t = int(start // 10) * 10
+        while t + 10 <= start + duration + 1e-6:
+            if t >= start - 1e-6:
+                segments.append({'start': t - start, 'end': t + 10 - start, 'text': f" s{t} "})
+            t += 10
+        return {'text': '', 'language': 'english', 'segments': segments}
+
+
+class FakeClient:
+    def __init__(self):
+        self.audio = type('Audio', (), {})()
+        self.audio.transcriptions = FakeTranscriptions()
+
+
+def test_plan_cuts_at_silences():
+    """Test chunks end in silences and fall back to hard cuts with overlap."""
+    print("🧪 Testing chunk planning...")
+    silences = [(m * 60 - 1.2, m * 60 - 0.2) for m in range(1, 60)]
+    chunks = plan_chunks(3600.0, silences, max_chunk_seconds=600, overlap=2)
+
+    assert all(chunk.end - chunk.start <= 600 for chunk in chunks)
+    assert [c.own_end for c in chunks[:-1]] == [c.own_start for c in chunks[1:]]
+    assert chunks[0].own_end == 539.3 and chunks[-1].own_end == 3600.0
+    assert chunks[1].start == chunks[0].own_end - 2
+
+    hard = plan_chunks(1000.0, [], max_chunk_seconds=300, overlap=5)
+    assert [c.own_start for c in hard] == [0.0, 290.0, 580.0, 870.0]
+    print("✅ Chunks cut at silences, hard cuts when there are none")
+
+
+def test_hour_transcribed_concurrently_without_duplicates():
+    """Test an hour of audio is chunked, transcribed in parallel and stitched in order."""
+    print("🧪 Testing chunked transcription...")
+    original_path = os.environ['PATH']
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp = Path(temp_dir)
+            ffmpeg = temp / "bin" / "ffmpeg"
+            ffmpeg.parent.mkdir()
+            ffmpeg.write_text(FAKE_FFMPEG.format(python=sys.executable))
+            ffmpeg.chmod(ffmpeg.stat().st_mode | stat.S_IEXEC)
+            os.environ['PATH'] = f"{ffmpeg.parent}{os.pathsep}{original_path}"
+            audio = temp / "lecture.wav"
+            audio.write_bytes(b"audio")
+
+            client = FakeClient()
+            result = transcribe_chunked(client, audio, max_chunk_seconds=600, overlap=2, max_workers=4)
+    finally:
+        os.environ['PATH'] = original_path
+
+    assert result['chunks'] == 7 and result['duration'] == 3600.0
+    assert client.audio.transcriptions.peak == 4
+    starts = [segment['start'] for segment in result['segments']]
+    assert starts == [float(t) for t in range(0, 3600, 10)]
+    assert result['text'].startswith("s0 s10 s20") and result['text'].endswith("s3590")
+    assert result['language'] == 'english'
+    print(f"✅ {len(starts)} segments stitched from {result['chunks']} parallel chunks")
+
+
+def test_rendered_formats():
+    """Test text, SRT and WebVTT output is rendered from stitched segments."""
+    print("🧪 Testing rendered response formats...")
+    segments = [{'start': 0.0, 'end': 9.9996, 'text': "Hello."},
+                {'start': 3725.25, 'end': 3730.5, 'text': "Bye."}]
+
+    assert render_segments(segments, 'text') == "Hello. Bye.\n"
+    assert render_segments(segments, 'srt') == (
+        "1\n00:00:00,000 --> 00:00:10,000\nHello.\n\n"
+        "2\n01:02:05,250 --> 01:02:10,500\nBye.\n"
+    )
+    assert render_segments(segments, 'vtt') == (
+        "WEBVTT\n\n00:00:00.000 --> 00:00:10.000\nHello.\n\n"
+        "01:02:05.250 --> 01:02:10.500\nBye.\n"
+    )
+
+    # Rejected before any audio is processed
+    client = FakeClient()
+    try:
+        transcribe_chunked(client, Path("missing.wav"), response_format="tsv")
+    except ValueError as e:
+        assert "tsv" in str(e)
+    else:
+        raise AssertionError("unsupported format was accepted")
+    print("✅ Text, SRT and WebVTT rendered; unknown formats rejected")
+
+
+def main():
+    """Run all chunked transcription tests."""
+    test_plan_cuts_at_silences()
+    test_hour_transcribed_concurrently_without_duplicates()
+    test_rendered_formats()
+    print("\n🎉 All chunked transcription tests passed!")
+
+
+if __name__ == "__main__":
+    main()
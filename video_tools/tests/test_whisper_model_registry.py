@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared local Whisper model registry.
+
+Models come from a fake loader, so neither whisper nor torch is needed.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add the parent directory to ensure imports work correctly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from video_utils import whisper_models, whisper_transcriber
+from video_utils.whisper_models import WhisperModelRegistry
+
+
+class FakeParameter:
+    def __init__(self, mb):
+        self.mb = mb
+
+    def numel(self):
+        return self.mb * 1024 * 1024
+
+    def element_size(self):
+        return 1
+
+
+class FakeModel:
+    """Stands in for a whisper model: fixed parameter size and canned transcript."""
+
+    SIZES_MB = {'tiny': 75, 'base': 140, 'turbo': 1600}
+
+    def __init__(self, model_size, device):
+        self.name = f"{model_size}@{device}"
+        self.size_mb = self.SIZES_MB.get(model_size, 10)
+
+    def parameters(self):
+        return [FakeParameter(self.size_mb)]
+
+    def transcribe(self, audio_path, **options):
+        return {'text': f"transcribed by {self.name}", 'language': 'en', 'segments': []}
+
+
+class CountingLoader:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+
+    def __call__(self, model_size, device):
+        self.calls.append((model_size, device))
+        time.sleep(self.delay)
+        return FakeModel(model_size, device)
+
+
+def test_models_load_once_per_size_and_device():
+    """Test repeated and concurrent requests share one load."""
+    print("🧪 Testing model reuse...")
+    loader = CountingLoader(delay=0.2)
+    registry = WhisperModelRegistry(max_models=4, loader=loader)
+
+    threads = [threading.Thread(target=registry.get, args=("base", "cpu")) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    model, load_time = registry.get("base", "cpu")
+    registry.get("base", "cuda")
+
+    assert loader.calls == [("base", "cpu"), ("base", "cuda")]
+    assert model.name == "base@cpu" and load_time == 0.0
+    stats = registry.get_stats()
+    assert (stats['loads'], stats['hits']) == (2, 4)
+    print("✅ Five requests, one load per device")
+
+
+def test_lru_eviction_by_count_and_memory():
+    """Test least recently used models are evicted over the limits."""
+    print("🧪 Testing LRU eviction...")
+    registry = WhisperModelRegistry(max_models=2, loader=CountingLoader())
+    registry.get("tiny", "cpu")
+    registry.get("base", "cpu")
+    registry.get("tiny", "cpu")
+    registry.get("turbo", "cpu")
+    assert registry.get_stats()['models'] == ["tiny@cpu", "turbo@cpu"]
+
+    registry = WhisperModelRegistry(max_models=3, max_memory_mb=1700, loader=CountingLoader())
+    registry.get("tiny", "cpu")
+    registry.get("base", "cpu")
+    registry.get("turbo", "cpu")
+    stats = registry.get_stats()
+    assert stats['models'] == ["turbo@cpu"] and stats['evictions'] == 2
+    assert stats['memory_mb'] == 1600
+
+    # A model bigger than the budget is still served
+    registry = WhisperModelRegistry(max_memory_mb=100, loader=CountingLoader())
+    assert registry.get("turbo", "cpu")[0].name == "turbo@cpu"
+    print("✅ Evicted least recently used models")
+
+
+def test_transcribers_share_registry():
+    """Test separate transcribers reuse one model and report load/inference time."""
+    print("🧪 Testing transcribers on the shared registry...")
+    loader = CountingLoader(delay=0.05)
+    original = (whisper_models._registry, whisper_transcriber.WHISPER_LOCAL_AVAILABLE)
+    whisper_models._registry = WhisperModelRegistry(loader=loader)
+    whisper_transcriber.WHISPER_LOCAL_AVAILABLE = True
+    try:
+        audio = Path(__file__)
+        first = whisper_transcriber.WhisperTranscriber(use_local=True, device="cpu")
+        second = whisper_transcriber.WhisperTranscriber(use_local=True, device="cpu")
+        result_a = first.transcribe_audio_file(audio, model_size="turbo")
+        result_b = second.transcribe_audio_file(audio, model_size="turbo")
+        result_c = second.transcribe_audio_file(audio, model_size="base")
+    finally:
+        whisper_models._registry, whisper_transcriber.WHISPER_LOCAL_AVAILABLE = original
+
+    assert loader.calls == [("turbo", "cpu"), ("base", "cpu")]
+    assert result_a['text'] == "transcribed by turbo@cpu"
+    assert result_b['load_time'] == 0.0 and result_c['load_time'] > 0
+    assert result_c['model'] == 'base' and 'inference_time' in result_c
+    print("✅ One turbo load across transcribers, timings reported")
+
+
+def main():
+    """Run all model registry tests."""
+    test_models_load_once_per_size_and_device()
+    test_lru_eviction_by_count_and_memory()
+    test_transcribers_share_registry()
+    print("\n🎉 All Whisper model registry tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,8 +18,17 @@ NEW CLASS-BASED ARCHITECTURE:
 - Unified command dispatcher for all operations
 """
 
+import sys
+from pathlib import Path
+
+# Shared services (ffprobe cache, HTTP clients) live in the repository-level
+# fal_common package; make it importable once for every submodule
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
 # Legacy function-based imports (for backward compatibility)
-from .core import check_ffmpeg, check_ffprobe, get_video_info
+from .core import check_ffmpeg, check_ffprobe, get_video_info, probe_media
 from .file_utils import find_video_files, find_audio_files, find_image_files
 from .video_processor import cut_video_duration
 from .audio_processor import (
@@ -40,6 +49,7 @@ from .interactive import interactive_audio_selection, interactive_multiple_audio
 # Enhanced class-based imports
 from .enhanced_video_processor import VideoProcessor
 from .enhanced_audio_processor import AudioProcessor
+from .media_graph import MediaGraph
 from .base_controller import BaseController
 from .media_processing_controller import MediaProcessingController
 from .command_dispatcher import CommandDispatcher
@@ -47,6 +57,7 @@ from .command_dispatcher import CommandDispatcher
 # AI analysis imports (split from large video_understanding.py)
 from .gemini_analyzer import GeminiVideoAnalyzer, check_gemini_requirements
 from .whisper_transcriber import WhisperTranscriber, check_whisper_requirements
+from .whisper_models import WhisperModelRegistry, get_model_registry
 from .ai_utils import (
     analyze_video_file,
     analyze_audio_file, 
@@ -61,7 +72,7 @@ from .ai_utils import (
 
 __all__ = [
     # Legacy function-based utilities (for backward compatibility)
-    'check_ffmpeg', 'check_ffprobe', 'get_video_info',
+    'check_ffmpeg', 'check_ffprobe', 'get_video_info', 'probe_media',
     'find_video_files', 'find_audio_files', 'find_image_files',
     'cut_video_duration',
     'add_audio_to_video', 'extract_audio_from_video', 
@@ -71,11 +82,11 @@ __all__ = [
     'interactive_audio_selection', 'interactive_multiple_audio_selection',
     
     # Enhanced class-based architecture
-    'VideoProcessor', 'AudioProcessor',
+    'VideoProcessor', 'AudioProcessor', 'MediaGraph',
     'BaseController', 'MediaProcessingController', 'CommandDispatcher',
     
     # AI analysis classes and functions
-    'GeminiVideoAnalyzer', 'WhisperTranscriber',
+    'GeminiVideoAnalyzer', 'WhisperTranscriber', 'WhisperModelRegistry', 'get_model_registry',
     'check_gemini_requirements', 'check_whisper_requirements',
     'analyze_video_file', 'analyze_audio_file', 'analyze_image_file',
     'save_analysis_result', 'transcribe_with_whisper', 'batch_transcribe_whisper',
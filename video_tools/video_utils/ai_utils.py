@@ -236,7 +236,8 @@ def transcribe_with_whisper(file_path: Path, use_local: bool = False, model_size
 
 
 def batch_transcribe_whisper(file_paths: List[Path], use_local: bool = False, model_size: str = "turbo",
-                            language: Optional[str] = None, save_results: bool = True) -> List[Dict[str, Any]]:
+                            language: Optional[str] = None, save_results: bool = True,
+                            max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
     """Convenience function to batch transcribe files using Whisper.
     
     Args:
@@ -245,6 +246,7 @@ def batch_transcribe_whisper(file_paths: List[Path], use_local: bool = False, mo
         model_size: Whisper model size
         language: Language code
         save_results: Whether to save results to files
+        max_workers: Concurrent API transcriptions (local models always use one)
         
     Returns:
         List of transcription results
@@ -255,6 +257,7 @@ def batch_transcribe_whisper(file_paths: List[Path], use_local: bool = False, mo
         return transcriber.batch_transcribe(
             file_paths,
             save_results=save_results,
+            max_workers=max_workers,
             model_size=model_size,
             language=language,
             include_timestamps=True
@@ -265,14 +268,34 @@ def batch_transcribe_whisper(file_paths: List[Path], use_local: bool = False, mo
         return []
 
 
+def analyze_media_combined(file_path: Path, media_type: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Run all Gemini facets of a comprehensive analysis in one request.
+    
+    Args:
+        file_path: Path to media file
+        media_type: 'video', 'audio' or 'image'
+        
+    Returns:
+        Dictionary of facet results, or None if the combined request or its parsing failed
+    """
+    try:
+        analyzer = GeminiVideoAnalyzer()
+        return analyzer.analyze_combined(file_path, media_type)
+    except Exception as e:
+        print(f"⚠️ Combined analysis failed ({e}); falling back to one request per facet")
+        return None
+
+
 def analyze_media_comprehensively(file_path: Path, output_dir: Optional[Path] = None,
-                                save_results: bool = True) -> Dict[str, Any]:
+                                save_results: bool = True, combined: bool = True) -> Dict[str, Any]:
     """Perform comprehensive analysis of a media file using multiple methods.
     
     Args:
         file_path: Path to media file (video, audio, or image)
         output_dir: Directory to save results
         save_results: Whether to save results to files
+        combined: Ask Gemini for all facets in one structured request (falls back
+            to one request per facet if the response cannot be parsed)
         
     Returns:
         Dictionary containing all analysis results
@@ -304,25 +327,29 @@ def analyze_media_comprehensively(file_path: Path, output_dir: Optional[Path] =
         try:
             print("🎬 Performing comprehensive video analysis...")
             
-            # Description
-            desc_result = analyze_video_file(file_path, "description", detailed=True)
-            if desc_result:
-                results['gemini_analysis']['description'] = desc_result
-            
-            # Scene analysis
-            scene_result = analyze_video_file(file_path, "scenes")
-            if scene_result:
-                results['gemini_analysis']['scenes'] = scene_result
-            
-            # Key information extraction
-            key_result = analyze_video_file(file_path, "extraction")
-            if key_result:
-                results['gemini_analysis']['key_info'] = key_result
-            
-            # Gemini transcription
-            transcribe_result = analyze_video_file(file_path, "transcription")
-            if transcribe_result:
-                results['gemini_analysis']['transcription'] = transcribe_result
+            combined_results = analyze_media_combined(file_path, 'video') if combined else None
+            if combined_results:
+                results['gemini_analysis'].update(combined_results)
+            else:
+                # Description
+                desc_result = analyze_video_file(file_path, "description", detailed=True)
+                if desc_result:
+                    results['gemini_analysis']['description'] = desc_result
+                
+                # Scene analysis
+                scene_result = analyze_video_file(file_path, "scenes")
+                if scene_result:
+                    results['gemini_analysis']['scenes'] = scene_result
+                
+                # Key information extraction
+                key_result = analyze_video_file(file_path, "extraction")
+                if key_result:
+                    results['gemini_analysis']['key_info'] = key_result
+                
+                # Gemini transcription
+                transcribe_result = analyze_video_file(file_path, "transcription")
+                if transcribe_result:
+                    results['gemini_analysis']['transcription'] = transcribe_result
             
         except Exception as e:
             results['errors'].append(f"Gemini video analysis error: {e}")
@@ -343,25 +370,29 @@ def analyze_media_comprehensively(file_path: Path, output_dir: Optional[Path] =
         try:
             print("🎵 Performing comprehensive audio analysis...")
             
-            # Description
-            desc_result = analyze_audio_file(file_path, "description", detailed=True)
-            if desc_result:
-                results['gemini_analysis']['description'] = desc_result
-            
-            # Content analysis
-            content_result = analyze_audio_file(file_path, "content_analysis")
-            if content_result:
-                results['gemini_analysis']['content_analysis'] = content_result
-            
-            # Event detection
-            event_result = analyze_audio_file(file_path, "event_detection")
-            if event_result:
-                results['gemini_analysis']['event_detection'] = event_result
-            
-            # Gemini transcription
-            transcribe_result = analyze_audio_file(file_path, "transcription")
-            if transcribe_result:
-                results['gemini_analysis']['transcription'] = transcribe_result
+            combined_results = analyze_media_combined(file_path, 'audio') if combined else None
+            if combined_results:
+                results['gemini_analysis'].update(combined_results)
+            else:
+                # Description
+                desc_result = analyze_audio_file(file_path, "description", detailed=True)
+                if desc_result:
+                    results['gemini_analysis']['description'] = desc_result
+                
+                # Content analysis
+                content_result = analyze_audio_file(file_path, "content_analysis")
+                if content_result:
+                    results['gemini_analysis']['content_analysis'] = content_result
+                
+                # Event detection
+                event_result = analyze_audio_file(file_path, "event_detection")
+                if event_result:
+                    results['gemini_analysis']['event_detection'] = event_result
+                
+                # Gemini transcription
+                transcribe_result = analyze_audio_file(file_path, "transcription")
+                if transcribe_result:
+                    results['gemini_analysis']['transcription'] = transcribe_result
             
         except Exception as e:
             results['errors'].append(f"Gemini audio analysis error: {e}")
@@ -382,30 +413,34 @@ def analyze_media_comprehensively(file_path: Path, output_dir: Optional[Path] =
         try:
             print("🖼️ Performing comprehensive image analysis...")
             
-            # Description
-            desc_result = analyze_image_file(file_path, "description", detailed=True)
-            if desc_result:
-                results['gemini_analysis']['description'] = desc_result
-            
-            # Classification
-            class_result = analyze_image_file(file_path, "classification")
-            if class_result:
-                results['gemini_analysis']['classification'] = class_result
-            
-            # Object detection
-            obj_result = analyze_image_file(file_path, "object_detection", detailed=True)
-            if obj_result:
-                results['gemini_analysis']['object_detection'] = obj_result
-            
-            # Text extraction (OCR)
-            text_result = analyze_image_file(file_path, "text_extraction")
-            if text_result:
-                results['gemini_analysis']['text_extraction'] = text_result
-            
-            # Composition analysis
-            comp_result = analyze_image_file(file_path, "composition")
-            if comp_result:
-                results['gemini_analysis']['composition'] = comp_result
+            combined_results = analyze_media_combined(file_path, 'image') if combined else None
+            if combined_results:
+                results['gemini_analysis'].update(combined_results)
+            else:
+                # Description
+                desc_result = analyze_image_file(file_path, "description", detailed=True)
+                if desc_result:
+                    results['gemini_analysis']['description'] = desc_result
+                
+                # Classification
+                class_result = analyze_image_file(file_path, "classification")
+                if class_result:
+                    results['gemini_analysis']['classification'] = class_result
+                
+                # Object detection
+                obj_result = analyze_image_file(file_path, "object_detection", detailed=True)
+                if obj_result:
+                    results['gemini_analysis']['object_detection'] = obj_result
+                
+                # Text extraction (OCR)
+                text_result = analyze_image_file(file_path, "text_extraction")
+                if text_result:
+                    results['gemini_analysis']['text_extraction'] = text_result
+                
+                # Composition analysis
+                comp_result = analyze_image_file(file_path, "composition")
+                if comp_result:
+                    results['gemini_analysis']['composition'] = comp_result
             
         except Exception as e:
             results['errors'].append(f"Gemini image analysis error: {e}")
@@ -7,6 +7,8 @@ Provides basic functionality like ffmpeg checks and video information extraction
 import subprocess
 from pathlib import Path
 
+from fal_common.media_probe import ProbeError, probe_media
+
 
 def check_ffmpeg() -> bool:
     """Check if ffmpeg is available."""
@@ -29,28 +31,14 @@ def check_ffprobe() -> bool:
 
 
 def get_video_info(video_path: Path) -> dict:
-    """Get video information using ffprobe."""
+    """Get video information using the cached ffprobe service."""
     try:
-        # Get general info
-        cmd = [
-            'ffprobe', '-v', 'error', '-show_entries', 
-            'format=duration', '-of', 'csv=p=0', str(video_path)
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        duration = float(result.stdout.strip())
-        
-        # Check for audio stream
-        cmd_audio = [
-            'ffprobe', '-v', 'error', '-select_streams', 'a:0',
-            '-show_entries', 'stream=codec_name', '-of', 'csv=p=0', str(video_path)
-        ]
-        result_audio = subprocess.run(cmd_audio, capture_output=True, text=True)
-        has_audio = bool(result_audio.stdout.strip())
-        
-        return {
-            'duration': duration,
-            'has_audio': has_audio,
-            'audio_codec': result_audio.stdout.strip() if has_audio else None
-        }
-    except (subprocess.CalledProcessError, ValueError):
-        return {'duration': None, 'has_audio': False, 'audio_codec': None}
\ No newline at end of file
+        info = probe_media(video_path)
+    except ProbeError:
+        return {'duration': None, 'has_audio': False, 'audio_codec': None}
+    
+    return {
+        'duration': info.duration,
+        'has_audio': info.has_audio,
+        'audio_codec': info.audio.codec if info.has_audio else None
+    }
\ No newline at end of file
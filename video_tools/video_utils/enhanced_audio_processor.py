@@ -10,11 +10,19 @@ Provides a comprehensive class-based approach for audio operations including:
 """
 
 import subprocess
+from functools import partial
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import json
 import tempfile
 
+from fal_common.media_probe import ProbeError, probe_media
+
+from .ffmpeg_runner import (
+    BatchJob, FFmpegBatchRunner, ProgressCallback, media_duration, run_ffmpeg, write_summary
+)
+from .trim_engine import cut_media
+
 
 class AudioProcessor:
     """Enhanced audio processor with comprehensive audio manipulation capabilities."""
@@ -26,6 +34,7 @@ class AudioProcessor:
             verbose: Whether to print operation details
         """
         self.verbose = verbose
+        self.last_batch_summary: Optional[Dict[str, Any]] = None
         
     def check_dependencies(self) -> Dict[str, bool]:
         """Check if required audio processing tools are available.
@@ -55,43 +64,25 @@ class AudioProcessor:
             Dictionary with audio information
         """
         try:
-            # Get format info
-            cmd = [
-                'ffprobe', '-v', 'error', '-show_entries',
-                'format=duration,size,bit_rate', '-of', 'csv=p=0', str(audio_path)
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            format_info = result.stdout.strip().split(',')
-            
-            duration = float(format_info[0]) if format_info[0] else None
-            size = int(format_info[1]) if format_info[1] else None
-            bit_rate = int(format_info[2]) if format_info[2] else None
-            
-            # Get stream info
-            cmd_stream = [
-                'ffprobe', '-v', 'error', '-select_streams', 'a:0',
-                '-show_entries', 'stream=codec_name,sample_rate,channels,bit_rate',
-                '-of', 'csv=p=0', str(audio_path)
-            ]
-            result_stream = subprocess.run(cmd_stream, capture_output=True, text=True)
-            stream_info = result_stream.stdout.strip().split(',') if result_stream.stdout.strip() else []
-            
-            return {
-                'duration': duration,
-                'file_size': size,
-                'format_bit_rate': bit_rate,
-                'codec': stream_info[0] if len(stream_info) > 0 else None,
-                'sample_rate': int(stream_info[1]) if len(stream_info) > 1 and stream_info[1] else None,
-                'channels': int(stream_info[2]) if len(stream_info) > 2 and stream_info[2] else None,
-                'stream_bit_rate': int(stream_info[3]) if len(stream_info) > 3 and stream_info[3] else None,
-            }
-        except (subprocess.CalledProcessError, ValueError, IndexError) as e:
+            info = probe_media(audio_path)
+        except ProbeError as e:
             if self.verbose:
                 print(f"❌ Error getting audio info for {audio_path.name}: {e}")
             return {
                 'duration': None, 'file_size': None, 'format_bit_rate': None,
                 'codec': None, 'sample_rate': None, 'channels': None, 'stream_bit_rate': None
             }
+        
+        audio = info.audio
+        return {
+            'duration': info.duration,
+            'file_size': info.file_size,
+            'format_bit_rate': info.bit_rate,
+            'codec': audio.codec if audio else None,
+            'sample_rate': audio.sample_rate if audio else None,
+            'channels': audio.channels if audio else None,
+            'stream_bit_rate': audio.bit_rate if audio else None,
+        }
     
     def extract_from_video(self, video_path: Path, output_path: Path, 
                           audio_format: str = 'mp3', quality: str = '192k') -> bool:
@@ -119,7 +110,7 @@ class AudioProcessor:
             if self.verbose:
                 print(f"🎵 Extracting audio: {video_path.name} → {output_path.name}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, output_path)
             
             if result.returncode == 0:
                 if self.verbose:
@@ -183,7 +174,7 @@ class AudioProcessor:
             if self.verbose:
                 print(f"🎵 {action} audio: {audio_path.name} → {video_path.name}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, output_path)
             
             if result.returncode == 0:
                 if self.verbose:
@@ -261,7 +252,7 @@ class AudioProcessor:
                 for audio in audio_files:
                     print(f"   - {audio.name}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, output_path)
             
             if result.returncode == 0:
                 if self.verbose:
@@ -336,7 +327,7 @@ class AudioProcessor:
                 for i, audio in enumerate(audio_files, 1):
                     print(f"   {i}. {audio.name}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, output_path)
             
             if result.returncode == 0:
                 if self.verbose:
@@ -385,7 +376,7 @@ class AudioProcessor:
         if self.verbose:
             print(f"🎵 Concatenating {len(audio_files)} files with {crossfade_duration}s crossfade...")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = run_ffmpeg(cmd, output_path)
         
         if result.returncode == 0:
             if self.verbose:
@@ -428,7 +419,7 @@ class AudioProcessor:
                 print(f"🎵 Converting: {input_path.name}")
                 print(f"🔄 Target format: {target_format} @ {quality}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, output_path)
             
             if result.returncode == 0:
                 if self.verbose:
@@ -477,7 +468,7 @@ class AudioProcessor:
                 print(f"🎵 Adjusting volume: {input_path.name}")
                 print(f"🔊 Volume factor: {volume_factor}, Normalize: {normalize}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, output_path)
             
             if result.returncode == 0:
                 if self.verbose:
@@ -499,6 +490,9 @@ class AudioProcessor:
                   end_time: Optional[str] = None) -> bool:
         """Trim audio file to specified time range.
         
+        Seeks on the input side and stream-copies when the output has the
+        input's file type; otherwise the segment is encoded to MP3.
+        
         Args:
             input_path: Input audio file path
             output_path: Output audio file path
@@ -510,32 +504,17 @@ class AudioProcessor:
             True if successful, False otherwise
         """
         try:
-            cmd = [
-                'ffmpeg', '-i', str(input_path),
-                '-ss', start_time
-            ]
-            
-            if duration:
-                cmd.extend(['-t', duration])
-            elif end_time:
-                cmd.extend(['-to', end_time])
-            
-            cmd.extend([
-                '-c:a', 'mp3',
-                '-ab', '192k',
-                str(output_path),
-                '-y'
-            ])
-            
             if self.verbose:
                 print(f"🎵 Trimming audio: {input_path.name}")
                 print(f"⏱️  From {start_time} for {duration or 'to ' + end_time}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = cut_media(input_path, output_path, start_time,
+                               end=end_time or None, duration=duration or None,
+                               reencode_args=['-c:a', 'mp3', '-ab', '192k'])
             
-            if result.returncode == 0:
+            if result.success:
                 if self.verbose:
-                    print(f"✅ Success: {output_path.name}")
+                    print(f"✅ Success: {output_path.name} ({result.plan.mode})")
                 return True
             else:
                 if self.verbose:
@@ -564,13 +543,25 @@ class AudioProcessor:
         return info.get('duration', 0) > 0 and info.get('codec') is not None
     
     def batch_process(self, input_dir: Path, output_dir: Path, 
-                     operation: str, **kwargs) -> Dict[str, bool]:
+                     operation: str, max_workers: Optional[int] = None,
+                     threads_per_job: Optional[int] = None,
+                     progress_callback: Optional[ProgressCallback] = None,
+                     summary_path: Optional[Path] = None, **kwargs) -> Dict[str, bool]:
         """Process multiple audio files with the same operation.
         
+        Files are processed in parallel, one ffmpeg process per file on a pool
+        sized to the CPU cores. Ctrl+C cancels the remaining files. A JSON
+        summary of the batch is written to summary_path and kept in
+        self.last_batch_summary.
+        
         Args:
             input_dir: Directory containing input audio files
             output_dir: Directory for output audio files
-            operation: Operation to perform
+            operation: Operation to perform ('convert', 'volume' or 'trim')
+            max_workers: Concurrent ffmpeg processes (default: CPU cores)
+            threads_per_job: ffmpeg threads per file (default: cores / files running at once)
+            progress_callback: Called as callback(filename, percent, stats) while ffmpeg runs
+            summary_path: JSON summary file (default: output_dir/batch_summary.json)
             **kwargs: Arguments for the operation
             
         Returns:
@@ -590,36 +581,52 @@ class AudioProcessor:
                 print(f"❌ No audio files found in {input_dir}")
             return results
         
-        output_dir.mkdir(parents=True, exist_ok=True)
+        operations = {
+            'convert': self.convert_format,
+            'volume': self.adjust_volume,
+            'trim': self.trim_audio
+        }
+        if operation not in operations:
+            if self.verbose:
+                print(f"❌ Unknown operation: {operation}")
+            return {audio_file.name: False for audio_file in audio_files}
         
-        if self.verbose:
-            print(f"🎵 Starting batch {operation} on {len(audio_files)} audio files")
+        output_dir.mkdir(parents=True, exist_ok=True)
         
+        jobs = []
         for audio_file in audio_files:
             output_file = output_dir / f"{audio_file.stem}_processed.mp3"
-            
-            try:
-                if operation == 'convert':
-                    success = self.convert_format(audio_file, output_file, **kwargs)
-                elif operation == 'volume':
-                    success = self.adjust_volume(audio_file, output_file, **kwargs)
-                elif operation == 'trim':
-                    success = self.trim_audio(audio_file, output_file, **kwargs)
-                else:
-                    if self.verbose:
-                        print(f"❌ Unknown operation: {operation}")
-                    success = False
-                    
-                results[audio_file.name] = success
-                
-            except Exception as e:
-                if self.verbose:
-                    print(f"❌ Error processing {audio_file.name}: {e}")
-                results[audio_file.name] = False
+            # Trim lengths are timestamps, so progress is only known for full-length operations
+            duration = None if operation == 'trim' else media_duration(audio_file)
+            jobs.append(BatchJob(
+                name=audio_file.name,
+                func=partial(operations[operation], audio_file, output_file, **kwargs),
+                input_path=audio_file,
+                output_path=output_file,
+                duration=duration
+            ))
+        
+        runner = FFmpegBatchRunner(max_workers, threads_per_job, progress_callback, self.verbose)
+        parallel = min(runner.max_workers, len(jobs)) or 1
+        if self.verbose:
+            print(f"🎵 Starting batch {operation} on {len(audio_files)} audio files "
+                  f"({parallel} parallel, {runner.threads_for(parallel)} threads each)")
+        
+        summary = {
+            'operation': operation,
+            'input_dir': str(input_dir),
+            'output_dir': str(output_dir),
+            **runner.run(jobs)
+        }
+        self.last_batch_summary = summary
+        write_summary(summary, summary_path or output_dir / 'batch_summary.json')
+        results = {job['name']: job['status'] == 'succeeded' for job in summary['jobs']}
         
         # Summary
         if self.verbose:
-            successful = sum(1 for success in results.values() if success)
-            print(f"🎵 Batch processing complete: {successful}/{len(results)} successful")
+            print(f"🎵 Batch processing complete: {summary['succeeded']}/{summary['total']} successful "
+                  f"in {summary['elapsed']:.1f}s")
+            if summary['cancelled']:
+                print(f"⚠️  {summary['cancelled']} audio files cancelled")
         
         return results
\ No newline at end of file
@@ -10,10 +10,19 @@ Provides a comprehensive class-based approach for video operations including:
 """
 
 import subprocess
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 import json
 
+from fal_common.media_probe import MediaInfo, ProbeError, probe_media
+
+from .ffmpeg_runner import (
+    BatchJob, FFmpegBatchRunner, ProgressCallback, media_duration, run_ffmpeg, write_summary
+)
+from .media_graph import MediaGraph
+from .trim_engine import cut_media
+
 
 class VideoProcessor:
     """Enhanced video processor with comprehensive video manipulation capabilities."""
@@ -25,6 +34,7 @@ class VideoProcessor:
             verbose: Whether to print operation details
         """
         self.verbose = verbose
+        self.last_batch_summary: Optional[Dict[str, Any]] = None
         
     def check_dependencies(self) -> Dict[str, bool]:
         """Check if required video processing tools are available.
@@ -52,6 +62,22 @@ class VideoProcessor:
             
         return deps
     
+    def probe(self, video_path: Path) -> Optional[MediaInfo]:
+        """Get typed metadata from the cached ffprobe service.
+        
+        Args:
+            video_path: Path to the video file
+            
+        Returns:
+            MediaInfo, or None if the file cannot be probed
+        """
+        try:
+            return probe_media(video_path)
+        except ProbeError as e:
+            if self.verbose:
+                print(f"❌ Error getting video info for {Path(video_path).name}: {e}")
+            return None
+    
     def get_video_info(self, video_path: Path) -> Dict[str, Any]:
         """Get comprehensive video information using ffprobe.
         
@@ -61,93 +87,58 @@ class VideoProcessor:
         Returns:
             Dictionary with video information
         """
-        try:
-            # Get general format info
-            cmd = [
-                'ffprobe', '-v', 'error', '-show_entries', 
-                'format=duration,size,bit_rate', '-of', 'csv=p=0', str(video_path)
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            format_info = result.stdout.strip().split(',')
-            
-            duration = float(format_info[0]) if format_info[0] else None
-            size = int(format_info[1]) if format_info[1] else None
-            bit_rate = int(format_info[2]) if format_info[2] else None
-            
-            # Get video stream info
-            cmd_video = [
-                'ffprobe', '-v', 'error', '-select_streams', 'v:0',
-                '-show_entries', 'stream=codec_name,width,height,r_frame_rate',
-                '-of', 'csv=p=0', str(video_path)
-            ]
-            result_video = subprocess.run(cmd_video, capture_output=True, text=True)
-            video_info = result_video.stdout.strip().split(',') if result_video.stdout.strip() else []
-            
-            # Get audio stream info
-            cmd_audio = [
-                'ffprobe', '-v', 'error', '-select_streams', 'a:0',
-                '-show_entries', 'stream=codec_name,sample_rate,channels',
-                '-of', 'csv=p=0', str(video_path)
-            ]
-            result_audio = subprocess.run(cmd_audio, capture_output=True, text=True)
-            audio_info = result_audio.stdout.strip().split(',') if result_audio.stdout.strip() else []
-            
-            return {
-                'duration': duration,
-                'file_size': size,
-                'bit_rate': bit_rate,
-                'has_video': bool(video_info),
-                'video_codec': video_info[0] if len(video_info) > 0 else None,
-                'width': int(video_info[1]) if len(video_info) > 1 and video_info[1] else None,
-                'height': int(video_info[2]) if len(video_info) > 2 and video_info[2] else None,
-                'frame_rate': video_info[3] if len(video_info) > 3 else None,
-                'has_audio': bool(audio_info),
-                'audio_codec': audio_info[0] if len(audio_info) > 0 else None,
-                'sample_rate': int(audio_info[1]) if len(audio_info) > 1 and audio_info[1] else None,
-                'audio_channels': int(audio_info[2]) if len(audio_info) > 2 and audio_info[2] else None,
-            }
-        except (subprocess.CalledProcessError, ValueError, IndexError) as e:
-            if self.verbose:
-                print(f"❌ Error getting video info for {video_path.name}: {e}")
+        info = self.probe(video_path)
+        if info is None:
             return {
                 'duration': None, 'file_size': None, 'bit_rate': None,
                 'has_video': False, 'video_codec': None, 'width': None, 'height': None, 'frame_rate': None,
                 'has_audio': False, 'audio_codec': None, 'sample_rate': None, 'audio_channels': None
             }
+        
+        video, audio = info.video, info.audio
+        return {
+            'duration': info.duration,
+            'file_size': info.file_size,
+            'bit_rate': info.bit_rate,
+            'has_video': info.has_video,
+            'video_codec': video.codec if video else None,
+            'width': video.width if video else None,
+            'height': video.height if video else None,
+            'frame_rate': video.frame_rate if video else None,
+            'has_audio': info.has_audio,
+            'audio_codec': audio.codec if audio else None,
+            'sample_rate': audio.sample_rate if audio else None,
+            'audio_channels': audio.channels if audio else None,
+        }
     
     def cut_duration(self, input_path: Path, output_path: Path, duration: int, 
-                    start_time: int = 0) -> bool:
+                    start_time: int = 0, snap_to_keyframes: bool = False) -> bool:
         """Cut video to specified duration from start time.
         
+        Seeks on the input side and stream-copies when the start is on a
+        keyframe; otherwise only the first partial GOP is re-encoded.
+        
         Args:
             input_path: Input video file path
             output_path: Output video file path
             duration: Duration to extract in seconds
             start_time: Start time in seconds (default: 0)
+            snap_to_keyframes: Start at the previous keyframe to always stream-copy
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            cmd = [
-                'ffmpeg', '-i', str(input_path),
-                '-ss', str(start_time),  # Start time
-                '-t', str(duration),     # Duration in seconds
-                '-c', 'copy',           # Copy streams without re-encoding (faster)
-                '-avoid_negative_ts', 'make_zero',
-                str(output_path),
-                '-y'  # Overwrite output file if exists
-            ]
-            
             if self.verbose:
                 print(f"🎬 Processing: {input_path.name}")
                 print(f"⏱️  Extracting {duration}s from {start_time}s...")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = cut_media(input_path, output_path, start_time, duration=duration,
+                               snap_to_keyframes=snap_to_keyframes)
             
-            if result.returncode == 0:
+            if result.success:
                 if self.verbose:
-                    print(f"✅ Success: {output_path.name}")
+                    print(f"✅ Success: {output_path.name} ({result.plan.mode})")
                 return True
             else:
                 if self.verbose:
@@ -161,38 +152,32 @@ class VideoProcessor:
             return False
     
     def cut_timeframe(self, input_path: Path, output_path: Path, 
-                     start_time: str, end_time: str) -> bool:
+                     start_time: str, end_time: str, snap_to_keyframes: bool = False) -> bool:
         """Cut video between specific timestamps.
         
+        Uses the same keyframe-aware fast path as cut_duration.
+        
         Args:
             input_path: Input video file path
             output_path: Output video file path
             start_time: Start time (HH:MM:SS format)
             end_time: End time (HH:MM:SS format)
+            snap_to_keyframes: Start at the previous keyframe to always stream-copy
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            cmd = [
-                'ffmpeg', '-i', str(input_path),
-                '-ss', start_time,
-                '-to', end_time,
-                '-c', 'copy',
-                '-avoid_negative_ts', 'make_zero',
-                str(output_path),
-                '-y'
-            ]
-            
             if self.verbose:
                 print(f"🎬 Processing: {input_path.name}")
                 print(f"⏱️  Cutting from {start_time} to {end_time}...")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = cut_media(input_path, output_path, start_time, end=end_time,
+                               snap_to_keyframes=snap_to_keyframes)
             
-            if result.returncode == 0:
+            if result.success:
                 if self.verbose:
-                    print(f"✅ Success: {output_path.name}")
+                    print(f"✅ Success: {output_path.name} ({result.plan.mode})")
                 return True
             else:
                 if self.verbose:
@@ -237,7 +222,7 @@ class VideoProcessor:
                 print(f"🎬 Resizing: {input_path.name}")
                 print(f"📐 Target dimensions: {width}x{height}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, output_path)
             
             if result.returncode == 0:
                 if self.verbose:
@@ -279,7 +264,7 @@ class VideoProcessor:
                 print(f"🎬 Converting: {input_path.name}")
                 print(f"🔄 Target codec: {target_codec}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, output_path)
             
             if result.returncode == 0:
                 if self.verbose:
@@ -325,7 +310,7 @@ class VideoProcessor:
                 print(f"🎬 Extracting frames: {input_path.name}")
                 print(f"📸 Frame rate: {frame_rate}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, output_pattern)
             
             if result.returncode == 0:
                 if self.verbose:
@@ -368,7 +353,7 @@ class VideoProcessor:
                 print(f"🎬 Extracting thumbnail: {input_path.name}")
                 print(f"⏱️  At timestamp: {timestamp}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, output_path)
             
             if result.returncode == 0:
                 if self.verbose:
@@ -385,6 +370,74 @@ class VideoProcessor:
                 print(f"❌ Exception extracting thumbnail from {input_path.name}: {e}")
             return False
     
+    def render_graph(self, graph: MediaGraph) -> bool:
+        """Render all outputs of a MediaGraph in one ffmpeg pass.
+        
+        Args:
+            graph: Graph of outputs for one input video
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if self.verbose:
+                print(f"🎬 Rendering {len(graph.outputs)} outputs in one pass: {graph.input_path.name}")
+            
+            result = graph.run()
+            
+            if result.returncode == 0:
+                if self.verbose:
+                    for output in graph.outputs:
+                        print(f"✅ {output.operation}: {output.output_path.name}")
+                return True
+            else:
+                if self.verbose:
+                    print(f"❌ Error rendering outputs of {graph.input_path.name}:")
+                    print(result.stderr)
+                return False
+                
+        except Exception as e:
+            if self.verbose:
+                print(f"❌ Exception rendering outputs of {graph.input_path.name}: {e}")
+            return False
+    
+    def process_outputs(self, input_path: Path, output_dir: Path, 
+                       outputs: List[Dict[str, Any]]) -> bool:
+        """Produce several derivatives of one video while decoding it once.
+        
+        Args:
+            input_path: Input video file path
+            output_dir: Directory for the outputs
+            outputs: Output specs, e.g. [{'operation': 'thumbnail', 'timestamp': '00:00:02'},
+                {'operation': 'resize', 'width': 1280, 'height': 720}]. Files are named
+                {stem}_thumb.jpg, {stem}_resized{ext} and {stem}_converted{ext};
+                frames go to output_dir.
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        names = {
+            'thumbnail': ('_thumb', '.jpg'),
+            'resize': ('_resized', input_path.suffix),
+            'convert': ('_converted', input_path.suffix)
+        }
+        graph = MediaGraph(input_path)
+        seen: Dict[str, int] = {}
+        for spec in outputs:
+            options = dict(spec)
+            operation = options.pop('operation')
+            if operation not in names:
+                graph.add(operation, output_dir, **options)
+                continue
+            
+            # Number repeated operations: clip_resized.mp4, clip_resized2.mp4, ...
+            seen[operation] = seen.get(operation, 0) + 1
+            name, extension = names[operation]
+            number = str(seen[operation]) if seen[operation] > 1 else ''
+            graph.add(operation, output_dir / f"{input_path.stem}{name}{number}{extension}", **options)
+        
+        return self.render_graph(graph)
+    
     def validate_video(self, video_path: Path) -> bool:
         """Validate if file is a valid video file.
         
@@ -397,17 +450,30 @@ class VideoProcessor:
         if not video_path.exists():
             return False
             
-        info = self.get_video_info(video_path)
-        return info.get('has_video', False) and info.get('duration', 0) > 0
+        info = self.probe(video_path)
+        return info is not None and info.has_video and (info.duration or 0) > 0
     
     def batch_process(self, input_dir: Path, output_dir: Path, 
-                     operation: str, **kwargs) -> Dict[str, bool]:
+                     operation: str, max_workers: Optional[int] = None,
+                     threads_per_job: Optional[int] = None,
+                     progress_callback: Optional[ProgressCallback] = None,
+                     summary_path: Optional[Path] = None, **kwargs) -> Dict[str, bool]:
         """Process multiple videos with the same operation.
         
+        Videos are processed in parallel, one ffmpeg process per file on a pool
+        sized to the CPU cores. Ctrl+C cancels the remaining files. A JSON
+        summary of the batch is written to summary_path and kept in
+        self.last_batch_summary.
+        
         Args:
             input_dir: Directory containing input videos
             output_dir: Directory for output videos
-            operation: Operation to perform ('cut_duration', 'resize', 'convert', etc.)
+            operation: Operation to perform ('cut_duration', 'resize', 'convert', 'thumbnail',
+                or 'graph' with outputs=[...] specs for process_outputs)
+            max_workers: Concurrent ffmpeg processes (default: CPU cores)
+            threads_per_job: ffmpeg threads per video (default: cores / files running at once)
+            progress_callback: Called as callback(filename, percent, stats) while ffmpeg runs
+            summary_path: JSON summary file (default: output_dir/batch_summary.json)
             **kwargs: Arguments for the operation
             
         Returns:
@@ -427,39 +493,63 @@ class VideoProcessor:
                 print(f"❌ No video files found in {input_dir}")
             return results
         
+        operations = {
+            'cut_duration': self.cut_duration,
+            'resize': self.resize_video,
+            'convert': self.convert_format,
+            'thumbnail': self.get_thumbnail,
+            'graph': self.process_outputs
+        }
+        if operation not in operations:
+            if self.verbose:
+                print(f"❌ Unknown operation: {operation}")
+            return {video_file.name: False for video_file in video_files}
+        
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        jobs = []
+        for video_file in video_files:
+            if operation == 'thumbnail':
+                output_file = output_dir / f"{video_file.stem}_thumb.jpg"
+                duration = None
+            elif operation == 'graph':
+                output_file = output_dir
+                duration = media_duration(video_file)
+            else:
+                output_file = output_dir / f"{video_file.stem}_processed{video_file.suffix}"
+                duration = media_duration(video_file)
+                if operation == 'cut_duration' and kwargs.get('duration'):
+                    duration = float(kwargs['duration'])
+            
+            jobs.append(BatchJob(
+                name=video_file.name,
+                func=partial(operations[operation], video_file, output_file, **kwargs),
+                input_path=video_file,
+                output_path=output_file,
+                duration=duration
+            ))
+        
+        runner = FFmpegBatchRunner(max_workers, threads_per_job, progress_callback, self.verbose)
+        parallel = min(runner.max_workers, len(jobs)) or 1
         if self.verbose:
-            print(f"🎬 Starting batch {operation} on {len(video_files)} videos")
+            print(f"🎬 Starting batch {operation} on {len(video_files)} videos "
+                  f"({parallel} parallel, {runner.threads_for(parallel)} threads each)")
         
-        for video_file in video_files:
-            output_file = output_dir / f"{video_file.stem}_processed{video_file.suffix}"
-            
-            try:
-                if operation == 'cut_duration':
-                    success = self.cut_duration(video_file, output_file, **kwargs)
-                elif operation == 'resize':
-                    success = self.resize_video(video_file, output_file, **kwargs)
-                elif operation == 'convert':
-                    success = self.convert_format(video_file, output_file, **kwargs)
-                elif operation == 'thumbnail':
-                    thumb_output = output_dir / f"{video_file.stem}_thumb.jpg"
-                    success = self.get_thumbnail(video_file, thumb_output, **kwargs)
-                else:
-                    if self.verbose:
-                        print(f"❌ Unknown operation: {operation}")
-                    success = False
-                    
-                results[video_file.name] = success
-                
-            except Exception as e:
-                if self.verbose:
-                    print(f"❌ Error processing {video_file.name}: {e}")
-                results[video_file.name] = False
+        summary = {
+            'operation': operation,
+            'input_dir': str(input_dir),
+            'output_dir': str(output_dir),
+            **runner.run(jobs)
+        }
+        self.last_batch_summary = summary
+        write_summary(summary, summary_path or output_dir / 'batch_summary.json')
+        results = {job['name']: job['status'] == 'succeeded' for job in summary['jobs']}
         
         # Summary
         if self.verbose:
-            successful = sum(1 for success in results.values() if success)
-            print(f"🎬 Batch processing complete: {successful}/{len(results)} successful")
+            print(f"🎬 Batch processing complete: {summary['succeeded']}/{summary['total']} successful "
+                  f"in {summary['elapsed']:.1f}s")
+            if summary['cancelled']:
+                print(f"⚠️  {summary['cancelled']} videos cancelled")
         
         return results
\ No newline at end of file
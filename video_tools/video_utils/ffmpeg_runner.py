@@ -0,0 +1,284 @@
+"""
+Parallel ffmpeg batch runner.
+
+Runs one ffmpeg process per file on a pool sized to the machine's CPU cores.
+Each job gets an equal share of cores through ``-threads`` (cores divided by
+the jobs actually running at once), reports progress parsed from
+``-progress pipe:1`` and can be cancelled; a cancelled job's partial output
+is deleted. The batch returns a JSON-serializable summary.
+
+Processor methods build their ffmpeg command as before and execute it with
+``run_ffmpeg``. Outside a batch this is a plain ``subprocess.run``; inside a
+batch job it picks up the job's thread allocation, progress reporting and
+cancellation.
+"""
+
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from fal_common.media_probe import ProbeError, probe_media
+
+ProgressCallback = Callable[[str, Optional[float], Dict[str, str]], None]
+
+# Current batch job of each worker thread (see run_ffmpeg)
+_context = threading.local()
+
+
+@dataclass
+class BatchJob:
+    """One file of a batch.
+
+    Attributes:
+        name: Job name used in progress reports and the summary (input filename)
+        func: Callable running the operation and returning True on success
+        input_path: Input file
+        output_path: Output file or directory
+        duration: Expected output duration in seconds, for progress percentages
+    """
+    name: str
+    func: Callable[[], bool]
+    input_path: Path
+    output_path: Path
+    duration: Optional[float] = None
+
+
+class FFmpegBatchRunner:
+    """Run ffmpeg jobs concurrently with per-job thread allocation."""
+
+    def __init__(self, max_workers: Optional[int] = None, threads_per_job: Optional[int] = None,
+                 progress_callback: Optional[ProgressCallback] = None, verbose: bool = True):
+        """Initialize the runner.
+
+        Args:
+            max_workers: Concurrent ffmpeg processes (default: CPU cores)
+            threads_per_job: ffmpeg ``-threads`` per job (default: cores divided by
+                the number of jobs running at once)
+            progress_callback: Called as callback(job_name, percent, stats) on progress updates
+            verbose: Whether to print progress milestones
+        """
+        self.cpu_count = os.cpu_count() or 1
+        self.max_workers = max(1, max_workers or self.cpu_count)
+        self.requested_threads_per_job = threads_per_job
+        self.threads_per_job = self.threads_for(self.max_workers)
+        self.progress_callback = progress_callback
+        self.verbose = verbose
+        self._cancel = threading.Event()
+        self._processes: Dict[str, subprocess.Popen] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self):
+        """Stop running ffmpeg processes and skip jobs that have not started."""
+        self._cancel.set()
+        with self._lock:
+            processes = list(self._processes.values())
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+
+    def run(self, jobs: List[BatchJob]) -> Dict[str, Any]:
+        """Run all jobs and summarize the results.
+
+        Ctrl+C cancels the batch; finished jobs keep their results.
+
+        Args:
+            jobs: Jobs to run
+
+        Returns:
+            Summary with counts, timings and one entry per job (in input order)
+        """
+        started_at = datetime.now().isoformat()
+        start = time.time()
+        workers = min(self.max_workers, len(jobs)) or 1
+        # A batch smaller than the pool splits the cores among fewer jobs
+        self.threads_per_job = self.threads_for(workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._run_job, job) for job in jobs]
+            try:
+                entries = [future.result() for future in futures]
+            except KeyboardInterrupt:
+                if self.verbose:
+                    print("\n⚠️  Cancelling batch...")
+                self.cancel()
+                entries = [future.result() for future in futures]
+
+        counts = {status: sum(1 for e in entries if e['status'] == status)
+                  for status in ('succeeded', 'failed', 'cancelled')}
+        return {
+            'started_at': started_at,
+            'elapsed': round(time.time() - start, 3),
+            'workers': workers,
+            'threads_per_job': self.threads_per_job,
+            'total': len(entries),
+            **counts,
+            'jobs': entries
+        }
+
+    def threads_for(self, workers: int) -> int:
+        """ffmpeg ``-threads`` per job when ``workers`` jobs run at once."""
+        return max(1, self.requested_threads_per_job or self.cpu_count // workers)
+
+    def _run_job(self, job: BatchJob) -> Dict[str, Any]:
+        entry = {
+            'name': job.name,
+            'input': str(job.input_path),
+            'output': str(job.output_path),
+            'status': 'cancelled',
+            'elapsed': 0.0,
+            'error': None
+        }
+        if self.cancelled:
+            return entry
+
+        _context.runner = self
+        _context.job = job
+        start = time.time()
+        try:
+            success = job.func()
+            if self.cancelled and not success:
+                entry['status'] = 'cancelled'
+            else:
+                entry['status'] = 'succeeded' if success else 'failed'
+        except Exception as e:
+            if self.verbose:
+                print(f"❌ Error processing {job.name}: {e}")
+            entry['status'] = 'failed'
+            entry['error'] = str(e)
+        finally:
+            _context.runner = None
+            _context.job = None
+        entry['elapsed'] = round(time.time() - start, 3)
+        return entry
+
+    def _execute(self, job: BatchJob, cmd: List[str],
+                 output_path: Optional[Path] = None) -> subprocess.CompletedProcess:
+        """Run one ffmpeg command of a job, reporting progress until it exits.
+
+        If the batch is cancelled while the command runs, its partial output
+        file is deleted.
+        """
+        if self.cancelled:
+            return subprocess.CompletedProcess(cmd, -1, '', 'Cancelled')
+
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   text=True, errors='replace')
+        with self._lock:
+            self._processes[job.name] = process
+        if self.cancelled:
+            process.terminate()
+
+        # Drain stderr on the side so a chatty ffmpeg cannot block on a full pipe
+        stderr_lines: List[str] = []
+        stderr_reader = threading.Thread(target=lambda: stderr_lines.extend(process.stderr), daemon=True)
+        stderr_reader.start()
+
+        stats: Dict[str, str] = {}
+        last_milestone = -1
+        try:
+            for line in process.stdout:
+                key, _, value = line.strip().partition('=')
+                if not value:
+                    continue
+                stats[key] = value
+                if key != 'progress':
+                    continue
+
+                percent = self._percent(job, stats)
+                if self.progress_callback:
+                    self.progress_callback(job.name, percent, dict(stats))
+                elif self.verbose and percent is not None and int(percent // 25) > last_milestone:
+                    last_milestone = int(percent // 25)
+                    print(f"📊 {job.name}: {percent:.0f}% (speed {stats.get('speed', '?')})")
+                stats = {}
+            process.wait()
+            stderr_reader.join()
+        finally:
+            with self._lock:
+                self._processes.pop(job.name, None)
+
+        if self.cancelled and process.returncode != 0 and output_path is not None:
+            try:
+                Path(output_path).unlink(missing_ok=True)
+            except OSError:
+                pass
+
+        return subprocess.CompletedProcess(cmd, process.returncode, '', ''.join(stderr_lines))
+
+    @staticmethod
+    def _percent(job: BatchJob, stats: Dict[str, str]) -> Optional[float]:
+        if stats.get('progress') == 'end':
+            return 100.0
+        if not job.duration:
+            return None
+        # out_time_us is the current position; older ffmpeg reports it (also in us) as out_time_ms
+        position = stats.get('out_time_us') or stats.get('out_time_ms')
+        try:
+            return min(100.0, max(0.0, int(position) / 1e6 / job.duration * 100))
+        except (TypeError, ValueError):
+            return None
+
+
+def media_duration(path: Path) -> Optional[float]:
+    """Duration of a media file for progress reporting, or None if it cannot be probed."""
+    try:
+        return probe_media(path).duration
+    except ProbeError:
+        return None
+
+
+def run_ffmpeg(cmd: List[str], output_path: Optional[Path] = None) -> subprocess.CompletedProcess:
+    """Run an ffmpeg command, joining the current batch job if there is one.
+
+    Inside a batch job, ``-threads`` is added in front of the output file and
+    ``-progress pipe:1`` reports progress to the runner.
+
+    Args:
+        cmd: ffmpeg command line
+        output_path: Output file of the command, used to place ``-threads``
+
+    Returns:
+        CompletedProcess with returncode and stderr
+    """
+    runner = getattr(_context, 'runner', None)
+    job = getattr(_context, 'job', None)
+    if runner is None or job is None:
+        return subprocess.run(cmd, capture_output=True, text=True)
+
+    cmd = list(cmd)
+    output = str(output_path) if output_path is not None else None
+    insert_at = len(cmd) - 1 - cmd[::-1].index(output) if output in cmd else 1
+    cmd[insert_at:insert_at] = ['-threads', str(runner.threads_per_job)]
+    cmd[1:1] = ['-nostats', '-progress', 'pipe:1']
+    return runner._execute(job, cmd, output_path)
+
+
+def write_summary(summary: Dict[str, Any], summary_path: Path) -> bool:
+    """Write a batch summary as JSON.
+
+    Args:
+        summary: Summary returned by FFmpegBatchRunner.run
+        summary_path: Output JSON file
+
+    Returns:
+        True if written, False otherwise
+    """
+    try:
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        return True
+    except OSError as e:
+        print(f"⚠️  Could not write batch summary {summary_path}: {e}")
+        return False
@@ -0,0 +1,138 @@
+"""
+Representative frame sampling for image-based video analysis.
+
+Models that accept images but not video files can still describe a video
+from a handful of its frames. ``sample_frames`` picks them in one ffmpeg
+pass:
+
+- frames where the scene changes (``select`` filter scene score), and
+- a uniform fallback: a frame whenever nothing was picked for
+  ``duration / max_frames`` seconds, so static videos are still covered.
+
+Frames are downscaled and JPEG-encoded by ffmpeg and read from its stdout,
+so no temporary files are written. If scene changes yield more frames than
+the budget, an evenly spread subset is kept.
+
+Example:
+    frames = sample_frames(Path("clip.mp4"), max_frames=8)
+    for frame in frames:
+        print(frame.timestamp, len(frame.data))
+"""
+
+import base64
+import re
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from .ffmpeg_runner import media_duration
+
+DEFAULT_MAX_FRAMES = 12
+DEFAULT_MAX_WIDTH = 768
+DEFAULT_SCENE_THRESHOLD = 0.3
+
+# Interval used for the uniform fallback when the duration is unknown
+UNKNOWN_DURATION_INTERVAL = 10.0
+
+_JPEG_START = b'\xff\xd8'
+_JPEG_END = b'\xff\xd9'
+_PTS_TIME_RE = re.compile(r"showinfo.*?pts_time:\s*(-?\d+(?:\.\d+)?)")
+
+
+@dataclass
+class SampledFrame:
+    """One JPEG-encoded frame and its position in the video."""
+    timestamp: float
+    data: bytes
+
+    @property
+    def data_url(self) -> str:
+        """Frame as a base64 data URL for multimodal chat messages."""
+        return f"data:image/jpeg;base64,{base64.b64encode(self.data).decode('utf-8')}"
+
+
+def build_sample_command(video_path: Path, interval: float, max_width: int = DEFAULT_MAX_WIDTH,
+                         scene_threshold: float = DEFAULT_SCENE_THRESHOLD,
+                         quality: int = 5) -> List[str]:
+    """Build the ffmpeg command writing sampled frames as a JPEG stream to stdout.
+
+    Args:
+        video_path: Source video
+        interval: Longest gap between sampled frames, in seconds
+        max_width: Frames wider than this are downscaled
+        scene_threshold: Scene change score (0-1) that triggers a frame
+        quality: JPEG quality (2 best - 31 worst)
+
+    Returns:
+        ffmpeg arguments
+    """
+    # Scene changes closer than a quarter interval to the last frame are skipped,
+    # so fast cuts do not flood the budget
+    select = (f"isnan(prev_selected_t)"
+              f"+gt(scene,{scene_threshold})*gte(t-prev_selected_t,{interval / 4:.3f})"
+              f"+gte(t-prev_selected_t,{interval:.3f})")
+    filters = f"select='{select}',scale='min({max_width},iw)':-2,showinfo"
+    return [
+        'ffmpeg', '-hide_banner', '-nostats', '-i', str(video_path),
+        '-an', '-vf', filters, '-vsync', 'vfr',
+        '-f', 'image2pipe', '-c:v', 'mjpeg', '-q:v', str(quality), 'pipe:1'
+    ]
+
+
+def split_jpeg_stream(stream: bytes) -> List[bytes]:
+    """Split concatenated JPEG images (ffmpeg image2pipe output)."""
+    images = []
+    start = stream.find(_JPEG_START)
+    while start != -1:
+        end = stream.find(_JPEG_END + _JPEG_START, start + 2)
+        if end == -1:
+            images.append(stream[start:])
+            break
+        images.append(stream[start:end + 2])
+        start = end + 2
+    return images
+
+
+def sample_frames(video_path: Path, max_frames: int = DEFAULT_MAX_FRAMES,
+                  max_width: int = DEFAULT_MAX_WIDTH,
+                  scene_threshold: float = DEFAULT_SCENE_THRESHOLD,
+                  duration: Optional[float] = None) -> List[SampledFrame]:
+    """Sample representative frames of a video.
+
+    Args:
+        video_path: Source video
+        max_frames: Frame budget
+        max_width: Frames wider than this are downscaled
+        scene_threshold: Scene change score (0-1) that triggers a frame
+        duration: Video duration in seconds (probed when not given)
+
+    Returns:
+        Up to max_frames frames in timeline order
+
+    Raises:
+        RuntimeError: If ffmpeg fails or produces no frames
+    """
+    if duration is None:
+        duration = media_duration(video_path)
+    interval = duration / max_frames if duration else UNKNOWN_DURATION_INTERVAL
+
+    cmd = build_sample_command(video_path, interval, max_width, scene_threshold)
+    result = subprocess.run(cmd, capture_output=True)
+    stderr = result.stderr.decode('utf-8', errors='replace')
+    if result.returncode != 0:
+        raise RuntimeError(f"Frame sampling failed: {stderr.strip()[-500:]}")
+
+    images = split_jpeg_stream(result.stdout)
+    if not images:
+        raise RuntimeError(f"No frames could be sampled from {video_path.name}")
+    timestamps = [float(t) for t in _PTS_TIME_RE.findall(stderr)]
+    if len(timestamps) != len(images):
+        # Without showinfo timings fall back to the uniform schedule
+        timestamps = [i * interval for i in range(len(images))]
+
+    frames = [SampledFrame(t, data) for t, data in zip(timestamps, images)]
+    if len(frames) > max_frames:
+        step = len(frames) / max_frames
+        frames = [frames[int(i * step)] for i in range(max_frames)]
+    return frames
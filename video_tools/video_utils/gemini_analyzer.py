@@ -16,6 +16,8 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 import os
 
+from .gemini_file_registry import GeminiFileRegistry, get_default_registry
+
 try:
     import google.generativeai as genai
     from google.generativeai.types import HarmCategory, HarmBlockThreshold
@@ -27,8 +29,15 @@ except ImportError:
 class GeminiVideoAnalyzer:
     """Google Gemini video, audio, and image understanding analyzer."""
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize with API key."""
+    def __init__(self, api_key: Optional[str] = None, reuse_uploads: bool = True,
+                 file_registry: Optional[GeminiFileRegistry] = None):
+        """Initialize with API key.
+        
+        Args:
+            api_key: Gemini API key (default: GEMINI_API_KEY environment variable)
+            reuse_uploads: Share uploaded files across analyses of the same media
+            file_registry: Registry for reused uploads (default: process-wide registry)
+        """
         if not GEMINI_AVAILABLE:
             raise ImportError(
                 "Google GenerativeAI not installed. Run: pip install google-generativeai"
@@ -43,6 +52,28 @@ class GeminiVideoAnalyzer:
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
         
+        # Uploaded files are kept alive and reused until the registry evicts them
+        self.file_registry = None
+        if reuse_uploads:
+            self.file_registry = file_registry or get_default_registry(delete_fn=genai.delete_file)
+    
+    def _get_file_id(self, media_path: Path, upload_fn) -> str:
+        """Upload a media file, or reuse an earlier upload of the same content."""
+        if self.file_registry is None:
+            return upload_fn(media_path)
+        return self.file_registry.get_or_upload(media_path, upload_fn)
+    
+    def _cleanup_file(self, file_id: str):
+        """Release a reused upload, or delete an unmanaged one."""
+        if self.file_registry is not None and self.file_registry.release(file_id):
+            return
+        try:
+            genai.delete_file(file_id)
+            print("🗑️ Cleaned up uploaded file")
+        except Exception as e:
+            # Already deleted or expired remotely; the analysis result still stands
+            print(f"⚠️ Could not delete uploaded file {file_id}: {e}")
+        
     def upload_video(self, video_path: Path) -> str:
         """Upload video to Gemini and return file ID."""
         try:
@@ -130,8 +161,9 @@ class GeminiVideoAnalyzer:
     
     def describe_video(self, video_path: Path, detailed: bool = False) -> Dict[str, Any]:
         """Generate video description and summary."""
+        file_id = None
         try:
-            file_id = self.upload_video(video_path)
+            file_id = self._get_file_id(video_path, self.upload_video)
             video_file = genai.get_file(file_id)
             
             if detailed:
@@ -161,20 +193,21 @@ Provide structured analysis with clear sections."""
                 'analysis_type': 'description'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Description failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def transcribe_video(self, video_path: Path, include_timestamps: bool = True) -> Dict[str, Any]:
         """Transcribe audio content from video."""
+        file_id = None
         try:
-            file_id = self.upload_video(video_path)
+            file_id = self._get_file_id(video_path, self.upload_video)
             video_file = genai.get_file(file_id)
             
             if include_timestamps:
@@ -199,20 +232,21 @@ Focus on accuracy and readability. Include speaker changes if multiple people sp
                 'analysis_type': 'transcription'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Transcription failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def answer_questions(self, video_path: Path, questions: List[str]) -> Dict[str, Any]:
         """Answer specific questions about the video."""
+        file_id = None
         try:
-            file_id = self.upload_video(video_path)
+            file_id = self._get_file_id(video_path, self.upload_video)
             video_file = genai.get_file(file_id)
             
             questions_text = "\n".join([f"{i+1}. {q}" for i, q in enumerate(questions)])
@@ -232,20 +266,21 @@ Provide detailed, accurate answers based on what you observe in the video. If a
                 'analysis_type': 'qa'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Q&A failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def analyze_scenes(self, video_path: Path) -> Dict[str, Any]:
         """Analyze video scenes and create timeline breakdown."""
+        file_id = None
         try:
-            file_id = self.upload_video(video_path)
+            file_id = self._get_file_id(video_path, self.upload_video)
             video_file = genai.get_file(file_id)
             
             prompt = """Analyze this video and break it down into distinct scenes or segments. For each scene, provide:
@@ -266,20 +301,21 @@ Create a detailed timeline of the video content."""
                 'analysis_type': 'scenes'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Scene analysis failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def extract_key_info(self, video_path: Path) -> Dict[str, Any]:
         """Extract key information and insights from video."""
+        file_id = None
         try:
-            file_id = self.upload_video(video_path)
+            file_id = self._get_file_id(video_path, self.upload_video)
             video_file = genai.get_file(file_id)
             
             prompt = """Extract key information from this video including:
@@ -302,20 +338,21 @@ Provide structured, actionable information."""
                 'analysis_type': 'extraction'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Key info extraction failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def describe_audio(self, audio_path: Path, detailed: bool = False) -> Dict[str, Any]:
         """Generate audio description and summary."""
+        file_id = None
         try:
-            file_id = self.upload_audio(audio_path)
+            file_id = self._get_file_id(audio_path, self.upload_audio)
             audio_file = genai.get_file(file_id)
             
             if detailed:
@@ -346,21 +383,22 @@ Provide comprehensive audio analysis."""
                 'analysis_type': 'description'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Audio description failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def transcribe_audio(self, audio_path: Path, include_timestamps: bool = True, 
                         speaker_identification: bool = True) -> Dict[str, Any]:
         """Transcribe spoken content from audio."""
+        file_id = None
         try:
-            file_id = self.upload_audio(audio_path)
+            file_id = self._get_file_id(audio_path, self.upload_audio)
             audio_file = genai.get_file(file_id)
             
             prompt_parts = ["Transcribe all spoken content in this audio file."]
@@ -389,20 +427,21 @@ Provide comprehensive audio analysis."""
                 'analysis_type': 'transcription'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Audio transcription failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def analyze_audio_content(self, audio_path: Path) -> Dict[str, Any]:
         """Analyze audio content for type, genre, mood, etc."""
+        file_id = None
         try:
-            file_id = self.upload_audio(audio_path)
+            file_id = self._get_file_id(audio_path, self.upload_audio)
             audio_file = genai.get_file(file_id)
             
             prompt = """Analyze the content and characteristics of this audio:
@@ -425,20 +464,21 @@ Provide detailed content analysis."""
                 'analysis_type': 'content_analysis'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Audio content analysis failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def answer_audio_questions(self, audio_path: Path, questions: List[str]) -> Dict[str, Any]:
         """Answer specific questions about the audio."""
+        file_id = None
         try:
-            file_id = self.upload_audio(audio_path)
+            file_id = self._get_file_id(audio_path, self.upload_audio)
             audio_file = genai.get_file(file_id)
             
             questions_text = "\n".join([f"{i+1}. {q}" for i, q in enumerate(questions)])
@@ -458,20 +498,21 @@ Provide detailed, accurate answers based on what you hear in the audio. If a que
                 'analysis_type': 'qa'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Audio Q&A failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def detect_audio_events(self, audio_path: Path) -> Dict[str, Any]:
         """Detect and analyze specific events in audio."""
+        file_id = None
         try:
-            file_id = self.upload_audio(audio_path)
+            file_id = self._get_file_id(audio_path, self.upload_audio)
             audio_file = genai.get_file(file_id)
             
             prompt = """Analyze this audio and detect specific events or segments:
@@ -494,20 +535,21 @@ Create a detailed timeline of audio events."""
                 'analysis_type': 'event_detection'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Audio event detection failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def describe_image(self, image_path: Path, detailed: bool = False) -> Dict[str, Any]:
         """Generate image description and summary."""
+        file_id = None
         try:
-            file_id = self.upload_image(image_path)
+            file_id = self._get_file_id(image_path, self.upload_image)
             image_file = genai.get_file(file_id)
             
             if detailed:
@@ -539,20 +581,21 @@ Provide comprehensive visual analysis."""
                 'analysis_type': 'description'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Image description failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def classify_image(self, image_path: Path) -> Dict[str, Any]:
         """Classify image content and categorize."""
+        file_id = None
         try:
-            file_id = self.upload_image(image_path)
+            file_id = self._get_file_id(image_path, self.upload_image)
             image_file = genai.get_file(file_id)
             
             prompt = """Classify and categorize this image:
@@ -574,20 +617,21 @@ Provide structured classification with confidence levels where possible."""
                 'analysis_type': 'classification'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Image classification failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def detect_objects(self, image_path: Path, detailed: bool = False) -> Dict[str, Any]:
         """Detect and identify objects in the image."""
+        file_id = None
         try:
-            file_id = self.upload_image(image_path)
+            file_id = self._get_file_id(image_path, self.upload_image)
             image_file = genai.get_file(file_id)
             
             if detailed:
@@ -618,20 +662,21 @@ Provide comprehensive object detection analysis."""
                 'analysis_type': 'object_detection'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Object detection failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def answer_image_questions(self, image_path: Path, questions: List[str]) -> Dict[str, Any]:
         """Answer specific questions about the image."""
+        file_id = None
         try:
-            file_id = self.upload_image(image_path)
+            file_id = self._get_file_id(image_path, self.upload_image)
             image_file = genai.get_file(file_id)
             
             questions_text = "\n".join([f"{i+1}. {q}" for i, q in enumerate(questions)])
@@ -651,20 +696,21 @@ Provide detailed, accurate answers based on what you can see in the image. If a
                 'analysis_type': 'qa'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Image Q&A failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def extract_text_from_image(self, image_path: Path) -> Dict[str, Any]:
         """Extract and transcribe text from image (OCR)."""
+        file_id = None
         try:
-            file_id = self.upload_image(image_path)
+            file_id = self._get_file_id(image_path, self.upload_image)
             image_file = genai.get_file(file_id)
             
             prompt = """Extract all text visible in this image:
@@ -687,20 +733,21 @@ Provide complete text extraction with structure."""
                 'analysis_type': 'text_extraction'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Text extraction failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
     
     def analyze_image_composition(self, image_path: Path) -> Dict[str, Any]:
         """Analyze image composition, style, and technical aspects."""
+        file_id = None
         try:
-            file_id = self.upload_image(image_path)
+            file_id = self._get_file_id(image_path, self.upload_image)
             image_file = genai.get_file(file_id)
             
             prompt = """Analyze the composition and technical aspects of this image:
@@ -724,15 +771,148 @@ Provide detailed photographic/artistic analysis."""
                 'analysis_type': 'composition'
             }
             
-            # Clean up uploaded file
-            genai.delete_file(file_id)
-            print("🗑️ Cleaned up uploaded file")
-            
             return result
             
         except Exception as e:
             print(f"❌ Composition analysis failed: {e}")
             raise
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            if file_id is not None:
+                self._cleanup_file(file_id)
+    
+    def analyze_combined(self, media_path: Path, media_type: str = 'video') -> Dict[str, Dict[str, Any]]:
+        """Run every comprehensive-analysis facet in a single structured request.
+        
+        The media is uploaded (or reused) once and tokenized once; the model
+        answers all facets as one JSON object which is split back into the
+        result dictionaries of the individual methods.
+        
+        Args:
+            media_path: Path to the video, audio or image file
+            media_type: 'video', 'audio' or 'image'
+            
+        Returns:
+            Dictionary of facet key (e.g. 'description', 'scenes') to facet result
+            
+        Raises:
+            ValueError: If the response cannot be parsed into all facets
+        """
+        upload_fn = {
+            'video': self.upload_video,
+            'audio': self.upload_audio,
+            'image': self.upload_image
+        }[media_type]
+        facets = COMBINED_FACETS[media_type]
+        
+        file_id = self._get_file_id(media_path, upload_fn)
+        try:
+            media_file = genai.get_file(file_id)
+            
+            instructions = "\n".join(f'- "{key}": {instruction}' for key, _, _, _, instruction in facets)
+            prompt = f"""Analyze this {media_type} and answer every task below in a single JSON object.
+Each field must be a string containing a complete, readable answer (markdown allowed).
+
+{instructions}"""
+            generation_config = genai.GenerationConfig(
+                response_mime_type="application/json",
+                response_schema={
+                    'type': 'OBJECT',
+                    'properties': {key: {'type': 'STRING'} for key, *_ in facets},
+                    'required': [key for key, *_ in facets]
+                }
+            )
+            
+            print(f"🧠 Running combined {media_type} analysis ({len(facets)} facets, 1 request)...")
+            response = self.model.generate_content([media_file, prompt], generation_config=generation_config)
+            return split_combined_response(response.text, media_type, file_id)
+        finally:
+            # Clean up uploaded file (reused uploads are deleted on eviction)
+            self._cleanup_file(file_id)
+
+
+# Facets requested by analyze_combined, per media type: result key, text
+# field of the per-facet result, analysis_type and extra fields of the
+# equivalent single-facet call, and the instruction sent to the model.
+COMBINED_FACETS = {
+    'video': [
+        ('description', 'description', 'description', {'detailed': True},
+         "Detailed analysis: overall summary and main topic, key scenes with timestamps, "
+         "visual elements, audio content, mood and tone, technical observations."),
+        ('scenes', 'scene_analysis', 'scenes', {},
+         "Timeline of distinct scenes: approximate start/end timestamps, description, key visual "
+         "elements and actions, audio content, transitions and cuts."),
+        ('key_info', 'key_info', 'extraction', {},
+         "Key information: main topics, important facts or data, key people/places/objects, "
+         "notable quotes, conclusions, timestamps for important moments."),
+        ('transcription', 'transcription', 'transcription', {'include_timestamps': True},
+         "Complete transcript of all speech with speaker identification and approximate "
+         "timestamps; note non-speech audio (music, sound effects, silence)."),
+    ],
+    'audio': [
+        ('description', 'description', 'description', {'detailed': True},
+         "Detailed analysis: content summary and type, speech, music, sound effects, quality, "
+         "emotional tone, notable segments with timestamps."),
+        ('content_analysis', 'content_analysis', 'content_analysis', {},
+         "Content characteristics: content type, genre/style/instruments/tempo for music, "
+         "language/accent/emotion for speech, production quality, background sounds."),
+        ('event_detection', 'event_detection', 'event_detection', {},
+         "Timeline of audio events: speech segments and speaker changes, music changes, sound "
+         "effects, silences, volume changes, transitions, with timestamps."),
+        ('transcription', 'transcription', 'transcription',
+         {'include_timestamps': True, 'speaker_identification': True},
+         "Complete transcript of all speech with consistent speaker labels and approximate "
+         "timestamps; note non-speech audio."),
+    ],
+    'image': [
+        ('description', 'description', 'description', {'detailed': True},
+         "Detailed description: main subject, objects/people/animals, setting, colors and "
+         "lighting, style and mood, visible text, notable details."),
+        ('classification', 'classification', 'classification', {},
+         "Classification: primary category, content type, subject, style or genre, purpose, "
+         "technical classification, with confidence levels where possible."),
+        ('object_detection', 'object_detection', 'object_detection', {'detailed': True},
+         "All identifiable objects with locations, counts, relationships, conditions and "
+         "colors, brands or labels, spatial arrangement."),
+        ('text_extraction', 'extracted_text', 'text_extraction', {},
+         "All visible text transcribed accurately, with location, style and orientation; "
+         "state 'No text found' if there is none."),
+        ('composition', 'composition_analysis', 'composition', {},
+         "Composition: techniques, lighting, color palette, depth of field, perspective, "
+         "visual balance, style and technical quality."),
+    ],
+}
+
+
+def split_combined_response(text: str, media_type: str, file_id: str) -> Dict[str, Dict[str, Any]]:
+    """Split a combined JSON response into the per-facet result dictionaries.
+    
+    Args:
+        text: JSON response text with one string field per facet
+        media_type: 'video', 'audio' or 'image'
+        file_id: Gemini file the analysis was run on
+        
+    Returns:
+        Dictionary of facet key to the result the single-facet method would return
+        
+    Raises:
+        ValueError: If the response is not valid JSON or a facet is missing
+    """
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        text = text[text.find("{"):]
+    data = json.loads(text)
+    if not isinstance(data, dict):
+        raise ValueError("Combined response is not a JSON object")
+    
+    results = {}
+    for key, field, analysis_type, extra, _ in COMBINED_FACETS[media_type]:
+        value = data.get(key)
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"Combined response is missing '{key}'")
+        results[key] = {'file_id': file_id, field: value, **extra, 'analysis_type': analysis_type}
+    return results
 
 
 def check_gemini_requirements() -> tuple[bool, str]:
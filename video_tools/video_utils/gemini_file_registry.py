@@ -0,0 +1,203 @@
+"""
+Registry of media files uploaded to the Gemini File API.
+
+Uploading a video and waiting for Gemini to process it is usually the
+slowest part of an analysis. The registry keys uploads by file content hash
+and keeps the remote file alive for a TTL, so describing, scene-splitting,
+extracting and transcribing the same video upload it only once. Remote files
+are deleted when an entry expires, is evicted for capacity, or the process
+exits. Callers hold a reference from ``get_or_upload`` until ``release``;
+deleting a file that is still in use is deferred until its last release.
+"""
+
+import atexit
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+
+class GeminiFileRegistry:
+    """Content-addressed cache of Gemini file handles with TTL eviction."""
+
+    def __init__(self, ttl: float = 3600.0, max_entries: int = 32,
+                 delete_fn: Optional[Callable[[str], None]] = None):
+        """Initialize the registry.
+
+        Args:
+            ttl: Seconds an uploaded file is reused before it is deleted and re-uploaded
+            max_entries: Maximum number of remote files kept alive at once
+            delete_fn: Function deleting a remote file by name (e.g. genai.delete_file)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.delete_fn = delete_fn
+        self._entries: Dict[str, Dict[str, float]] = {}
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._in_use: Dict[str, int] = {}
+        self._pending_delete: Set[str] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.uploads = 0
+
+    def content_hash(self, file_path: Path) -> str:
+        """SHA256 of a file's contents, memoized by path, size and mtime."""
+        stat = file_path.stat()
+        stamp = (str(file_path.resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._hashes.get(stamp)
+        if cached:
+            return cached
+
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+
+        with self._lock:
+            self._hashes[stamp] = digest.hexdigest()
+        return digest.hexdigest()
+
+    def get_or_upload(self, file_path: Path, upload_fn: Callable[[Path], str]) -> str:
+        """Return the remote file name for a local file, uploading it if needed.
+
+        The caller holds a reference to the file and must ``release`` it when
+        done; the file is not deleted while references remain.
+
+        Args:
+            file_path: Local media file
+            upload_fn: Function uploading the file and returning its remote name
+
+        Returns:
+            Remote file name (usable with genai.get_file)
+        """
+        key = self.content_hash(Path(file_path))
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Concurrent analyses of the same file wait for a single upload
+        with key_lock:
+            self.evict_expired()
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry:
+                    entry['last_used'] = time.time()
+                    self.hits += 1
+                    self._acquire(entry['name'])
+                    print(f"♻️ Reusing uploaded file: {entry['name']}")
+                    return entry['name']
+
+            name = upload_fn(Path(file_path))
+            with self._lock:
+                self.uploads += 1
+                now = time.time()
+                self._entries[key] = {'name': name, 'uploaded_at': now, 'last_used': now}
+                self._acquire(name)
+                overflow = self._retire(self._pop_least_recent(len(self._entries) - self.max_entries))
+            self._delete(overflow)
+            return name
+
+    def release(self, name: str) -> bool:
+        """Drop a reference taken by ``get_or_upload``.
+
+        Args:
+            name: Remote file name returned by get_or_upload
+
+        Returns:
+            True if the registry owns the file (the caller must not delete it)
+        """
+        with self._lock:
+            count = self._in_use.get(name)
+            if count is None:
+                return False
+            if count > 1:
+                self._in_use[name] = count - 1
+                return True
+            del self._in_use[name]
+            deferred = name in self._pending_delete
+            self._pending_delete.discard(name)
+        if deferred:
+            self._delete([name])
+        return True
+
+    def is_managed(self, name: str) -> bool:
+        """Check whether a remote file is owned by the registry."""
+        with self._lock:
+            return name in self._in_use or any(entry['name'] == name for entry in self._entries.values())
+
+    def evict_expired(self):
+        """Delete remote files older than the TTL."""
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if entry['uploaded_at'] < cutoff]
+            names = self._retire([self._entries.pop(key)['name'] for key in expired])
+        self._delete(names)
+
+    def clear(self, force: bool = False):
+        """Delete every remote file held by the registry.
+
+        Args:
+            force: Also delete files still in use (used at interpreter exit)
+        """
+        with self._lock:
+            names = [entry['name'] for entry in self._entries.values()]
+            self._entries.clear()
+            if force:
+                names.extend(self._pending_delete)
+                self._pending_delete.clear()
+                self._in_use.clear()
+            else:
+                names = self._retire(names)
+        self._delete(names)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get upload and reuse counts."""
+        with self._lock:
+            return {'entries': len(self._entries), 'uploads': self.uploads, 'hits': self.hits}
+
+    def _pop_least_recent(self, count: int) -> list:
+        """Remove the least recently used entries (caller holds the lock)."""
+        if count <= 0:
+            return []
+        oldest = sorted(self._entries, key=lambda k: self._entries[k]['last_used'])[:count]
+        return [self._entries.pop(key)['name'] for key in oldest]
+
+    def _acquire(self, name: str):
+        """Take a reference to a remote file (caller holds the lock)."""
+        self._in_use[name] = self._in_use.get(name, 0) + 1
+
+    def _retire(self, names: List[str]) -> List[str]:
+        """Split evicted files into deletable ones and deferred in-use ones (caller holds the lock)."""
+        in_use = [name for name in names if name in self._in_use]
+        self._pending_delete.update(in_use)
+        return [name for name in names if name not in self._in_use]
+
+    def _delete(self, names):
+        for name in names:
+            if self.delete_fn is None:
+                continue
+            try:
+                self.delete_fn(name)
+                print(f"🗑️ Cleaned up uploaded file: {name}")
+            except Exception as e:
+                print(f"⚠️ Could not delete uploaded file {name}: {e}")
+
+
+_default_registry: Optional[GeminiFileRegistry] = None
+
+
+def get_default_registry(delete_fn: Optional[Callable[[str], None]] = None) -> GeminiFileRegistry:
+    """Get the process-wide registry shared by all Gemini analyzers.
+
+    Remote files still held at interpreter exit are deleted.
+    """
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = GeminiFileRegistry(delete_fn=delete_fn)
+        atexit.register(_default_registry.clear, force=True)
+    elif _default_registry.delete_fn is None:
+        _default_registry.delete_fn = delete_fn
+    return _default_registry
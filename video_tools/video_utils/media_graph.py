@@ -0,0 +1,142 @@
+"""
+Single-pass multi-output ffmpeg graphs.
+
+A MediaGraph collects the derivatives wanted from one input - resized and
+converted copies, extracted frames, thumbnails - and compiles them into one
+ffmpeg invocation. The source video is decoded once and fanned out with a
+``split`` filter to every full-length output. Thumbnails read their own
+input-seeked copy of the source, which only decodes the GOP around the
+timestamp.
+
+Example:
+    graph = (MediaGraph(Path("input/clip.mp4"))
+             .thumbnail(Path("output/clip_thumb.jpg"))
+             .resize(Path("output/clip_720p.mp4"), 1280, 720)
+             .frames(Path("output/frames"), "1/5"))
+    graph.run()
+"""
+
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .ffmpeg_runner import run_ffmpeg
+from .trim_engine import parse_timestamp
+
+
+@dataclass
+class GraphOutput:
+    """One requested derivative of the graph's input."""
+    operation: str
+    output_path: Path
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+class MediaGraph:
+    """Several outputs of one input, rendered by a single ffmpeg invocation."""
+
+    OPERATIONS = ('thumbnail', 'frames', 'resize', 'convert')
+
+    def __init__(self, input_path: Path):
+        """Initialize an empty graph.
+
+        Args:
+            input_path: Source video
+        """
+        self.input_path = Path(input_path)
+        self.outputs: List[GraphOutput] = []
+
+    def thumbnail(self, output_path: Path, timestamp: str = "00:00:01") -> 'MediaGraph':
+        """Add a still image at a timestamp (HH:MM:SS format)."""
+        return self.add('thumbnail', output_path, timestamp=timestamp)
+
+    def frames(self, output_dir: Path, frame_rate: str = "1/10") -> 'MediaGraph':
+        """Add frame extraction ("1/10" is one frame every 10 seconds)."""
+        return self.add('frames', output_dir, frame_rate=frame_rate)
+
+    def resize(self, output_path: Path, width: int, height: int,
+               maintain_aspect: bool = True) -> 'MediaGraph':
+        """Add a resized copy; audio is copied unchanged."""
+        return self.add('resize', output_path, width=width, height=height,
+                        maintain_aspect=maintain_aspect)
+
+    def convert(self, output_path: Path, target_codec: str = 'libx264') -> 'MediaGraph':
+        """Add a re-encoded copy with another video codec and AAC audio."""
+        return self.add('convert', output_path, target_codec=target_codec)
+
+    def add(self, operation: str, output_path: Path, **options) -> 'MediaGraph':
+        """Add an output by operation name.
+
+        Args:
+            operation: 'thumbnail', 'frames', 'resize' or 'convert'
+            output_path: Output file (output directory for 'frames')
+            **options: Operation arguments (same as the VideoProcessor methods)
+
+        Returns:
+            The graph, for chaining
+        """
+        if operation not in self.OPERATIONS:
+            raise ValueError(f"Unknown graph operation: {operation}")
+        self.outputs.append(GraphOutput(operation, Path(output_path), options))
+        return self
+
+    def build_command(self) -> List[str]:
+        """Compile the graph to an ffmpeg command line.
+
+        Returns:
+            ffmpeg arguments
+
+        Raises:
+            ValueError: If the graph has no outputs
+        """
+        if not self.outputs:
+            raise ValueError("MediaGraph has no outputs")
+
+        inputs = ['-i', str(self.input_path)]
+        filters: List[str] = []
+        output_args: List[str] = []
+
+        shared = [o for o in self.outputs if o.operation != 'thumbnail']
+        if shared:
+            labels = ''.join(f"[v{i}]" for i in range(len(shared)))
+            filters.append(f"[0:v]split={len(shared)}{labels}")
+
+        for i, output in enumerate(shared):
+            opts = output.options
+            if output.operation == 'resize':
+                scale = f"scale={opts['width']}:{opts['height']}"
+                if opts.get('maintain_aspect', True):
+                    scale += ":force_original_aspect_ratio=decrease"
+                filters.append(f"[v{i}]{scale}[o{i}]")
+                output_args += ['-map', f"[o{i}]", '-map', '0:a?', '-c:a', 'copy', str(output.output_path)]
+            elif output.operation == 'convert':
+                output_args += ['-map', f"[v{i}]", '-map', '0:a?',
+                                '-c:v', opts.get('target_codec', 'libx264'), '-c:a', 'aac',
+                                str(output.output_path)]
+            elif output.operation == 'frames':
+                pattern = output.output_path / f"{self.input_path.stem}_frame_%04d.png"
+                filters.append(f"[v{i}]fps={opts.get('frame_rate', '1/10')}[o{i}]")
+                output_args += ['-map', f"[o{i}]", '-q:v', '2', str(pattern)]
+
+        thumbnails = [o for o in self.outputs if o.operation == 'thumbnail']
+        for n, output in enumerate(thumbnails, start=1):
+            timestamp = parse_timestamp(output.options.get('timestamp', "00:00:01"))
+            inputs += ['-ss', f"{timestamp:.6f}", '-i', str(self.input_path)]
+            output_args += ['-map', f"{n}:v:0", '-frames:v', '1', '-q:v', '2', str(output.output_path)]
+
+        cmd = ['ffmpeg', '-y'] + inputs
+        if filters:
+            cmd += ['-filter_complex', ';'.join(filters)]
+        return cmd + output_args
+
+    def run(self) -> subprocess.CompletedProcess:
+        """Render every output with one ffmpeg process.
+
+        Returns:
+            CompletedProcess with returncode and stderr
+        """
+        for output in self.outputs:
+            directory = output.output_path if output.operation == 'frames' else output.output_path.parent
+            directory.mkdir(parents=True, exist_ok=True)
+        return run_ffmpeg(self.build_command())
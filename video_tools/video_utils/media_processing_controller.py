@@ -595,7 +595,8 @@ class MediaProcessingController(BaseController):
             '1': 'Cut duration from all videos',
             '2': 'Resize all videos',
             '3': 'Convert all videos',
-            '4': 'Extract thumbnails from all'
+            '4': 'Extract thumbnails from all',
+            '5': 'Thumbnail + resize + convert in one pass (decodes each video once)'
         }
         
         operation_choice = self.get_user_choice("⚡ Select batch operation:", batch_options)
@@ -617,6 +618,18 @@ class MediaProcessingController(BaseController):
             timestamp = self.get_user_input("⏱️  Timestamp", "00:00:01")
             results = self.video_processor.batch_process(
                 self.input_dir, self.output_dir, 'thumbnail', timestamp=timestamp)
+        elif operation_choice == '5':
+            timestamp = self.get_user_input("⏱️  Thumbnail timestamp", "00:00:01")
+            width = int(self.get_user_input("📐 Width", "1920"))
+            height = int(self.get_user_input("📐 Height", "1080"))
+            codec = self.get_user_input("🔄 Codec", "libx264")
+            outputs = [
+                {'operation': 'thumbnail', 'timestamp': timestamp},
+                {'operation': 'resize', 'width': width, 'height': height},
+                {'operation': 'convert', 'target_codec': codec}
+            ]
+            results = self.video_processor.batch_process(
+                self.input_dir, self.output_dir, 'graph', outputs=outputs)
         else:
             if self.verbose:
                 print("❌ Invalid choice")
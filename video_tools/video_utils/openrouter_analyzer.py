@@ -19,11 +19,11 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 import os
 
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+from fal_common import get_host_client
+
+from .frame_sampler import DEFAULT_MAX_FRAMES, SampledFrame, sample_frames
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
 
 class OpenRouterAnalyzer:
@@ -31,11 +31,6 @@ class OpenRouterAnalyzer:
     
     def __init__(self, api_key: Optional[str] = None, model: str = "google/gemini-2.0-flash-001"):
         """Initialize with API key and model selection."""
-        if not OPENAI_AVAILABLE:
-            raise ImportError(
-                "OpenAI library not installed. Run: pip install openai"
-            )
-        
         self.api_key = api_key or os.getenv('OPENROUTER_API_KEY')
         if not self.api_key:
             raise ValueError(
@@ -43,10 +38,12 @@ class OpenRouterAnalyzer:
             )
         
         self.model = model
-        self.client = openai.OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=self.api_key,
-        )
+        # Pooled session with rate-limit aware retries shared by all OpenRouter callers
+        self.http = get_host_client(OPENROUTER_BASE_URL)
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
         
         print(f"✅ OpenRouter analyzer initialized with model: {model}")
     
@@ -75,100 +72,198 @@ class OpenRouterAnalyzer:
                 "content": content_list + [{"type": "text", "text": prompt}]
             }]
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=4000,
-                temperature=0.1
+            response = self.http.post(
+                f"{OPENROUTER_BASE_URL}/chat/completions",
+                headers=self.headers,
+                json={
+                    "model": self.model,
+                    "messages": messages,
+                    "max_tokens": 4000,
+                    "temperature": 0.1
+                },
+                timeout=120
             )
             
-            return response.choices[0].message.content
+            if response.status_code != 200:
+                raise RuntimeError(f"OpenRouter API error: HTTP {response.status_code} - {response.text[:200]}")
+            
+            return response.json()['choices'][0]['message']['content']
             
         except Exception as e:
             print(f"❌ Analysis failed: {e}")
             raise
     
-    # Video Analysis Methods
-    def describe_video(self, video_path: Path, detailed: bool = False) -> Dict[str, Any]:
-        """Generate video description and summary."""
-        print(f"🎬 Note: Video analysis requires file upload - using image frame analysis instead")
-        print(f"📝 For full video analysis, consider using direct Gemini API")
+    def _video_frames_content(self, video_path: Path, max_frames: int) -> tuple[List[Dict[str, Any]], List[SampledFrame]]:
+        """Sample representative frames and build a timestamped multi-image message."""
+        print(f"🎞️ Sampling up to {max_frames} frames from: {video_path.name}")
+        frames = sample_frames(video_path, max_frames=max_frames)
+        print(f"✅ Sampled {len(frames)} frames")
         
-        if detailed:
-            prompt = """Analyze this video content in detail and provide:
+        content_list = []
+        for i, frame in enumerate(frames, 1):
+            minutes, seconds = divmod(frame.timestamp, 60)
+            content_list.append({"type": "text", "text": f"Frame {i} at {int(minutes):02d}:{seconds:05.2f}"})
+            content_list.append({"type": "image_url", "image_url": {"url": frame.data_url}})
+        return content_list, frames
+    
+    def _analyze_video_frames(self, video_path: Path, prompt: str, max_frames: int) -> tuple[str, List[SampledFrame]]:
+        """Run a prompt over sampled frames of a video."""
+        content_list, frames = self._video_frames_content(video_path, max_frames)
+        preface = (f"The images above are {len(frames)} frames sampled in order from a video, "
+                   f"at scene changes and regular intervals, each labelled with its timestamp. "
+                   f"Treat them as the video's timeline.\n\n")
+        return self._analyze_with_prompt(content_list, preface + prompt), frames
+    
+    @staticmethod
+    def _frame_info(frames: List[SampledFrame]) -> Dict[str, Any]:
+        return {
+            'frames_analyzed': len(frames),
+            'frame_timestamps': [round(frame.timestamp, 2) for frame in frames]
+        }
+    
+    # Video Analysis Methods (sampled frames, no upload)
+    def describe_video(self, video_path: Path, detailed: bool = False,
+                       max_frames: int = DEFAULT_MAX_FRAMES) -> Dict[str, Any]:
+        """Generate video description and summary from sampled frames."""
+        try:
+            print(f"🎬 Analyzing video: {video_path.name}")
+            
+            if detailed:
+                prompt = """Analyze this video content in detail and provide:
 1. Overall summary and main topic
 2. Key scenes and their timestamps
 3. Visual elements (objects, people, settings, actions)
-4. Audio content (speech, music, sounds)
+4. On-screen text and captions
 5. Mood and tone
 6. Technical observations (quality, style, etc.)
 
 Provide structured analysis with clear sections."""
-        else:
-            prompt = """Provide a concise description of this video including:
+            else:
+                prompt = """Provide a concise description of this video including:
 - Main content and topic
 - Key visual elements
 - Brief summary of what happens
-- Duration and pacing"""
-        
-        result = {
-            'description': "Video analysis through OpenRouter requires direct file upload capabilities not available in this implementation. Consider using Gemini API directly for video analysis.",
-            'detailed': detailed,
-            'analysis_type': 'description',
-            'note': 'Full video analysis requires native file upload support'
-        }
-        
-        return result
+- Pacing"""
+            
+            description, frames = self._analyze_video_frames(video_path, prompt, max_frames)
+            
+            return {
+                'description': description,
+                'detailed': detailed,
+                'analysis_type': 'description',
+                **self._frame_info(frames)
+            }
+            
+        except Exception as e:
+            print(f"❌ Video description failed: {e}")
+            raise
     
-    def transcribe_video(self, video_path: Path, include_timestamps: bool = True) -> Dict[str, Any]:
-        """Transcribe audio content from video."""
-        print(f"🎤 Note: Video transcription requires file upload - not supported in OpenRouter implementation")
+    def transcribe_video(self, video_path: Path, include_timestamps: bool = True,
+                         max_frames: int = DEFAULT_MAX_FRAMES) -> Dict[str, Any]:
+        """Transcribe on-screen text (captions, titles, slides) from sampled frames.
         
-        result = {
-            'transcription': "Video transcription through OpenRouter requires direct file upload capabilities not available in this implementation. Consider using Whisper API or Gemini API directly.",
-            'include_timestamps': include_timestamps,
-            'analysis_type': 'transcription',
-            'note': 'Video transcription requires native file upload support'
-        }
-        
-        return result
+        Frames carry no audio, so speech is not included; use Whisper for spoken content.
+        """
+        try:
+            print(f"📝 Transcribing on-screen text: {video_path.name}")
+            
+            prompt = """Transcribe all text visible in these frames: subtitles and captions, titles, slides, signs and labels.
+- Keep the order in which the text appears
+- Merge text that stays on screen across consecutive frames
+- Say so if no text is visible"""
+            if include_timestamps:
+                prompt += "\n- Prefix each text with the timestamp of the frame where it first appears"
+            
+            transcription, frames = self._analyze_video_frames(video_path, prompt, max_frames)
+            
+            return {
+                'transcription': transcription,
+                'include_timestamps': include_timestamps,
+                'analysis_type': 'transcription',
+                'note': 'On-screen text only - spoken audio requires Whisper or Gemini',
+                **self._frame_info(frames)
+            }
+            
+        except Exception as e:
+            print(f"❌ Video transcription failed: {e}")
+            raise
     
-    def answer_questions(self, video_path: Path, questions: List[str]) -> Dict[str, Any]:
-        """Answer specific questions about the video."""
-        print(f"❓ Note: Video Q&A requires file upload - not supported in OpenRouter implementation")
-        
-        result = {
-            'questions': questions,
-            'answers': "Video Q&A through OpenRouter requires direct file upload capabilities not available in this implementation. Consider using Gemini API directly.",
-            'analysis_type': 'qa',
-            'note': 'Video Q&A requires native file upload support'
-        }
-        
-        return result
+    def answer_questions(self, video_path: Path, questions: List[str],
+                         max_frames: int = DEFAULT_MAX_FRAMES) -> Dict[str, Any]:
+        """Answer specific questions about the video from sampled frames."""
+        try:
+            print(f"❓ Answering questions about video: {video_path.name}")
+            
+            questions_text = "\n".join([f"{i+1}. {q}" for i, q in enumerate(questions)])
+            prompt = f"""Answer the following questions about this video:
+
+{questions_text}
+
+Base the answers on what the frames show and cite frame timestamps where relevant. If a question cannot be answered from the frames, please state that clearly."""
+            
+            answers, frames = self._analyze_video_frames(video_path, prompt, max_frames)
+            
+            return {
+                'questions': questions,
+                'answers': answers,
+                'analysis_type': 'qa',
+                **self._frame_info(frames)
+            }
+            
+        except Exception as e:
+            print(f"❌ Video Q&A failed: {e}")
+            raise
     
-    def analyze_scenes(self, video_path: Path) -> Dict[str, Any]:
-        """Analyze video scenes and create timeline breakdown."""
-        print(f"🎬 Note: Scene analysis requires file upload - not supported in OpenRouter implementation")
-        
-        result = {
-            'scene_analysis': "Scene analysis through OpenRouter requires direct file upload capabilities not available in this implementation. Consider using Gemini API directly.",
-            'analysis_type': 'scenes',
-            'note': 'Scene analysis requires native file upload support'
-        }
-        
-        return result
+    def analyze_scenes(self, video_path: Path, max_frames: int = DEFAULT_MAX_FRAMES) -> Dict[str, Any]:
+        """Analyze video scenes and create timeline breakdown from sampled frames."""
+        try:
+            print(f"🎬 Analyzing scenes: {video_path.name}")
+            
+            prompt = """Break this video down into scenes:
+1. Scene boundaries with start timestamps
+2. Setting, subjects and action in each scene
+3. Camera work and transitions between scenes
+4. How the scenes connect into an overall structure
+
+Provide a timeline-ordered scene list."""
+            
+            scene_analysis, frames = self._analyze_video_frames(video_path, prompt, max_frames)
+            
+            return {
+                'scene_analysis': scene_analysis,
+                'analysis_type': 'scenes',
+                **self._frame_info(frames)
+            }
+            
+        except Exception as e:
+            print(f"❌ Scene analysis failed: {e}")
+            raise
     
-    def extract_key_info(self, video_path: Path) -> Dict[str, Any]:
-        """Extract key information and insights from video."""
-        print(f"🔍 Note: Video info extraction requires file upload - not supported in OpenRouter implementation")
-        
-        result = {
-            'key_info': "Key info extraction through OpenRouter requires direct file upload capabilities not available in this implementation. Consider using Gemini API directly.",
-            'analysis_type': 'extraction',
-            'note': 'Video key info extraction requires native file upload support'
-        }
-        
-        return result
+    def extract_key_info(self, video_path: Path, max_frames: int = DEFAULT_MAX_FRAMES) -> Dict[str, Any]:
+        """Extract key information and insights from sampled video frames."""
+        try:
+            print(f"🔍 Extracting key info: {video_path.name}")
+            
+            prompt = """Extract the key information from this video:
+1. Main topic and purpose
+2. Important people, products, brands or locations
+3. Key facts, numbers and on-screen text
+4. Notable moments with timestamps
+5. Main takeaways
+
+Provide a structured summary."""
+            
+            key_info, frames = self._analyze_video_frames(video_path, prompt, max_frames)
+            
+            return {
+                'key_info': key_info,
+                'analysis_type': 'extraction',
+                **self._frame_info(frames)
+            }
+            
+        except Exception as e:
+            print(f"❌ Key info extraction failed: {e}")
+            raise
     
     # Audio Analysis Methods  
     def describe_audio(self, audio_path: Path, detailed: bool = False) -> Dict[str, Any]:
@@ -564,27 +659,25 @@ Focus on creating movement that feels natural and enhances the original image's
 
 def check_openrouter_requirements() -> tuple[bool, str]:
     """Check if OpenRouter requirements are met."""
-    if not OPENAI_AVAILABLE:
-        return False, "OpenAI library not installed"
-    
     api_key = os.getenv('OPENROUTER_API_KEY')
     if not api_key:
         return False, "OPENROUTER_API_KEY environment variable not set"
     
     try:
-        # Test API connection
-        client = openai.OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=api_key,
-        )
-        
         # Simple test call
-        response = client.chat.completions.create(
-            model="google/gemini-2.0-flash-001",
-            messages=[{"role": "user", "content": "Hello"}],
-            max_tokens=10
+        response = get_host_client(OPENROUTER_BASE_URL).post(
+            f"{OPENROUTER_BASE_URL}/chat/completions",
+            headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+            json={
+                "model": "google/gemini-2.0-flash-001",
+                "messages": [{"role": "user", "content": "Hello"}],
+                "max_tokens": 10
+            },
+            timeout=30
         )
         
+        if response.status_code != 200:
+            return False, f"OpenRouter API error: HTTP {response.status_code} - {response.text[:200]}"
         return True, "OpenRouter API ready"
     except Exception as e:
         return False, f"OpenRouter API error: {str(e)}"
\ No newline at end of file
@@ -21,8 +21,6 @@ def cmd_analyze_images_openrouter():
     openrouter_ready, message = check_openrouter_requirements()
     if not openrouter_ready:
         print(f"❌ OpenRouter not available: {message}")
-        if "not installed" in message:
-            print("📥 Install with: pip install openai")
         if "not set" in message:
             print("🔑 Set API key: export OPENROUTER_API_KEY=your_api_key")
             print("🌐 Get API key: https://openrouter.ai/keys")
@@ -218,15 +216,14 @@ def cmd_openrouter_info():
     print("")
     
     print("⚠️ Limitations:")
-    print("   • Video analysis requires file upload (not supported)")
+    print("   • Video analysis uses sampled frames (no audio, no motion between frames)")
     print("   • Audio analysis requires file upload (not supported)")
-    print("   • Use direct Gemini API for video/audio processing")
+    print("   • Use direct Gemini API for audio and full video processing")
     print("")
     
     print("🔧 Setup:")
     print("   1. Get API key: https://openrouter.ai/keys")
     print("   2. Set environment: export OPENROUTER_API_KEY=your_key")
-    print("   3. Install requirements: pip install openai")
     print("")
     
     # Check current setup
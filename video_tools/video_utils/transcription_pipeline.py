@@ -0,0 +1,151 @@
+"""
+Pipelined batch transcription.
+
+Batch transcription has two stages that use different resources:
+
+- audio extraction: ffmpeg, CPU-bound
+- transcription: the Whisper API (network-bound) or a local model (GPU/CPU)
+
+The pipeline runs the stages side by side. A pool of extraction workers feeds
+a bounded queue of audio files. Transcription workers drain the queue: several
+concurrent workers for the API, or a single worker for a local model, which
+keeps the one loaded model busy back to back. The bounded queue caps how many
+extracted WAV files wait on disk at once.
+
+Each result is passed to a callback as soon as it finishes, so callers can
+write it to disk immediately.
+
+Example:
+    pipeline = TranscriptionPipeline(transcriber, on_result=save)
+    results = pipeline.run(files, model_size="turbo")
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'}
+
+DEFAULT_API_WORKERS = 4
+
+# Called with (batch index starting at 1, source file, result) as each file finishes
+ResultCallback = Callable[[int, Path, Dict[str, Any]], None]
+
+
+def is_video_file(file_path: Path) -> bool:
+    """Check whether a file needs audio extraction before transcription."""
+    return file_path.suffix.lower() in VIDEO_EXTENSIONS
+
+
+@dataclass
+class _AudioItem:
+    index: int
+    source: Path
+    audio_path: Path
+    temporary: bool
+
+
+class TranscriptionPipeline:
+    """Overlap ffmpeg audio extraction with Whisper transcription."""
+
+    def __init__(self, transcriber: Any, extract_workers: Optional[int] = None,
+                 transcribe_workers: Optional[int] = None, queue_size: Optional[int] = None,
+                 on_result: Optional[ResultCallback] = None):
+        """Initialize the pipeline.
+
+        Args:
+            transcriber: WhisperTranscriber providing transcribe_audio_file and
+                _extract_audio_from_video
+            extract_workers: Concurrent ffmpeg extractions (default: CPU cores, max 4)
+            transcribe_workers: Concurrent transcriptions (default: 4 for the API,
+                always 1 for a local model)
+            queue_size: Extracted files waiting for transcription (default: 2 per transcriber)
+            on_result: Callback run for every finished file, in completion order
+        """
+        self.transcriber = transcriber
+        self.extract_workers = extract_workers or min(4, os.cpu_count() or 1)
+        if self._uses_local_model():
+            self.transcribe_workers = 1
+        else:
+            self.transcribe_workers = transcribe_workers or DEFAULT_API_WORKERS
+        self.queue_size = queue_size or 2 * self.transcribe_workers
+        self.on_result = on_result
+        self._callback_lock = threading.Lock()
+
+    def _uses_local_model(self) -> bool:
+        return bool(getattr(self.transcriber, 'use_local', False)) or \
+            getattr(self.transcriber, 'client', None) is None
+
+    def run(self, file_paths: List[Path], **transcribe_kwargs) -> List[Dict[str, Any]]:
+        """Transcribe files through the pipeline.
+
+        Failures of single files are returned as results with 'error' set
+        and do not stop the batch.
+
+        Args:
+            file_paths: Audio and video files
+            **transcribe_kwargs: Arguments passed to transcribe_audio_file
+
+        Returns:
+            One result per file, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(file_paths)
+        audio_queue: "queue.Queue[Optional[_AudioItem]]" = queue.Queue(maxsize=self.queue_size)
+
+        def finish(index: int, source: Path, result: Dict[str, Any]):
+            results[index - 1] = result
+            if self.on_result:
+                with self._callback_lock:
+                    try:
+                        self.on_result(index, source, result)
+                    except Exception as e:
+                        print(f"⚠️  Could not save result for {source.name}: {e}")
+
+        def extract(index: int, source: Path):
+            try:
+                if is_video_file(source):
+                    audio_path = self.transcriber._extract_audio_from_video(source)
+                    audio_queue.put(_AudioItem(index, source, audio_path, temporary=True))
+                else:
+                    audio_queue.put(_AudioItem(index, source, source, temporary=False))
+            except Exception as e:
+                finish(index, source, {'error': str(e), 'success': False})
+
+        def transcribe():
+            while True:
+                item = audio_queue.get()
+                if item is None:
+                    return
+                print(f"\n📊 Transcribing file {item.index}/{len(file_paths)}: {item.source.name}")
+                try:
+                    result = self.transcriber.transcribe_audio_file(item.audio_path, **transcribe_kwargs)
+                except Exception as e:
+                    print(f"❌ Failed to transcribe {item.source.name}: {e}")
+                    result = {'error': str(e), 'success': False}
+                finally:
+                    if item.temporary:
+                        item.audio_path.unlink(missing_ok=True)
+                finish(item.index, item.source, result)
+
+        print(f"🎤 Starting batch transcription of {len(file_paths)} files "
+              f"({self.extract_workers} extractors, {self.transcribe_workers} transcribers)")
+
+        consumers = [threading.Thread(target=transcribe, daemon=True)
+                     for _ in range(self.transcribe_workers)]
+        for consumer in consumers:
+            consumer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.extract_workers) as extractors:
+                for index, source in enumerate(file_paths, 1):
+                    extractors.submit(extract, index, Path(source))
+        finally:
+            for _ in consumers:
+                audio_queue.put(None)
+            for consumer in consumers:
+                consumer.join()
+
+        return [result or {'error': 'not processed', 'success': False} for result in results]
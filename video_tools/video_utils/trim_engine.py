@@ -0,0 +1,340 @@
+"""
+Keyframe-aware trimming engine.
+
+Every cut seeks on the input side (``-ss`` before ``-i``), so ffmpeg jumps
+straight to the cut instead of decoding from the start of the file. The
+engine then picks the cheapest exact way to produce the segment:
+
+- ``copy``: the start lines up with a keyframe (or the caller accepts
+  snapping to the keyframe before it) - lossless ``-c copy``, no decoding.
+- ``smart``: only the partial GOP between the start and the next keyframe
+  is re-encoded; the rest is stream-copied and the two parts are joined.
+- ``reencode``: the segment is re-encoded (short cuts inside one GOP,
+  codecs without a smart path, or when probing fails). Encoders keep the
+  source codecs when the output container accepts them and otherwise use
+  the container's defaults (VP9/Opus for WebM, H.264/AAC elsewhere). If the
+  re-encode still fails, the cut falls back to a copy from the keyframe
+  before the start.
+
+Keyframes are found with ffprobe reading packet flags only, limited to a
+window after the start, so probing a one-hour source costs milliseconds.
+"""
+
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Union
+
+from fal_common.media_probe import MediaInfo, ProbeError, probe_media
+
+from .ffmpeg_runner import run_ffmpeg
+
+# Seconds after the start searched for the next keyframe
+KEYFRAME_SEARCH_WINDOW = 30.0
+
+# Encoders used to re-encode boundary GOPs so they can be joined to copied packets
+SMART_VIDEO_ENCODERS = {'h264': 'libx264', 'hevc': 'libx265'}
+SMART_AUDIO_ENCODERS = {'aac': 'aac', 'mp3': 'libmp3lame', 'opus': 'libopus', 'ac3': 'ac3'}
+
+# Encoders used for full re-encodes, by source codec
+VIDEO_ENCODERS = {**SMART_VIDEO_ENCODERS, 'vp9': 'libvpx-vp9', 'vp8': 'libvpx'}
+AUDIO_ENCODERS = {**SMART_AUDIO_ENCODERS, 'vorbis': 'libvorbis'}
+
+# Codecs each container accepts and the encoders used when the source codec
+# does not fit; containers not listed (mkv, ...) take any codec
+CONTAINER_CODECS = {
+    '.webm': ({'vp8', 'vp9'}, {'opus', 'vorbis'}),
+    '.mp4': ({'h264', 'hevc'}, {'aac', 'mp3', 'ac3'}),
+    '.m4v': ({'h264', 'hevc'}, {'aac', 'mp3', 'ac3'}),
+    '.mov': ({'h264', 'hevc'}, {'aac', 'mp3', 'ac3'}),
+}
+CONTAINER_DEFAULT_ENCODERS = {'.webm': ('libvpx-vp9', 'libopus')}
+DEFAULT_ENCODERS = ('libx264', 'aac')
+
+Timestamp = Union[int, float, str]
+
+
+@dataclass
+class CutPlan:
+    """How a segment will be cut.
+
+    Attributes:
+        mode: 'copy', 'smart' or 'reencode'
+        start: Actual start in seconds (a keyframe when snapped)
+        end: End in seconds, or None for the end of the file
+        keyframe: First keyframe after the start; smart cuts copy from here
+    """
+    mode: str
+    start: float
+    end: Optional[float]
+    keyframe: Optional[float] = None
+
+
+@dataclass
+class CutResult:
+    """Outcome of a cut."""
+    success: bool
+    plan: CutPlan
+    stderr: str = ''
+
+
+def parse_timestamp(value: Timestamp) -> float:
+    """Convert seconds or an "HH:MM:SS(.ms)" / "MM:SS" string to seconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    seconds = 0.0
+    for part in str(value).strip().split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def probe_keyframes(input_path: Path, start: float, end: float, ffprobe: str = 'ffprobe') -> List[float]:
+    """Keyframe timestamps of the first video stream between start and end.
+
+    ffprobe seeks to the keyframe at or before ``start``, so it is included.
+    Only packet flags are read; nothing is decoded.
+
+    Args:
+        input_path: Video file
+        start: Window start in seconds
+        end: Window end in seconds
+        ffprobe: ffprobe executable
+
+    Returns:
+        Sorted keyframe timestamps
+
+    Raises:
+        ProbeError: If ffprobe fails
+    """
+    cmd = [
+        ffprobe, '-v', 'error', '-select_streams', 'v:0',
+        '-read_intervals', f"{start:.6f}%{end:.6f}",
+        '-show_entries', 'packet=pts_time,flags', '-of', 'csv=p=0', str(input_path)
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=60)
+    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        raise ProbeError(f"Could not read keyframes of {input_path.name}: {e}") from e
+
+    keyframes = set()
+    for line in result.stdout.splitlines():
+        pts_time, _, flags = line.partition(',')
+        if 'K' in flags:
+            try:
+                keyframes.add(float(pts_time))
+            except ValueError:
+                continue
+    return sorted(keyframes)
+
+
+def plan_cut(input_path: Path, start: float, end: Optional[float] = None,
+             snap_to_keyframes: bool = False, output_path: Optional[Path] = None) -> CutPlan:
+    """Choose how to cut [start, end) out of a file.
+
+    Args:
+        input_path: Source file
+        start: Start in seconds
+        end: End in seconds, or None for the end of the file
+        snap_to_keyframes: Move an unaligned start back to the previous keyframe
+            and stream-copy instead of re-encoding
+        output_path: Output file; audio is only stream-copied into the same file type
+
+    Returns:
+        CutPlan
+    """
+    try:
+        info = probe_media(input_path)
+    except ProbeError:
+        return CutPlan('reencode', start, end)
+
+    if end is not None and info.duration and end >= info.duration:
+        end = None
+    if not info.has_video:
+        # Every audio packet is independently decodable, but audio codecs rarely
+        # fit another container, so only copy into the same file type
+        same_type = output_path is None or Path(input_path).suffix.lower() == Path(output_path).suffix.lower()
+        return CutPlan('copy' if same_type else 'reencode', start, end)
+    if start <= 0:
+        return CutPlan('copy', 0.0, end)
+
+    window_end = start + KEYFRAME_SEARCH_WINDOW
+    if end is not None:
+        window_end = min(window_end, end)
+    try:
+        keyframes = probe_keyframes(input_path, start, window_end)
+    except ProbeError:
+        return CutPlan('reencode', start, end)
+
+    # Timestamps within half a frame of a keyframe count as aligned
+    fps = info.video.fps or 25.0
+    tolerance = 0.5 / fps
+    previous = [k for k in keyframes if k <= start + tolerance]
+    following = [k for k in keyframes if k >= start - tolerance]
+
+    if following and following[0] - start <= tolerance:
+        return CutPlan('copy', following[0], end, keyframe=following[0])
+    if snap_to_keyframes and previous:
+        return CutPlan('copy', previous[-1], end, keyframe=previous[-1])
+
+    next_keyframe = next((k for k in following if k > start + tolerance), None)
+    smart_possible = (
+        next_keyframe is not None
+        and (end is None or next_keyframe < end - tolerance)
+        and info.video.codec in SMART_VIDEO_ENCODERS
+        and (not info.has_audio or info.audio.codec in SMART_AUDIO_ENCODERS)
+        and _fits_container(info, output_path)
+    )
+    if smart_possible:
+        return CutPlan('smart', start, end, keyframe=next_keyframe)
+    return CutPlan('reencode', start, end)
+
+
+def cut_media(input_path: Path, output_path: Path, start: Timestamp = 0,
+              end: Optional[Timestamp] = None, duration: Optional[Timestamp] = None,
+              snap_to_keyframes: bool = False,
+              reencode_args: Optional[List[str]] = None) -> CutResult:
+    """Cut a segment out of a video or audio file.
+
+    Args:
+        input_path: Source file
+        output_path: Output file
+        start: Start (seconds or HH:MM:SS)
+        end: End (seconds or HH:MM:SS); ignored when duration is given
+        duration: Length (seconds or HH:MM:SS)
+        snap_to_keyframes: Accept a start moved back to the previous keyframe for a lossless copy
+        reencode_args: Codec arguments used when re-encoding (default: match the source codecs)
+
+    Returns:
+        CutResult with the plan that was used
+    """
+    start_s = parse_timestamp(start)
+    end_s = None
+    if duration is not None:
+        end_s = start_s + parse_timestamp(duration)
+    elif end is not None:
+        end_s = parse_timestamp(end)
+
+    plan = plan_cut(input_path, start_s, end_s, snap_to_keyframes, output_path)
+    copy_failed = False
+
+    if plan.mode == 'copy':
+        result = run_ffmpeg(_segment_cmd(input_path, output_path, plan.start, plan.end, ['-c', 'copy']),
+                            output_path)
+        if result.returncode == 0:
+            return CutResult(True, plan)
+        # The output container may not accept the source codecs; re-encode instead
+        copy_failed = True
+        plan = CutPlan('reencode', start_s, plan.end)
+
+    if plan.mode == 'smart':
+        result = _smart_cut(input_path, output_path, plan)
+        if result.returncode == 0:
+            return CutResult(True, plan)
+        plan = CutPlan('reencode', plan.start, plan.end)
+
+    args = reencode_args if reencode_args is not None else _reencode_args(input_path, output_path)
+    result = run_ffmpeg(_segment_cmd(input_path, output_path, plan.start, plan.end, args), output_path)
+    if result.returncode == 0 or copy_failed:
+        return CutResult(result.returncode == 0, plan, result.stderr)
+
+    # No usable encoder (e.g. an ffmpeg build without libvpx): copy from the
+    # keyframe before the start, as plain '-c copy' cuts always did
+    snapped = plan_cut(input_path, start_s, end_s, snap_to_keyframes=True, output_path=output_path)
+    if snapped.mode == 'copy':
+        copy_result = run_ffmpeg(_segment_cmd(input_path, output_path, snapped.start, snapped.end,
+                                              ['-c', 'copy']), output_path)
+        if copy_result.returncode == 0:
+            return CutResult(True, snapped)
+    return CutResult(False, plan, result.stderr)
+
+
+def _segment_cmd(input_path: Path, output_path: Path, start: float, end: Optional[float],
+                 codec_args: List[str]) -> List[str]:
+    cmd = ['ffmpeg', '-ss', f"{start:.6f}", '-i', str(input_path)]
+    if end is not None:
+        cmd.extend(['-t', f"{end - start:.6f}"])
+    cmd.extend(codec_args)
+    cmd.extend(['-avoid_negative_ts', 'make_zero', str(output_path), '-y'])
+    return cmd
+
+
+def _fits_container(info: MediaInfo, output_path: Optional[Path]) -> bool:
+    """Check whether the output container accepts the source codecs as they are."""
+    if output_path is None:
+        return True
+    video_codecs, audio_codecs = CONTAINER_CODECS.get(Path(output_path).suffix.lower(), (None, None))
+    if video_codecs is not None and info.has_video and info.video.codec not in video_codecs:
+        return False
+    return audio_codecs is None or not info.has_audio or info.audio.codec in audio_codecs
+
+
+def _reencode_args(input_path: Path, output_path: Optional[Path] = None) -> List[str]:
+    """Codec arguments for an exact re-encode; ffmpeg picks encoders for audio-only outputs."""
+    suffix = Path(output_path).suffix.lower() if output_path else ''
+    default_video, default_audio = CONTAINER_DEFAULT_ENCODERS.get(suffix, DEFAULT_ENCODERS)
+    try:
+        info = probe_media(input_path)
+    except ProbeError:
+        return ['-c:v', default_video, '-c:a', default_audio]
+    if not info.has_video:
+        return []
+
+    video_codecs, audio_codecs = CONTAINER_CODECS.get(suffix, (None, None))
+    args = _video_encode_args(info, video_codecs, default_video)
+    if info.has_audio:
+        codec = info.audio.codec
+        fits = audio_codecs is None or codec in audio_codecs
+        args.extend(['-c:a', AUDIO_ENCODERS[codec] if fits and codec in AUDIO_ENCODERS else default_audio])
+    return args
+
+
+def _video_encode_args(info: MediaInfo, allowed_codecs: Optional[set] = None,
+                       default_encoder: str = 'libx264') -> List[str]:
+    """Video encoder arguments keeping the source codec when the container allows it."""
+    codec = info.video.codec
+    fits = allowed_codecs is None or codec in allowed_codecs
+    encoder = VIDEO_ENCODERS[codec] if fits and codec in VIDEO_ENCODERS else default_encoder
+    args = ['-c:v', encoder, '-crf', '18']
+    if encoder.startswith('libvpx'):
+        # Constant quality mode for VP8/VP9
+        args.extend(['-b:v', '0', '-deadline', 'good', '-cpu-used', '4'])
+    else:
+        args.extend(['-preset', 'veryfast'])
+    if info.video.pix_fmt:
+        args.extend(['-pix_fmt', info.video.pix_fmt])
+    return args
+
+
+def _smart_cut(input_path: Path, output_path: Path, plan: CutPlan) -> subprocess.CompletedProcess:
+    """Re-encode [start, keyframe), copy [keyframe, end) and join the parts.
+
+    The parts are written as MPEG-TS so each keeps its own in-band codec
+    parameters; the join is a stream copy into the output container.
+    """
+    info = probe_media(input_path)
+    head_args = _video_encode_args(info)
+    if info.has_audio:
+        head_args.extend(['-c:a', SMART_AUDIO_ENCODERS[info.audio.codec]])
+        if info.audio.sample_rate:
+            head_args.extend(['-ar', str(info.audio.sample_rate)])
+        if info.audio.channels:
+            head_args.extend(['-ac', str(info.audio.channels)])
+
+    with tempfile.TemporaryDirectory(dir=output_path.parent) as temp_dir:
+        head = Path(temp_dir) / 'head.ts'
+        tail = Path(temp_dir) / 'tail.ts'
+        steps = [
+            (_segment_cmd(input_path, head, plan.start, plan.keyframe, head_args), head),
+            (_segment_cmd(input_path, tail, plan.keyframe, plan.end, ['-c', 'copy']), tail),
+        ]
+        for cmd, part in steps:
+            result = run_ffmpeg(cmd, part)
+            if result.returncode != 0:
+                return result
+
+        parts_list = Path(temp_dir) / 'parts.txt'
+        parts_list.write_text(f"file '{head}'\nfile '{tail}'\n", encoding='utf-8')
+        cmd = ['ffmpeg', '-f', 'concat', '-safe', '0', '-i', str(parts_list),
+               '-c', 'copy', str(output_path), '-y']
+        return run_ffmpeg(cmd, output_path)
@@ -4,28 +4,20 @@ Video processing utilities.
 Provides functions for video cutting and manipulation.
 """
 
-import subprocess
 from pathlib import Path
 
+from .trim_engine import cut_media
+
 
 def cut_video_duration(input_path: Path, output_path: Path, duration: int) -> bool:
-    """Cut first N seconds from video using ffmpeg."""
+    """Cut first N seconds from video using ffmpeg (stream copy, no re-encoding)."""
     try:
-        cmd = [
-            'ffmpeg', '-i', str(input_path),
-            '-t', str(duration),  # Duration in seconds
-            '-c', 'copy',  # Copy streams without re-encoding (faster)
-            '-avoid_negative_ts', 'make_zero',
-            str(output_path),
-            '-y'  # Overwrite output file if exists
-        ]
-        
         print(f"🎬 Processing: {input_path.name}")
         print(f"⏱️  Extracting first {duration} seconds...")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = cut_media(input_path, output_path, 0, duration=duration)
         
-        if result.returncode == 0:
+        if result.success:
             print(f"✅ Success: {output_path.name}")
             return True
         else:
@@ -11,6 +11,7 @@ Provides AI-powered multimodal analysis including:
 """
 
 import json
+import tempfile
 import time
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -29,11 +30,10 @@ try:
 except ImportError:
     OPENAI_WHISPER_API_AVAILABLE = False
 
-try:
-    import whisper
-    WHISPER_LOCAL_AVAILABLE = True
-except ImportError:
-    WHISPER_LOCAL_AVAILABLE = False
+from .whisper_chunking import transcribe_chunked
+# whisper itself is only imported by whisper_models, which loads the models
+from .whisper_models import WHISPER_LOCAL_AVAILABLE, get_model_registry
+from .transcription_pipeline import TranscriptionPipeline, is_video_file
 
 
 class GeminiVideoAnalyzer:
@@ -920,7 +920,7 @@ class WhisperTranscriber:
                 raise ImportError(
                     "Local Whisper not installed. Run: pip install openai-whisper"
                 )
-            self.model = None  # Will be loaded on first use
+            self.model = None  # Taken from the shared model registry on first use
         else:
             if not OPENAI_WHISPER_API_AVAILABLE:
                 raise ImportError(
@@ -936,12 +936,13 @@ class WhisperTranscriber:
             self.client = OpenAI(api_key=self.api_key)
     
     def _load_local_model(self, model_size: str = "turbo"):
-        """Load local Whisper model on demand."""
-        if self.model is None:
-            print(f"🔄 Loading Whisper {model_size} model...")
-            self.model = whisper.load_model(model_size)
-            print(f"✅ Whisper {model_size} model loaded")
-        return self.model
+        """Get a local Whisper model from the process-wide model registry.
+
+        Returns:
+            (model, seconds spent loading it - 0.0 if it was already loaded)
+        """
+        self.model, load_time = get_model_registry().get(model_size)
+        return self.model, load_time
     
     def transcribe_audio_file(self, audio_path: Path, 
                              language: Optional[str] = None,
@@ -957,10 +958,11 @@ class WhisperTranscriber:
             print(f"📊 File size: {file_size:.1f} MB")
             
             if not self.use_local and file_size > 25:
-                print("⚠️  File exceeds 25MB API limit, switching to local model...")
-                if not WHISPER_LOCAL_AVAILABLE:
-                    raise Exception("File too large for API and local Whisper not available")
-                self.use_local = True
+                print("📦 File exceeds 25MB API limit, transcribing in parallel chunks...")
+                result = transcribe_chunked(self.client, audio_path, language, response_format=response_format)
+                result.update({'method': 'openai_api', 'model': 'whisper-1'})
+                print("✅ API transcription complete")
+                return result
             
             if self.use_local:
                 return self._transcribe_local(audio_path, model_size, include_timestamps)
@@ -1037,7 +1039,7 @@ class WhisperTranscriber:
         try:
             print(f"💻 Using local Whisper {model_size} model...")
             
-            model = self._load_local_model(model_size)
+            model, load_time = self._load_local_model(model_size)
             
             # Transcribe with options
             options = {
@@ -1045,7 +1047,9 @@ class WhisperTranscriber:
                 "language": None,  # Auto-detect language
             }
             
+            start = time.perf_counter()
             result = model.transcribe(str(audio_path), **options)
+            inference_time = time.perf_counter() - start
             
             # Structure the response
             transcription_result = {
@@ -1053,7 +1057,9 @@ class WhisperTranscriber:
                 'method': 'local_whisper',
                 'model': model_size,
                 'language': result.get('language'),
-                'duration': None
+                'duration': None,
+                'load_time': round(load_time, 3),
+                'inference_time': round(inference_time, 3)
             }
             
             if include_timestamps and 'segments' in result:
@@ -1070,7 +1076,7 @@ class WhisperTranscriber:
                 if result['segments']:
                     transcription_result['duration'] = result['segments'][-1]['end']
             
-            print("✅ Local transcription complete")
+            print(f"✅ Local transcription complete (load {load_time:.1f}s, inference {inference_time:.1f}s)")
             return transcription_result
             
         except Exception as e:
@@ -1085,12 +1091,13 @@ class WhisperTranscriber:
             if extract_audio:
                 # Extract audio from video first
                 audio_path = self._extract_audio_from_video(video_path)
-                result = self.transcribe_audio_file(audio_path, **kwargs)
-                
-                # Clean up temporary audio file
-                if audio_path.exists():
-                    audio_path.unlink()
-                    print("🗑️ Cleaned up temporary audio file")
+                try:
+                    result = self.transcribe_audio_file(audio_path, **kwargs)
+                finally:
+                    # Clean up temporary audio file
+                    if audio_path.exists():
+                        audio_path.unlink()
+                        print("🗑️ Cleaned up temporary audio file")
                 
                 result['source'] = 'video'
                 result['video_file'] = str(video_path)
@@ -1110,7 +1117,10 @@ class WhisperTranscriber:
         """Extract audio from video using ffmpeg."""
         import subprocess
         
-        audio_path = video_path.parent / f"{video_path.stem}_temp_audio.wav"
+        # Unique temporary file, so concurrent jobs on same-named videos do not collide
+        fd, temp_name = tempfile.mkstemp(prefix=f"{video_path.stem}_", suffix="_audio.wav")
+        os.close(fd)
+        audio_path = Path(temp_name)
         
         try:
             print(f"🎵 Extracting audio from video...")
@@ -1131,6 +1141,7 @@ class WhisperTranscriber:
             
         except Exception as e:
             print(f"❌ Audio extraction failed: {e}")
+            audio_path.unlink(missing_ok=True)
             raise
 
 
@@ -1306,59 +1317,40 @@ def batch_transcribe_whisper(file_paths: List[Path],
                             use_local: bool = False,
                             model_size: str = "turbo",
                             language: Optional[str] = None,
-                            save_results: bool = True) -> List[Dict[str, Any]]:
-    """Batch transcribe multiple files with Whisper."""
-    results = []
+                            save_results: bool = True,
+                            max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Batch transcribe multiple files with Whisper.
+
+    Audio extraction runs ahead of transcription in a pipeline, and API
+    transcriptions run concurrently (max_workers). Results are saved as
+    each file finishes.
+    """
+    def save_result(index: int, file_path: Path, result: Dict[str, Any]):
+        result['file_path'] = str(file_path)
+        if 'error' in result:
+            result['text'] = None
+            return
+        if is_video_file(file_path):
+            result['source'] = 'video'
+            result['video_file'] = str(file_path)
+        
+        # Save individual result if requested
+        if save_results:
+            output_file = file_path.parent / f"{file_path.stem}_whisper_transcription.json"
+            save_analysis_result(result, output_file)
+            
+            # Also save text version
+            txt_file = file_path.parent / f"{file_path.stem}_whisper_transcription.txt"
+            with open(txt_file, 'w', encoding='utf-8') as f:
+                f.write(result['text'])
+        
+        print(f"✅ Successfully transcribed: {file_path.name}")
     
     try:
         transcriber = WhisperTranscriber(use_local=use_local)
-        
-        for i, file_path in enumerate(file_paths, 1):
-            print(f"\n📁 Processing file {i}/{len(file_paths)}: {file_path.name}")
-            
-            try:
-                # Check if it's a video file
-                video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv'}
-                if file_path.suffix.lower() in video_extensions:
-                    result = transcriber.transcribe_video_audio(
-                        file_path,
-                        model_size=model_size,
-                        language=language,
-                        include_timestamps=True
-                    )
-                else:
-                    result = transcriber.transcribe_audio_file(
-                        file_path,
-                        model_size=model_size,
-                        language=language,
-                        include_timestamps=True
-                    )
-                
-                result['file_path'] = str(file_path)
-                results.append(result)
-                
-                # Save individual result if requested
-                if save_results:
-                    output_file = file_path.parent / f"{file_path.stem}_whisper_transcription.json"
-                    save_analysis_result(result, output_file)
-                    
-                    # Also save text version
-                    txt_file = file_path.parent / f"{file_path.stem}_whisper_transcription.txt"
-                    with open(txt_file, 'w', encoding='utf-8') as f:
-                        f.write(result['text'])
-                
-                print(f"✅ Successfully transcribed: {file_path.name}")
-                
-            except Exception as e:
-                print(f"❌ Failed to transcribe {file_path.name}: {e}")
-                results.append({
-                    'file_path': str(file_path),
-                    'error': str(e),
-                    'text': None
-                })
-        
-        return results
+        pipeline = TranscriptionPipeline(transcriber, transcribe_workers=max_workers, on_result=save_result)
+        return pipeline.run(file_paths, model_size=model_size, language=language, include_timestamps=True)
         
     except Exception as e:
         print(f"❌ Batch transcription failed: {e}")
-        return results
\ No newline at end of file
+        return []
\ No newline at end of file
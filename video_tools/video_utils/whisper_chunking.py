@@ -0,0 +1,290 @@
+"""
+Chunked Whisper API transcription for audio above the 25MB upload limit.
+
+Long audio is transcribed as follows:
+
+1. One ffmpeg ``silencedetect`` pass finds the duration and the silences.
+2. The timeline is cut at silences into chunks that stay under the size cap
+   once encoded. Each chunk is padded with a little overlap on both sides.
+3. The chunks are encoded to mono Opus, which holds about 100 minutes of
+   speech per 25MB, and uploaded concurrently.
+4. The segment timestamps are shifted back to the source timeline, and
+   text, SRT or WebVTT output is rendered from the stitched segments.
+
+A chunk owns the span between its two cut points. A segment is kept only by
+the chunk that owns its midpoint, so speech transcribed twice in an overlap
+appears once. An hour-long recording takes about as long as its longest
+chunk.
+
+Example:
+    result = transcribe_chunked(OpenAI(), Path("lecture.wav"), language="en")
+    print(result['text'])
+"""
+
+import re
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ffmpeg_runner import media_duration
+
+# OpenAI Whisper API upload limit
+API_MAX_BYTES = 25 * 1024 * 1024
+
+# Chunk encoding: mono 16kHz Opus is ~4KB/s and transcribes as well as WAV
+CHUNK_BITRATE = 32000
+CHUNK_CODEC_ARGS = ['-vn', '-ac', '1', '-ar', '16000', '-c:a', 'libopus', '-b:a', '32k']
+CHUNK_SUFFIX = '.ogg'
+
+# Chunks are kept short enough to transcribe in parallel
+DEFAULT_CHUNK_SECONDS = 600.0
+DEFAULT_OVERLAP_SECONDS = 2.0
+DEFAULT_MAX_WORKERS = 4
+
+# Response formats the stitched result can be returned in
+JSON_FORMATS = ('json', 'verbose_json')
+RENDERED_FORMATS = ('text', 'srt', 'vtt')
+
+_DURATION_RE = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+_SILENCE_RE = re.compile(r"silence_(start|end): (-?\d+(?:\.\d+)?)")
+
+
+@dataclass
+class AudioChunk:
+    """A slice of the source audio sent to the API as one upload."""
+    index: int
+    start: float      # Encoded span, overlap included
+    end: float
+    own_start: float  # Span whose segments this chunk keeps
+    own_end: float
+
+
+def detect_silences(audio_path: Path, noise_db: int = -35,
+                    min_silence: float = 0.5) -> Tuple[Optional[float], List[Tuple[float, float]]]:
+    """Find silences with ffmpeg silencedetect.
+
+    Args:
+        audio_path: Audio or video file
+        noise_db: Level below which audio counts as silence
+        min_silence: Shortest silence to report, in seconds
+
+    Returns:
+        (duration in seconds or None if ffmpeg did not report it, [(start, end), ...])
+    """
+    cmd = [
+        'ffmpeg', '-hide_banner', '-nostats', '-i', str(audio_path),
+        '-vn', '-af', f'silencedetect=noise={noise_db}dB:d={min_silence}',
+        '-f', 'null', '-'
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Silence detection failed: {result.stderr.strip()[-500:]}")
+
+    duration = None
+    match = _DURATION_RE.search(result.stderr)
+    if match:
+        hours, minutes, seconds = match.groups()
+        duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    silences = []
+    start = None
+    for kind, value in _SILENCE_RE.findall(result.stderr):
+        if kind == 'start':
+            start = max(0.0, float(value))
+        elif start is not None:
+            silences.append((start, float(value)))
+            start = None
+    if start is not None and duration is not None:
+        silences.append((start, duration))
+    return duration, silences
+
+
+def plan_chunks(duration: float, silences: List[Tuple[float, float]],
+                max_chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+                overlap: float = DEFAULT_OVERLAP_SECONDS) -> List[AudioChunk]:
+    """Split a timeline into chunks cut in the middle of silences.
+
+    Each cut goes at the last silence that keeps the chunk at most
+    ``max_chunk_seconds`` long. Silences in the first half of a chunk are
+    ignored so that chunks do not get tiny. Without a usable silence the
+    chunk is cut at the maximum length and the overlap covers the cut word.
+
+    Args:
+        duration: Length of the audio in seconds
+        silences: (start, end) silences from detect_silences
+        max_chunk_seconds: Longest chunk, overlap included
+        overlap: Seconds of audio repeated on each side of a cut
+
+    Returns:
+        Chunks in timeline order
+    """
+    span = max(1.0, max_chunk_seconds - 2 * overlap)
+    midpoints = sorted((start + end) / 2 for start, end in silences)
+
+    cuts = [0.0]
+    while duration - cuts[-1] > span:
+        earliest, latest = cuts[-1] + span / 2, cuts[-1] + span
+        candidates = [m for m in midpoints if earliest <= m <= latest]
+        cuts.append(candidates[-1] if candidates else latest)
+    cuts.append(duration)
+
+    return [
+        AudioChunk(index=i, start=max(0.0, cuts[i] - overlap), end=min(duration, cuts[i + 1] + overlap),
+                   own_start=cuts[i], own_end=cuts[i + 1])
+        for i in range(len(cuts) - 1)
+    ]
+
+
+def _field(item: Any, name: str, default: Any = None) -> Any:
+    """Read a field from an SDK object or a plain dict."""
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+def stitch_segments(chunk_results: List[Tuple[AudioChunk, Any]]) -> List[Dict[str, Any]]:
+    """Merge per-chunk API responses into one timeline.
+
+    Segment times are shifted by the chunk start. A segment is kept only if
+    its midpoint lies in the span its chunk owns, which drops the copies
+    transcribed twice in overlaps.
+
+    Args:
+        chunk_results: (chunk, verbose_json transcription) pairs
+
+    Returns:
+        Segments with 'start', 'end' and 'text', in timeline order
+    """
+    segments = []
+    ordered = sorted(chunk_results, key=lambda pair: pair[0].index)
+    for position, (chunk, transcription) in enumerate(ordered):
+        is_last = position == len(ordered) - 1
+        for segment in _field(transcription, 'segments') or []:
+            start = chunk.start + float(_field(segment, 'start', 0.0))
+            end = chunk.start + float(_field(segment, 'end', 0.0))
+            middle = (start + end) / 2
+            if middle < chunk.own_start or (middle >= chunk.own_end and not is_last):
+                continue
+            text = (_field(segment, 'text', '') or '').strip()
+            if text:
+                segments.append({'start': round(start, 3), 'end': round(end, 3), 'text': text})
+    return segments
+
+
+def _timestamp(seconds: float, separator: str) -> str:
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3600000)
+    minutes, millis = divmod(millis, 60000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def render_segments(segments: List[Dict[str, Any]], response_format: str) -> str:
+    """Render stitched segments the way the API renders a non-JSON response.
+
+    Args:
+        segments: Segments with 'start', 'end' and 'text'
+        response_format: 'text', 'srt' or 'vtt'
+
+    Returns:
+        Transcript text, SRT or WebVTT document
+    """
+    if response_format == 'text':
+        return ' '.join(segment['text'] for segment in segments) + '\n'
+    if response_format == 'srt':
+        cues = [f"{number}\n{_timestamp(s['start'], ',')} --> {_timestamp(s['end'], ',')}\n{s['text']}\n"
+                for number, s in enumerate(segments, 1)]
+        return '\n'.join(cues)
+    if response_format == 'vtt':
+        cues = [f"{_timestamp(s['start'], '.')} --> {_timestamp(s['end'], '.')}\n{s['text']}\n"
+                for s in segments]
+        return '\n'.join(['WEBVTT\n'] + cues)
+    raise ValueError(f"Unsupported response format: {response_format}")
+
+
+def _encode_chunk(audio_path: Path, chunk: AudioChunk, output_dir: Path) -> Path:
+    output = output_dir / f"chunk_{chunk.index:03d}{CHUNK_SUFFIX}"
+    cmd = [
+        'ffmpeg', '-y', '-v', 'error',
+        '-ss', f"{chunk.start:.3f}", '-t', f"{chunk.end - chunk.start:.3f}", '-i', str(audio_path),
+        *CHUNK_CODEC_ARGS, str(output)
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0 or not output.exists():
+        raise RuntimeError(f"Encoding chunk {chunk.index + 1} failed: {result.stderr.strip()[-500:]}")
+    if output.stat().st_size > API_MAX_BYTES:
+        raise RuntimeError(f"Chunk {chunk.index + 1} is still over the 25MB API limit")
+    return output
+
+
+def transcribe_chunked(client: Any, audio_path: Path, language: Optional[str] = None,
+                       max_chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+                       overlap: float = DEFAULT_OVERLAP_SECONDS,
+                       max_workers: int = DEFAULT_MAX_WORKERS,
+                       model: str = "whisper-1", response_format: str = "json") -> Dict[str, Any]:
+    """Transcribe audio of any length with the Whisper API.
+
+    Args:
+        client: OpenAI client
+        audio_path: Audio or video file
+        language: Language code (None: detected by the API)
+        max_chunk_seconds: Longest chunk (lowered further if the encoded size could exceed 25MB)
+        overlap: Seconds of audio repeated on each side of a cut
+        max_workers: Chunks encoded and transcribed at once
+        model: API model name
+        response_format: 'json', 'verbose_json', 'text', 'srt' or 'vtt'
+
+    Returns:
+        Dictionary with 'text', 'language', 'segments', 'duration' and 'chunks'.
+        For 'text', 'srt' and 'vtt', 'text' holds the rendered output and
+        'format' the format name.
+
+    Raises:
+        ValueError: If response_format is not supported
+    """
+    if response_format not in JSON_FORMATS + RENDERED_FORMATS:
+        raise ValueError(f"Unsupported response format: {response_format}")
+
+    duration, silences = detect_silences(audio_path)
+    if duration is None:
+        duration = media_duration(audio_path)
+    if not duration:
+        raise RuntimeError(f"Could not determine the duration of {audio_path.name}")
+
+    # Leave 10% headroom for container overhead and bitrate variation
+    size_cap_seconds = API_MAX_BYTES * 0.9 * 8 / CHUNK_BITRATE
+    chunks = plan_chunks(duration, silences, min(max_chunk_seconds, size_cap_seconds), overlap)
+    print(f"✂️  Splitting {duration / 60:.1f} min into {len(chunks)} chunks "
+          f"({len(silences)} silences found)")
+
+    with tempfile.TemporaryDirectory(prefix="whisper_chunks_") as temp_dir:
+        def transcribe(chunk: AudioChunk):
+            chunk_path = _encode_chunk(audio_path, chunk, Path(temp_dir))
+            kwargs = {'model': model, 'response_format': 'verbose_json',
+                      'timestamp_granularities': ['segment']}
+            if language:
+                kwargs['language'] = language
+            with open(chunk_path, 'rb') as chunk_file:
+                transcription = client.audio.transcriptions.create(file=chunk_file, **kwargs)
+            print(f"   ✅ Chunk {chunk.index + 1}/{len(chunks)} "
+                  f"({chunk.start:.0f}s-{chunk.end:.0f}s)")
+            return chunk, transcription
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            chunk_results = list(executor.map(transcribe, chunks))
+
+    segments = stitch_segments(chunk_results)
+    detected = next((_field(t, 'language') for _, t in chunk_results if _field(t, 'language')), None)
+    result = {
+        'text': ' '.join(segment['text'] for segment in segments),
+        'language': language or detected,
+        'segments': segments,
+        'duration': duration,
+        'chunks': len(chunks)
+    }
+    if response_format in RENDERED_FORMATS:
+        result.update({'text': render_segments(segments, response_format), 'format': response_format})
+    return result
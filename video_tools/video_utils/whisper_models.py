@@ -0,0 +1,220 @@
+"""
+Process-wide registry of loaded local Whisper models.
+
+Loading Whisper weights takes seconds (turbo and large are several GB), so
+models are loaded once per (model size, device) and shared by every
+WhisperTranscriber and batch in the process. Least recently used models are
+evicted when the registry holds more than ``max_models`` models or more than
+``max_memory_mb`` of weights.
+
+Example:
+    registry = get_model_registry()
+    registry.warm(["turbo"])              # optional, e.g. at startup
+    model, load_time = registry.get("turbo")
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+try:
+    import whisper
+    WHISPER_LOCAL_AVAILABLE = True
+except ImportError:
+    WHISPER_LOCAL_AVAILABLE = False
+
+# Models kept loaded at once unless WHISPER_MAX_MODELS overrides it
+DEFAULT_MAX_MODELS = 2
+
+ModelKey = Tuple[str, str]
+
+
+def default_device() -> str:
+    """CUDA if torch sees a GPU, otherwise CPU."""
+    try:
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        return "cpu"
+
+
+def model_memory_mb(model: Any) -> float:
+    """Size of a model's parameters in MB (0 if it has no torch parameters)."""
+    try:
+        return sum(p.numel() * p.element_size() for p in model.parameters()) / (1024 * 1024)
+    except (AttributeError, TypeError):
+        return 0.0
+
+
+def _load_whisper_model(model_size: str, device: str) -> Any:
+    if not WHISPER_LOCAL_AVAILABLE:
+        raise ImportError("whisper package not installed. Run: pip install openai-whisper")
+    return whisper.load_model(model_size, device=device)
+
+
+class WhisperModelRegistry:
+    """Thread-safe LRU cache of loaded Whisper models keyed by (model size, device)."""
+
+    def __init__(self, max_models: int = DEFAULT_MAX_MODELS, max_memory_mb: Optional[float] = None,
+                 loader: Optional[Callable[[str, str], Any]] = None):
+        """Initialize the registry.
+
+        Args:
+            max_models: Maximum number of loaded models
+            max_memory_mb: Maximum total parameter memory in MB (None: no limit)
+            loader: Function loading a model from (model_size, device)
+                (default: whisper.load_model)
+        """
+        self.max_models = max(1, max_models)
+        self.max_memory_mb = max_memory_mb
+        self.loader = loader or _load_whisper_model
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+        self._models: "OrderedDict[ModelKey, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[ModelKey, threading.Lock] = {}
+
+    def get(self, model_size: str, device: Optional[str] = None) -> Tuple[Any, float]:
+        """Get a loaded model, loading it on first use.
+
+        Concurrent requests for the same model wait for a single load.
+
+        Args:
+            model_size: Whisper model name ('tiny', 'base', 'small', 'medium', 'large', 'turbo')
+            device: 'cpu' or 'cuda' (default: CUDA when available)
+
+        Returns:
+            (model, seconds spent loading it - 0.0 when it was already loaded)
+        """
+        key = (model_size, device or default_device())
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    self._models.move_to_end(key)
+                    self.hits += 1
+                    return entry[0], 0.0
+
+            print(f"🤖 Loading Whisper model: {model_size} ({key[1]})")
+            start = time.perf_counter()
+            model = self.loader(*key)
+            load_time = time.perf_counter() - start
+            print(f"✅ Whisper {model_size} loaded in {load_time:.1f}s")
+
+            with self._lock:
+                self.loads += 1
+                self._models[key] = (model, model_memory_mb(model))
+                self._evict(keep=key)
+            return model, load_time
+
+    def warm(self, model_sizes: Iterable[str], device: Optional[str] = None,
+             background: bool = False) -> Optional[threading.Thread]:
+        """Load models ahead of the first transcription.
+
+        Args:
+            model_sizes: Models to load
+            device: Device for all models (default: CUDA when available)
+            background: Load in a daemon thread instead of blocking
+
+        Returns:
+            The loading thread when background is True
+        """
+        def load_all():
+            for model_size in model_sizes:
+                try:
+                    self.get(model_size, device)
+                except Exception as e:
+                    print(f"⚠️  Could not warm Whisper model {model_size}: {e}")
+
+        if not background:
+            load_all()
+            return None
+        thread = threading.Thread(target=load_all, daemon=True)
+        thread.start()
+        return thread
+
+    def unload(self, model_size: str, device: Optional[str] = None) -> bool:
+        """Drop a model from the registry; returns True if it was loaded."""
+        with self._lock:
+            removed = self._models.pop((model_size, device or default_device()), None) is not None
+        if removed:
+            _release_gpu_memory()
+        return removed
+
+    def clear(self):
+        """Drop all loaded models."""
+        with self._lock:
+            self._models.clear()
+        _release_gpu_memory()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get loaded models, their memory and hit/load/eviction counts."""
+        with self._lock:
+            return {
+                'models': [f"{size}@{device}" for size, device in self._models],
+                'memory_mb': round(sum(mb for _, mb in self._models.values()), 1),
+                'hits': self.hits,
+                'loads': self.loads,
+                'evictions': self.evictions
+            }
+
+    def _evict(self, keep: ModelKey):
+        """Evict least recently used models over the limits (caller holds the lock)."""
+        def over_limits() -> bool:
+            if len(self._models) > self.max_models:
+                return True
+            if self.max_memory_mb is None:
+                return False
+            return sum(mb for _, mb in self._models.values()) > self.max_memory_mb
+
+        evicted = False
+        while over_limits():
+            key = next((k for k in self._models if k != keep), None)
+            if key is None:
+                break
+            del self._models[key]
+            self.evictions += 1
+            evicted = True
+            print(f"♻️ Unloaded Whisper model: {key[0]} ({key[1]})")
+        if evicted:
+            _release_gpu_memory()
+
+
+def _release_gpu_memory():
+    try:
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except ImportError:
+        pass
+
+
+_registry: Optional[WhisperModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> WhisperModelRegistry:
+    """Get the process-wide model registry.
+
+    Limits come from WHISPER_MAX_MODELS and WHISPER_MAX_MODEL_MEMORY_MB. Models
+    listed in WHISPER_WARM_MODELS (comma-separated) start loading in the
+    background when the registry is first created.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            max_memory = os.getenv('WHISPER_MAX_MODEL_MEMORY_MB')
+            _registry = WhisperModelRegistry(
+                max_models=int(os.getenv('WHISPER_MAX_MODELS', DEFAULT_MAX_MODELS)),
+                max_memory_mb=float(max_memory) if max_memory else None
+            )
+            warm_models = [m.strip() for m in os.getenv('WHISPER_WARM_MODELS', '').split(',') if m.strip()]
+            if warm_models and WHISPER_LOCAL_AVAILABLE:
+                _registry.warm(warm_models, background=True)
+    return _registry
@@ -8,6 +8,7 @@ Supports multiple audio formats and languages with timestamp extraction.
 import json
 import subprocess
 import tempfile
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import os
@@ -18,24 +19,26 @@ try:
 except ImportError:
     OPENAI_WHISPER_API_AVAILABLE = False
 
-try:
-    import whisper
-    WHISPER_LOCAL_AVAILABLE = True
-except ImportError:
-    WHISPER_LOCAL_AVAILABLE = False
+from .whisper_chunking import transcribe_chunked
+# whisper itself is only imported by whisper_models, which loads the models
+from .whisper_models import WHISPER_LOCAL_AVAILABLE, get_model_registry
+from .transcription_pipeline import TranscriptionPipeline, is_video_file
 
 
 class WhisperTranscriber:
     """OpenAI Whisper transcriber for audio and video files."""
     
-    def __init__(self, api_key: Optional[str] = None, use_local: bool = False):
+    def __init__(self, api_key: Optional[str] = None, use_local: bool = False,
+                 device: Optional[str] = None):
         """Initialize the transcriber.
         
         Args:
             api_key: OpenAI API key (if using API)
             use_local: Whether to use local Whisper model by default
+            device: Device for local models ('cpu' or 'cuda', default: CUDA when available)
         """
         self.use_local = use_local
+        self.device = device
         self.local_model = None
         
         # Setup API client if available and requested
@@ -52,18 +55,24 @@ class WhisperTranscriber:
         if use_local and WHISPER_LOCAL_AVAILABLE:
             self._load_local_model()
     
-    def _load_local_model(self, model_size: str = "turbo"):
-        """Load local Whisper model."""
+    def _load_local_model(self, model_size: str = "turbo") -> float:
+        """Get a local Whisper model from the shared model registry.
+        
+        Models are loaded once per process and shared by all transcribers.
+        
+        Returns:
+            Seconds spent loading the model (0.0 if it was already loaded)
+        """
         if not WHISPER_LOCAL_AVAILABLE:
             raise ImportError("whisper package not installed. Run: pip install openai-whisper")
         
         try:
-            print(f"🤖 Loading Whisper model: {model_size}")
-            self.local_model = whisper.load_model(model_size)
-            print("✅ Local Whisper model loaded")
+            self.local_model, load_time = get_model_registry().get(model_size, self.device)
+            return load_time
         except Exception as e:
             print(f"❌ Failed to load local model: {e}")
             self.local_model = None
+            return 0.0
     
     def transcribe_audio_file(self, audio_path: Path, language: Optional[str] = None,
                              model_size: str = "turbo", include_timestamps: bool = True,
@@ -98,10 +107,14 @@ class WhisperTranscriber:
             raise ValueError("OpenAI API client not available")
         
         try:
-            # Check file size (25MB limit for API)
+            # Files over the 25MB API limit are split and transcribed in parallel chunks
             file_size = audio_path.stat().st_size / (1024 * 1024)  # MB
             if file_size > 25:
-                raise ValueError(f"File too large for API: {file_size:.1f}MB (max 25MB)")
+                print(f"📦 {file_size:.1f}MB is over the 25MB API limit, transcribing in chunks")
+                result = transcribe_chunked(self.client, audio_path, language, response_format=response_format)
+                result.update({'method': 'api', 'model': 'whisper-1', 'file_size_mb': file_size})
+                print("✅ API transcription complete")
+                return result
             
             print(f"📤 Uploading to OpenAI API ({file_size:.1f}MB)")
             
@@ -141,8 +154,7 @@ class WhisperTranscriber:
     def _transcribe_local(self, audio_path: Path, model_size: str,
                          include_timestamps: bool) -> Dict[str, Any]:
         """Transcribe using local Whisper model."""
-        if not self.local_model or self.local_model.dims.n_vocab != whisper.load_model(model_size).dims.n_vocab:
-            self._load_local_model(model_size)
+        load_time = self._load_local_model(model_size)
         
         if not self.local_model:
             raise RuntimeError("Local Whisper model not available")
@@ -159,7 +171,9 @@ class WhisperTranscriber:
             if include_timestamps:
                 options["word_timestamps"] = True
             
+            start = time.perf_counter()
             result_whisper = self.local_model.transcribe(str(audio_path), **options)
+            inference_time = time.perf_counter() - start
             
             # Format result
             result = {
@@ -167,6 +181,8 @@ class WhisperTranscriber:
                 'language': result_whisper.get('language', 'unknown'),
                 'method': 'local',
                 'model': model_size,
+                'load_time': round(load_time, 3),
+                'inference_time': round(inference_time, 3),
                 'segments': []
             }
             
@@ -193,7 +209,7 @@ class WhisperTranscriber:
                     
                     result['segments'].append(segment_info)
             
-            print("✅ Local transcription complete")
+            print(f"✅ Local transcription complete (load {load_time:.1f}s, inference {inference_time:.1f}s)")
             return result
             
         except Exception as e:
@@ -236,11 +252,12 @@ class WhisperTranscriber:
     
     def _extract_audio_from_video(self, video_path: Path) -> Path:
         """Extract audio from video to temporary file."""
+        # Unique temporary file, so concurrent jobs on same-named videos do not collide
+        fd, temp_name = tempfile.mkstemp(prefix=f"{video_path.stem}_", suffix="_audio.wav")
+        os.close(fd)
+        temp_audio = Path(temp_name)
+        
         try:
-            # Create temporary audio file
-            temp_dir = Path(tempfile.gettempdir())
-            temp_audio = temp_dir / f"{video_path.stem}_temp_audio.wav"
-            
             print(f"🎵 Extracting audio from: {video_path.name}")
             
             # Use ffmpeg to extract audio
@@ -259,7 +276,7 @@ class WhisperTranscriber:
             if result.returncode != 0:
                 raise RuntimeError(f"ffmpeg failed: {result.stderr}")
             
-            if not temp_audio.exists():
+            if temp_audio.stat().st_size == 0:
                 raise RuntimeError("Audio extraction failed - no output file")
             
             print(f"✅ Audio extracted: {temp_audio.name}")
@@ -267,83 +284,81 @@ class WhisperTranscriber:
             
         except Exception as e:
             print(f"❌ Audio extraction failed: {e}")
+            temp_audio.unlink(missing_ok=True)
             raise
     
     def batch_transcribe(self, file_paths: List[Path], save_results: bool = True,
-                        output_dir: Optional[Path] = None, **kwargs) -> List[Dict[str, Any]]:
+                        output_dir: Optional[Path] = None, max_workers: Optional[int] = None,
+                        extract_workers: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
         """Transcribe multiple files in batch.
         
+        Audio extraction and transcription run as a pipeline: ffmpeg extracts
+        audio from upcoming videos while earlier files are being transcribed.
+        Each result and the batch summary are written as soon as a file finishes.
+        
         Args:
             file_paths: List of audio/video file paths
             save_results: Whether to save results to files
             output_dir: Directory to save results (default: current directory)
+            max_workers: Concurrent API transcriptions (local models always use one)
+            extract_workers: Concurrent ffmpeg audio extractions
             **kwargs: Arguments passed to transcribe methods
             
         Returns:
-            List of transcription results
+            List of transcription results, in input order
         """
         if output_dir is None:
             output_dir = Path.cwd()
         
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        results = []
+        completed = []
         
-        print(f"🎤 Starting batch transcription of {len(file_paths)} files")
-        
-        for i, file_path in enumerate(file_paths, 1):
-            print(f"\n📊 Processing file {i}/{len(file_paths)}: {file_path.name}")
+        def save_result(index: int, file_path: Path, result: Dict[str, Any]):
+            result['source_file'] = str(file_path)
+            result['batch_index'] = index
+            if 'error' not in result and is_video_file(file_path):
+                result['source_video'] = str(file_path)
+                result['extracted_audio'] = True
+            completed.append(result)
             
-            try:
-                # Determine if it's a video or audio file
-                video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'}
-                is_video = file_path.suffix.lower() in video_extensions
-                
-                if is_video:
-                    result = self.transcribe_video_audio(file_path, **kwargs)
-                else:
-                    result = self.transcribe_audio_file(file_path, **kwargs)
-                
-                result['source_file'] = str(file_path)
-                result['batch_index'] = i
-                results.append(result)
-                
-                # Save individual result if requested
-                if save_results:
+            if save_results:
+                if 'error' not in result:
                     result_file = output_dir / f"{file_path.stem}_transcription.json"
                     with open(result_file, 'w', encoding='utf-8') as f:
                         json.dump(result, f, indent=2, ensure_ascii=False)
                     print(f"💾 Saved: {result_file.name}")
-                
-            except Exception as e:
-                print(f"❌ Failed to transcribe {file_path.name}: {e}")
-                error_result = {
-                    'source_file': str(file_path),
-                    'batch_index': i,
-                    'error': str(e),
-                    'success': False
-                }
-                results.append(error_result)
+                self._write_batch_summary(output_dir, len(file_paths), completed)
+        
+        pipeline = TranscriptionPipeline(self, extract_workers=extract_workers,
+                                         transcribe_workers=max_workers, on_result=save_result)
+        results = pipeline.run(file_paths, **kwargs)
         
-        # Save batch summary
         if save_results:
-            summary_file = output_dir / "batch_transcription_summary.json"
-            summary = {
-                'total_files': len(file_paths),
-                'successful': len([r for r in results if 'error' not in r]),
-                'failed': len([r for r in results if 'error' in r]),
-                'results': results
-            }
-            
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
-            print(f"\n📋 Batch summary saved: {summary_file.name}")
+            self._write_batch_summary(output_dir, len(file_paths), results)
+            print("\n📋 Batch summary saved: batch_transcription_summary.json")
         
         successful = len([r for r in results if 'error' not in r])
         failed = len(results) - successful
         print(f"\n📊 Batch complete: {successful} successful, {failed} failed")
         
         return results
+    
+    @staticmethod
+    def _write_batch_summary(output_dir: Path, total_files: int, results: List[Dict[str, Any]]):
+        """Write the batch summary, replacing the previous version atomically."""
+        summary = {
+            'total_files': total_files,
+            'completed': len(results),
+            'successful': len([r for r in results if 'error' not in r]),
+            'failed': len([r for r in results if 'error' in r]),
+            'results': results
+        }
+        summary_file = output_dir / "batch_transcription_summary.json"
+        temp_file = summary_file.with_suffix('.json.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        os.replace(temp_file, summary_file)
 
 
 def check_whisper_requirements(check_api: bool = True, check_local: bool = True) -> Dict[str, tuple[bool, str]]: